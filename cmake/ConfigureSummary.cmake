@@ -80,6 +80,15 @@ function( NEST_PRINT_CONFIG_SUMMARY )
     message( "Use GSL             : No" )
   endif ()
 
+  if ( HAVE_ZLIB )
+    message( "Use zlib            : Yes (zlib ${ZLIB_VERSION_STRING})" )
+    message( "    Includes        : ${ZLIB_INCLUDE_DIRS}" )
+    message( "    Libraries       : ${ZLIB_LIBRARIES}" )
+    message( "" )
+  else ()
+    message( "Use zlib            : No" )
+  endif ()
+
   if ( HAVE_READLINE )
     message( "Use Readline        : Yes (GNU Readline ${READLINE_VERSION})" )
     message( "    Includes        : ${READLINE_INCLUDE_DIRS}" )
@@ -372,6 +372,29 @@ function( NEST_PROCESS_WITH_GSL )
   endif ()
 endfunction()
 
+function( NEST_PROCESS_WITH_ZLIB )
+  # Find zlib
+  set( HAVE_ZLIB OFF PARENT_SCOPE )
+  if ( with-zlib )
+    if ( NOT ${with-zlib} STREQUAL "ON" )
+      # a path is set
+      set( ZLIB_ROOT "${with-zlib}" )
+    endif ()
+
+    find_package( ZLIB )
+    if ( ZLIB_FOUND )
+      set( HAVE_ZLIB ON PARENT_SCOPE )
+      # export found variables to parent scope
+      set( ZLIB_LIBRARIES "${ZLIB_LIBRARIES}" PARENT_SCOPE )
+      set( ZLIB_INCLUDE_DIRS "${ZLIB_INCLUDE_DIRS}" PARENT_SCOPE )
+      set( ZLIB_VERSION_STRING "${ZLIB_VERSION_STRING}" PARENT_SCOPE )
+
+      include_directories( ${ZLIB_INCLUDE_DIRS} )
+      # is linked in nestkernel/CMakeLists.txt
+    endif ()
+  endif ()
+endfunction()
+
 function( NEST_PROCESS_WITH_PYTHON )
   # Find Python
   set( HAVE_PYTHON OFF PARENT_SCOPE )
@@ -273,7 +273,9 @@ models_with_documentation = (
     "models/multimeter",
     "models/spike_detector",
     "models/weight_recorder",
+    "nestkernel/recording_backend_aggregate",
     "nestkernel/recording_backend_ascii",
+    "nestkernel/recording_backend_binary",
     "nestkernel/recording_backend_memory",
     "nestkernel/recording_backend_screen",
     "nestkernel/recording_backend_sionlib",
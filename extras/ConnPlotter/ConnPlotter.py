@@ -2110,7 +2110,8 @@ def _kerneval(x, y, fun):
     elif isinstance(fun, nest.Parameter):
         # Create a single node in origo that we can apply the Parameter on.
         origo_node = nest.Create('iaf_psc_alpha', positions=nest.spatial.free([[0., 0.]]))
-        return np.array([fun.apply(origo_node, list(np.column_stack((xn, yn)))) for xn, yn in zip(x, y)])
+        positions = np.column_stack((np.ravel(x), np.ravel(y)))
+        return fun.evaluate(positions, origo_node).reshape(np.shape(x))
 
     # something very wrong
     raise Exception('Cannot handle kernel.')
@@ -200,6 +200,13 @@ public:
   port handles_test_event( DataLoggingRequest&, rport );
 
   void get_status( DictionaryDatum& ) const;
+
+  bool
+  get_value( const Name& name, double& value ) const
+  {
+    return recordablesMap_.get_value( *this, name, value );
+  }
+
   void set_status( const DictionaryDatum& );
 
 private:
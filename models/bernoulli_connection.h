@@ -174,6 +174,11 @@ public:
 
   void get_status( DictionaryDatum& d ) const;
 
+  /**
+   * Get the value of a single property without building a dictionary.
+   */
+  bool get_value( const Name& name, double& value ) const;
+
   void set_status( const DictionaryDatum& d, ConnectorModel& cm );
 
   void
@@ -197,6 +202,18 @@ BernoulliConnection< targetidentifierT >::get_status( DictionaryDatum& d ) const
   def< long >( d, names::size_of, sizeof( *this ) );
 }
 
+template < typename targetidentifierT >
+bool
+BernoulliConnection< targetidentifierT >::get_value( const Name& name, double& value ) const
+{
+  if ( name == names::weight )
+  {
+    value = weight_;
+    return true;
+  }
+  return ConnectionBase::get_value( name, value );
+}
+
 template < typename targetidentifierT >
 void
 BernoulliConnection< targetidentifierT >::set_status( const DictionaryDatum& d, ConnectorModel& cm )
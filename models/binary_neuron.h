@@ -95,6 +95,13 @@ public:
   SignalType receives_signal() const;
 
   void get_status( DictionaryDatum& ) const;
+
+  bool
+  get_value( const Name& name, double& value ) const
+  {
+    return recordablesMap_.get_value( *this, name, value );
+  }
+
   void set_status( const DictionaryDatum& );
 
   void calibrate_time( const TimeConverter& tc );
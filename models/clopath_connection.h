@@ -128,6 +128,11 @@ public:
    */
   void get_status( DictionaryDatum& d ) const;
 
+  /**
+   * Get the value of a single property without building a dictionary.
+   */
+  bool get_value( const Name& name, double& value ) const;
+
   /**
    * Set properties of this connection from the values given in dictionary.
    */
@@ -288,6 +293,18 @@ ClopathConnection< targetidentifierT >::get_status( DictionaryDatum& d ) const
   def< long >( d, names::size_of, sizeof( *this ) );
 }
 
+template < typename targetidentifierT >
+bool
+ClopathConnection< targetidentifierT >::get_value( const Name& name, double& value ) const
+{
+  if ( name == names::weight )
+  {
+    value = weight_;
+    return true;
+  }
+  return ConnectionBase::get_value( name, value );
+}
+
 template < typename targetidentifierT >
 void
 ClopathConnection< targetidentifierT >::set_status( const DictionaryDatum& d, ConnectorModel& cm )
@@ -63,6 +63,23 @@ ContDelayConnection< targetidentifierT >::get_status( DictionaryDatum& d ) const
   def< long >( d, names::size_of, sizeof( *this ) );
 }
 
+template < typename targetidentifierT >
+bool
+ContDelayConnection< targetidentifierT >::get_value( const Name& name, double& value ) const
+{
+  if ( name == names::weight )
+  {
+    value = weight_;
+    return true;
+  }
+  if ( name == names::delay )
+  {
+    value = Time( Time::step( ConnectionBase::get_delay_steps() ) ).get_ms() - delay_offset_;
+    return true;
+  }
+  return ConnectionBase::get_value( name, value );
+}
+
 template < typename targetidentifierT >
 void
 ContDelayConnection< targetidentifierT >::set_status( const DictionaryDatum& d, ConnectorModel& cm )
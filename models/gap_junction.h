@@ -125,6 +125,11 @@ public:
 
   void get_status( DictionaryDatum& d ) const;
 
+  /**
+   * Get the value of a single property without building a dictionary.
+   */
+  bool get_value( const Name& name, double& value ) const;
+
   void set_status( const DictionaryDatum& d, ConnectorModel& cm );
 
   void
@@ -155,6 +160,18 @@ GapJunction< targetidentifierT >::get_status( DictionaryDatum& d ) const
   def< long >( d, names::size_of, sizeof( *this ) );
 }
 
+template < typename targetidentifierT >
+bool
+GapJunction< targetidentifierT >::get_value( const Name& name, double& value ) const
+{
+  if ( name == names::weight )
+  {
+    value = weight_;
+    return true;
+  }
+  return ConnectionBase::get_value( name, value );
+}
+
 template < typename targetidentifierT >
 void
 GapJunction< targetidentifierT >::set_status( const DictionaryDatum& d, ConnectorModel& cm )
@@ -118,6 +118,11 @@ public:
    */
   virtual void get_status( DictionaryDatum& d ) const;
 
+  /**
+   * Get the value of a single property without building a dictionary.
+   */
+  bool get_value( const Name& name, double& value ) const;
+
   /**
    * Set properties of this connection from the values given in dictionary.
    */
@@ -230,6 +235,18 @@ HTConnection< targetidentifierT >::get_status( DictionaryDatum& d ) const
   def< long >( d, names::size_of, sizeof( *this ) );
 }
 
+template < typename targetidentifierT >
+bool
+HTConnection< targetidentifierT >::get_value( const Name& name, double& value ) const
+{
+  if ( name == names::weight )
+  {
+    value = weight_;
+    return true;
+  }
+  return ConnectionBase::get_value( name, value );
+}
+
 template < typename targetidentifierT >
 void
 HTConnection< targetidentifierT >::set_status( const DictionaryDatum& d, ConnectorModel& cm )
@@ -167,6 +167,19 @@ public:
   port handles_test_event( DataLoggingRequest&, rport );
 
   void get_status( DictionaryDatum& ) const;
+
+  bool
+  get_value( const Name& name, double& value ) const
+  {
+    // The recordable V_m is relative to E_L, the status entry is not
+    if ( name == names::V_m )
+    {
+      value = S_.V_m_ + P_.E_L_;
+      return true;
+    }
+    return recordablesMap_.get_value( *this, name, value );
+  }
+
   void set_status( const DictionaryDatum& );
 
 private:
@@ -111,6 +111,18 @@ Quantal_StpConnection< targetidentifierT >::get_status( DictionaryDatum& d ) con
   def< int >( d, names::a, a_ );
 }
 
+template < typename targetidentifierT >
+bool
+Quantal_StpConnection< targetidentifierT >::get_value( const Name& name, double& value ) const
+{
+  if ( name == names::weight )
+  {
+    value = weight_;
+    return true;
+  }
+  return ConnectionBase::get_value( name, value );
+}
+
 
 template < typename targetidentifierT >
 void
@@ -253,6 +253,11 @@ public:
    */
   void get_status( DictionaryDatum& d ) const;
 
+  /**
+   * Get the value of a single property without building a dictionary.
+   */
+  bool get_value( const Name& name, double& value ) const;
+
   /**
    * Set properties of this connection from the values given in dictionary.
    */
@@ -331,6 +331,18 @@ STDPFACETSHWConnectionHom< targetidentifierT >::get_status( DictionaryDatum& d )
   // weight_per_lut_entry_), weight_per_lut_entry_));
 }
 
+template < typename targetidentifierT >
+bool
+STDPFACETSHWConnectionHom< targetidentifierT >::get_value( const Name& name, double& value ) const
+{
+  if ( name == names::weight )
+  {
+    value = weight_;
+    return true;
+  }
+  return ConnectionBase::get_value( name, value );
+}
+
 template < typename targetidentifierT >
 void
 STDPFACETSHWConnectionHom< targetidentifierT >::set_status( const DictionaryDatum& d, ConnectorModel& cm )
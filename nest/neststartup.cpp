@@ -230,4 +230,28 @@ set_communicator( PyObject* )
 }
 
 #endif
+
+void
+set_python_error_from_exception()
+{
+  try
+  {
+    throw;
+  }
+  catch ( SLIException& e )
+  {
+    PyObject* args = Py_BuildValue( "(ss)", e.what(), e.message().c_str() );
+    PyErr_SetObject( PyExc_RuntimeError, args );
+    Py_XDECREF( args );
+  }
+  catch ( std::exception& e )
+  {
+    PyErr_SetString( PyExc_RuntimeError, e.what() );
+  }
+  catch ( ... )
+  {
+    PyErr_SetString( PyExc_RuntimeError, "Unknown exception" );
+  }
+}
+
 #endif //_IS_PYNEST
@@ -65,6 +65,10 @@ SLIInterpreter& get_engine();
 // Call only with GIL
 void set_communicator( PyObject* );
 
+// Call only with GIL and from within a catch block. Sets a Python RuntimeError
+// with the name and the message of the exception that is being handled.
+void set_python_error_from_exception();
+
 inline bool
 nest_has_mpi4py()
 {
@@ -0,0 +1,226 @@
+/*
+ *  async_file_writer.cpp
+ *
+ *  This file is part of NEST.
+ *
+ *  Copyright (C) 2004 The NEST Initiative
+ *
+ *  NEST is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 2 of the License, or
+ *  (at your option) any later version.
+ *
+ *  NEST is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ */
+
+#include "async_file_writer.h"
+
+// C++ includes:
+#include <algorithm>
+#include <chrono>
+
+// Includes from nestkernel:
+#include "exceptions.h"
+#include "nest_names.h"
+
+// Includes from libnestutil:
+#include "compose.hpp"
+
+// Includes from sli:
+#include "dictutils.h"
+
+nest::AsyncFileWriter::AsyncFileWriter()
+  : async_write_( false )
+  , block_size_( 1 << 20 )
+  , max_pending_blocks_( 64 )
+  , running_( false )
+  , stopping_( false )
+  , writing_( false )
+  , blocks_written_( 0 )
+  , bytes_written_( 0 )
+  , peak_pending_blocks_( 0 )
+  , stalls_( 0 )
+  , stall_time_( 0.0 )
+{
+}
+
+nest::AsyncFileWriter::~AsyncFileWriter()
+{
+  try
+  {
+    stop();
+  }
+  catch ( FileWriteError& )
+  {
+    // Errors can only be reported by explicit calls of wait() and stop()
+  }
+}
+
+void
+nest::AsyncFileWriter::start()
+{
+  if ( not async_write_ or running_ )
+  {
+    return;
+  }
+
+  stopping_ = false;
+  running_ = true;
+  thread_ = std::thread( &AsyncFileWriter::run_, this );
+}
+
+void
+nest::AsyncFileWriter::stop()
+{
+  if ( not running_ )
+  {
+    return;
+  }
+
+  {
+    std::lock_guard< std::mutex > lock( mutex_ );
+    stopping_ = true;
+  }
+  block_submitted_.notify_one();
+  thread_.join();
+  running_ = false;
+
+  std::lock_guard< std::mutex > lock( mutex_ );
+  throw_error_();
+}
+
+void
+nest::AsyncFileWriter::wait()
+{
+  std::unique_lock< std::mutex > lock( mutex_ );
+  block_written_.wait( lock, [this] { return queue_.empty() and not writing_; } );
+  throw_error_();
+}
+
+void
+nest::AsyncFileWriter::throw_error_()
+{
+  if ( not error_.empty() )
+  {
+    const std::string error = error_;
+    error_.clear();
+    throw FileWriteError( error );
+  }
+}
+
+void
+nest::AsyncFileWriter::submit( std::ofstream& file, std::ostringstream& buffer )
+{
+  std::string block = buffer.str();
+  buffer.str( "" );
+  if ( block.empty() )
+  {
+    return;
+  }
+
+  std::unique_lock< std::mutex > lock( mutex_ );
+  if ( static_cast< long >( queue_.size() ) >= max_pending_blocks_ )
+  {
+    const auto stall_start = std::chrono::steady_clock::now();
+    block_written_.wait( lock, [this] { return static_cast< long >( queue_.size() ) < max_pending_blocks_; } );
+    const std::chrono::duration< double, std::milli > stall_duration = std::chrono::steady_clock::now() - stall_start;
+    ++stalls_;
+    stall_time_ += stall_duration.count();
+  }
+
+  queue_.emplace_back( &file, std::move( block ) );
+  peak_pending_blocks_ = std::max( peak_pending_blocks_, static_cast< long >( queue_.size() ) );
+  lock.unlock();
+  block_submitted_.notify_one();
+}
+
+void
+nest::AsyncFileWriter::run_()
+{
+  std::unique_lock< std::mutex > lock( mutex_ );
+  while ( true )
+  {
+    block_submitted_.wait( lock, [this] { return stopping_ or not queue_.empty(); } );
+    if ( queue_.empty() )
+    {
+      return; // stopping_ is set and all blocks are written
+    }
+
+    std::pair< std::ofstream*, std::string > block = std::move( queue_.front() );
+    queue_.pop_front();
+    writing_ = true;
+
+    // Write without holding the lock, so that other threads can submit
+    lock.unlock();
+    block.first->write( block.second.data(), block.second.size() );
+    const bool good = block.first->good();
+    lock.lock();
+
+    if ( not good and error_.empty() )
+    {
+      error_ = String::compose( "I/O error while writing a block of %1 bytes to a file.", block.second.size() );
+    }
+    writing_ = false;
+    ++blocks_written_;
+    bytes_written_ += block.second.size();
+    block_written_.notify_all();
+  }
+}
+
+void
+nest::AsyncFileWriter::reset_statistics()
+{
+  std::lock_guard< std::mutex > lock( mutex_ );
+  blocks_written_ = 0;
+  bytes_written_ = 0;
+  peak_pending_blocks_ = 0;
+  stalls_ = 0;
+  stall_time_ = 0.0;
+}
+
+void
+nest::AsyncFileWriter::get_status( DictionaryDatum& d ) const
+{
+  std::lock_guard< std::mutex > lock( mutex_ );
+  ( *d )[ names::async_write ] = async_write_;
+  ( *d )[ names::block_size ] = block_size_;
+  ( *d )[ names::max_pending_blocks ] = max_pending_blocks_;
+  ( *d )[ names::blocks_written ] = blocks_written_;
+  ( *d )[ names::bytes_written ] = bytes_written_;
+  ( *d )[ names::peak_pending_blocks ] = peak_pending_blocks_;
+  ( *d )[ names::stalls ] = stalls_;
+  ( *d )[ names::stall_time ] = stall_time_;
+}
+
+void
+nest::AsyncFileWriter::set_status( const DictionaryDatum& d )
+{
+  bool async_write = async_write_;
+  long block_size = block_size_;
+  long max_pending_blocks = max_pending_blocks_;
+  updateValue< bool >( d, names::async_write, async_write );
+  updateValue< long >( d, names::block_size, block_size );
+  updateValue< long >( d, names::max_pending_blocks, max_pending_blocks );
+
+  if ( block_size < 1 )
+  {
+    throw BadProperty( "Property block_size must be positive." );
+  }
+  if ( max_pending_blocks < 1 )
+  {
+    throw BadProperty( "Property max_pending_blocks must be positive." );
+  }
+
+  // A change of async_write takes effect with the next call to Simulate or Prepare
+  std::lock_guard< std::mutex > lock( mutex_ );
+  async_write_ = async_write;
+  block_size_ = block_size;
+  max_pending_blocks_ = max_pending_blocks;
+}
@@ -0,0 +1,153 @@
+/*
+ *  async_file_writer.h
+ *
+ *  This file is part of NEST.
+ *
+ *  Copyright (C) 2004 The NEST Initiative
+ *
+ *  NEST is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 2 of the License, or
+ *  (at your option) any later version.
+ *
+ *  NEST is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ */
+
+#ifndef ASYNC_FILE_WRITER_H
+#define ASYNC_FILE_WRITER_H
+
+// C++ includes:
+#include <condition_variable>
+#include <deque>
+#include <fstream>
+#include <mutex>
+#include <sstream>
+#include <string>
+#include <thread>
+
+// Includes from sli:
+#include "dictdatum.h"
+
+namespace nest
+{
+
+/**
+ * Background writer thread for file based recording backends.
+ *
+ * Instead of writing to their files directly during the update of the
+ * nodes, recording backends can format their data into a buffer
+ * owned by the device instance on the current thread and submit the
+ * buffer as a block to the AsyncFileWriter once it exceeds the block
+ * size. Blocks are appended to a queue, from which a dedicated I/O
+ * thread writes them to their files in the order of submission, while
+ * the simulation continues. Appending to the buffers therefore needs
+ * no synchronization at all, and the queue is only locked once per
+ * block.
+ *
+ * The queue holds at most max_pending_blocks blocks. If it is full,
+ * submit() blocks until the I/O thread has written a block, which
+ * limits the memory used if the file system is slower than the
+ * simulation. The number and duration of these stalls are recorded,
+ * so that users can see whether the I/O thread keeps up.
+ *
+ * Files written by the I/O thread must not be accessed by other
+ * threads between start() and wait() or stop().
+ * If writing a block fails, the I/O thread records the error and
+ * wait() or stop() throw it as a FileWriteError.
+ */
+class AsyncFileWriter
+{
+public:
+  AsyncFileWriter();
+  ~AsyncFileWriter();
+
+  /**
+   * Start the I/O thread if asynchronous writing is enabled.
+   */
+  void start();
+
+  /**
+   * Write all pending blocks and stop the I/O thread.
+   * @throws FileWriteError if writing a block failed.
+   */
+  void stop();
+
+  /**
+   * Wait until all blocks submitted so far have been written.
+   * @throws FileWriteError if writing a block failed.
+   */
+  void wait();
+
+  /**
+   * Return true if the I/O thread is running and accepts blocks.
+   */
+  bool is_running() const;
+
+  /**
+   * Return true if the given buffer should be submitted.
+   */
+  bool is_full( std::ostringstream& buffer ) const;
+
+  /**
+   * Queue the contents of the buffer for writing to the file and clear
+   * the buffer. Blocks if max_pending_blocks blocks are pending.
+   */
+  void submit( std::ofstream& file, std::ostringstream& buffer );
+
+  /**
+   * Reset the statistics.
+   */
+  void reset_statistics();
+
+  void get_status( DictionaryDatum& ) const;
+  void set_status( const DictionaryDatum& );
+
+private:
+  //! Main loop of the I/O thread
+  void run_();
+
+  //! Throw the error recorded by the I/O thread, if any. Call only with mutex_ locked.
+  void throw_error_();
+
+  bool async_write_;          //!< Whether files are written asynchronously
+  long block_size_;           //!< Size in bytes above which buffers are submitted
+  long max_pending_blocks_;   //!< Maximal number of blocks in the queue
+  bool running_;              //!< Whether the I/O thread is running
+  bool stopping_;             //!< Whether the I/O thread should stop after writing all blocks
+  bool writing_;              //!< Whether the I/O thread is currently writing a block
+  long blocks_written_;       //!< Number of blocks written
+  long bytes_written_;        //!< Number of bytes written
+  long peak_pending_blocks_;  //!< Maximal number of blocks in the queue so far
+  long stalls_;               //!< Number of times submit() had to wait for the I/O thread
+  double stall_time_;         //!< Total time in ms that submit() waited for the I/O thread
+  std::string error_;         //!< Error of the first block that could not be written, empty if none
+
+  std::deque< std::pair< std::ofstream*, std::string > > queue_; //!< Blocks to be written
+  mutable std::mutex mutex_;                                     //!< Protects all members above
+  std::condition_variable block_submitted_;                      //!< Notifies the I/O thread of new blocks
+  std::condition_variable block_written_;                        //!< Notifies waiting threads of written blocks
+  std::thread thread_;                                           //!< The I/O thread
+};
+
+inline bool
+AsyncFileWriter::is_running() const
+{
+  return running_;
+}
+
+inline bool
+AsyncFileWriter::is_full( std::ostringstream& buffer ) const
+{
+  return buffer.tellp() >= block_size_;
+}
+
+} // namespace nest
+
+#endif // ASYNC_FILE_WRITER_H
@@ -142,6 +142,16 @@ public:
    */
   void get_status( DictionaryDatum& d ) const;
 
+  /**
+   * Get the value of a single numeric property of this connection without
+   * building a status dictionary. Return false if the property cannot be
+   * read this way, in which case it has to be taken from get_status().
+   *
+   * @note Connection models that store further properties, such as the
+   * weight, hide this function and fall back to it for the remaining names.
+   */
+  bool get_value( const Name& name, double& value ) const;
+
   /**
    * Set properties of this connection from the values given in dictionary.
    *
@@ -359,6 +369,23 @@ Connection< targetidentifierT >::get_status( DictionaryDatum& d ) const
   target_.get_status( d );
 }
 
+template < typename targetidentifierT >
+inline bool
+Connection< targetidentifierT >::get_value( const Name& name, double& value ) const
+{
+  if ( name == names::delay )
+  {
+    value = syn_id_delay_.get_delay_ms();
+    return true;
+  }
+  if ( name == names::rport )
+  {
+    value = target_.get_rport();
+    return true;
+  }
+  return false;
+}
+
 template < typename targetidentifierT >
 inline void
 Connection< targetidentifierT >::set_status( const DictionaryDatum& d, ConnectorModel& )
@@ -61,6 +61,11 @@ public:
    */
   void get_status( DictionaryDatum& d ) const;
 
+  /**
+   * Get the value of a single property without building a dictionary.
+   */
+  bool get_value( const Name& name, double& value ) const;
+
   /**
    * Set properties of this connection from the values given in dictionary.
    *
@@ -94,6 +99,18 @@ ConnectionLabel< ConnectionT >::get_status( DictionaryDatum& d ) const
   def< long >( d, names::size_of, sizeof( *this ) );
 }
 
+template < typename ConnectionT >
+bool
+ConnectionLabel< ConnectionT >::get_value( const Name& name, double& value ) const
+{
+  if ( name == names::synapse_label )
+  {
+    value = label_;
+    return true;
+  }
+  return ConnectionT::get_value( name, value );
+}
+
 template < typename ConnectionT >
 void
 ConnectionLabel< ConnectionT >::set_status( const DictionaryDatum& d, ConnectorModel& cm )
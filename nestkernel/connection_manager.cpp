@@ -31,6 +31,7 @@
 #include <cmath>
 #include <iomanip>
 #include <limits>
+#include <map>
 #include <set>
 #include <vector>
 
@@ -55,7 +56,10 @@
 #include "vp_manager_impl.h"
 
 // Includes from sli:
+#include "arraydatum.h"
 #include "dictutils.h"
+#include "doubledatum.h"
+#include "integerdatum.h"
 #include "sliexceptions.h"
 #include "token.h"
 #include "tokenutils.h"
@@ -187,9 +191,223 @@ nest::ConnectionManager::get_synapse_status( const index source_node_id,
   const synindex syn_id,
   const index lcid ) const
 {
-  kernel().model_manager.assert_valid_syn_id( syn_id );
+  DictionaryDatum dict( new Dictionary );
+  get_synapse_status_( source_node_id, target_node_id, tid, syn_id, lcid, dict );
+  return dict;
+}
+
+DictionaryDatum
+nest::ConnectionManager::get_synapse_status( const long* conns, const size_t n, const std::vector< Name >& keys ) const
+{
+  DictionaryDatum result( new Dictionary );
+  if ( n == 0 or get_num_connections() == 0 )
+  {
+    return result;
+  }
+
+  const long* sources = conns;
+  const long* targets = conns + n;
+  const long* threads = conns + 2 * n;
+  const long* syn_ids = conns + 3 * n;
+  const long* ports = conns + 4 * n;
+
+  // Status of the first connection of each synapse model in conns, used to
+  // determine the keys and the type of their columns, and the name of the
+  // synapse model, which is the same for all its connections
+  std::map< long, DictionaryDatum > samples;
+  for ( size_t i = 0; i < n; ++i )
+  {
+    if ( samples.find( syn_ids[ i ] ) == samples.end() )
+    {
+      DictionaryDatum sample( new Dictionary );
+      get_synapse_status_( sources[ i ], targets[ i ], threads[ i ], syn_ids[ i ], ports[ i ], sample );
+      samples[ syn_ids[ i ] ] = sample;
+    }
+  }
+
+  // Each key gets a single column, even if it is requested more than once
+  std::vector< Name > names;
+  for ( const Name& key : keys )
+  {
+    if ( std::find( names.begin(), names.end(), key ) == names.end() )
+    {
+      names.push_back( key );
+    }
+  }
+  if ( names.empty() )
+  {
+    const DictionaryDatum& first = samples.begin()->second;
+    for ( auto it = first->begin(); it != first->end(); ++it )
+    {
+      bool shared = true;
+      for ( const auto& sample : samples )
+      {
+        shared = shared and sample.second->known( it->first );
+      }
+      if ( shared )
+      {
+        names.push_back( it->first );
+      }
+    }
+  }
+
+  // One output column per key. It holds integers if the key has an integer
+  // value in all synapse models, doubles if it has a numeric value in all
+  // synapse models and tokens otherwise.
+  std::vector< std::vector< long >* > int_columns( names.size(), nullptr );
+  std::vector< std::vector< double >* > double_columns( names.size(), nullptr );
+  std::vector< ArrayDatum* > token_columns( names.size(), nullptr );
+  for ( size_t k = 0; k < names.size(); ++k )
+  {
+    bool is_integer = true;
+    bool is_numeric = true;
+    for ( const auto& sample : samples )
+    {
+      const Token& value = sample.second->lookup2( names[ k ] );
+      if ( not dynamic_cast< IntegerDatum* >( value.datum() ) )
+      {
+        is_integer = false;
+        is_numeric = is_numeric and dynamic_cast< DoubleDatum* >( value.datum() );
+      }
+    }
 
+    if ( is_integer )
+    {
+      int_columns[ k ] = new std::vector< long >( n );
+      ( *result )[ names[ k ] ] = new IntVectorDatum( int_columns[ k ] );
+    }
+    else if ( is_numeric )
+    {
+      double_columns[ k ] = new std::vector< double >( n );
+      ( *result )[ names[ k ] ] = new DoubleVectorDatum( double_columns[ k ] );
+    }
+    else
+    {
+      token_columns[ k ] = new ArrayDatum();
+      token_columns[ k ]->reserve( n );
+      ( *result )[ names[ k ] ] = token_columns[ k ];
+    }
+  }
+
+  // The status dictionary is only built for connections with values that
+  // cannot be read directly
   DictionaryDatum dict( new Dictionary );
+  for ( size_t i = 0; i < n; ++i )
+  {
+    const thread tid = threads[ i ];
+    const synindex syn_id = syn_ids[ i ];
+    const index lcid = ports[ i ];
+    const ConnectorBase* connector = get_neuron_connector_( sources[ i ], targets[ i ], tid, syn_id );
+    bool has_dict = false;
+
+    for ( size_t k = 0; k < names.size(); ++k )
+    {
+      const Name& name = names[ k ];
+      if ( token_columns[ k ] )
+      {
+        if ( name == names::synapse_model )
+        {
+          token_columns[ k ]->push_back( samples[ syn_id ]->lookup2( name ) );
+          continue;
+        }
+      }
+      else
+      {
+        double value;
+        bool is_direct = true;
+        if ( name == names::source )
+        {
+          value = sources[ i ];
+        }
+        else if ( name == names::target_thread )
+        {
+          value = tid;
+        }
+        else if ( name == names::synapse_id )
+        {
+          value = syn_id;
+        }
+        else if ( name == names::port )
+        {
+          value = lcid;
+        }
+        else if ( name == names::target and connector )
+        {
+          value = connector->get_target_node_id( tid, lcid );
+        }
+        else
+        {
+          is_direct = connector and connector->get_synapse_value( lcid, name, value );
+        }
+
+        if ( is_direct )
+        {
+          if ( int_columns[ k ] )
+          {
+            ( *int_columns[ k ] )[ i ] = static_cast< long >( value );
+          }
+          else
+          {
+            ( *double_columns[ k ] )[ i ] = value;
+          }
+          continue;
+        }
+      }
+
+      if ( not has_dict )
+      {
+        dict->clear();
+        get_synapse_status_( sources[ i ], targets[ i ], tid, syn_id, lcid, dict );
+        has_dict = true;
+      }
+
+      const Token& value = dict->lookup2( name );
+      if ( int_columns[ k ] )
+      {
+        ( *int_columns[ k ] )[ i ] = getValue< long >( value );
+      }
+      else if ( double_columns[ k ] )
+      {
+        const IntegerDatum* int_value = dynamic_cast< IntegerDatum* >( value.datum() );
+        ( *double_columns[ k ] )[ i ] = int_value ? int_value->get() : getValue< double >( value );
+      }
+      else
+      {
+        token_columns[ k ]->push_back( value );
+      }
+    }
+  }
+
+  return result;
+}
+
+const nest::ConnectorBase*
+nest::ConnectionManager::get_neuron_connector_( const index source_node_id,
+  const index target_node_id,
+  const thread tid,
+  const synindex syn_id ) const
+{
+  const Node* source = kernel().node_manager.get_node_or_proxy( source_node_id, tid );
+  const Node* target = kernel().node_manager.get_node_or_proxy( target_node_id, tid );
+
+  // same cases as the first branch in get_synapse_status_()
+  if ( source->has_proxies() and ( target->has_proxies() or not target->local_receiver() ) )
+  {
+    return connections_[ tid ][ syn_id ];
+  }
+  return NULL;
+}
+
+void
+nest::ConnectionManager::get_synapse_status_( const index source_node_id,
+  const index target_node_id,
+  const thread tid,
+  const synindex syn_id,
+  const index lcid,
+  DictionaryDatum& dict ) const
+{
+  kernel().model_manager.assert_valid_syn_id( syn_id );
+
   ( *dict )[ names::source ] = source_node_id;
   ( *dict )[ names::synapse_model ] = LiteralDatum( kernel().model_manager.get_synapse_prototype( syn_id ).get_name() );
   ( *dict )[ names::target_thread ] = tid;
@@ -220,8 +438,6 @@ nest::ConnectionManager::get_synapse_status( const index source_node_id,
   {
     assert( false );
   }
-
-  return dict;
 }
 
 void
@@ -732,6 +948,24 @@ ArrayDatum
 nest::ConnectionManager::get_connections( const DictionaryDatum& params ) const
 {
   std::deque< ConnectionID > connectome;
+  get_connections( connectome, params );
+
+  ArrayDatum result;
+  result.reserve( connectome.size() );
+
+  while ( not connectome.empty() )
+  {
+    result.push_back( ConnectionDatum( connectome.front() ) );
+    connectome.pop_front();
+  }
+
+  return result;
+}
+
+void
+nest::ConnectionManager::get_connections( std::deque< ConnectionID >& connectome,
+  const DictionaryDatum& params ) const
+{
   const Token& source_t = params->lookup( names::source );
   const Token& target_t = params->lookup( names::target );
   const Token& syn_model_t = params->lookup( names::synapse_model );
@@ -798,17 +1032,6 @@ nest::ConnectionManager::get_connections( const DictionaryDatum& params ) const
       get_connections( connectome, source_a, target_a, syn_id, synapse_label );
     }
   }
-
-  ArrayDatum result;
-  result.reserve( connectome.size() );
-
-  while ( not connectome.empty() )
-  {
-    result.push_back( ConnectionDatum( connectome.front() ) );
-    connectome.pop_front();
-  }
-
-  return result;
 }
 
 // Helper method which removes ConnectionIDs from input deque and
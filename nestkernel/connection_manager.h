@@ -165,6 +165,24 @@ public:
     const synindex syn_id,
     const index lcid ) const;
 
+  /**
+   * Get the values of the given keys for n connections at once.
+   *
+   * conns holds the connection IDs column-wise, as returned by
+   * nest::get_connections_arrays(). Integer and double valued parameters
+   * are returned as IntVectorDatum and DoubleVectorDatum, all other
+   * parameters as ArrayDatum. The type of each key is determined from all
+   * synapse models in conns, integer values of one model and double values
+   * of another giving a DoubleVectorDatum. If keys is empty, all parameters
+   * shared by these synapse models are returned. If there are no connections
+   * in the network, the returned dictionary is empty.
+   *
+   * Values of connections between neurons are read directly from the
+   * connectors where the connection model supports it (see
+   * Connection::get_value()), otherwise from their status dictionary.
+   */
+  DictionaryDatum get_synapse_status( const long* conns, const size_t n, const std::vector< Name >& keys ) const;
+
   // aka conndatum SetStatus
   void set_synapse_status( const index source_node_id,
     const index target_node_id,
@@ -189,6 +207,12 @@ public:
    */
   ArrayDatum get_connections( const DictionaryDatum& params ) const;
 
+  /**
+   * Collect the connection IDs selected by params into connectome.
+   * params is interpreted as for get_connections() above.
+   */
+  void get_connections( std::deque< ConnectionID >& connectome, const DictionaryDatum& params ) const;
+
   void get_connections( std::deque< ConnectionID >& connectome,
     NodeCollectionPTR source,
     NodeCollectionPTR target,
@@ -429,6 +453,26 @@ private:
    */
   void delete_connections_();
 
+  /**
+   * Write the status of a connection to dict.
+   */
+  void get_synapse_status_( const index source_node_id,
+    const index target_node_id,
+    const thread tid,
+    const synindex syn_id,
+    const index lcid,
+    DictionaryDatum& dict ) const;
+
+  /**
+   * Return the connector that holds the given connection if it is a
+   * connection between neurons or from a neuron to a globally receiving
+   * device, and NULL for all other connections.
+   */
+  const ConnectorBase* get_neuron_connector_( const index source_node_id,
+    const index target_node_id,
+    const thread tid,
+    const synindex syn_id ) const;
+
   /**
    * connect_ is used to establish a connection between a sender and
    * receiving node which both have proxies.
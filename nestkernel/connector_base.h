@@ -83,6 +83,13 @@ public:
    */
   virtual void get_synapse_status( const thread tid, const index lcid, DictionaryDatum& dict ) const = 0;
 
+  /**
+   * Write the value of the property name of the connection at position
+   * lcid to value without building a status dictionary. Return false if
+   * the connection model does not provide the property this way.
+   */
+  virtual bool get_synapse_value( const index lcid, const Name& name, double& value ) const = 0;
+
   /**
    * Set status of the connection at position lcid according to the
    * dictionary dict.
@@ -254,6 +261,14 @@ public:
     def< long >( dict, names::target, C_[ lcid ].get_target( tid )->get_node_id() );
   }
 
+  bool
+  get_synapse_value( const index lcid, const Name& name, double& value ) const
+  {
+    assert( lcid >= 0 and lcid < C_.size() );
+
+    return C_[ lcid ].get_value( name, value );
+  }
+
   void
   set_synapse_status( const index lcid, const DictionaryDatum& dict, ConnectorModel& cm )
   {
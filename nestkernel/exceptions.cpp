@@ -441,3 +441,9 @@ nest::InternalError::message() const
 {
   return msg_;
 }
+
+std::string
+nest::FileWriteError::message() const
+{
+  return msg_;
+}
@@ -948,6 +948,29 @@ public:
   std::string message() const;
 };
 
+/**
+ * Exception to be thrown if writing data to a file failed.
+ * @ingroup KernelExceptions
+ */
+class FileWriteError : public KernelException
+{
+  std::string msg_;
+
+public:
+  //! @param detailed error message
+  FileWriteError( std::string msg )
+    : KernelException( "FileWriteError" )
+    , msg_( msg )
+  {
+  }
+
+  ~FileWriteError() throw()
+  {
+  }
+
+  std::string message() const;
+};
+
 
 #ifdef HAVE_MUSIC
 /**
@@ -39,7 +39,9 @@
 
 // Includes from nestkernel:
 #include "kernel_manager.h"
+#include "recording_backend_aggregate.h"
 #include "recording_backend_ascii.h"
+#include "recording_backend_binary.h"
 #include "recording_backend_memory.h"
 #include "recording_backend_screen.h"
 #ifdef HAVE_MPI
@@ -303,10 +305,21 @@ IOManager::get_recording_backend_device_status( Name backend_name, const Recordi
   recording_backends_[ backend_name ]->get_device_status( device, d );
 }
 
+void
+IOManager::get_recording_backend_device_new_events( Name backend_name,
+  const RecordingDevice& device,
+  DictionaryDatum& events,
+  bool drain )
+{
+  recording_backends_[ backend_name ]->get_device_new_events( device, events, drain );
+}
+
 void
 IOManager::register_recording_backends_()
 {
+  recording_backends_.insert( std::make_pair( "aggregate", new RecordingBackendAggregate() ) );
   recording_backends_.insert( std::make_pair( "ascii", new RecordingBackendASCII() ) );
+  recording_backends_.insert( std::make_pair( "binary", new RecordingBackendBinary() ) );
   recording_backends_.insert( std::make_pair( "memory", new RecordingBackendMemory() ) );
   recording_backends_.insert( std::make_pair( "screen", new RecordingBackendScreen() ) );
 #ifdef HAVE_MPI
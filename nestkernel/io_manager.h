@@ -111,6 +111,7 @@ public:
   void check_recording_backend_device_status( Name, const DictionaryDatum& );
   void get_recording_backend_device_defaults( Name, DictionaryDatum& );
   void get_recording_backend_device_status( Name, const RecordingDevice&, DictionaryDatum& );
+  void get_recording_backend_device_new_events( Name, const RecordingDevice&, DictionaryDatum&, bool );
 
 private:
   void set_data_path_prefix_( const DictionaryDatum& );
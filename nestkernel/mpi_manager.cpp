@@ -600,6 +600,36 @@ nest::MPIManager::communicate( std::vector< unsigned long >& send_buffer,
   }
 }
 
+void
+nest::MPIManager::communicate( std::vector< long >& send_buffer,
+  std::vector< long >& recv_buffer,
+  std::vector< int >& displacements )
+{
+  // get size of buffers
+  std::vector< int > n_nodes( num_processes_ );
+  n_nodes[ rank_ ] = send_buffer.size();
+  communicate( n_nodes );
+  // Set up displacements vector.
+  displacements.resize( num_processes_, 0 );
+  for ( int i = 1; i < num_processes_; ++i )
+  {
+    displacements.at( i ) = displacements.at( i - 1 ) + n_nodes.at( i - 1 );
+  }
+
+  // Calculate total number of node data items to be gathered.
+  size_t n_globals = std::accumulate( n_nodes.begin(), n_nodes.end(), 0 );
+
+  if ( n_globals != 0 )
+  {
+    recv_buffer.resize( n_globals, 0 );
+    communicate_Allgatherv( send_buffer, recv_buffer, displacements, n_nodes );
+  }
+  else
+  {
+    recv_buffer.clear();
+  }
+}
+
 void
 nest::MPIManager::communicate( std::vector< int >& send_buffer,
   std::vector< int >& recv_buffer,
@@ -1007,6 +1037,16 @@ nest::MPIManager::communicate( std::vector< unsigned long >& send_buffer,
   recv_buffer.swap( send_buffer );
 }
 
+void
+nest::MPIManager::communicate( std::vector< long >& send_buffer,
+  std::vector< long >& recv_buffer,
+  std::vector< int >& displacements )
+{
+  displacements.resize( num_processes_, 0 );
+  displacements[ 0 ] = 0;
+  recv_buffer.swap( send_buffer );
+}
+
 void
 nest::MPIManager::communicate( std::vector< int >& send_buffer,
   std::vector< int >& recv_buffer,
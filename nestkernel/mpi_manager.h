@@ -146,6 +146,10 @@ public:
     std::vector< unsigned long >& recv_buffer,
     std::vector< int >& displacements );
 
+  void communicate( std::vector< long >& send_buffer,
+    std::vector< long >& recv_buffer,
+    std::vector< int >& displacements );
+
   void
   communicate( std::vector< int >& send_buffer, std::vector< int >& recv_buffer, std::vector< int >& displacements );
 
@@ -23,15 +23,20 @@
 #include "nest.h"
 
 // C++ includes:
+#include <algorithm>
 #include <cassert>
+#include <deque>
 
 // Includes from nestkernel:
 #include "exceptions.h"
 #include "kernel_manager.h"
 #include "mpi_manager_impl.h"
 #include "parameter.h"
+#include "recording_device.h"
 
 // Includes from sli:
+#include "doubledatum.h"
+#include "integerdatum.h"
 #include "sliexceptions.h"
 #include "token.h"
 
@@ -125,6 +130,43 @@ get_node_status( const index node_id )
   return kernel().node_manager.get_status( node_id );
 }
 
+DictionaryDatum
+get_node_status_arrays( const NodeCollectionDatum& nc, const std::vector< std::string >& keys )
+{
+  const std::vector< Name > names( keys.begin(), keys.end() );
+  return kernel().node_manager.get_status( nc, names );
+}
+
+void
+set_node_status_arrays( const NodeCollectionDatum& nc,
+  const DictionaryDatum& params,
+  const std::vector< std::string >& double_keys,
+  const double* double_values,
+  const std::vector< std::string >& int_keys,
+  const long* int_values )
+{
+  const std::vector< Name > double_names( double_keys.begin(), double_keys.end() );
+  const std::vector< Name > int_names( int_keys.begin(), int_keys.end() );
+  kernel().node_manager.set_status( nc, params, double_names, double_values, int_names, int_values );
+}
+
+DictionaryDatum
+get_new_events( const index node_id, const bool drain )
+{
+  if ( dynamic_cast< RecordingDevice* >( kernel().node_manager.get_node_or_proxy( node_id ) ) == 0 )
+  {
+    throw BadProperty( "Only recording devices have recorded events." );
+  }
+
+  DictionaryDatum events( new Dictionary );
+  for ( Node* node : kernel().node_manager.get_thread_siblings( node_id ) )
+  {
+    static_cast< RecordingDevice* >( node )->get_new_events( events, drain );
+  }
+
+  return events;
+}
+
 void
 set_connection_status( const ConnectionDatum& conn, const DictionaryDatum& dict )
 {
@@ -182,6 +224,28 @@ get_nodes( const DictionaryDatum& params, const bool local_only )
   return kernel().node_manager.get_nodes( params, local_only );
 }
 
+IntVectorDatum
+node_collection_to_vector( const NodeCollectionDatum& nc )
+{
+  IntVectorDatum node_ids( new std::vector< long >() );
+  node_ids->reserve( nc->size() );
+  for ( auto it = nc->begin(); it < nc->end(); ++it )
+  {
+    node_ids->push_back( ( *it ).node_id );
+  }
+  return node_ids;
+}
+
+NodeCollectionDatum
+slice_node_collection( const NodeCollectionDatum& nc, const size_t start, const size_t stop, const size_t step )
+{
+  if ( step < 1 )
+  {
+    throw BadParameter( "Slicing step must be strictly positive." );
+  }
+  return nc->slice( start, stop, step );
+}
+
 void
 connect( NodeCollectionPTR sources,
   NodeCollectionPTR targets,
@@ -324,6 +388,189 @@ get_connections( const DictionaryDatum& dict )
   return array;
 }
 
+IntVectorDatum
+get_connections_arrays( const DictionaryDatum& dict )
+{
+  dict->clear_access_flags();
+
+  std::deque< ConnectionID > connectome;
+  kernel().connection_manager.get_connections( connectome, dict );
+
+  ALL_ENTRIES_ACCESSED( *dict, "GetConnections", "Unread dictionary entries: " );
+
+  const size_t n = connectome.size();
+  IntVectorDatum conns( new std::vector< long >( 5 * n ) );
+  std::vector< long >& c = *conns;
+  for ( size_t i = 0; i < n; ++i )
+  {
+    const ConnectionID& conn = connectome[ i ];
+    c[ i ] = conn.get_source_node_id();
+    c[ n + i ] = conn.get_target_node_id();
+    c[ 2 * n + i ] = conn.get_target_thread();
+    c[ 3 * n + i ] = conn.get_synapse_model_id();
+    c[ 4 * n + i ] = conn.get_port();
+  }
+  return conns;
+}
+
+DictionaryDatum
+get_connection_status_arrays( const long* conns, size_t n, const std::vector< std::string >& keys )
+{
+  const std::vector< Name > names( keys.begin(), keys.end() );
+  return kernel().connection_manager.get_synapse_status( conns, n, names );
+}
+
+void
+set_connection_status_arrays( const long* conns,
+  size_t n,
+  const DictionaryDatum& params,
+  const std::vector< std::string >& double_keys,
+  const double* double_values,
+  const std::vector< std::string >& int_keys,
+  const long* int_values )
+{
+  if ( n == 0 or kernel().connection_manager.get_num_connections() == 0 )
+  {
+    return;
+  }
+
+  const long* sources = conns;
+  const long* targets = conns + n;
+  const long* threads = conns + 2 * n;
+  const long* syn_ids = conns + 3 * n;
+  const long* ports = conns + 4 * n;
+
+  const std::vector< Name > double_names( double_keys.begin(), double_keys.end() );
+  const std::vector< Name > int_names( int_keys.begin(), int_keys.end() );
+
+  // One dictionary per thread with one datum per array, created here as datums must not be allocated
+  // and the shared entries of params must not be copied concurrently. The threads only change the
+  // values of the datums.
+  const thread num_threads = kernel().vp_manager.get_num_threads();
+  std::vector< DictionaryDatum > param_dicts;
+  std::vector< std::vector< DoubleDatum* > > double_datums( num_threads );
+  std::vector< std::vector< IntegerDatum* > > int_datums( num_threads );
+  param_dicts.reserve( num_threads );
+  for ( thread tid = 0; tid < num_threads; ++tid )
+  {
+    param_dicts.push_back( DictionaryDatum( new Dictionary( *params ) ) );
+    for ( const Name& name : double_names )
+    {
+      double_datums[ tid ].push_back( new DoubleDatum( 0.0 ) );
+      ( *param_dicts[ tid ] )[ name ] = double_datums[ tid ].back();
+    }
+    for ( const Name& name : int_names )
+    {
+      int_datums[ tid ].push_back( new IntegerDatum( 0 ) );
+      ( *param_dicts[ tid ] )[ name ] = int_datums[ tid ].back();
+    }
+    param_dicts[ tid ]->clear_access_flags();
+  }
+
+  // Group the connections by thread, so that each thread only visits its own.
+  std::vector< std::vector< size_t > > thread_connections( num_threads );
+  for ( size_t i = 0; i < n; ++i )
+  {
+    if ( threads[ i ] < 0 or threads[ i ] >= num_threads )
+    {
+      throw UnknownThread( threads[ i ] );
+    }
+    thread_connections[ threads[ i ] ].push_back( i );
+  }
+
+  // Vector for storing exceptions raised by threads.
+  std::vector< std::shared_ptr< WrappedThreadException > > exceptions_raised( num_threads );
+#pragma omp parallel
+  {
+    const thread tid = kernel().vp_manager.get_thread_id();
+    DictionaryDatum& dict = param_dicts[ tid ];
+    try
+    {
+      for ( const size_t i : thread_connections[ tid ] )
+      {
+        // change values of dictionary entries without allocating new datums
+        for ( size_t k = 0; k < double_names.size(); ++k )
+        {
+          *double_datums[ tid ][ k ] = double_values[ k * n + i ];
+        }
+        for ( size_t k = 0; k < int_names.size(); ++k )
+        {
+          *int_datums[ tid ][ k ] = int_values[ k * n + i ];
+        }
+
+        kernel().connection_manager.set_synapse_status(
+          sources[ i ], targets[ i ], tid, syn_ids[ i ], ports[ i ], dict );
+      }
+    }
+    catch ( std::exception& err )
+    {
+      // We must create a new exception here, err's lifetime ends at the end of the catch block.
+      exceptions_raised.at( tid ) = std::shared_ptr< WrappedThreadException >( new WrappedThreadException( err ) );
+    }
+  }
+  // check if any exceptions have been raised
+  for ( thread tid = 0; tid < num_threads; ++tid )
+  {
+    if ( exceptions_raised.at( tid ).get() )
+    {
+      throw WrappedThreadException( *( exceptions_raised.at( tid ) ) );
+    }
+  }
+
+  // The keys are checked once per thread instead of once per connection.
+  for ( thread tid = 0; tid < num_threads; ++tid )
+  {
+    if ( not thread_connections[ tid ].empty() )
+    {
+      ALL_ENTRIES_ACCESSED2( *param_dicts[ tid ],
+        "SetStatus",
+        "Unread dictionary entries: ",
+        "Maybe you tried to set common synapse properties through an individual "
+        "synapse?" );
+    }
+  }
+}
+
+DictionaryDatum
+gather_arrays( const DictionaryDatum& arrays )
+{
+  // Exchange the arrays in the same order on all processes, independent of the order in which names were created
+  std::vector< std::string > keys;
+  for ( auto& entry : *arrays )
+  {
+    keys.push_back( entry.first.toString() );
+  }
+  std::sort( keys.begin(), keys.end() );
+
+  DictionaryDatum gathered( new Dictionary );
+  std::vector< int > displacements;
+  for ( auto& key : keys )
+  {
+    Datum* datum = arrays->lookup( key ).datum();
+    if ( IntVectorDatum* int_vector = dynamic_cast< IntVectorDatum* >( datum ) )
+    {
+      // Copy the local data, as the exchange may swap it into the result without MPI
+      std::vector< long > send_buffer( **int_vector );
+      IntVectorDatum recv_buffer( new std::vector< long >() );
+      kernel().mpi_manager.communicate( send_buffer, *recv_buffer, displacements );
+      def< IntVectorDatum >( gathered, key, recv_buffer );
+    }
+    else if ( DoubleVectorDatum* double_vector = dynamic_cast< DoubleVectorDatum* >( datum ) )
+    {
+      std::vector< double > send_buffer( **double_vector );
+      DoubleVectorDatum recv_buffer( new std::vector< double >() );
+      kernel().mpi_manager.communicate( send_buffer, *recv_buffer, displacements );
+      def< DoubleVectorDatum >( gathered, key, recv_buffer );
+    }
+    else
+    {
+      throw BadProperty( "Only arrays of integers or doubles can be gathered, but " + key + " is of type "
+        + datum->gettypename().toString() + "." );
+    }
+  }
+  return gathered;
+}
+
 void
 simulate( const double& t )
 {
@@ -512,7 +759,9 @@ double
 get_value( const ParameterDatum& param )
 {
   librandom::RngPtr rng = get_global_rng();
-  return param->value( rng, nullptr );
+  std::vector< double > result;
+  param->values( rng, ParameterBlock( 1 ), result );
+  return result[ 0 ];
 }
 
 bool
@@ -524,14 +773,16 @@ is_spatial( const ParameterDatum& param )
 std::vector< double >
 apply( const ParameterDatum& param, const NodeCollectionDatum& nc )
 {
-  std::vector< double > result;
-  result.reserve( nc->size() );
-  librandom::RngPtr rng = get_global_rng();
+  std::vector< Node* > nodes;
+  nodes.reserve( nc->size() );
   for ( auto it = nc->begin(); it < nc->end(); ++it )
   {
-    auto node = kernel().node_manager.get_node_or_proxy( ( *it ).node_id );
-    result.push_back( param->value( rng, node ) );
+    nodes.push_back( kernel().node_manager.get_node_or_proxy( ( *it ).node_id ) );
   }
+
+  std::vector< double > result;
+  librandom::RngPtr rng = get_global_rng();
+  param->values( rng, ParameterBlock( nodes ), result );
   return result;
 }
 
@@ -546,4 +797,31 @@ apply( const ParameterDatum& param, const DictionaryDatum& positions )
   return param->apply( source_nc, target_tkns );
 }
 
+std::vector< double >
+evaluate( const ParameterDatum& param,
+  const NodeCollectionDatum& source,
+  const std::vector< double >& positions,
+  const long dim )
+{
+  if ( dim < 1 )
+  {
+    throw BadParameterValue( "Number of dimensions must be positive." );
+  }
+  return param->apply( source, positions, dim );
+}
+
+std::vector< double >
+sample( const ParameterDatum& param, const long n )
+{
+  if ( n < 0 )
+  {
+    throw BadParameterValue( "Number of values to sample must not be negative." );
+  }
+
+  std::vector< double > result;
+  librandom::RngPtr rng = get_global_rng();
+  param->values( rng, ParameterBlock( n ), result );
+  return result;
+}
+
 } // namespace nest
@@ -105,6 +105,39 @@ DictionaryDatum get_kernel_status();
 void set_node_status( const index node_id, const DictionaryDatum& dict );
 DictionaryDatum get_node_status( const index node_id );
 
+/**
+ * @brief Get parameters of all nodes in a NodeCollection at once
+ *
+ * Returns a dictionary with one vector of values per key, holding the
+ * values of all nodes in the order of the collection.
+ */
+DictionaryDatum get_node_status_arrays( const NodeCollectionDatum& nc, const std::vector< std::string >& keys );
+
+/**
+ * @brief Set parameters of all nodes in a NodeCollection at once
+ *
+ * The entries of params are set on all nodes. double_values and
+ * int_values hold one row of nc->size() values for each of double_keys
+ * and int_keys, respectively, giving the value of that parameter for
+ * each node.
+ */
+void set_node_status_arrays( const NodeCollectionDatum& nc,
+  const DictionaryDatum& params,
+  const std::vector< std::string >& double_keys,
+  const double* double_values,
+  const std::vector< std::string >& int_keys,
+  const long* int_values );
+
+/**
+ * @brief Get the events recorded by a recording device since the last call
+ *
+ * Returns the events of all thread-local instances of the device that
+ * were recorded since the last call to this function, in the format of
+ * the events dictionary of the device's recording backend. If drain is
+ * true, the returned events are removed from the backend.
+ */
+DictionaryDatum get_new_events( const index node_id, const bool drain );
+
 void set_connection_status( const ConnectionDatum& conn, const DictionaryDatum& dict );
 DictionaryDatum get_connection_status( const ConnectionDatum& conn );
 
@@ -112,6 +145,25 @@ NodeCollectionPTR create( const Name& model_name, const index n );
 
 NodeCollectionPTR get_nodes( const DictionaryDatum& dict, const bool local_only );
 
+/**
+ * @brief Get the node IDs of a NodeCollection as a vector
+ *
+ * The NodeCollection is traversed with its const iterator, so the cost is
+ * linear in the number of nodes regardless of the structure of the collection.
+ */
+IntVectorDatum node_collection_to_vector( const NodeCollectionDatum& nc );
+
+/**
+ * @brief Slice a NodeCollection
+ *
+ * start and stop are zero-based, stop is exclusive. The metadata of the
+ * NodeCollection is retained in the slice.
+ */
+NodeCollectionDatum slice_node_collection( const NodeCollectionDatum& nc,
+  const size_t start,
+  const size_t stop,
+  const size_t step );
+
 void connect( NodeCollectionPTR sources,
   NodeCollectionPTR targets,
   const DictionaryDatum& connectivity,
@@ -144,6 +196,58 @@ void connect_arrays( long* sources,
 
 ArrayDatum get_connections( const DictionaryDatum& dict );
 
+/**
+ * @brief Get connections as arrays of connection IDs
+ *
+ * Selects connections like get_connections(), but instead of one
+ * ConnectionDatum per connection returns a single vector of length 5*n
+ * for n connections. It holds n source node IDs, followed by n target
+ * node IDs, n target threads, n synapse model IDs and n ports.
+ */
+IntVectorDatum get_connections_arrays( const DictionaryDatum& dict );
+
+/**
+ * @brief Get parameters of many connections at once
+ *
+ * conns holds the IDs of n connections column-wise, as returned by
+ * get_connections_arrays(). Returns a dictionary with one vector of n
+ * values per key, read directly from the connection storage. If keys is
+ * empty, all parameters are returned. The dictionary is empty if there
+ * are no connections in the network.
+ */
+DictionaryDatum get_connection_status_arrays( const long* conns, size_t n, const std::vector< std::string >& keys );
+
+/**
+ * @brief Set parameters of many connections at once
+ *
+ * conns holds the IDs of n connections column-wise, as returned by
+ * get_connections_arrays(). The entries of params are set on all
+ * connections. double_values and int_values hold one row of n values for
+ * each of double_keys and int_keys, respectively, giving the value of
+ * that parameter for each connection. Connections are updated by the
+ * thread they belong to, and unread entries are reported once per call.
+ * Nothing is done if there are no connections in the network.
+ */
+void set_connection_status_arrays( const long* conns,
+  size_t n,
+  const DictionaryDatum& params,
+  const std::vector< std::string >& double_keys,
+  const double* double_values,
+  const std::vector< std::string >& int_keys,
+  const long* int_values );
+
+/**
+ * @brief Gather arrays from all MPI processes
+ *
+ * arrays holds one IntVectorDatum or DoubleVectorDatum per key. Returns
+ * a dictionary with the same keys, in which each vector is the
+ * concatenation of the vectors of all processes in the order of their
+ * rank. Each vector is exchanged with a single Allgatherv, so the result
+ * is available on all processes. All processes must call this function
+ * with the same keys.
+ */
+DictionaryDatum gather_arrays( const DictionaryDatum& arrays );
+
 void simulate( const double& t );
 
 /**
@@ -216,6 +320,22 @@ double get_value( const ParameterDatum& param );
 bool is_spatial( const ParameterDatum& param );
 std::vector< double > apply( const ParameterDatum& param, const NodeCollectionDatum& nc );
 std::vector< double > apply( const ParameterDatum& param, const DictionaryDatum& positions );
+
+/**
+ * Evaluate a spatial parameter for connections from a single source node
+ * to many target positions in one block. The target positions are stored
+ * consecutively in a vector, with dim entries per position. dim must equal
+ * the number of dimensions of the layer of the source node.
+ */
+std::vector< double > evaluate( const ParameterDatum& param,
+  const NodeCollectionDatum& source,
+  const std::vector< double >& positions,
+  const long dim );
+
+/**
+ * Draw n values from a parameter in one block.
+ */
+std::vector< double > sample( const ParameterDatum& param, const long n );
 }
 
 
@@ -67,15 +67,21 @@ const Name asc_init( "asc_init" );
 const Name asc_r( "asc_r" );
 const Name ASCurrents( "ASCurrents" );
 const Name ASCurrents_sum( "ASCurrents_sum" );
+const Name async_write( "async_write" );
 const Name available( "available" );
 
 const Name b( "b" );
 const Name beta( "beta" );
 const Name beta_Ca( "beta_Ca" );
+const Name bin_means( "bin_means" );
+const Name bin_width( "bin_width" );
+const Name block_size( "block_size" );
+const Name blocks_written( "blocks_written" );
 const Name buffer_size( "buffer_size" );
 const Name buffer_size_secondary_events( "buffer_size_secondary_events" );
 const Name buffer_size_spike_data( "buffer_size_spike_data" );
 const Name buffer_size_target_data( "buffer_size_target_data" );
+const Name bytes_written( "bytes_written" );
 
 const Name c( "c" );
 const Name c_1( "c_1" );
@@ -86,8 +92,11 @@ const Name Ca( "Ca" );
 const Name calibrate( "calibrate" );
 const Name calibrate_node( "calibrate_node" );
 const Name capacity( "capacity" );
+const Name chunk_size( "chunk_size" );
 const Name clear( "clear" );
 const Name comparator( "comparator" );
+const Name compression( "compression" );
+const Name compression_level( "compression_level" );
 const Name configbit_0( "configbit_0" );
 const Name configbit_1( "configbit_1" );
 const Name connection_count( "connection_count" );
@@ -95,6 +104,7 @@ const Name consistent_integration( "consistent_integration" );
 const Name continuous( "continuous" );
 const Name count_covariance( "count_covariance" );
 const Name count_histogram( "count_histogram" );
+const Name counts( "counts" );
 const Name covariance( "covariance" );
 const Name currents( "currents" );
 
@@ -258,7 +268,10 @@ const Name max_buffer_size_spike_data( "max_buffer_size_spike_data" );
 const Name max_buffer_size_target_data( "max_buffer_size_target_data" );
 const Name max_num_syn_models( "max_num_syn_models" );
 const Name max_delay( "max_delay" );
+const Name max_events( "max_events" );
+const Name max_pending_blocks( "max_pending_blocks" );
 const Name mean( "mean" );
+const Name means( "means" );
 const Name memory( "memory" );
 const Name message_times( "messages_times" );
 const Name messages( "messages" );
@@ -307,6 +320,7 @@ const Name p( "p" );
 const Name P( "P" );
 const Name p_copy( "p_copy" );
 const Name p_transmit( "p_transmit" );
+const Name peak_pending_blocks( "peak_pending_blocks" );
 const Name phase( "phase" );
 const Name port( "port" );
 const Name port_name( "port_name" );
@@ -376,6 +390,8 @@ const Name spike_dependent_threshold( "spike_dependent_threshold" );
 const Name spike_multiplicities( "spike_multiplicities" );
 const Name spike_times( "spike_times" );
 const Name spike_weights( "spike_weights" );
+const Name stall_time( "stall_time" );
+const Name stalls( "stalls" );
 const Name start( "start" );
 const Name state( "state" );
 const Name std( "std" );
@@ -480,6 +496,7 @@ const Name time( "time" );
 const Name time_collocate( "time_collocate" );
 const Name time_communicate( "time_communicate" );
 const Name time_in_steps( "time_in_steps" );
+const Name time_sorted( "time_sorted" );
 const Name times( "times" );
 const Name to_do( "to_do" );
 const Name total_num_virtual_procs( "total_num_virtual_procs" );
@@ -515,6 +532,7 @@ const Name V_th_max( "V_th_max" );
 const Name V_th_rest( "V_th_rest" );
 const Name V_th_v( "V_th_v" );
 const Name val_eta( "val_eta" );
+const Name variances( "variances" );
 const Name voltage_clamp( "voltage_clamp" );
 const Name voltage_reset_add( "voltage_reset_add" );
 const Name voltage_reset_fraction( "voltage_reset_fraction" );
@@ -532,6 +550,7 @@ const Name wfr_comm_interval( "wfr_comm_interval" );
 const Name wfr_interpolation_order( "wfr_interpolation_order" );
 const Name wfr_max_iterations( "wfr_max_iterations" );
 const Name wfr_tol( "wfr_tol" );
+const Name window_ms( "window_ms" );
 const Name with_reset( "with_reset" );
 const Name Wmax( "Wmax" );
 const Name Wmin( "Wmin" );
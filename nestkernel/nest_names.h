@@ -88,15 +88,21 @@ extern const Name asc_init;
 extern const Name asc_r;
 extern const Name ASCurrents;
 extern const Name ASCurrents_sum;
+extern const Name async_write;
 extern const Name available;
 
 extern const Name b;
 extern const Name beta;
 extern const Name beta_Ca;
+extern const Name bin_means;
+extern const Name bin_width;
+extern const Name block_size;
+extern const Name blocks_written;
 extern const Name buffer_size;
 extern const Name buffer_size_secondary_events;
 extern const Name buffer_size_spike_data;
 extern const Name buffer_size_target_data;
+extern const Name bytes_written;
 
 extern const Name c;
 extern const Name c_1;
@@ -107,8 +113,11 @@ extern const Name Ca;
 extern const Name calibrate;
 extern const Name calibrate_node;
 extern const Name capacity;
+extern const Name chunk_size;
 extern const Name clear;
 extern const Name comparator;
+extern const Name compression;
+extern const Name compression_level;
 extern const Name configbit_0;
 extern const Name configbit_1;
 extern const Name connection_count;
@@ -116,6 +125,7 @@ extern const Name consistent_integration;
 extern const Name continuous;
 extern const Name count_covariance;
 extern const Name count_histogram;
+extern const Name counts;
 extern const Name covariance;
 extern const Name currents;
 
@@ -279,7 +289,10 @@ extern const Name max_buffer_size_spike_data;
 extern const Name max_buffer_size_target_data;
 extern const Name max_num_syn_models;
 extern const Name max_delay;
+extern const Name max_events;
+extern const Name max_pending_blocks;
 extern const Name mean;
+extern const Name means;
 extern const Name memory;
 extern const Name message_times;
 extern const Name messages;
@@ -328,6 +341,7 @@ extern const Name p;
 extern const Name P;
 extern const Name p_copy;
 extern const Name p_transmit;
+extern const Name peak_pending_blocks;
 extern const Name phase;
 extern const Name port;
 extern const Name port_name;
@@ -397,6 +411,8 @@ extern const Name spike_dependent_threshold;
 extern const Name spike_multiplicities;
 extern const Name spike_times;
 extern const Name spike_weights;
+extern const Name stall_time;
+extern const Name stalls;
 extern const Name start;
 extern const Name state;
 extern const Name std;
@@ -501,6 +517,7 @@ extern const Name time;
 extern const Name time_collocate;
 extern const Name time_communicate;
 extern const Name time_in_steps;
+extern const Name time_sorted;
 extern const Name times;
 extern const Name to_do;
 extern const Name total_num_virtual_procs;
@@ -536,6 +553,7 @@ extern const Name V_th_max;
 extern const Name V_th_rest;
 extern const Name V_th_v;
 extern const Name val_eta;
+extern const Name variances;
 extern const Name voltage_clamp;
 extern const Name voltage_reset_add;
 extern const Name voltage_reset_fraction;
@@ -553,6 +571,7 @@ extern const Name wfr_comm_interval;
 extern const Name wfr_interpolation_order;
 extern const Name wfr_max_iterations;
 extern const Name wfr_tol;
+extern const Name window_ms;
 extern const Name with_reset;
 extern const Name Wmax;
 extern const Name Wmin;
@@ -1906,6 +1906,71 @@ NestModule::Apply_P_gFunction::execute( SLIInterpreter* i ) const
   i->EStack.pop();
 }
 
+/** @BeginDocumentation
+  Name: Evaluate - evaluate a parameter at many positions
+
+  Synopsis:
+  param source positions dim Evaluate -> values
+
+  Description:
+  Evaluates the parameter for the node in source at all target positions
+  in one call. The positions are given as one flat vector with the
+  coordinates of one position after the other, each position having
+  dim coordinates. dim must be the number of dimensions of the layer
+  of source.
+
+  Parameters:
+  param     - parameter to evaluate
+  source    - NodeCollection containing a single node of a spatial layer
+  positions - doublevector with the flattened target positions
+  dim       - number of dimensions of each position
+
+  SeeAlso: Apply, Sample
+*/
+void
+NestModule::Evaluate_P_g_dv_iFunction::execute( SLIInterpreter* i ) const
+{
+  i->assert_stack_load( 4 );
+
+  const long dim = getValue< long >( i->OStack.pick( 0 ) );
+  auto positions = getValue< std::vector< double > >( i->OStack.pick( 1 ) );
+  NodeCollectionDatum nc = getValue< NodeCollectionDatum >( i->OStack.pick( 2 ) );
+  ParameterDatum param = getValue< ParameterDatum >( i->OStack.pick( 3 ) );
+
+  auto result = evaluate( param, nc, positions, dim );
+
+  i->OStack.pop( 4 );
+  i->OStack.push( new DoubleVectorDatum( new std::vector< double >( std::move( result ) ) ) );
+  i->EStack.pop();
+}
+
+/** @BeginDocumentation
+  Name: Sample - draw many values from a parameter
+
+  Synopsis:
+  param n Sample -> values
+
+  Description:
+  Returns a doublevector with n values of the parameter, drawn in one
+  call. The parameter must not depend on node positions.
+
+  SeeAlso: GetValue, Evaluate
+*/
+void
+NestModule::Sample_P_iFunction::execute( SLIInterpreter* i ) const
+{
+  i->assert_stack_load( 2 );
+
+  const long n = getValue< long >( i->OStack.pick( 0 ) );
+  ParameterDatum param = getValue< ParameterDatum >( i->OStack.pick( 1 ) );
+
+  auto result = sample( param, n );
+
+  i->OStack.pop( 2 );
+  i->OStack.push( new DoubleVectorDatum( new std::vector< double >( std::move( result ) ) ) );
+  i->EStack.pop();
+}
+
 void
 NestModule::init( SLIInterpreter* i )
 {
@@ -1977,6 +2042,8 @@ NestModule::init( SLIInterpreter* i )
   i->createcommand( "IsSpatial_P", &isspatial_Pfunction );
   i->createcommand( "Apply_P_D", &apply_P_Dfunction );
   i->createcommand( "Apply_P_g", &apply_P_gfunction );
+  i->createcommand( "Evaluate_P_g_dv_i", &evaluate_P_g_dv_ifunction );
+  i->createcommand( "Sample_P_i", &sample_P_ifunction );
 
   i->createcommand( "Connect_g_g_D_D", &connect_g_g_D_Dfunction );
 
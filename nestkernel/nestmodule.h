@@ -626,6 +626,18 @@ public:
     void execute( SLIInterpreter* ) const;
   } apply_P_gfunction;
 
+  class Evaluate_P_g_dv_iFunction : public SLIFunction
+  {
+  public:
+    void execute( SLIInterpreter* ) const;
+  } evaluate_P_g_dv_ifunction;
+
+  class Sample_P_iFunction : public SLIFunction
+  {
+  public:
+    void execute( SLIInterpreter* ) const;
+  } sample_P_ifunction;
+
 private:
   static ParameterFactory& parameter_factory_();
 
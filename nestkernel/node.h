@@ -365,6 +365,20 @@ public:
    */
   virtual void get_status( DictionaryDatum& ) const = 0;
 
+  /**
+   * Export the value of a single numeric property of the node without
+   * building a status dictionary. Return false if the property cannot be
+   * read this way, in which case it has to be taken from get_status().
+   * The default implementation provides no properties. Models with a
+   * RecordablesMap provide their recordables.
+   * @ingroup status_interface
+   */
+  virtual bool
+  get_value( const Name&, double& ) const
+  {
+    return false;
+  }
+
 public:
   /**
    * @defgroup event_interface Communication.
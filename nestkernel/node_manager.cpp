@@ -23,6 +23,8 @@
 #include "node_manager.h"
 
 // C++ includes:
+#include <algorithm>
+#include <map>
 #include <set>
 
 // Includes from libnestutil:
@@ -41,6 +43,8 @@
 
 // Includes from sli:
 #include "dictutils.h"
+#include "doubledatum.h"
+#include "integerdatum.h"
 
 namespace nest
 {
@@ -91,6 +95,172 @@ NodeManager::get_status( index idx )
   return d;
 }
 
+DictionaryDatum
+NodeManager::get_status( NodeCollectionPTR nc, const std::vector< Name >& requested_keys )
+{
+  const size_t n = nc->size();
+
+  // Each key gets a single column, even if it is requested more than once
+  std::vector< Name > keys;
+  for ( const Name& key : requested_keys )
+  {
+    if ( std::find( keys.begin(), keys.end(), key ) == keys.end() )
+    {
+      keys.push_back( key );
+    }
+  }
+
+  // Status of the first node of each model in nc, used to determine the
+  // type of the columns
+  std::map< index, DictionaryDatum > samples;
+  for ( auto it = nc->begin(); it < nc->end(); ++it )
+  {
+    const NodeIDTriple node_triple = *it;
+    if ( samples.find( node_triple.model_id ) == samples.end() )
+    {
+      Node* node = get_mpi_local_node_or_device_head( node_triple.node_id );
+      assert( node != 0 );
+      samples[ node_triple.model_id ] = node->get_status_base();
+    }
+  }
+
+  DictionaryDatum result( new Dictionary );
+
+  // One output column per key. It holds integers if the key has an integer
+  // value for all models, doubles if it has a numeric value for all models
+  // and tokens otherwise.
+  std::vector< std::vector< long >* > int_columns( keys.size(), nullptr );
+  std::vector< std::vector< double >* > double_columns( keys.size(), nullptr );
+  std::vector< ArrayDatum* > token_columns( keys.size(), nullptr );
+  for ( size_t k = 0; k < keys.size(); ++k )
+  {
+    bool is_integer = true;
+    bool is_numeric = true;
+    for ( const auto& sample : samples )
+    {
+      const Token& value = sample.second->lookup2( keys[ k ] );
+      if ( not dynamic_cast< IntegerDatum* >( value.datum() ) )
+      {
+        is_integer = false;
+        is_numeric = is_numeric and dynamic_cast< DoubleDatum* >( value.datum() );
+      }
+    }
+
+    if ( is_integer )
+    {
+      int_columns[ k ] = new std::vector< long >( n );
+      ( *result )[ keys[ k ] ] = new IntVectorDatum( int_columns[ k ] );
+    }
+    else if ( is_numeric )
+    {
+      double_columns[ k ] = new std::vector< double >( n );
+      ( *result )[ keys[ k ] ] = new DoubleVectorDatum( double_columns[ k ] );
+    }
+    else
+    {
+      token_columns[ k ] = new ArrayDatum();
+      token_columns[ k ]->reserve( n );
+      ( *result )[ keys[ k ] ] = token_columns[ k ];
+    }
+  }
+
+  // The status dictionary is only built for nodes with values that cannot be
+  // read directly
+  DictionaryDatum dict;
+  size_t i = 0;
+  for ( auto it = nc->begin(); it < nc->end(); ++it, ++i )
+  {
+    const index node_id = ( *it ).node_id;
+    Node* node = get_mpi_local_node_or_device_head( node_id );
+    assert( node != 0 );
+    bool has_dict = false;
+
+    for ( size_t k = 0; k < keys.size(); ++k )
+    {
+      const Name& key = keys[ k ];
+      if ( token_columns[ k ] )
+      {
+        if ( key == names::model )
+        {
+          token_columns[ k ]->push_back( new LiteralDatum( node->get_name() ) );
+          continue;
+        }
+        if ( key == names::local )
+        {
+          token_columns[ k ]->push_back( Token( is_local_node( node ) ) );
+          continue;
+        }
+        if ( key == names::frozen and not node->is_proxy() )
+        {
+          token_columns[ k ]->push_back( Token( node->is_frozen() ) );
+          continue;
+        }
+      }
+      else
+      {
+        double value;
+        bool is_direct = true;
+        if ( key == names::global_id )
+        {
+          value = node_id;
+        }
+        else if ( key == names::vp )
+        {
+          value = node->get_vp();
+        }
+        else if ( key == names::thread and not node->is_proxy() )
+        {
+          value = node->get_thread();
+        }
+        else if ( key == names::thread_local_id and not node->is_proxy() )
+        {
+          value = node->get_thread_lid();
+        }
+        else
+        {
+          is_direct = not node->is_proxy() and node->get_value( key, value );
+        }
+
+        if ( is_direct )
+        {
+          if ( int_columns[ k ] )
+          {
+            ( *int_columns[ k ] )[ i ] = static_cast< long >( value );
+          }
+          else
+          {
+            ( *double_columns[ k ] )[ i ] = value;
+          }
+          continue;
+        }
+      }
+
+      if ( not has_dict )
+      {
+        dict = node->get_status_base();
+        has_dict = true;
+      }
+
+      const Token& value = dict->lookup2( key );
+      if ( int_columns[ k ] )
+      {
+        ( *int_columns[ k ] )[ i ] = getValue< long >( value );
+      }
+      else if ( double_columns[ k ] )
+      {
+        const IntegerDatum* int_value = dynamic_cast< IntegerDatum* >( value.datum() );
+        ( *double_columns[ k ] )[ i ] = int_value ? int_value->get() : getValue< double >( value );
+      }
+      else
+      {
+        token_columns[ k ]->push_back( value );
+      }
+    }
+  }
+
+  return result;
+}
+
 NodeCollectionPTR
 NodeManager::add_node( index model_id, long n )
 {
@@ -796,6 +966,213 @@ NodeManager::set_status( index node_id, const DictionaryDatum& d )
   }
 }
 
+void
+NodeManager::set_status( NodeCollectionPTR nc,
+  const DictionaryDatum& params,
+  const std::vector< Name >& double_keys,
+  const double* double_values,
+  const std::vector< Name >& int_keys,
+  const long* int_values )
+{
+  const size_t n = nc->size();
+  const thread num_threads = kernel().vp_manager.get_num_threads();
+
+  // The local nodes of nc on each thread, with their position in nc. Neurons
+  // live on the thread of their virtual process, nodes without proxies, such
+  // as devices, have an instance on every thread. The status of the latter
+  // is set serially, as devices register with other kernel managers when
+  // their status changes. So is the status of the first neuron of each
+  // model, which creates all Names the model needs for these parameters, as
+  // Names must not be created in a parallel region.
+  std::vector< std::vector< std::pair< Node*, size_t > > > thread_nodes( num_threads );
+  std::vector< std::vector< std::pair< Node*, size_t > > > serial_nodes( num_threads );
+
+  // One dictionary per thread and model with one datum per array, created
+  // here as datums must not be allocated and the shared entries of params
+  // must not be copied concurrently. The threads only change the values of
+  // the datums. The keys are checked against the first local node of each
+  // model before any node is changed.
+  std::map< index, bool > model_has_proxies;
+  std::map< index, DictionaryDatum > model_dicts;
+  std::vector< std::map< index, DictionaryDatum > > param_dicts( num_threads );
+  std::vector< std::map< index, std::vector< DoubleDatum* > > > double_datums( num_threads );
+  std::vector< std::map< index, std::vector< IntegerDatum* > > > int_datums( num_threads );
+
+  size_t i = 0;
+  for ( auto it = nc->begin(); it < nc->end(); ++it, ++i )
+  {
+    const NodeIDTriple node_triple = *it;
+    auto model_it = model_has_proxies.find( node_triple.model_id );
+    if ( model_it == model_has_proxies.end() )
+    {
+      const bool has_proxies = kernel().model_manager.get_model( node_triple.model_id )->has_proxies();
+      model_it = model_has_proxies.insert( std::make_pair( node_triple.model_id, has_proxies ) ).first;
+    }
+    const bool has_proxies = model_it->second;
+
+    thread begin_tid = 0;
+    thread end_tid = num_threads;
+    if ( has_proxies )
+    {
+      const thread vp = kernel().vp_manager.node_id_to_vp( node_triple.node_id );
+      if ( not kernel().vp_manager.is_local_vp( vp ) )
+      {
+        continue;
+      }
+      begin_tid = kernel().vp_manager.vp_to_thread( vp );
+      end_tid = begin_tid + 1;
+    }
+
+    for ( thread tid = begin_tid; tid < end_tid; ++tid )
+    {
+      Node* node = local_nodes_[ tid ].get_node_by_node_id( node_triple.node_id );
+      if ( node == 0 or node->is_proxy() )
+      {
+        continue;
+      }
+
+      bool is_serial = not has_proxies;
+      if ( param_dicts[ tid ].find( node_triple.model_id ) == param_dicts[ tid ].end() )
+      {
+        auto dict_it = model_dicts.find( node_triple.model_id );
+        if ( dict_it == model_dicts.end() )
+        {
+          DictionaryDatum dict( new Dictionary( *params ) );
+          for ( size_t k = 0; k < double_keys.size(); ++k )
+          {
+            ( *dict )[ double_keys[ k ] ] = double_values[ k * n + i ];
+          }
+          for ( size_t k = 0; k < int_keys.size(); ++k )
+          {
+            ( *dict )[ int_keys[ k ] ] = int_values[ k * n + i ];
+          }
+          check_status_keys_( *node, dict );
+          dict_it = model_dicts.insert( std::make_pair( node_triple.model_id, dict ) ).first;
+          is_serial = true;
+        }
+        DictionaryDatum dict( new Dictionary( *dict_it->second ) );
+        std::vector< DoubleDatum* >& model_double_datums = double_datums[ tid ][ node_triple.model_id ];
+        for ( const Name& key : double_keys )
+        {
+          model_double_datums.push_back( new DoubleDatum( 0.0 ) );
+          ( *dict )[ key ] = model_double_datums.back();
+        }
+        std::vector< IntegerDatum* >& model_int_datums = int_datums[ tid ][ node_triple.model_id ];
+        for ( const Name& key : int_keys )
+        {
+          model_int_datums.push_back( new IntegerDatum( 0 ) );
+          ( *dict )[ key ] = model_int_datums.back();
+        }
+        dict->clear_access_flags();
+        param_dicts[ tid ][ node_triple.model_id ] = dict;
+      }
+
+      ( is_serial ? serial_nodes : thread_nodes )[ tid ].push_back( std::make_pair( node, i ) );
+    }
+  }
+
+  for ( thread tid = 0; tid < num_threads; ++tid )
+  {
+    for ( const auto& node_position : serial_nodes[ tid ] )
+    {
+      const index model_id = node_position.first->get_model_id();
+      set_status_from_arrays_( *node_position.first,
+        param_dicts[ tid ][ model_id ],
+        node_position.second,
+        n,
+        double_datums[ tid ][ model_id ],
+        double_values,
+        int_datums[ tid ][ model_id ],
+        int_values );
+    }
+  }
+
+  std::vector< std::shared_ptr< WrappedThreadException > > exceptions_raised( num_threads );
+#pragma omp parallel
+  {
+    const thread tid = kernel().vp_manager.get_thread_id();
+    try
+    {
+      for ( const auto& node_position : thread_nodes[ tid ] )
+      {
+        const index model_id = node_position.first->get_model_id();
+        set_status_from_arrays_( *node_position.first,
+          param_dicts[ tid ][ model_id ],
+          node_position.second,
+          n,
+          double_datums[ tid ][ model_id ],
+          double_values,
+          int_datums[ tid ][ model_id ],
+          int_values );
+      }
+    }
+    catch ( std::exception& err )
+    {
+      // We must create a new exception here, err's lifetime ends at the end of the catch block.
+      exceptions_raised.at( tid ) = std::shared_ptr< WrappedThreadException >( new WrappedThreadException( err ) );
+    }
+  }
+  // check if any exceptions have been raised
+  for ( thread tid = 0; tid < num_threads; ++tid )
+  {
+    if ( exceptions_raised.at( tid ).get() )
+    {
+      throw WrappedThreadException( *( exceptions_raised.at( tid ) ) );
+    }
+  }
+
+  // Entries that the nodes report but do not read, such as read-only
+  // properties, are only found after setting the status.
+  for ( thread tid = 0; tid < num_threads; ++tid )
+  {
+    for ( auto& model_dict : param_dicts[ tid ] )
+    {
+      ALL_ENTRIES_ACCESSED( *model_dict.second, "NodeManager::set_status", "Unread dictionary entries: " );
+    }
+  }
+}
+
+void
+NodeManager::check_status_keys_( Node& node, const DictionaryDatum& d ) const
+{
+  const DictionaryDatum status = node.get_status_base();
+
+  // Unknown entries are collected in a separate dictionary, so that they are
+  // reported in the same way as entries the node did not read.
+  DictionaryDatum unknown( new Dictionary );
+  for ( auto& entry : *d )
+  {
+    if ( not status->known( entry.first ) )
+    {
+      ( *unknown )[ entry.first ] = entry.second;
+    }
+  }
+  unknown->clear_access_flags();
+  ALL_ENTRIES_ACCESSED( *unknown, "NodeManager::set_status", "Unread dictionary entries: " );
+}
+
+void
+NodeManager::set_status_from_arrays_( Node& node,
+  DictionaryDatum& d,
+  const size_t i,
+  const size_t n,
+  const std::vector< DoubleDatum* >& double_datums,
+  const double* double_values,
+  const std::vector< IntegerDatum* >& int_datums,
+  const long* int_values )
+{
+  // change values of dictionary entries without allocating new datums
+  for ( size_t k = 0; k < double_datums.size(); ++k )
+  {
+    *double_datums[ k ] = double_values[ k * n + i ];
+  }
+  for ( size_t k = 0; k < int_datums.size(); ++k )
+  {
+    *int_datums[ k ] = int_values[ k * n + i ];
+  }
+  node.set_status_base( d );
+}
+
 void
 NodeManager::get_status( DictionaryDatum& d )
 {
@@ -38,6 +38,8 @@
 // Includes from sli:
 #include "arraydatum.h"
 #include "dictdatum.h"
+#include "doubledatum.h"
+#include "integerdatum.h"
 
 namespace nest
 {
@@ -63,6 +65,22 @@ public:
    */
   DictionaryDatum get_status( index );
 
+  /**
+   * Get the values of the given keys for all nodes in a NodeCollection.
+   *
+   * Returns a dictionary with one entry per key, holding the values of all
+   * nodes in the order of the collection. Integer and double valued
+   * parameters are returned as IntVectorDatum and DoubleVectorDatum, all
+   * other parameters as ArrayDatum. The type of each key is determined
+   * from the first node of each model in the collection.
+   *
+   * The basic properties of the nodes and the properties a node provides
+   * through Node::get_value() are read directly, the status dictionary of
+   * a node is only built if any other key is requested.
+   * @throws UndefinedName  A node does not have one of the keys.
+   */
+  DictionaryDatum get_status( NodeCollectionPTR nc, const std::vector< Name >& keys );
+
   /**
    * Set properties of a Node. The specified node must exist.
    * @throws nest::UnknownNode Target does not exist in the network.
@@ -72,6 +90,27 @@ public:
    */
   void set_status( index, const DictionaryDatum& );
 
+  /**
+   * Set properties of all nodes in a NodeCollection.
+   *
+   * The entries of params are set on all nodes. double_values and
+   * int_values hold one row of values for each of double_keys and int_keys,
+   * respectively, giving the value for each node in the order of the
+   * collection. The values are written directly into one dictionary per
+   * thread and model, and unread entries are reported once per model
+   * instead of once per node. Keys that a model does not have are reported
+   * before any node is changed. Neurons are updated in parallel by the
+   * threads they live on.
+   * @throws nest::UnaccessedDictionaryEntry  Nodes of a model did not read
+   *                                          a dict entry.
+   */
+  void set_status( NodeCollectionPTR nc,
+    const DictionaryDatum& params,
+    const std::vector< Name >& double_keys,
+    const double* double_values,
+    const std::vector< Name >& int_keys,
+    const long* int_values );
+
   /**
    * Add a number of nodes to the network.
    * This function creates n Node objects of Model m and adds them
@@ -254,6 +293,26 @@ private:
    */
   void set_status_single_node_( Node&, const DictionaryDatum&, bool clear_flags = true );
 
+  /**
+   * Check that node has all entries of d in its status dictionary.
+   * @throws UnaccessedDictionaryEntry
+   */
+  void check_status_keys_( Node& node, const DictionaryDatum& d ) const;
+
+  /**
+   * Write the values of the node at position i of a collection of n nodes
+   * to the datums of d and set the status of node from d.
+   * @see set_status( NodeCollectionPTR, ... )
+   */
+  void set_status_from_arrays_( Node& node,
+    DictionaryDatum& d,
+    const size_t i,
+    const size_t n,
+    const std::vector< DoubleDatum* >& double_datums,
+    const double* double_values,
+    const std::vector< IntegerDatum* >& int_datums,
+    const long* int_values );
+
   /**
    * Initialized buffers, register in list of nodes to update/finalize.
    * @see prepare_nodes_()
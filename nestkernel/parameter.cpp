@@ -33,19 +33,91 @@ template class sharedPtrDatum< nest::Parameter, &nest::NestModule::ParameterType
 
 namespace nest
 {
+
+ParameterBlock::ParameterBlock( const std::vector< Node* >& nodes )
+  : size( nodes.size() )
+  , nodes( &nodes )
+  , source_pos( nullptr )
+  , target_pos( nullptr )
+  , layer( nullptr )
+  , num_dimensions( 0 )
+  , source_stride( 0 )
+  , target_stride( 0 )
+{
+}
+
+ParameterBlock::ParameterBlock( const size_t size )
+  : size( size )
+  , nodes( nullptr )
+  , source_pos( nullptr )
+  , target_pos( nullptr )
+  , layer( nullptr )
+  , num_dimensions( 0 )
+  , source_stride( 0 )
+  , target_stride( 0 )
+{
+}
+
+ParameterBlock::ParameterBlock( const size_t size,
+  const std::vector< double >& source_pos,
+  const std::vector< double >& target_pos,
+  const AbstractLayer& layer )
+  : size( size )
+  , nodes( nullptr )
+  , source_pos( &source_pos )
+  , target_pos( &target_pos )
+  , layer( &layer )
+  , num_dimensions( layer.get_num_dimensions() )
+  , source_stride( source_pos.size() == num_dimensions ? 0 : num_dimensions )
+  , target_stride( target_pos.size() == num_dimensions ? 0 : num_dimensions )
+{
+  assert( source_pos.size() == num_dimensions or source_pos.size() == size * num_dimensions );
+  assert( target_pos.size() == num_dimensions or target_pos.size() == size * num_dimensions );
+}
+
+void
+ParameterBlock::get_positions( const size_t i,
+  std::vector< double >& source_pos,
+  std::vector< double >& target_pos ) const
+{
+  const auto source_begin = this->source_pos->begin() + i * source_stride;
+  const auto target_begin = this->target_pos->begin() + i * target_stride;
+  source_pos.assign( source_begin, source_begin + num_dimensions );
+  target_pos.assign( target_begin, target_begin + num_dimensions );
+}
+
+void
+Parameter::values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const
+{
+  result.resize( block.size );
+  if ( not block.layer )
+  {
+    for ( size_t i = 0; i < block.size; ++i )
+    {
+      result[ i ] = value( rng, block.nodes ? ( *block.nodes )[ i ] : nullptr );
+    }
+  }
+  else
+  {
+    std::vector< double > source_pos;
+    std::vector< double > target_pos;
+    for ( size_t i = 0; i < block.size; ++i )
+    {
+      block.get_positions( i, source_pos, target_pos );
+      result[ i ] = value( rng, source_pos, target_pos, *block.layer );
+    }
+  }
+}
+
 Node*
 Parameter::node_id_to_node_ptr_( const index node_id, const thread t ) const
 {
   return kernel().node_manager.get_node_or_proxy( node_id, t );
 }
 
-std::vector< double >
-Parameter::apply( const NodeCollectionPTR& nc, const TokenArray& token_array ) const
+AbstractLayerPTR
+Parameter::get_source_layer_( const NodeCollectionPTR& nc, std::vector< double >& source_pos ) const
 {
-  std::vector< double > result;
-  result.reserve( token_array.size() );
-  librandom::RngPtr rng = get_global_rng();
-
   // Get source layer from the NodeCollection
   auto source_metadata = nc->get_metadata();
   if ( not source_metadata.get() )
@@ -63,24 +135,66 @@ Parameter::apply( const NodeCollectionPTR& nc, const TokenArray& token_array ) c
     throw KernelException( "apply: not valid layer" );
   }
 
-  assert( nc->size() == 1 );
+  if ( nc->size() != 1 )
+  {
+    throw BadProperty( "Parameter apply: The source NodeCollection must contain a single node ID only." );
+  }
   const index source_lid = nc->operator[]( 0 ) - source_metadata->get_first_node_id();
-  std::vector< double > source_pos = source_layer->get_position_vector( source_lid );
+  source_pos = source_layer->get_position_vector( source_lid );
+  return source_layer;
+}
+
+std::vector< double >
+Parameter::apply( const NodeCollectionPTR& nc, const TokenArray& token_array ) const
+{
+  std::vector< double > result;
+  librandom::RngPtr rng = get_global_rng();
 
-  // For each position, calculate the displacement, then calculate the parameter value
+  std::vector< double > source_pos;
+  AbstractLayerPTR source_layer = get_source_layer_( nc, source_pos );
+
+  // Collect all target positions, then calculate the parameter values in one block
+  std::vector< double > target_pos;
+  target_pos.reserve( token_array.size() * source_pos.size() );
   for ( auto&& token : token_array )
   {
-    std::vector< double > target_pos = getValue< std::vector< double > >( token );
-    if ( target_pos.size() != source_pos.size() )
+    std::vector< double > pos = getValue< std::vector< double > >( token );
+    if ( pos.size() != source_pos.size() )
     {
       throw BadProperty(
         String::compose( "Parameter apply: Target position has %1 dimensions, but source position has %2 dimensions.",
-          target_pos.size(),
+          pos.size(),
           source_pos.size() ) );
     }
-    auto value = this->value( rng, source_pos, target_pos, *source_layer.get() );
-    result.push_back( value );
+    target_pos.insert( target_pos.end(), pos.begin(), pos.end() );
+  }
+  values( rng, ParameterBlock( token_array.size(), source_pos, target_pos, *source_layer.get() ), result );
+  return result;
+}
+
+std::vector< double >
+Parameter::apply( const NodeCollectionPTR& nc, const std::vector< double >& target_pos, const size_t dim ) const
+{
+  std::vector< double > result;
+  librandom::RngPtr rng = get_global_rng();
+
+  std::vector< double > source_pos;
+  AbstractLayerPTR source_layer = get_source_layer_( nc, source_pos );
+
+  if ( dim != source_pos.size() )
+  {
+    throw BadProperty(
+      String::compose( "Parameter apply: Target positions have %1 dimensions, but source position has %2 dimensions.",
+        dim,
+        source_pos.size() ) );
   }
+  if ( target_pos.size() % dim != 0 )
+  {
+    throw BadProperty( String::compose(
+      "Parameter apply: Number of coordinates must be a multiple of the number of dimensions %1.", dim ) );
+  }
+  const size_t num_positions = target_pos.size() / dim;
+  values( rng, ParameterBlock( num_positions, source_pos, target_pos, *source_layer.get() ), result );
   return result;
 }
 
@@ -122,6 +236,25 @@ NodePosParameter::get_node_pos_( librandom::RngPtr& rng, Node* node ) const
   }
   return pos[ dimension_ ];
 }
+
+void
+NodePosParameter::values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const
+{
+  if ( not block.layer or synaptic_endpoint_ == 0 )
+  {
+    Parameter::values( rng, block, result );
+    return;
+  }
+
+  const std::vector< double >& pos = synaptic_endpoint_ == 1 ? *block.source_pos : *block.target_pos;
+  const size_t stride = synaptic_endpoint_ == 1 ? block.source_stride : block.target_stride;
+  result.resize( block.size );
+  for ( size_t i = 0; i < block.size; ++i )
+  {
+    result[ i ] = pos[ i * stride + dimension_ ];
+  }
+}
+
 double
 SpatialDistanceParameter::value( librandom::RngPtr& rng,
   const std::vector< double >& source_pos,
@@ -153,6 +286,22 @@ SpatialDistanceParameter::value( librandom::RngPtr& rng,
   }
 }
 
+void
+SpatialDistanceParameter::values( librandom::RngPtr& rng,
+  const ParameterBlock& block,
+  std::vector< double >& result ) const
+{
+  if ( not block.layer or dimension_ > 3 or ( unsigned int ) dimension_ > block.num_dimensions or block.size == 0 )
+  {
+    // Throws the same exceptions as value()
+    Parameter::values( rng, block, result );
+    return;
+  }
+
+  result.resize( block.size );
+  block.layer->compute_distances( *block.source_pos, *block.target_pos, dimension_, result );
+}
+
 RedrawParameter::RedrawParameter( const Parameter& p, const double min, const double max )
   : Parameter( p )
   , p_( p.clone() )
@@ -161,6 +310,7 @@ RedrawParameter::RedrawParameter( const Parameter& p, const double min, const do
   , max_redraws_( 1000 )
 {
   parameter_is_spatial_ = p_->is_spatial();
+  parameter_is_random_ = p_->is_random();
   if ( min > max )
   {
     throw BadParameterValue( "min <= max required." );
@@ -223,4 +373,24 @@ RedrawParameter::value( librandom::RngPtr& rng,
   return value;
 }
 
+void
+RedrawParameter::values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const
+{
+  if ( p_->is_random() )
+  {
+    Parameter::values( rng, block, result );
+    return;
+  }
+
+  // Redrawing a value that draws no random numbers always gives the same value
+  p_->values( rng, block, result );
+  for ( const double value : result )
+  {
+    if ( value < min_ or value > max_ )
+    {
+      throw KernelException( String::compose( "Number of redraws exceeded limit of %1", max_redraws_ ) );
+    }
+  }
+}
+
 } /* namespace nest */
@@ -45,6 +45,52 @@ namespace nest
 
 class AbstractLayer;
 
+/**
+ * Arguments for which a parameter generates a block of values, see
+ * Parameter::values().
+ *
+ * A block holds either nodes, or source and target positions of
+ * connections in a layer, or only the number of values for parameters
+ * that depend on neither. The positions of all sources and targets are
+ * stored consecutively, unless source_pos or target_pos holds a single
+ * position, which is then used for all values.
+ */
+struct ParameterBlock
+{
+  /**
+   * Create a block of values for the given nodes.
+   */
+  explicit ParameterBlock( const std::vector< Node* >& nodes );
+
+  /**
+   * Create a block of size values without nodes or positions.
+   */
+  explicit ParameterBlock( const size_t size );
+
+  /**
+   * Create a block of size values for connections between the given
+   * source and target positions in a layer.
+   */
+  ParameterBlock( const size_t size,
+    const std::vector< double >& source_pos,
+    const std::vector< double >& target_pos,
+    const AbstractLayer& layer );
+
+  /**
+   * Copies the source and target positions of value i to the given vectors.
+   */
+  void get_positions( const size_t i, std::vector< double >& source_pos, std::vector< double >& target_pos ) const;
+
+  const size_t size;                       //!< Number of values
+  const std::vector< Node* >* nodes;       //!< Nodes, or nullptr for connections and blocks without nodes
+  const std::vector< double >* source_pos; //!< Source positions of connections
+  const std::vector< double >* target_pos; //!< Target positions of connections
+  const AbstractLayer* layer;              //!< Layer in which displacements are computed
+  const size_t num_dimensions;             //!< Number of dimensions of the positions
+  const size_t source_stride;              //!< Distance between source positions, 0 if there is only one
+  const size_t target_stride;              //!< Distance between target positions, 0 if there is only one
+};
+
 /**
  * Abstract base class for parameters.
  */
@@ -90,6 +136,20 @@ public:
     return value( rng, nullptr );
   }
 
+  /**
+   * Generates values for a whole block of nodes or connections at once.
+   *
+   * Values and random numbers drawn are the same as when calling value()
+   * for each element of the block in turn. Subclasses evaluate the
+   * block in tight loops, while the base class falls back to calling
+   * value() for each element. Compound parameters also fall back if
+   * evaluating their operands in blocks would change the order in which
+   * random numbers are drawn.
+   * @param block  nodes or connections for which values are generated
+   * @param result vector resized to the block size and filled with the values
+   */
+  virtual void values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const;
+
   /**
    * Create a copy of the parameter.
    * @returns dynamically allocated copy of parameter object
@@ -178,16 +238,36 @@ public:
    */
   std::vector< double > apply( const NodeCollectionPTR&, const TokenArray& ) const;
 
+  /**
+   * Applies a parameter on a single-node ID NodeCollection and given positions
+   * with the given number of dimensions, stored consecutively in a vector.
+   * @returns array of result values, one per position.
+   */
+  std::vector< double > apply( const NodeCollectionPTR&, const std::vector< double >&, const size_t ) const;
+
   /**
    * Check if the Parameter is based on spatial properties.
    * @returns true if the Parameter is based on spatial properties, false otherwise.
    */
   bool is_spatial() const;
 
+  /**
+   * Check if the Parameter draws random numbers.
+   * @returns true if the value of the Parameter may depend on random numbers drawn, false otherwise.
+   */
+  bool is_random() const;
+
 protected:
   bool parameter_is_spatial_{ false };
+  bool parameter_is_random_{ false };
 
   Node* node_id_to_node_ptr_( const index, const thread ) const;
+
+  /**
+   * Get the layer and position of the node in a single-node ID NodeCollection.
+   */
+  std::shared_ptr< AbstractLayer > get_source_layer_( const NodeCollectionPTR&,
+    std::vector< double >& source_pos ) const;
 };
 
 /**
@@ -225,6 +305,12 @@ public:
     return value_;
   }
 
+  void
+  values( librandom::RngPtr&, const ParameterBlock& block, std::vector< double >& result ) const override
+  {
+    result.assign( block.size, value_ );
+  }
+
   Parameter*
   clone() const override
   {
@@ -254,6 +340,7 @@ public:
     , lower_( 0.0 )
     , range_( 1.0 )
   {
+    parameter_is_random_ = true;
     updateValue< double >( d, names::min, lower_ );
     updateValue< double >( d, names::max, range_ );
     if ( lower_ >= range_ )
@@ -272,6 +359,16 @@ public:
     return lower_ + rng->drand() * range_;
   }
 
+  void
+  values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const override
+  {
+    result.resize( block.size );
+    for ( auto& value : result )
+    {
+      value = lower_ + rng->drand() * range_;
+    }
+  }
+
   Parameter*
   clone() const override
   {
@@ -302,6 +399,7 @@ public:
     , std_( 1.0 )
     , rdev()
   {
+    parameter_is_random_ = true;
     updateValue< double >( d, names::mean, mean_ );
     updateValue< double >( d, names::std, std_ );
     if ( std_ <= 0 )
@@ -318,6 +416,16 @@ public:
     return mean_ + rdev( rng ) * std_;
   }
 
+  void
+  values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const override
+  {
+    result.resize( block.size );
+    for ( auto& value : result )
+    {
+      value = mean_ + rdev( rng ) * std_;
+    }
+  }
+
   Parameter*
   clone() const override
   {
@@ -349,6 +457,7 @@ public:
     , std_( 1.0 )
     , rdev()
   {
+    parameter_is_random_ = true;
     updateValue< double >( d, names::mean, mean_ );
     updateValue< double >( d, names::std, std_ );
     if ( std_ <= 0 )
@@ -365,6 +474,16 @@ public:
     return std::exp( mean_ + rdev( rng ) * std_ );
   }
 
+  void
+  values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const override
+  {
+    result.resize( block.size );
+    for ( auto& value : result )
+    {
+      value = std::exp( mean_ + rdev( rng ) * std_ );
+    }
+  }
+
   Parameter*
   clone() const override
   {
@@ -393,6 +512,7 @@ public:
     : Parameter( d )
     , beta_( 1.0 )
   {
+    parameter_is_random_ = true;
     updateValue< double >( d, names::beta, beta_ );
   }
 
@@ -402,6 +522,16 @@ public:
     return beta_ * ( -std::log( 1 - rng->drand() ) );
   }
 
+  void
+  values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const override
+  {
+    result.resize( block.size );
+    for ( auto& value : result )
+    {
+      value = beta_ * ( -std::log( 1 - rng->drand() ) );
+    }
+  }
+
   Parameter*
   clone() const override
   {
@@ -485,6 +615,8 @@ public:
     throw KernelException( "Wrong synaptic_endpoint_." );
   }
 
+  void values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const override;
+
   Parameter*
   clone() const override
   {
@@ -534,6 +666,8 @@ public:
     const std::vector< double >& target_pos,
     const AbstractLayer& layer ) const override;
 
+  void values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const override;
+
   Parameter*
   clone() const override
   {
@@ -561,6 +695,7 @@ public:
     , parameter2_( m2.clone() )
   {
     parameter_is_spatial_ = parameter1_->is_spatial() or parameter2_->is_spatial();
+    parameter_is_random_ = parameter1_->is_random() or parameter2_->is_random();
   }
 
   /**
@@ -572,6 +707,7 @@ public:
     , parameter2_( p.parameter2_->clone() )
   {
     parameter_is_spatial_ = parameter1_->is_spatial() or parameter2_->is_spatial();
+    parameter_is_random_ = parameter1_->is_random() or parameter2_->is_random();
   }
 
   ~ProductParameter() override
@@ -606,6 +742,24 @@ public:
       * parameter2_->value( rng, source_pos, target_pos, layer );
   }
 
+  void
+  values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const override
+  {
+    if ( parameter1_->is_random() and parameter2_->is_random() )
+    {
+      // Evaluating both parameters in blocks would change the order of random numbers
+      Parameter::values( rng, block, result );
+      return;
+    }
+    std::vector< double > values2;
+    parameter1_->values( rng, block, result );
+    parameter2_->values( rng, block, values2 );
+    for ( size_t i = 0; i < result.size(); ++i )
+    {
+      result[ i ] *= values2[ i ];
+    }
+  }
+
   Parameter*
   clone() const override
   {
@@ -632,6 +786,7 @@ public:
     , parameter2_( m2.clone() )
   {
     parameter_is_spatial_ = parameter1_->is_spatial() or parameter2_->is_spatial();
+    parameter_is_random_ = parameter1_->is_random() or parameter2_->is_random();
   }
 
   /**
@@ -643,6 +798,7 @@ public:
     , parameter2_( p.parameter2_->clone() )
   {
     parameter_is_spatial_ = parameter1_->is_spatial() or parameter2_->is_spatial();
+    parameter_is_random_ = parameter1_->is_random() or parameter2_->is_random();
   }
 
   ~QuotientParameter() override
@@ -677,6 +833,23 @@ public:
       / parameter2_->value( rng, source_pos, target_pos, layer );
   }
 
+  void
+  values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const override
+  {
+    if ( parameter1_->is_random() and parameter2_->is_random() )
+    {
+      Parameter::values( rng, block, result );
+      return;
+    }
+    std::vector< double > values2;
+    parameter1_->values( rng, block, result );
+    parameter2_->values( rng, block, values2 );
+    for ( size_t i = 0; i < result.size(); ++i )
+    {
+      result[ i ] /= values2[ i ];
+    }
+  }
+
   Parameter*
   clone() const override
   {
@@ -703,6 +876,7 @@ public:
     , parameter2_( m2.clone() )
   {
     parameter_is_spatial_ = parameter1_->is_spatial() or parameter2_->is_spatial();
+    parameter_is_random_ = parameter1_->is_random() or parameter2_->is_random();
   }
 
   /**
@@ -714,6 +888,7 @@ public:
     , parameter2_( p.parameter2_->clone() )
   {
     parameter_is_spatial_ = parameter1_->is_spatial() or parameter2_->is_spatial();
+    parameter_is_random_ = parameter1_->is_random() or parameter2_->is_random();
   }
 
   ~SumParameter() override
@@ -748,6 +923,23 @@ public:
       + parameter2_->value( rng, source_pos, target_pos, layer );
   }
 
+  void
+  values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const override
+  {
+    if ( parameter1_->is_random() and parameter2_->is_random() )
+    {
+      Parameter::values( rng, block, result );
+      return;
+    }
+    std::vector< double > values2;
+    parameter1_->values( rng, block, result );
+    parameter2_->values( rng, block, values2 );
+    for ( size_t i = 0; i < result.size(); ++i )
+    {
+      result[ i ] += values2[ i ];
+    }
+  }
+
   Parameter*
   clone() const override
   {
@@ -774,6 +966,7 @@ public:
     , parameter2_( m2.clone() )
   {
     parameter_is_spatial_ = parameter1_->is_spatial() or parameter2_->is_spatial();
+    parameter_is_random_ = parameter1_->is_random() or parameter2_->is_random();
   }
 
   /**
@@ -785,6 +978,7 @@ public:
     , parameter2_( p.parameter2_->clone() )
   {
     parameter_is_spatial_ = parameter1_->is_spatial() or parameter2_->is_spatial();
+    parameter_is_random_ = parameter1_->is_random() or parameter2_->is_random();
   }
 
   ~DifferenceParameter() override
@@ -819,6 +1013,23 @@ public:
       - parameter2_->value( rng, source_pos, target_pos, layer );
   }
 
+  void
+  values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const override
+  {
+    if ( parameter1_->is_random() and parameter2_->is_random() )
+    {
+      Parameter::values( rng, block, result );
+      return;
+    }
+    std::vector< double > values2;
+    parameter1_->values( rng, block, result );
+    parameter2_->values( rng, block, values2 );
+    for ( size_t i = 0; i < result.size(); ++i )
+    {
+      result[ i ] -= values2[ i ];
+    }
+  }
+
   Parameter*
   clone() const override
   {
@@ -844,6 +1055,7 @@ public:
     , p_( p.clone() )
   {
     parameter_is_spatial_ = p_->is_spatial();
+    parameter_is_random_ = p_->is_random();
   }
 
   /**
@@ -854,6 +1066,7 @@ public:
     , p_( p.p_->clone() )
   {
     parameter_is_spatial_ = p_->is_spatial();
+    parameter_is_random_ = p_->is_random();
   }
 
   ~ConverseParameter() override
@@ -885,6 +1098,12 @@ public:
     return p_->value( rng, source_pos, target_pos, layer );
   }
 
+  void
+  values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const override
+  {
+    p_->values( rng, block, result );
+  }
+
   Parameter*
   clone() const override
   {
@@ -930,6 +1149,7 @@ public:
       throw BadParameter( "Comparator specification has to be in the range 0-5." );
     }
     parameter_is_spatial_ = parameter1_->is_spatial() or parameter2_->is_spatial();
+    parameter_is_random_ = parameter1_->is_random() or parameter2_->is_random();
   }
 
   /**
@@ -975,6 +1195,23 @@ public:
       parameter2_->value( rng, source_pos, target_pos, layer ) );
   }
 
+  void
+  values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const override
+  {
+    if ( parameter1_->is_random() and parameter2_->is_random() )
+    {
+      Parameter::values( rng, block, result );
+      return;
+    }
+    std::vector< double > values2;
+    parameter1_->values( rng, block, result );
+    parameter2_->values( rng, block, values2 );
+    for ( size_t i = 0; i < result.size(); ++i )
+    {
+      result[ i ] = compare_( result[ i ], values2[ i ] );
+    }
+  }
+
   Parameter*
   clone() const override
   {
@@ -1027,6 +1264,7 @@ public:
     , if_false_( if_false.clone() )
   {
     parameter_is_spatial_ = condition_->is_spatial() or if_true_->is_spatial() or if_false_->is_spatial();
+    parameter_is_random_ = condition_->is_random() or if_true_->is_random() or if_false_->is_random();
   }
 
   /**
@@ -1039,6 +1277,7 @@ public:
     , if_false_( p.if_false_->clone() )
   {
     parameter_is_spatial_ = condition_->is_spatial() or if_true_->is_spatial() or if_false_->is_spatial();
+    parameter_is_random_ = condition_->is_random() or if_true_->is_random() or if_false_->is_random();
   }
 
   ~ConditionalParameter() override
@@ -1093,6 +1332,26 @@ public:
     }
   }
 
+  void
+  values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const override
+  {
+    // value() only draws random numbers for the chosen parameter
+    if ( if_true_->is_random() or if_false_->is_random() )
+    {
+      Parameter::values( rng, block, result );
+      return;
+    }
+    std::vector< double > values_true;
+    std::vector< double > values_false;
+    condition_->values( rng, block, result );
+    if_true_->values( rng, block, values_true );
+    if_false_->values( rng, block, values_false );
+    for ( size_t i = 0; i < result.size(); ++i )
+    {
+      result[ i ] = result[ i ] ? values_true[ i ] : values_false[ i ];
+    }
+  }
+
   Parameter*
   clone() const override
   {
@@ -1120,6 +1379,7 @@ public:
     , other_value_( other_value )
   {
     parameter_is_spatial_ = p_->is_spatial();
+    parameter_is_random_ = p_->is_random();
   }
 
   /**
@@ -1131,6 +1391,7 @@ public:
     , other_value_( p.other_value_ )
   {
     parameter_is_spatial_ = p_->is_spatial();
+    parameter_is_random_ = p_->is_random();
   }
 
   ~MinParameter() override
@@ -1162,6 +1423,16 @@ public:
     return std::min( p_->value( rng, source_pos, target_pos, layer ), other_value_ );
   }
 
+  void
+  values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const override
+  {
+    p_->values( rng, block, result );
+    for ( auto& value : result )
+    {
+      value = std::min( value, other_value_ );
+    }
+  }
+
   Parameter*
   clone() const override
   {
@@ -1190,6 +1461,7 @@ public:
     , other_value_( other_value )
   {
     parameter_is_spatial_ = p_->is_spatial();
+    parameter_is_random_ = p_->is_random();
   }
 
   /**
@@ -1201,6 +1473,7 @@ public:
     , other_value_( p.other_value_ )
   {
     parameter_is_spatial_ = p_->is_spatial();
+    parameter_is_random_ = p_->is_random();
   }
 
   ~MaxParameter() override
@@ -1232,6 +1505,16 @@ public:
     return std::max( p_->value( rng, source_pos, target_pos, layer ), other_value_ );
   }
 
+  void
+  values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const override
+  {
+    p_->values( rng, block, result );
+    for ( auto& value : result )
+    {
+      value = std::max( value, other_value_ );
+    }
+  }
+
   Parameter*
   clone() const override
   {
@@ -1267,6 +1550,7 @@ public:
     , max_redraws_( p.max_redraws_ )
   {
     parameter_is_spatial_ = p_->is_spatial();
+    parameter_is_random_ = p_->is_random();
   }
 
   ~RedrawParameter() override
@@ -1284,6 +1568,8 @@ public:
     const std::vector< double >& target_pos,
     const AbstractLayer& layer ) const override;
 
+  void values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const override;
+
   Parameter*
   clone() const override
   {
@@ -1313,6 +1599,7 @@ public:
     , p_( p.clone() )
   {
     parameter_is_spatial_ = p_->is_spatial();
+    parameter_is_random_ = p_->is_random();
   }
 
   /**
@@ -1353,6 +1640,16 @@ public:
     return std::exp( p_->value( rng, source_pos, target_pos, layer ) );
   }
 
+  void
+  values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const override
+  {
+    p_->values( rng, block, result );
+    for ( auto& value : result )
+    {
+      value = std::exp( value );
+    }
+  }
+
   Parameter*
   clone() const override
   {
@@ -1379,6 +1676,7 @@ public:
     , p_( p.clone() )
   {
     parameter_is_spatial_ = p_->is_spatial();
+    parameter_is_random_ = p_->is_random();
   }
 
   /**
@@ -1389,6 +1687,7 @@ public:
     , p_( p.p_->clone() )
   {
     parameter_is_spatial_ = p_->is_spatial();
+    parameter_is_random_ = p_->is_random();
   }
 
   ~SinParameter() override
@@ -1420,6 +1719,16 @@ public:
     return std::sin( p_->value( rng, source_pos, target_pos, layer ) );
   }
 
+  void
+  values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const override
+  {
+    p_->values( rng, block, result );
+    for ( auto& value : result )
+    {
+      value = std::sin( value );
+    }
+  }
+
   Parameter*
   clone() const override
   {
@@ -1445,6 +1754,7 @@ public:
     , p_( p.clone() )
   {
     parameter_is_spatial_ = p_->is_spatial();
+    parameter_is_random_ = p_->is_random();
   }
 
   /**
@@ -1455,6 +1765,7 @@ public:
     , p_( p.p_->clone() )
   {
     parameter_is_spatial_ = p_->is_spatial();
+    parameter_is_random_ = p_->is_random();
   }
 
   ~CosParameter() override
@@ -1486,6 +1797,16 @@ public:
     return std::cos( p_->value( rng, source_pos, target_pos, layer ) );
   }
 
+  void
+  values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const override
+  {
+    p_->values( rng, block, result );
+    for ( auto& value : result )
+    {
+      value = std::cos( value );
+    }
+  }
+
   Parameter*
   clone() const override
   {
@@ -1513,6 +1834,7 @@ public:
     , exponent_( exponent )
   {
     parameter_is_spatial_ = p_->is_spatial();
+    parameter_is_random_ = p_->is_random();
   }
 
   /**
@@ -1524,6 +1846,7 @@ public:
     , exponent_( p.exponent_ )
   {
     parameter_is_spatial_ = p_->is_spatial();
+    parameter_is_random_ = p_->is_random();
   }
 
   ~PowParameter() override
@@ -1555,6 +1878,16 @@ public:
     return std::pow( p_->value( rng, source_pos, target_pos, layer ), exponent_ );
   }
 
+  void
+  values( librandom::RngPtr& rng, const ParameterBlock& block, std::vector< double >& result ) const override
+  {
+    p_->values( rng, block, result );
+    for ( auto& value : result )
+    {
+      value = std::pow( value, exponent_ );
+    }
+  }
+
   Parameter*
   clone() const override
   {
@@ -1587,6 +1920,7 @@ public:
     , py_( py.clone() )
   {
     parameter_is_spatial_ = true;
+    parameter_is_random_ = px_->is_random() or py_->is_random();
   }
 
   DimensionParameter( const Parameter& px, const Parameter& py, const Parameter& pz )
@@ -1596,6 +1930,7 @@ public:
     , pz_( pz.clone() )
   {
     parameter_is_spatial_ = true;
+    parameter_is_random_ = px_->is_random() or py_->is_random() or pz_->is_random();
   }
 
   /**
@@ -1768,6 +2103,12 @@ Parameter::is_spatial() const
   return parameter_is_spatial_;
 }
 
+inline bool
+Parameter::is_random() const
+{
+  return parameter_is_random_;
+}
+
 } // namespace nest
 
 #endif
@@ -101,6 +101,22 @@ public:
     // return recordables_;
   }
 
+  /**
+   * Write the current value of recordable n of host to value. Return false
+   * if there is no such recordable.
+   */
+  bool
+  get_value( const HostNode& host, const Name& n, double& value ) const
+  {
+    const typename Base_::const_iterator it = this->find( n );
+    if ( it == this->end() )
+    {
+      return false;
+    }
+    value = ( host.*( it->second ) )();
+    return true;
+  }
+
 private:
   //! Insertion functions to be used in create(), adds entry to map and list
   void
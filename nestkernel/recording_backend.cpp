@@ -22,7 +22,16 @@
 
 #include "recording_backend.h"
 
+// Includes from nestkernel:
+#include "exceptions.h"
+
 const std::vector< Name > nest::RecordingBackend::NO_DOUBLE_VALUE_NAMES;
 const std::vector< Name > nest::RecordingBackend::NO_LONG_VALUE_NAMES;
 const std::vector< double > nest::RecordingBackend::NO_DOUBLE_VALUES;
 const std::vector< long > nest::RecordingBackend::NO_LONG_VALUES;
+
+void
+nest::RecordingBackend::get_device_new_events( const RecordingDevice&, DictionaryDatum&, bool )
+{
+  throw BadProperty( "The recording backend does not support retrieving new events." );
+}
@@ -318,6 +318,25 @@ public:
    */
   virtual void get_device_status( const RecordingDevice& device, DictionaryDatum& params ) const = 0;
 
+  /**
+   * Append the data recorded by the given device since the last call
+   * to this function to the given events dictionary.
+   *
+   * If drain is true, the data is removed from the backend afterwards.
+   * Backends that do not keep data accessible to the user do not need
+   * to override this function. The default implementation throws a
+   * BadProperty exception.
+   *
+   * @param device the recording device for which the data is returned
+   * @param events the dictionary to append the data to
+   * @param drain whether to remove the returned data from the backend
+   *
+   * @see get_device_status()
+   *
+   * @ingroup NESTio
+   */
+  virtual void get_device_new_events( const RecordingDevice& device, DictionaryDatum& events, bool drain );
+
   static const std::vector< Name > NO_DOUBLE_VALUE_NAMES;
   static const std::vector< Name > NO_LONG_VALUE_NAMES;
   static const std::vector< double > NO_DOUBLE_VALUES;
@@ -0,0 +1,407 @@
+/*
+ *  recording_backend_aggregate.cpp
+ *
+ *  This file is part of NEST.
+ *
+ *  Copyright (C) 2004 The NEST Initiative
+ *
+ *  NEST is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 2 of the License, or
+ *  (at your option) any later version.
+ *
+ *  NEST is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ */
+
+// C++ includes:
+#include <algorithm>
+#include <limits>
+
+// Includes from nestkernel:
+#include "recording_device.h"
+#include "vp_manager_impl.h"
+
+// Includes from sli:
+#include "dictutils.h"
+
+#include "recording_backend_aggregate.h"
+
+nest::RecordingBackendAggregate::RecordingBackendAggregate()
+{
+}
+
+nest::RecordingBackendAggregate::~RecordingBackendAggregate() throw()
+{
+}
+
+void
+nest::RecordingBackendAggregate::initialize()
+{
+  device_data_map tmp( kernel().vp_manager.get_num_threads() );
+  device_data_.swap( tmp );
+}
+
+void
+nest::RecordingBackendAggregate::finalize()
+{
+  // nothing to do
+}
+
+void
+nest::RecordingBackendAggregate::enroll( const RecordingDevice& device, const DictionaryDatum& params )
+{
+  const thread t = device.get_thread();
+  const index node_id = device.get_node_id();
+
+  device_data_map::value_type::iterator device_data = device_data_[ t ].find( node_id );
+  if ( device_data == device_data_[ t ].end() )
+  {
+    auto p = device_data_[ t ].insert( std::make_pair( node_id, DeviceData() ) );
+    device_data = p.first;
+  }
+
+  device_data->second.set_status( params );
+}
+
+void
+nest::RecordingBackendAggregate::disenroll( const RecordingDevice& device )
+{
+  const thread t = device.get_thread();
+  const index node_id = device.get_node_id();
+
+  device_data_map::value_type::iterator device_data = device_data_[ t ].find( node_id );
+  if ( device_data != device_data_[ t ].end() )
+  {
+    device_data_[ t ].erase( device_data );
+  }
+}
+
+void
+nest::RecordingBackendAggregate::set_value_names( const RecordingDevice& device,
+  const std::vector< Name >& double_value_names,
+  const std::vector< Name >& long_value_names )
+{
+  const thread t = device.get_thread();
+  const index node_id = device.get_node_id();
+
+  device_data_map::value_type::iterator device_data = device_data_[ t ].find( node_id );
+  assert( device_data != device_data_[ t ].end() );
+  device_data->second.set_value_names( double_value_names, long_value_names );
+}
+
+void
+nest::RecordingBackendAggregate::prepare()
+{
+  // nothing to do
+}
+
+void
+nest::RecordingBackendAggregate::cleanup()
+{
+  // nothing to do
+}
+
+void
+nest::RecordingBackendAggregate::pre_run_hook()
+{
+  // nothing to do
+}
+
+void
+nest::RecordingBackendAggregate::post_run_hook()
+{
+  // nothing to do
+}
+
+void
+nest::RecordingBackendAggregate::post_step_hook()
+{
+  // nothing to do
+}
+
+void
+nest::RecordingBackendAggregate::write( const RecordingDevice& device,
+  const Event& event,
+  const std::vector< double >& double_values,
+  const std::vector< long >& long_values )
+{
+  const thread t = device.get_thread();
+  const index node_id = device.get_node_id();
+
+  device_data_[ t ][ node_id ].write( event, double_values, long_values );
+}
+
+void
+nest::RecordingBackendAggregate::set_status( const DictionaryDatum& )
+{
+  // nothing to do
+}
+
+void
+nest::RecordingBackendAggregate::get_status( DictionaryDatum& ) const
+{
+  // nothing to do
+}
+
+void
+nest::RecordingBackendAggregate::check_device_status( const DictionaryDatum& params ) const
+{
+  DeviceData dd;
+  dd.set_status( params ); // throws if params contains invalid entries
+}
+
+void
+nest::RecordingBackendAggregate::get_device_defaults( DictionaryDatum& params ) const
+{
+  DeviceData dd;
+  dd.get_status( params );
+}
+
+void
+nest::RecordingBackendAggregate::get_device_status( const RecordingDevice& device, DictionaryDatum& d ) const
+{
+  // The statistics of all threads are combined when the status of the
+  // instance on thread 0 is read. Recording devices add the status of
+  // their instances on the other threads afterwards, which must not
+  // add the statistics again.
+  if ( device.get_thread() != 0 )
+  {
+    return;
+  }
+
+  const index node_id = device.get_node_id();
+  const auto device_data = device_data_[ 0 ].find( node_id );
+  if ( device_data == device_data_[ 0 ].end() )
+  {
+    return;
+  }
+
+  DeviceData combined = device_data->second;
+  for ( size_t t = 1; t < device_data_.size(); ++t )
+  {
+    const auto thread_data = device_data_[ t ].find( node_id );
+    if ( thread_data != device_data_[ t ].end() )
+    {
+      combined.merge( thread_data->second );
+    }
+  }
+
+  combined.get_status( d );
+}
+
+/* ******************* Device meta data class DeviceData ******************* */
+
+nest::RecordingBackendAggregate::DeviceData::DeviceData()
+  : bin_width_( Time::step( 0 ) )
+{
+}
+
+void
+nest::RecordingBackendAggregate::DeviceData::set_value_names( const std::vector< Name >& double_value_names,
+  const std::vector< Name >& long_value_names )
+{
+  value_names_ = double_value_names;
+  value_names_.insert( value_names_.end(), long_value_names.begin(), long_value_names.end() );
+
+  bin_sums_.resize( value_names_.size() );
+  for ( auto& sums : bin_sums_ )
+  {
+    sums.resize( bin_counts_.size(), 0.0 );
+  }
+}
+
+void
+nest::RecordingBackendAggregate::DeviceData::write( const Event& event,
+  const std::vector< double >& double_values,
+  const std::vector< long >& long_values )
+{
+  SenderData& sender = senders_[ event.get_sender_node_id() ];
+  if ( sender.count == 0 )
+  {
+    sender.means.resize( value_names_.size(), 0.0 );
+    sender.sum_squared_diff.resize( value_names_.size(), 0.0 );
+  }
+  ++sender.count;
+
+  // Bin i contains the events with times in (i * bin_width, (i + 1) * bin_width]
+  long bin = -1;
+  if ( bin_width_.get_steps() > 0 )
+  {
+    bin = std::max( event.get_stamp().get_steps() - 1, 0L ) / bin_width_.get_steps();
+    if ( static_cast< size_t >( bin ) >= bin_counts_.size() )
+    {
+      bin_counts_.resize( bin + 1, 0 );
+      for ( auto& sums : bin_sums_ )
+      {
+        sums.resize( bin + 1, 0.0 );
+      }
+    }
+    ++bin_counts_[ bin ];
+  }
+
+  for ( size_t i = 0; i < double_values.size(); ++i )
+  {
+    add_value_( sender, i, double_values[ i ], bin );
+  }
+  for ( size_t i = 0; i < long_values.size(); ++i )
+  {
+    add_value_( sender, double_values.size() + i, long_values[ i ], bin );
+  }
+}
+
+void
+nest::RecordingBackendAggregate::DeviceData::add_value_( SenderData& sender, size_t i, double value, long bin )
+{
+  // Welford's algorithm for the running mean and variance
+  const double diff = value - sender.means[ i ];
+  sender.means[ i ] += diff / sender.count;
+  sender.sum_squared_diff[ i ] += diff * ( value - sender.means[ i ] );
+
+  if ( bin >= 0 )
+  {
+    bin_sums_[ i ][ bin ] += value;
+  }
+}
+
+void
+nest::RecordingBackendAggregate::DeviceData::merge( const DeviceData& other )
+{
+  for ( const auto& other_sender : other.senders_ )
+  {
+    auto sender = senders_.find( other_sender.first );
+    if ( sender == senders_.end() )
+    {
+      senders_.insert( other_sender );
+      continue;
+    }
+
+    // Combine means and variances with the formula of Chan et al.
+    SenderData& a = sender->second;
+    const SenderData& b = other_sender.second;
+    const double count = a.count + b.count;
+    for ( size_t i = 0; i < a.means.size(); ++i )
+    {
+      const double diff = b.means[ i ] - a.means[ i ];
+      a.means[ i ] += diff * b.count / count;
+      a.sum_squared_diff[ i ] += b.sum_squared_diff[ i ] + diff * diff * a.count * b.count / count;
+    }
+    a.count += b.count;
+  }
+
+  if ( other.bin_counts_.size() > bin_counts_.size() )
+  {
+    bin_counts_.resize( other.bin_counts_.size(), 0 );
+    for ( auto& sums : bin_sums_ )
+    {
+      sums.resize( other.bin_counts_.size(), 0.0 );
+    }
+  }
+  for ( size_t bin = 0; bin < other.bin_counts_.size(); ++bin )
+  {
+    bin_counts_[ bin ] += other.bin_counts_[ bin ];
+    for ( size_t i = 0; i < bin_sums_.size(); ++i )
+    {
+      bin_sums_[ i ][ bin ] += other.bin_sums_[ i ][ bin ];
+    }
+  }
+}
+
+void
+nest::RecordingBackendAggregate::DeviceData::get_status( DictionaryDatum& d ) const
+{
+  ( *d )[ names::bin_width ] = bin_width_.get_ms();
+
+  DictionaryDatum events( new Dictionary );
+  DictionaryDatum means( new Dictionary );
+  DictionaryDatum variances( new Dictionary );
+  DictionaryDatum bin_means( new Dictionary );
+
+  std::vector< long >* senders = new std::vector< long >();
+  std::vector< long >* counts = new std::vector< long >();
+  senders->reserve( senders_.size() );
+  counts->reserve( senders_.size() );
+  for ( const auto& sender : senders_ )
+  {
+    senders->push_back( sender.first );
+    counts->push_back( sender.second.count );
+  }
+  ( *events )[ names::senders ] = new IntVectorDatum( senders );
+  ( *events )[ names::counts ] = new IntVectorDatum( counts );
+  ( *events )[ names::histogram ] = new IntVectorDatum( new std::vector< long >( bin_counts_ ) );
+
+  for ( size_t i = 0; i < value_names_.size(); ++i )
+  {
+    std::vector< double >* value_means = new std::vector< double >();
+    std::vector< double >* value_variances = new std::vector< double >();
+    value_means->reserve( senders_.size() );
+    value_variances->reserve( senders_.size() );
+    for ( const auto& sender : senders_ )
+    {
+      value_means->push_back( sender.second.means[ i ] );
+      value_variances->push_back( sender.second.sum_squared_diff[ i ] / sender.second.count );
+    }
+    ( *means )[ value_names_[ i ] ] = new DoubleVectorDatum( value_means );
+    ( *variances )[ value_names_[ i ] ] = new DoubleVectorDatum( value_variances );
+
+    std::vector< double >* value_bin_means = new std::vector< double >( bin_counts_.size() );
+    for ( size_t bin = 0; bin < bin_counts_.size(); ++bin )
+    {
+      ( *value_bin_means )[ bin ] = bin_counts_[ bin ] > 0 ? bin_sums_[ i ][ bin ] / bin_counts_[ bin ]
+                                                           : std::numeric_limits< double >::quiet_NaN();
+    }
+    ( *bin_means )[ value_names_[ i ] ] = new DoubleVectorDatum( value_bin_means );
+  }
+
+  ( *events )[ names::means ] = means;
+  ( *events )[ names::variances ] = variances;
+  ( *events )[ names::bin_means ] = bin_means;
+  ( *d )[ names::events ] = events;
+}
+
+void
+nest::RecordingBackendAggregate::DeviceData::set_status( const DictionaryDatum& d )
+{
+  double bin_width = 0.0;
+  if ( updateValue< double >( d, names::bin_width, bin_width ) )
+  {
+    if ( kernel().simulation_manager.has_been_simulated() )
+    {
+      throw BadProperty( "Property bin_width cannot be set after Simulate has been called." );
+    }
+    if ( bin_width < 0 )
+    {
+      throw BadProperty( "Property bin_width must be >= 0." );
+    }
+
+    const Time t = Time( Time::ms( bin_width ) );
+    if ( not t.is_grid_time() )
+    {
+      throw BadProperty( "Property bin_width must be a multiple of the simulation resolution." );
+    }
+    bin_width_ = t;
+  }
+
+  size_t n_events = 1;
+  if ( updateValue< long >( d, names::n_events, n_events ) and n_events == 0 )
+  {
+    clear();
+  }
+}
+
+void
+nest::RecordingBackendAggregate::DeviceData::clear()
+{
+  senders_.clear();
+  bin_counts_.clear();
+  for ( auto& sums : bin_sums_ )
+  {
+    sums.clear();
+  }
+}
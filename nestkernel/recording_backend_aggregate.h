@@ -0,0 +1,184 @@
+/*
+ *  recording_backend_aggregate.h
+ *
+ *  This file is part of NEST.
+ *
+ *  Copyright (C) 2004 The NEST Initiative
+ *
+ *  NEST is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 2 of the License, or
+ *  (at your option) any later version.
+ *
+ *  NEST is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ */
+
+#ifndef RECORDING_BACKEND_AGGREGATE_H
+#define RECORDING_BACKEND_AGGREGATE_H
+
+// C++ includes:
+#include <map>
+#include <vector>
+
+// Includes from nestkernel:
+#include "nest_time.h"
+#include "recording_backend.h"
+
+/* BeginDocumentation
+
+.. _aggregate_backend:
+
+Aggregate data in main memory
+#############################
+
+The `aggregate` recording backend does not store the individual events
+sent by a recording device, but only statistics of them, which are
+updated whenever an event arrives. If only spike counts, firing rates,
+peri-stimulus time histograms or mean values are of interest, this
+needs far less memory than storing all events with the `memory`
+backend, and the statistics do not have to be computed after the
+simulation.
+
+The statistics are made available to the user level in the device's
+status dictionary under the key ``events``, which contains
+
+* ``senders``: the node IDs of all senders of events in ascending order,
+* ``counts``: the number of events of each sender,
+* ``means``: a dictionary with the mean of each recorded value for each
+  sender, e.g. the mean membrane potential of each neuron recorded by a
+  multimeter,
+* ``variances``: a dictionary with the variance of each recorded value
+  for each sender, normalized by the number of events,
+* ``histogram``: the number of events of all senders in each time bin,
+  if ``bin_width`` is larger than 0, and
+* ``bin_means``: a dictionary with the mean of each recorded value over
+  all senders in each time bin, if ``bin_width`` is larger than 0. It
+  is *NaN* for bins without events.
+
+Time bin *i* contains all events with times *t* that fulfill *i \*
+bin_width < t <= (i + 1) \* bin_width*. The firing rates of the
+senders in spikes/s are, e.g., given by ``1000 * counts / T``, where
+*T* is the simulation time in ms.
+
+The statistics are computed separately on each thread and are combined
+when the status is read. Like with the `memory` backend, they can be
+deleted by setting `n_events` to 0.
+
+Parameter summary
++++++++++++++++++
+
+.. glossary::
+
+ bin_width
+   A floating point number (default: *0.0*) that sets the width of the
+   time bins of ``histogram`` and ``bin_means`` in ms. It must be a
+   multiple of the simulation resolution. If it is 0, no time binned
+   statistics are computed. This property cannot be set after Simulate
+   has been called.
+
+ events
+   A dictionary containing the statistics described above.
+
+ n_events
+   The number of events collected or sampled since the last reset of
+   `n_events`. By setting `n_events` to 0, all statistics are reset.
+
+EndDocumentation */
+
+namespace nest
+{
+
+/**
+ * Aggregate specialization of the RecordingBackend interface.
+ *
+ * RecordingBackendAggregate maintains per-sender and per-time-bin
+ * statistics for every recording device instance on every thread,
+ * which are updated in write(). Per-sender means and variances are
+ * computed with Welford's algorithm and combined across threads with
+ * the formula of Chan et al. when the status of the device is read.
+ */
+class RecordingBackendAggregate : public RecordingBackend
+{
+public:
+  RecordingBackendAggregate();
+  ~RecordingBackendAggregate() throw();
+
+  void initialize() override;
+  void finalize() override;
+
+  void enroll( const RecordingDevice& device, const DictionaryDatum& params ) override;
+
+  void disenroll( const RecordingDevice& device ) override;
+
+  void set_value_names( const RecordingDevice& device,
+    const std::vector< Name >& double_value_names,
+    const std::vector< Name >& long_value_names ) override;
+
+  void prepare() override;
+
+  void cleanup() override;
+
+  void write( const RecordingDevice&, const Event&, const std::vector< double >&, const std::vector< long >& ) override;
+
+  void pre_run_hook() override;
+
+  void post_run_hook() override;
+
+  void post_step_hook() override;
+
+  void set_status( const DictionaryDatum& ) override;
+
+  void get_status( DictionaryDatum& ) const override;
+
+  void check_device_status( const DictionaryDatum& ) const override;
+  void get_device_defaults( DictionaryDatum& ) const override;
+  void get_device_status( const RecordingDevice& device, DictionaryDatum& ) const override;
+
+private:
+  struct DeviceData
+  {
+    DeviceData();
+    void set_value_names( const std::vector< Name >&, const std::vector< Name >& );
+    void write( const Event&, const std::vector< double >&, const std::vector< long >& );
+    void merge( const DeviceData& );
+    void get_status( DictionaryDatum& ) const;
+    void set_status( const DictionaryDatum& );
+
+  private:
+    //! Statistics of the events of a single sender
+    struct SenderData
+    {
+      SenderData()
+        : count( 0 )
+      {
+      }
+
+      long count;                             //!< number of events
+      std::vector< double > means;            //!< running mean of each value
+      std::vector< double > sum_squared_diff; //!< running sum of squared differences from the mean of each value
+    };
+
+    void clear();
+    void add_value_( SenderData&, size_t, double, long );
+
+    Time bin_width_;                                //!< width of the time bins, 0 if no bins are used
+    std::vector< Name > value_names_;               //!< names of the values of type double, then of type long
+    std::map< index, SenderData > senders_;         //!< statistics of each sender
+    std::vector< long > bin_counts_;                //!< number of events in each time bin
+    std::vector< std::vector< double > > bin_sums_; //!< sum of each value in each time bin, one vector per value
+  };
+
+  typedef std::vector< std::map< size_t, DeviceData > > device_data_map;
+  device_data_map device_data_;
+};
+
+} // namespace
+
+#endif // RECORDING_BACKEND_AGGREGATE_H
@@ -47,12 +47,13 @@ nest::RecordingBackendASCII::initialize()
 {
   data_map tmp( kernel().vp_manager.get_num_threads() );
   device_data_.swap( tmp );
+  writer_.reset_statistics();
 }
 
 void
 nest::RecordingBackendASCII::finalize()
 {
-  // nothing to do
+  writer_.stop();
 }
 
 void
@@ -108,6 +109,18 @@ nest::RecordingBackendASCII::pre_run_hook()
 void
 nest::RecordingBackendASCII::post_run_hook()
 {
+  if ( writer_.is_running() )
+  {
+    for ( auto& inner : device_data_ )
+    {
+      for ( auto& device_data : inner )
+      {
+        device_data.second.submit_buffer( writer_ );
+      }
+    }
+    writer_.wait();
+  }
+
   for ( auto& inner : device_data_ )
   {
     for ( auto& device_data : inner )
@@ -126,6 +139,18 @@ nest::RecordingBackendASCII::post_step_hook()
 void
 nest::RecordingBackendASCII::cleanup()
 {
+  if ( writer_.is_running() )
+  {
+    for ( auto& inner : device_data_ )
+    {
+      for ( auto& device_data : inner )
+      {
+        device_data.second.submit_buffer( writer_ );
+      }
+    }
+    writer_.stop();
+  }
+
   for ( auto& inner : device_data_ )
   {
     for ( auto& device_data : inner )
@@ -150,7 +175,7 @@ nest::RecordingBackendASCII::write( const RecordingDevice& device,
     return;
   }
 
-  device_data->second.write( event, double_values, long_values );
+  device_data->second.write( event, double_values, long_values, writer_ );
 }
 
 const std::string
@@ -178,18 +203,20 @@ nest::RecordingBackendASCII::prepare()
       device_info.second.open_file();
     }
   }
+
+  writer_.start();
 }
 
 void
-nest::RecordingBackendASCII::set_status( const DictionaryDatum& )
+nest::RecordingBackendASCII::set_status( const DictionaryDatum& d )
 {
-  // nothing to do
+  writer_.set_status( d );
 }
 
 void
-nest::RecordingBackendASCII::get_status( DictionaryDatum& ) const
+nest::RecordingBackendASCII::get_status( DictionaryDatum& d ) const
 {
-  // nothing to do
+  writer_.get_status( d );
 }
 
 void
@@ -286,6 +313,9 @@ nest::RecordingBackendASCII::DeviceData::open_file()
     file_ << "\t" << val;
   }
   file_ << std::endl;
+
+  buffer_.str( "" );
+  buffer_ << std::fixed << std::setprecision( precision_ );
 }
 
 void
@@ -297,29 +327,45 @@ nest::RecordingBackendASCII::DeviceData::close_file()
 void
 nest::RecordingBackendASCII::DeviceData::write( const Event& event,
   const std::vector< double >& double_values,
-  const std::vector< long >& long_values )
+  const std::vector< long >& long_values,
+  AsyncFileWriter& writer )
 {
-  file_ << event.get_sender_node_id() << "\t";
+  // If the writer thread is running, data is only written to the
+  // buffer here and handed over to the writer thread in blocks
+  std::ostream& out = writer.is_running() ? static_cast< std::ostream& >( buffer_ ) : file_;
+
+  out << event.get_sender_node_id() << "\t";
 
   if ( time_in_steps_ )
   {
-    file_ << event.get_stamp().get_steps() << "\t" << event.get_offset();
+    out << event.get_stamp().get_steps() << "\t" << event.get_offset();
   }
   else
   {
-    file_ << ( event.get_stamp().get_ms() - event.get_offset() );
+    out << ( event.get_stamp().get_ms() - event.get_offset() );
   }
 
   for ( auto& val : double_values )
   {
-    file_ << "\t" << val;
+    out << "\t" << val;
   }
   for ( auto& val : long_values )
   {
-    file_ << "\t" << val;
+    out << "\t" << val;
   }
 
-  file_ << "\n";
+  out << "\n";
+
+  if ( writer.is_running() and writer.is_full( buffer_ ) )
+  {
+    writer.submit( file_, buffer_ );
+  }
+}
+
+void
+nest::RecordingBackendASCII::DeviceData::submit_buffer( AsyncFileWriter& writer )
+{
+  writer.submit( file_, buffer_ );
 }
 
 void
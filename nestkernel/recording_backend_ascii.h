@@ -25,7 +25,10 @@
 
 // C++ includes:
 #include <fstream>
+#include <sstream>
 
+// Includes from nestkernel:
+#include "async_file_writer.h"
 #include "recording_backend.h"
 
 /* BeginDocumentation
@@ -76,6 +79,71 @@ alternative way for avoiding name clashes is to re-set the kernel
 properties ``data_path`` or ``data_prefix``, so that another filename is
 chosen.
 
+.. _async_write:
+
+Asynchronous writing
+++++++++++++++++++++
+
+By default, each thread writes the data of its recording devices
+directly to the files while the nodes are updated, so that a slow file
+system delays all threads. If the backend property ``async_write`` is
+set to *true*, each recording device instead collects the formatted
+data in a buffer in memory, which is handed over to a dedicated I/O
+thread whenever it exceeds ``block_size`` bytes. The I/O thread writes
+the blocks to the files while the simulation continues. At the end of
+each call to ``Run``, all remaining data is written and the files are
+flushed, as without asynchronous writing.
+
+At most ``max_pending_blocks`` blocks wait to be written at any time.
+If the I/O thread falls behind, threads that hand over a block stall
+until the I/O thread has written another block. The properties
+``stalls`` and ``stall_time`` show how often and for how long this
+happened. Large values indicate that the file system is the
+bottleneck of the simulation.
+
+The properties are set and read via the kernel property
+``recording_backends``:
+
+::
+
+   nest.SetKernelStatus({"recording_backends": {"ascii": {"async_write": True}}})
+   nest.GetKernelStatus("recording_backends")["ascii"]["stalls"]
+
+A change of ``async_write`` takes effect with the next call to
+``Simulate`` or ``Prepare``. The statistics are reset by
+``ResetKernel``.
+
+.. glossary::
+
+ async_write
+   A Boolean (default: *false*) that enables asynchronous writing.
+
+ block_size
+   An integer (default: *1048576*) that sets the size in bytes above
+   which the buffer of a recording device is handed over to the I/O
+   thread.
+
+ max_pending_blocks
+   An integer (default: *64*) that sets the maximal number of blocks
+   that wait to be written.
+
+ blocks_written
+   The number of blocks written by the I/O thread (read only).
+
+ bytes_written
+   The number of bytes written by the I/O thread (read only).
+
+ peak_pending_blocks
+   The maximal number of blocks that waited to be written at the same
+   time (read only).
+
+ stalls
+   The number of times a thread had to wait for the I/O thread because
+   ``max_pending_blocks`` blocks were pending (read only).
+
+ stall_time
+   The total time in ms threads waited for the I/O thread (read only).
+
 Data format
 +++++++++++
 
@@ -200,7 +268,8 @@ private:
     DeviceData( std::string, std::string );
     void set_value_names( const std::vector< Name >&, const std::vector< Name >& );
     void open_file();
-    void write( const Event&, const std::vector< double >&, const std::vector< long >& );
+    void write( const Event&, const std::vector< double >&, const std::vector< long >&, AsyncFileWriter& );
+    void submit_buffer( AsyncFileWriter& );
     void flush_file();
     void close_file();
     void get_status( DictionaryDatum& ) const;
@@ -214,6 +283,7 @@ private:
     std::string file_extension_;             //!< File name extension without leading "."
     std::string label_;                      //!< The label of the device.
     std::ofstream file_;                     //!< File stream to use for the device
+    std::ostringstream buffer_;              //!< Data not yet handed over to the writer thread
     std::vector< Name > double_value_names_; //!< names for values of type double
     std::vector< Name > long_value_names_;   //!< names for values of type long
 
@@ -222,6 +292,8 @@ private:
 
   typedef std::vector< std::map< size_t, DeviceData > > data_map;
   data_map device_data_;
+
+  AsyncFileWriter writer_; //!< Writes the files in the background if enabled
 };
 
 } // namespace
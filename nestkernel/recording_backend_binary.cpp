@@ -0,0 +1,581 @@
+/*
+ *  recording_backend_binary.cpp
+ *
+ *  This file is part of NEST.
+ *
+ *  Copyright (C) 2004 The NEST Initiative
+ *
+ *  NEST is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 2 of the License, or
+ *  (at your option) any later version.
+ *
+ *  NEST is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ */
+
+// C++ includes:
+#include <cstring>
+
+// Includes from libnestutil:
+#include "compose.hpp"
+
+// Includes from nestkernel:
+#include "recording_device.h"
+#include "vp_manager_impl.h"
+
+// includes from sli:
+#include "dictutils.h"
+
+#include "recording_backend_binary.h"
+
+// Generated includes:
+#include "config.h"
+
+#ifdef HAVE_ZLIB
+#include <zlib.h>
+#endif
+
+const unsigned int nest::RecordingBackendBinary::BINARY_REC_BACKEND_VERSION = 2;
+
+nest::RecordingBackendBinary::RecordingBackendBinary()
+{
+}
+
+nest::RecordingBackendBinary::~RecordingBackendBinary() throw()
+{
+}
+
+void
+nest::RecordingBackendBinary::initialize()
+{
+  data_map tmp( kernel().vp_manager.get_num_threads() );
+  device_data_.swap( tmp );
+  writer_.reset_statistics();
+}
+
+void
+nest::RecordingBackendBinary::finalize()
+{
+  writer_.stop();
+}
+
+void
+nest::RecordingBackendBinary::enroll( const RecordingDevice& device, const DictionaryDatum& params )
+{
+  const thread t = device.get_thread();
+  const index node_id = device.get_node_id();
+
+  data_map::value_type::iterator device_data = device_data_[ t ].find( node_id );
+  if ( device_data == device_data_[ t ].end() )
+  {
+    std::string vp_node_id_string = compute_vp_node_id_string_( device );
+    std::string modelname = device.get_name();
+    auto p = device_data_[ t ].insert( std::make_pair( node_id, DeviceData( modelname, vp_node_id_string ) ) );
+    device_data = p.first;
+  }
+
+  device_data->second.set_status( params );
+}
+
+void
+nest::RecordingBackendBinary::disenroll( const RecordingDevice& device )
+{
+  const thread t = device.get_thread();
+  const index node_id = device.get_node_id();
+
+  data_map::value_type::iterator device_data = device_data_[ t ].find( node_id );
+  if ( device_data != device_data_[ t ].end() )
+  {
+    device_data_[ t ].erase( device_data );
+  }
+}
+
+void
+nest::RecordingBackendBinary::set_value_names( const RecordingDevice& device,
+  const std::vector< Name >& double_value_names,
+  const std::vector< Name >& long_value_names )
+{
+  const thread t = device.get_thread();
+  const index node_id = device.get_node_id();
+
+  data_map::value_type::iterator device_data = device_data_[ t ].find( node_id );
+  assert( device_data != device_data_[ t ].end() );
+  device_data->second.set_value_names( double_value_names, long_value_names );
+}
+
+void
+nest::RecordingBackendBinary::pre_run_hook()
+{
+  // nothing to do
+}
+
+void
+nest::RecordingBackendBinary::post_run_hook()
+{
+  for ( auto& inner : device_data_ )
+  {
+    for ( auto& device_data : inner )
+    {
+      device_data.second.write_chunk( writer_ );
+      device_data.second.submit_buffer( writer_ );
+    }
+  }
+
+  if ( writer_.is_running() )
+  {
+    writer_.wait();
+  }
+
+  for ( auto& inner : device_data_ )
+  {
+    for ( auto& device_data : inner )
+    {
+      device_data.second.flush_file();
+    }
+  }
+}
+
+void
+nest::RecordingBackendBinary::post_step_hook()
+{
+  // nothing to do
+}
+
+void
+nest::RecordingBackendBinary::cleanup()
+{
+  if ( writer_.is_running() )
+  {
+    for ( auto& inner : device_data_ )
+    {
+      for ( auto& device_data : inner )
+      {
+        device_data.second.write_chunk( writer_ );
+        device_data.second.submit_buffer( writer_ );
+      }
+    }
+    writer_.stop();
+  }
+
+  for ( auto& inner : device_data_ )
+  {
+    for ( auto& device_data : inner )
+    {
+      device_data.second.close_file( writer_ );
+    }
+  }
+}
+
+void
+nest::RecordingBackendBinary::write( const RecordingDevice& device,
+  const Event& event,
+  const std::vector< double >& double_values,
+  const std::vector< long >& long_values )
+{
+  const thread t = device.get_thread();
+  const index node_id = device.get_node_id();
+
+  data_map::value_type::iterator device_data = device_data_[ t ].find( node_id );
+  if ( device_data == device_data_[ t ].end() )
+  {
+    return;
+  }
+
+  device_data->second.write( event, double_values, long_values, writer_ );
+}
+
+const std::string
+nest::RecordingBackendBinary::compute_vp_node_id_string_( const RecordingDevice& device ) const
+{
+  const float num_vps = kernel().vp_manager.get_num_virtual_processes();
+  const float num_nodes = kernel().node_manager.size();
+  const int vp_digits = static_cast< int >( std::floor( std::log10( num_vps ) ) + 1 );
+  const int node_id_digits = static_cast< int >( std::floor( std::log10( num_nodes ) ) + 1 );
+
+  std::ostringstream vp_node_id_string;
+  vp_node_id_string << "-" << std::setfill( '0' ) << std::setw( node_id_digits ) << device.get_node_id() << "-"
+                    << std::setfill( '0' ) << std::setw( vp_digits ) << device.get_vp();
+
+  return vp_node_id_string.str();
+}
+
+void
+nest::RecordingBackendBinary::prepare()
+{
+  for ( auto& inner : device_data_ )
+  {
+    for ( auto& device_info : inner )
+    {
+      device_info.second.open_file();
+    }
+  }
+
+  writer_.start();
+}
+
+void
+nest::RecordingBackendBinary::set_status( const DictionaryDatum& d )
+{
+  writer_.set_status( d );
+}
+
+void
+nest::RecordingBackendBinary::get_status( DictionaryDatum& d ) const
+{
+  writer_.get_status( d );
+}
+
+void
+nest::RecordingBackendBinary::check_device_status( const DictionaryDatum& params ) const
+{
+  DeviceData dd( "", "" );
+  dd.set_status( params ); // throws if params contains invalid entries
+}
+
+void
+nest::RecordingBackendBinary::get_device_defaults( DictionaryDatum& params ) const
+{
+  DeviceData dd( "", "" );
+  dd.get_status( params );
+}
+
+void
+nest::RecordingBackendBinary::get_device_status( const nest::RecordingDevice& device, DictionaryDatum& d ) const
+{
+  const thread t = device.get_thread();
+  const index node_id = device.get_node_id();
+
+  data_map::value_type::const_iterator device_data = device_data_[ t ].find( node_id );
+  if ( device_data != device_data_[ t ].end() )
+  {
+    device_data->second.get_status( d );
+  }
+}
+
+/* ******************* Device meta data class DeviceData ******************* */
+
+nest::RecordingBackendBinary::DeviceData::DeviceData( std::string modelname, std::string vp_node_id_string )
+  : chunk_size_( 65536 )
+  , compression_( "none" )
+  , compression_level_( 1 )
+  , modelname_( modelname )
+  , vp_node_id_string_( vp_node_id_string )
+  , file_extension_( "nbin" )
+  , label_( "" )
+{
+}
+
+void
+nest::RecordingBackendBinary::DeviceData::set_value_names( const std::vector< Name >& double_value_names,
+  const std::vector< Name >& long_value_names )
+{
+  double_value_names_ = double_value_names;
+  long_value_names_ = long_value_names;
+  double_values_.resize( double_value_names_.size() );
+  long_values_.resize( long_value_names_.size() );
+}
+
+void
+nest::RecordingBackendBinary::DeviceData::flush_file()
+{
+  file_.flush();
+}
+
+void
+nest::RecordingBackendBinary::DeviceData::open_file()
+{
+  std::string filename = compute_filename_();
+
+  std::ifstream test( filename.c_str() );
+  if ( test.good() && not kernel().io_manager.overwrite_files() )
+  {
+    std::string msg = String::compose(
+      "The file '%1' already exists and overwriting files is disabled. To overwrite files, set "
+      "the kernel property overwrite_files to true. To change the name or location of the file, "
+      "change the kernel properties data_path or data_prefix, or the device property label.",
+      filename );
+    LOG( M_ERROR, "RecordingBackendBinary::enroll()", msg );
+    throw IOError();
+  }
+  test.close();
+
+  file_ = std::ofstream( filename.c_str(), std::ios::binary );
+
+  if ( not file_.good() )
+  {
+    std::string msg = String::compose( "I/O error while opening file '%1'.", filename );
+    LOG( M_ERROR, "RecordingBackendBinary::prepare()", msg );
+    throw IOError();
+  }
+
+  const uint32_t version = BINARY_REC_BACKEND_VERSION;
+  const uint32_t byte_order_mark = 0x01020304;
+  const double resolution = Time::get_resolution().get_ms();
+  const uint32_t num_double_values = double_value_names_.size();
+  const uint32_t num_long_values = long_value_names_.size();
+  const uint32_t compression = compression_ == "zlib" ? 1 : 0;
+
+  file_.write( "NESTBIN", 8 );
+  file_.write( reinterpret_cast< const char* >( &version ), sizeof( version ) );
+  file_.write( reinterpret_cast< const char* >( &byte_order_mark ), sizeof( byte_order_mark ) );
+  file_.write( reinterpret_cast< const char* >( &resolution ), sizeof( resolution ) );
+  write_string_( NEST_VERSION_STRING );
+  file_.write( reinterpret_cast< const char* >( &num_double_values ), sizeof( num_double_values ) );
+  file_.write( reinterpret_cast< const char* >( &num_long_values ), sizeof( num_long_values ) );
+  for ( auto& val : double_value_names_ )
+  {
+    write_string_( val.toString() );
+  }
+  for ( auto& val : long_value_names_ )
+  {
+    write_string_( val.toString() );
+  }
+  file_.write( reinterpret_cast< const char* >( &compression ), sizeof( compression ) );
+
+  // Pad the header, so that all columns start at a multiple of 8 bytes
+  const long padding = ( 8 - static_cast< long >( file_.tellp() ) % 8 ) % 8;
+  file_.write( "\0\0\0\0\0\0\0", padding );
+
+  buffer_.str( "" );
+}
+
+void
+nest::RecordingBackendBinary::DeviceData::close_file( AsyncFileWriter& writer )
+{
+  if ( file_.is_open() )
+  {
+    write_chunk( writer );
+  }
+  file_.close();
+}
+
+void
+nest::RecordingBackendBinary::DeviceData::write( const Event& event,
+  const std::vector< double >& double_values,
+  const std::vector< long >& long_values,
+  AsyncFileWriter& writer )
+{
+  senders_.push_back( event.get_sender_node_id() );
+  steps_.push_back( event.get_stamp().get_steps() );
+  offsets_.push_back( event.get_offset() );
+
+  for ( size_t i = 0; i < double_values.size(); ++i )
+  {
+    double_values_[ i ].push_back( double_values[ i ] );
+  }
+  for ( size_t i = 0; i < long_values.size(); ++i )
+  {
+    long_values_[ i ].push_back( long_values[ i ] );
+  }
+
+  if ( static_cast< long >( senders_.size() ) >= chunk_size_ )
+  {
+    write_chunk( writer );
+  }
+}
+
+void
+nest::RecordingBackendBinary::DeviceData::write_chunk( AsyncFileWriter& writer )
+{
+  const uint64_t num_events = senders_.size();
+  if ( num_events == 0 )
+  {
+    return;
+  }
+
+  // If the writer thread is running, chunks are only written to the
+  // buffer here and handed over to the writer thread in blocks
+  std::ostream& out = writer.is_running() ? static_cast< std::ostream& >( buffer_ ) : file_;
+
+  if ( compression_ == "zlib" )
+  {
+    write_compressed_chunk_( out );
+  }
+  else
+  {
+    out.write( reinterpret_cast< const char* >( &num_events ), sizeof( num_events ) );
+    out.write( reinterpret_cast< const char* >( senders_.data() ), num_events * sizeof( int64_t ) );
+    out.write( reinterpret_cast< const char* >( steps_.data() ), num_events * sizeof( int64_t ) );
+    out.write( reinterpret_cast< const char* >( offsets_.data() ), num_events * sizeof( double ) );
+    for ( auto& column : double_values_ )
+    {
+      out.write( reinterpret_cast< const char* >( column.data() ), num_events * sizeof( double ) );
+    }
+    for ( auto& column : long_values_ )
+    {
+      out.write( reinterpret_cast< const char* >( column.data() ), num_events * sizeof( int64_t ) );
+    }
+  }
+
+  senders_.clear();
+  steps_.clear();
+  offsets_.clear();
+  for ( auto& column : double_values_ )
+  {
+    column.clear();
+  }
+  for ( auto& column : long_values_ )
+  {
+    column.clear();
+  }
+
+  if ( writer.is_running() and writer.is_full( buffer_ ) )
+  {
+    writer.submit( file_, buffer_ );
+  }
+}
+
+void
+nest::RecordingBackendBinary::DeviceData::submit_buffer( AsyncFileWriter& writer )
+{
+  if ( writer.is_running() )
+  {
+    writer.submit( file_, buffer_ );
+  }
+}
+
+void
+nest::RecordingBackendBinary::DeviceData::write_compressed_chunk_( std::ostream& out )
+{
+#ifdef HAVE_ZLIB
+  const uint64_t num_events = senders_.size();
+
+  // Senders and time steps change only little from one event to the
+  // next, so their differences compress much better than the values.
+  // The buffers are cleared after writing, so they are encoded in place.
+  for ( size_t i = num_events - 1; i > 0; --i )
+  {
+    senders_[ i ] -= senders_[ i - 1 ];
+    steps_[ i ] -= steps_[ i - 1 ];
+  }
+
+  const size_t column_size = num_events * 8;
+  std::vector< char > data( ( 3 + double_values_.size() + long_values_.size() ) * column_size );
+  char* pos = data.data();
+  std::memcpy( pos, senders_.data(), column_size );
+  std::memcpy( pos += column_size, steps_.data(), column_size );
+  std::memcpy( pos += column_size, offsets_.data(), column_size );
+  for ( auto& column : double_values_ )
+  {
+    std::memcpy( pos += column_size, column.data(), column_size );
+  }
+  for ( auto& column : long_values_ )
+  {
+    std::memcpy( pos += column_size, column.data(), column_size );
+  }
+
+  uLongf compressed_size = compressBound( data.size() );
+  std::vector< char > compressed( compressed_size );
+  const int status = compress2( reinterpret_cast< Bytef* >( compressed.data() ),
+    &compressed_size,
+    reinterpret_cast< const Bytef* >( data.data() ),
+    data.size(),
+    compression_level_ );
+  if ( status != Z_OK )
+  {
+    std::string msg =
+      String::compose( "zlib error %1 while compressing data for file '%2'.", status, compute_filename_() );
+    LOG( M_ERROR, "RecordingBackendBinary::write()", msg );
+    throw IOError();
+  }
+
+  const uint64_t size = compressed_size;
+  out.write( reinterpret_cast< const char* >( &num_events ), sizeof( num_events ) );
+  out.write( reinterpret_cast< const char* >( &size ), sizeof( size ) );
+  out.write( compressed.data(), size );
+
+  // Pad the chunk, so that the next chunk starts at a multiple of 8 bytes
+  out.write( "\0\0\0\0\0\0\0", ( 8 - size % 8 ) % 8 );
+#endif
+}
+
+void
+nest::RecordingBackendBinary::DeviceData::write_string_( const std::string& s )
+{
+  const uint32_t length = s.size();
+  file_.write( reinterpret_cast< const char* >( &length ), sizeof( length ) );
+  file_.write( s.data(), length );
+}
+
+void
+nest::RecordingBackendBinary::DeviceData::get_status( DictionaryDatum& d ) const
+{
+  ( *d )[ names::chunk_size ] = chunk_size_;
+  ( *d )[ names::compression ] = compression_;
+  ( *d )[ names::compression_level ] = compression_level_;
+  ( *d )[ names::file_extension ] = file_extension_;
+
+  std::string filename = compute_filename_();
+  initialize_property_array( d, names::filenames );
+  append_property( d, names::filenames, filename );
+}
+
+void
+nest::RecordingBackendBinary::DeviceData::set_status( const DictionaryDatum& d )
+{
+  updateValue< std::string >( d, names::file_extension, file_extension_ );
+  updateValue< std::string >( d, names::label, label_ );
+
+  long chunk_size = chunk_size_;
+  if ( updateValue< long >( d, names::chunk_size, chunk_size ) )
+  {
+    if ( chunk_size < 1 )
+    {
+      throw BadProperty( "Property chunk_size must be positive." );
+    }
+    chunk_size_ = chunk_size;
+  }
+
+  std::string compression = compression_;
+  if ( updateValue< std::string >( d, names::compression, compression ) )
+  {
+    if ( compression != "none" and compression != "zlib" )
+    {
+      throw BadProperty( "Property compression must be \"none\" or \"zlib\"." );
+    }
+#ifndef HAVE_ZLIB
+    if ( compression == "zlib" )
+    {
+      throw BadProperty( "Compression with zlib is not available, since NEST was compiled without zlib." );
+    }
+#endif
+    compression_ = compression;
+  }
+
+  long compression_level = compression_level_;
+  if ( updateValue< long >( d, names::compression_level, compression_level ) )
+  {
+    if ( compression_level < 0 or compression_level > 9 )
+    {
+      throw BadProperty( "Property compression_level must be between 0 and 9." );
+    }
+    compression_level_ = compression_level;
+  }
+}
+
+std::string
+nest::RecordingBackendBinary::DeviceData::compute_filename_() const
+{
+  std::string data_path = kernel().io_manager.get_data_path();
+  if ( not data_path.empty() and not( data_path[ data_path.size() - 1 ] == '/' ) )
+  {
+    data_path += '/';
+  }
+
+  std::string label = label_;
+  if ( label.empty() )
+  {
+    label = modelname_;
+  }
+
+  std::string data_prefix = kernel().io_manager.get_data_prefix();
+
+  return data_path + data_prefix + label + vp_node_id_string_ + "." + file_extension_;
+}
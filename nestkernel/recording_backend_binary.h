@@ -0,0 +1,262 @@
+/*
+ *  recording_backend_binary.h
+ *
+ *  This file is part of NEST.
+ *
+ *  Copyright (C) 2004 The NEST Initiative
+ *
+ *  NEST is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 2 of the License, or
+ *  (at your option) any later version.
+ *
+ *  NEST is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ */
+
+#ifndef RECORDING_BACKEND_BINARY_H
+#define RECORDING_BACKEND_BINARY_H
+
+// C++ includes:
+#include <cstdint>
+#include <fstream>
+#include <sstream>
+
+// Includes from nestkernel:
+#include "async_file_writer.h"
+#include "recording_backend.h"
+
+/* BeginDocumentation
+
+.. _binary_backend:
+
+Write data to binary files
+##########################
+
+The `binary` recording backend writes collected data persistently to
+binary files. Compared to the :ref:`ASCII backend <ascii_backend>`, it
+avoids formatting numbers as text, which makes writing faster and the
+files smaller, and numbers are stored without loss of precision. The
+files can be read efficiently, e.g. by memory-mapping them with NumPy.
+
+Like the `ascii` backend, this backend opens one file per recording
+device per thread on each MPI process. Filenames of data files are
+determined according to the same pattern:
+
+::
+
+   data_path/data_prefix(label|model_name)-node_id-vp.file_extension
+
+Data is collected in memory and written to the file in chunks of at
+most ``chunk_size`` events. A chunk is written whenever the buffer is
+full and at the end of each call to ``Run``, so that all data is
+available for inspection after each call to ``Run``.
+
+If ``compression`` is set to ``"zlib"``, each chunk is compressed
+before it is written. Since the senders and time steps are stored as
+differences to the previous event, spike data can typically be reduced
+to a tenth of its size or less. Compression is only available if NEST
+was compiled with zlib. Files can be read with the functions of the
+PyNEST module ``nest.io``.
+
+The life of a file starts with the call to ``Prepare`` and ends with the
+call to ``Cleanup``. Existing files are handled as described for the
+`ascii` backend, i.e., the kernel property ``overwrite_files`` has to be
+set to *true* to overwrite them.
+
+Chunks can be written to the files by a dedicated I/O thread while the
+simulation continues. This is enabled with the backend property
+``async_write`` and works as described for the :ref:`ASCII backend
+<async_write>`, e.g.:
+
+::
+
+   nest.SetKernelStatus({"recording_backends": {"binary": {"async_write": True}}})
+
+Data format
++++++++++++
+
+All numbers are stored in the native byte order of the machine that
+wrote the file. Each file starts with a header, which consists of
+
+* the 8 characters ``NESTBIN`` followed by a null character,
+* the version of the file format as 32 bit unsigned integer,
+* the number ``0x01020304`` as 32 bit unsigned integer, which allows
+  readers to detect the byte order,
+* the simulation resolution in ms as 64 bit floating point number,
+* the NEST version with which the file was created,
+* the number of floating point and of integer value columns, each as
+  32 bit unsigned integer, and
+* the names of the floating point value columns followed by the names
+  of the integer value columns, and
+* the compression method as 32 bit unsigned integer, which is 0 for
+  uncompressed and 1 for zlib compressed chunks.
+
+The NEST version and the column names are stored as the length of the
+string as 32 bit unsigned integer, followed by the characters of the
+string without terminating null character. The header is padded with
+null characters to a multiple of 8 bytes.
+
+The header is followed by the data chunks. Each chunk starts with the
+number of events *n* in the chunk as 64 bit unsigned integer, followed
+by one column after the other, each with *n* entries:
+
+* the node IDs of the senders as 64 bit integers,
+* the time steps of the events as 64 bit integers,
+* the negative offsets of the events from the time steps in ms as 64 bit
+  floating point numbers,
+* the floating point value columns as 64 bit floating point numbers and
+* the integer value columns as 64 bit integers.
+
+The time of an event in ms is given by the time step multiplied by the
+resolution minus the offset.
+
+Compressed chunks start with the number of events *n* and the size of
+the compressed data in bytes, each as 64 bit unsigned integer, followed
+by the compressed data and null characters to pad the chunk to a
+multiple of 8 bytes. The decompressed data contains the columns as
+described above, except that the senders and the time steps contain
+the difference to the previous entry of the column within the chunk,
+with the first entry being the difference to 0.
+
+Parameter summary
++++++++++++++++++
+
+.. glossary::
+
+ chunk_size
+   An integer (default: *65536*) that sets the maximal number of events
+   written to the file at once.
+
+ compression
+   A string (default: *"none"*) that sets the compression method of the
+   chunks. Can be *"none"* or *"zlib"*.
+
+ compression_level
+   An integer between 0 and 9 (default: *1*) that sets the zlib
+   compression level, which trades off speed (1) against size (9).
+
+ file_extension
+   A string (default: *"nbin"*) that specifies the file name extension,
+   without leading dot.
+
+ filenames
+   A list of the filenames where data is recorded to. This list has one
+   entry per local thread and is a read-only property.
+
+ label
+   A string (default: *""*) that replaces the model name component in
+   the filename if it is set.
+
+EndDocumentation */
+
+namespace nest
+{
+
+/**
+ * Binary specialization of the RecordingBackend interface.
+ *
+ * RecordingBackendBinary maintains a data structure mapping one file
+ * stream and one buffer for the data to every recording device instance
+ * on every thread. Files are opened during the prepare() call, buffers
+ * are written to the files if they are full and in post_run_hook(), and
+ * files are closed in cleanup().
+ */
+class RecordingBackendBinary : public RecordingBackend
+{
+public:
+  const static unsigned int BINARY_REC_BACKEND_VERSION;
+
+  RecordingBackendBinary();
+
+  ~RecordingBackendBinary() throw();
+
+  void initialize() override;
+
+  void finalize() override;
+
+  void enroll( const RecordingDevice& device, const DictionaryDatum& params ) override;
+
+  void disenroll( const RecordingDevice& device ) override;
+
+  void set_value_names( const RecordingDevice& device,
+    const std::vector< Name >& double_value_names,
+    const std::vector< Name >& long_value_names ) override;
+
+  void prepare() override;
+
+  void cleanup() override;
+
+  void pre_run_hook() override;
+
+  /**
+   * Write buffered data and flush files after a single call to Run
+   */
+  void post_run_hook() override;
+
+  void post_step_hook() override;
+
+  void write( const RecordingDevice&, const Event&, const std::vector< double >&, const std::vector< long >& ) override;
+
+  void set_status( const DictionaryDatum& ) override;
+  void get_status( DictionaryDatum& ) const override;
+
+  void check_device_status( const DictionaryDatum& ) const override;
+  void get_device_defaults( DictionaryDatum& ) const override;
+  void get_device_status( const RecordingDevice& device, DictionaryDatum& ) const override;
+
+private:
+  const std::string compute_vp_node_id_string_( const RecordingDevice& device ) const;
+
+  struct DeviceData
+  {
+    DeviceData() = delete;
+    DeviceData( std::string, std::string );
+    void set_value_names( const std::vector< Name >&, const std::vector< Name >& );
+    void open_file();
+    void write( const Event&, const std::vector< double >&, const std::vector< long >&, AsyncFileWriter& );
+    void write_chunk( AsyncFileWriter& );
+    void submit_buffer( AsyncFileWriter& );
+    void flush_file();
+    void close_file( AsyncFileWriter& );
+    void get_status( DictionaryDatum& ) const;
+    void set_status( const DictionaryDatum& );
+
+  private:
+    long chunk_size_;                                    //!< Maximal number of events written at once
+    std::string compression_;                            //!< Compression method of the chunks
+    long compression_level_;                             //!< zlib compression level
+    std::string modelname_;                              //!< File name up to but not including the "."
+    std::string vp_node_id_string_;                      //!< The vp and node ID component of the filename
+    std::string file_extension_;                         //!< File name extension without leading "."
+    std::string label_;                                  //!< The label of the device.
+    std::ofstream file_;                                 //!< File stream to use for the device
+    std::ostringstream buffer_;                          //!< Data not yet handed over to the writer thread
+    std::vector< Name > double_value_names_;             //!< names for values of type double
+    std::vector< Name > long_value_names_;               //!< names for values of type long
+    std::vector< int64_t > senders_;                     //!< buffered node IDs of the senders
+    std::vector< int64_t > steps_;                       //!< buffered time steps of the events
+    std::vector< double > offsets_;                      //!< buffered offsets of the events
+    std::vector< std::vector< double > > double_values_; //!< buffered values of type double, one per column
+    std::vector< std::vector< int64_t > > long_values_;  //!< buffered values of type long, one per column
+
+    std::string compute_filename_() const; //!< Compose and return the filename
+    void write_compressed_chunk_( std::ostream& );
+    void write_string_( const std::string& );
+  };
+
+  typedef std::vector< std::map< size_t, DeviceData > > data_map;
+  data_map device_data_;
+
+  AsyncFileWriter writer_; //!< Writes the files in the background if enabled
+};
+
+} // namespace
+
+#endif // RECORDING_BACKEND_BINARY_H
@@ -20,12 +20,98 @@
  *
  */
 
+// C++ includes:
+#include <algorithm>
+#include <functional>
+#include <queue>
+#include <tuple>
+
 // Includes from nestkernel:
 #include "recording_device.h"
 #include "vp_manager_impl.h"
 
 #include "recording_backend_memory.h"
 
+namespace
+{
+
+/**
+ * Append the elements first to last - 1 of the ring buffer values, whose
+ * oldest element is at index head, to the vector datum with the given
+ * name in the dictionary, in order from oldest to newest.
+ */
+template < typename VectorDatumT, typename T >
+void
+append_range_( DictionaryDatum& d, Name name, const std::vector< T >& values, size_t head, size_t first, size_t last )
+{
+  Token t = d->lookup( name );
+  assert( not t.empty() );
+
+  VectorDatumT* vd = dynamic_cast< VectorDatumT* >( t.datum() );
+  assert( vd != 0 );
+
+  const size_t capacity = values.size();
+  size_t begin = head + first;
+  size_t end = head + last;
+  if ( begin >= capacity )
+  {
+    begin -= capacity;
+    end -= capacity;
+  }
+
+  ( *vd )->reserve( ( *vd )->size() + last - first );
+  if ( end <= capacity )
+  {
+    ( *vd )->insert( ( *vd )->end(), values.begin() + begin, values.begin() + end );
+  }
+  else
+  {
+    ( *vd )->insert( ( *vd )->end(), values.begin() + begin, values.end() );
+    ( *vd )->insert( ( *vd )->end(), values.begin(), values.begin() + ( end - capacity ) );
+  }
+}
+
+/**
+ * Move the elements of the ring buffer values, whose oldest element is
+ * at index head, to the start of the vector, keeping their order, and
+ * resize it to the given capacity.
+ */
+template < typename T >
+void
+unroll_ring_( std::vector< T >& values, size_t head, size_t capacity )
+{
+  std::rotate( values.begin(), values.begin() + head, values.end() );
+  values.resize( capacity );
+}
+
+/**
+ * Append the elements given by order to the vector datum with the given
+ * name in the dictionary. Each element of order is a pair of the index
+ * of a thread and the index of the element in the vector returned by
+ * column for that thread.
+ */
+template < typename VectorDatumT, typename ColumnT >
+void
+append_ordered_( DictionaryDatum& d,
+  Name name,
+  const std::vector< std::pair< size_t, size_t > >& order,
+  ColumnT column )
+{
+  Token t = d->lookup( name );
+  assert( not t.empty() );
+
+  VectorDatumT* vd = dynamic_cast< VectorDatumT* >( t.datum() );
+  assert( vd != 0 );
+
+  ( *vd )->reserve( ( *vd )->size() + order.size() );
+  for ( const auto& event : order )
+  {
+    ( *vd )->push_back( column( event.first )[ event.second ] );
+  }
+}
+
+} // namespace
+
 nest::RecordingBackendMemory::RecordingBackendMemory()
 {
 }
@@ -136,13 +222,63 @@ nest::RecordingBackendMemory::get_device_status( const RecordingDevice& device,
   if ( device_data != device_data_[ t ].end() )
   {
     device_data->second.get_status( d );
+
+    // The device on thread 0 collects the merged events of all threads
+    if ( device_data->second.is_time_sorted() and t == 0 )
+    {
+      DictionaryDatum events = getValue< DictionaryDatum >( d, names::events );
+      DeviceData::append_time_sorted_events( events, get_thread_siblings_data_( node_id ), false );
+    }
   }
 }
 
+void
+nest::RecordingBackendMemory::get_device_new_events( const RecordingDevice& device,
+  DictionaryDatum& events,
+  bool drain )
+{
+  const thread t = device.get_thread();
+  const index node_id = device.get_node_id();
+
+  const auto device_data = device_data_[ t ].find( node_id );
+  if ( device_data != device_data_[ t ].end() )
+  {
+    // The device on thread 0 is read first and collects the merged events of all threads
+    if ( device_data->second.is_time_sorted() and t == 0 )
+    {
+      DeviceData::append_time_sorted_events( events, get_thread_siblings_data_( node_id ), true );
+    }
+
+    device_data->second.get_new_events( events, drain );
+  }
+}
+
+std::vector< const nest::RecordingBackendMemory::DeviceData* >
+nest::RecordingBackendMemory::get_thread_siblings_data_( index node_id ) const
+{
+  std::vector< const DeviceData* > siblings_data;
+  for ( const auto& thread_device_data : device_data_ )
+  {
+    const auto device_data = thread_device_data.find( node_id );
+    if ( device_data != thread_device_data.end() )
+    {
+      siblings_data.push_back( &device_data->second );
+    }
+  }
+  return siblings_data;
+}
+
 void
 nest::RecordingBackendMemory::post_run_hook()
 {
-  // nothing to do
+  const double now = kernel().simulation_manager.get_time().get_ms();
+  for ( auto& thread_device_data : device_data_ )
+  {
+    for ( auto& device_data : thread_device_data )
+    {
+      device_data.second.discard_old_events( now );
+    }
+  }
 }
 
 void
@@ -173,6 +309,12 @@ nest::RecordingBackendMemory::prepare()
 
 nest::RecordingBackendMemory::DeviceData::DeviceData()
   : time_in_steps_( false )
+  , time_sorted_( false )
+  , head_( 0 )
+  , size_( 0 )
+  , read_position_( 0 )
+  , max_events_( 0 )
+  , window_ms_( 0.0 )
 {
 }
 
@@ -181,10 +323,10 @@ nest::RecordingBackendMemory::DeviceData::set_value_names( const std::vector< Na
   const std::vector< Name >& long_value_names )
 {
   double_value_names_ = double_value_names;
-  double_values_.resize( double_value_names.size() );
+  double_values_.resize( double_value_names.size(), std::vector< double >( senders_.size() ) );
 
   long_value_names_ = long_value_names;
-  long_values_.resize( long_value_names.size() );
+  long_values_.resize( long_value_names.size(), std::vector< long >( senders_.size() ) );
 }
 
 void
@@ -192,26 +334,209 @@ nest::RecordingBackendMemory::DeviceData::push_back( const Event& event,
   const std::vector< double >& double_values,
   const std::vector< long >& long_values )
 {
-  senders_.push_back( event.get_sender_node_id() );
+  if ( not is_bounded_() )
+  {
+    set_( new_slot_(), event, double_values, long_values );
+    ++size_;
+    return;
+  }
+
+  // Keep the events sorted by time, so that the oldest ones are discarded
+  // first. Events arrive almost in order, so the search is short. Events
+  // are never inserted before the events read by get_new_events().
+  const double time_ms = event.get_stamp().get_ms() - event.get_offset();
+  if ( max_events_ > 0 and size_ == max_events_ )
+  {
+    // An event older than all events kept would be discarded right away
+    if ( read_position_ == 0 and time_ms < time_ms_( index_( 0 ) ) )
+    {
+      return;
+    }
+    drop_oldest_( 1 );
+  }
+
+  set_( new_slot_(), event, double_values, long_values );
+  ++size_;
+  for ( size_t i = size_ - 1; i > read_position_ and time_ms_( index_( i - 1 ) ) > time_ms; --i )
+  {
+    swap_( index_( i - 1 ), index_( i ) );
+  }
+
+  discard_old_events( time_ms_( index_( size_ - 1 ) ) );
+}
+
+size_t
+nest::RecordingBackendMemory::DeviceData::index_( size_t i ) const
+{
+  const size_t index = head_ + i;
+  return index < senders_.size() ? index : index - senders_.size();
+}
+
+size_t
+nest::RecordingBackendMemory::DeviceData::new_slot_()
+{
+  if ( size_ < senders_.size() )
+  {
+    return index_( size_ );
+  }
+
+  // The buffer is full and has to grow. Unbounded buffers grow like
+  // vectors. Bounded buffers double their capacity up to max_events_,
+  // so that they have to be unrolled only rarely.
+  size_t capacity = size_ + 1;
+  if ( is_bounded_() )
+  {
+    capacity = std::max( capacity, 2 * size_ );
+    if ( max_events_ > 0 )
+    {
+      capacity = std::min( capacity, max_events_ );
+    }
+  }
+  unroll_( capacity );
+  return size_;
+}
+
+void
+nest::RecordingBackendMemory::DeviceData::set_( size_t index,
+  const Event& event,
+  const std::vector< double >& double_values,
+  const std::vector< long >& long_values )
+{
+  senders_[ index ] = event.get_sender_node_id();
 
   if ( time_in_steps_ )
   {
-    times_steps_.push_back( event.get_stamp().get_steps() );
-    times_offset_.push_back( event.get_offset() );
+    times_steps_[ index ] = event.get_stamp().get_steps();
+    times_offset_[ index ] = event.get_offset();
   }
   else
   {
-    times_ms_.push_back( event.get_stamp().get_ms() - event.get_offset() );
+    times_ms_[ index ] = event.get_stamp().get_ms() - event.get_offset();
   }
 
   for ( size_t i = 0; i < double_values.size(); ++i )
   {
-    double_values_[ i ].push_back( double_values[ i ] );
+    double_values_[ i ][ index ] = double_values[ i ];
   }
   for ( size_t i = 0; i < long_values.size(); ++i )
   {
-    long_values_[ i ].push_back( long_values[ i ] );
+    long_values_[ i ][ index ] = long_values[ i ];
+  }
+}
+
+void
+nest::RecordingBackendMemory::DeviceData::swap_( size_t a, size_t b )
+{
+  std::swap( senders_[ a ], senders_[ b ] );
+
+  if ( time_in_steps_ )
+  {
+    std::swap( times_steps_[ a ], times_steps_[ b ] );
+    std::swap( times_offset_[ a ], times_offset_[ b ] );
+  }
+  else
+  {
+    std::swap( times_ms_[ a ], times_ms_[ b ] );
+  }
+
+  for ( size_t i = 0; i < double_values_.size(); ++i )
+  {
+    std::swap( double_values_[ i ][ a ], double_values_[ i ][ b ] );
+  }
+  for ( size_t i = 0; i < long_values_.size(); ++i )
+  {
+    std::swap( long_values_[ i ][ a ], long_values_[ i ][ b ] );
+  }
+}
+
+void
+nest::RecordingBackendMemory::DeviceData::drop_oldest_( size_t n )
+{
+  if ( n == 0 )
+  {
+    return;
   }
+  head_ = index_( n );
+  size_ -= n;
+  read_position_ = read_position_ > n ? read_position_ - n : 0;
+}
+
+void
+nest::RecordingBackendMemory::DeviceData::unroll_( size_t capacity )
+{
+  unroll_ring_( senders_, head_, capacity );
+
+  if ( time_in_steps_ )
+  {
+    unroll_ring_( times_steps_, head_, capacity );
+    unroll_ring_( times_offset_, head_, capacity );
+  }
+  else
+  {
+    unroll_ring_( times_ms_, head_, capacity );
+  }
+
+  for ( size_t i = 0; i < double_values_.size(); ++i )
+  {
+    unroll_ring_( double_values_[ i ], head_, capacity );
+  }
+  for ( size_t i = 0; i < long_values_.size(); ++i )
+  {
+    unroll_ring_( long_values_[ i ], head_, capacity );
+  }
+
+  head_ = 0;
+}
+
+void
+nest::RecordingBackendMemory::DeviceData::discard_old_events( double now )
+{
+  if ( not is_bounded_() )
+  {
+    return;
+  }
+
+  if ( max_events_ > 0 and size_ > max_events_ )
+  {
+    drop_oldest_( size_ - max_events_ );
+  }
+  if ( window_ms_ > 0 )
+  {
+    size_t n = 0;
+    while ( n < size_ and time_ms_( index_( n ) ) <= now - window_ms_ )
+    {
+      ++n;
+    }
+    drop_oldest_( n );
+  }
+
+  // Shrink the buffer if max_events_ was reduced
+  if ( max_events_ > 0 and senders_.size() > max_events_ )
+  {
+    unroll_( max_events_ );
+  }
+}
+
+bool
+nest::RecordingBackendMemory::DeviceData::is_time_sorted() const
+{
+  return time_sorted_;
+}
+
+bool
+nest::RecordingBackendMemory::DeviceData::is_bounded_() const
+{
+  return max_events_ > 0 or window_ms_ > 0;
+}
+
+double
+nest::RecordingBackendMemory::DeviceData::time_ms_( size_t index ) const
+{
+  if ( time_in_steps_ )
+  {
+    return Time( Time::step( times_steps_[ index ] ) ).get_ms() - times_offset_[ index ];
+  }
+  return times_ms_[ index ];
 }
 
 void
@@ -229,35 +554,187 @@ nest::RecordingBackendMemory::DeviceData::get_status( DictionaryDatum& d ) const
     events = getValue< DictionaryDatum >( d, names::events );
   }
 
+  // Time sorted events are appended for all threads by append_time_sorted_events()
+  append_events_( events, time_sorted_ ? size_ : 0 );
+
+  ( *d )[ names::time_in_steps ] = time_in_steps_;
+  ( *d )[ names::time_sorted ] = time_sorted_;
+  ( *d )[ names::max_events ] = max_events_;
+  ( *d )[ names::window_ms ] = window_ms_;
+}
+
+void
+nest::RecordingBackendMemory::DeviceData::get_new_events( DictionaryDatum& events, bool drain )
+{
+  append_events_( events, time_sorted_ ? size_ : read_position_ );
+
+  if ( drain )
+  {
+    clear();
+  }
+  else
+  {
+    read_position_ = size_;
+  }
+}
+
+void
+nest::RecordingBackendMemory::DeviceData::append_events_( DictionaryDatum& events, size_t first ) const
+{
   initialize_property_intvector( events, names::senders );
-  append_property( events, names::senders, senders_ );
+  append_range_< IntVectorDatum >( events, names::senders, senders_, head_, first, size_ );
 
   if ( time_in_steps_ )
   {
     initialize_property_intvector( events, names::times );
-    append_property( events, names::times, times_steps_ );
+    append_range_< IntVectorDatum >( events, names::times, times_steps_, head_, first, size_ );
 
     initialize_property_doublevector( events, names::offsets );
-    append_property( events, names::offsets, times_offset_ );
+    append_range_< DoubleVectorDatum >( events, names::offsets, times_offset_, head_, first, size_ );
   }
   else
   {
     initialize_property_doublevector( events, names::times );
-    append_property( events, names::times, times_ms_ );
+    append_range_< DoubleVectorDatum >( events, names::times, times_ms_, head_, first, size_ );
   }
 
   for ( size_t i = 0; i < double_values_.size(); ++i )
   {
     initialize_property_doublevector( events, double_value_names_[ i ] );
-    append_property( events, double_value_names_[ i ], double_values_[ i ] );
+    append_range_< DoubleVectorDatum >( events, double_value_names_[ i ], double_values_[ i ], head_, first, size_ );
   }
   for ( size_t i = 0; i < long_values_.size(); ++i )
   {
     initialize_property_intvector( events, long_value_names_[ i ] );
-    append_property( events, long_value_names_[ i ], long_values_[ i ] );
+    append_range_< IntVectorDatum >( events, long_value_names_[ i ], long_values_[ i ], head_, first, size_ );
   }
+}
 
-  ( *d )[ names::time_in_steps ] = time_in_steps_;
+void
+nest::RecordingBackendMemory::DeviceData::append_time_sorted_events( DictionaryDatum& events,
+  const std::vector< const DeviceData* >& data,
+  bool new_only )
+{
+  if ( data.empty() )
+  {
+    return;
+  }
+
+  // Order the events of each thread by time. Events are recorded in
+  // order of time on each thread, so this usually only needs a check.
+  typedef std::pair< double, size_t > TimeKey; // time, index of the event
+  std::vector< std::vector< TimeKey > > runs( data.size() );
+  size_t n_events = 0;
+  for ( size_t k = 0; k < data.size(); ++k )
+  {
+    const DeviceData& dd = *data[ k ];
+    const size_t first = new_only ? dd.read_position_ : 0;
+    runs[ k ].reserve( dd.size_ - first );
+    for ( size_t i = first; i < dd.size_; ++i )
+    {
+      const size_t index = dd.index_( i );
+      runs[ k ].push_back( TimeKey( dd.time_ms_( index ), index ) );
+    }
+    n_events += runs[ k ].size();
+
+    const auto earlier = []( const TimeKey& a, const TimeKey& b ) { return a.first < b.first; };
+    if ( not std::is_sorted( runs[ k ].begin(), runs[ k ].end(), earlier ) )
+    {
+      std::stable_sort( runs[ k ].begin(), runs[ k ].end(), earlier );
+    }
+  }
+
+  // Merge the runs of all threads one time at a time, using a heap of the
+  // time of the next event of each thread. Only the events with equal
+  // times are sorted, by sender, thread and index.
+  typedef std::pair< double, size_t > Head;             // time of the next event of a thread, index of the thread
+  typedef std::tuple< long, size_t, size_t > GroupKey; // sender, thread, index of the event
+  std::priority_queue< Head, std::vector< Head >, std::greater< Head > > heads;
+  for ( size_t k = 0; k < runs.size(); ++k )
+  {
+    if ( not runs[ k ].empty() )
+    {
+      heads.push( Head( runs[ k ][ 0 ].first, k ) );
+    }
+  }
+
+  std::vector< std::pair< size_t, size_t > > order; // thread, index of the event
+  order.reserve( n_events );
+  std::vector< size_t > positions( runs.size(), 0 );
+  std::vector< GroupKey > group;
+  while ( not heads.empty() )
+  {
+    const double time = heads.top().first;
+    group.clear();
+    while ( not heads.empty() and heads.top().first == time )
+    {
+      const size_t k = heads.top().second;
+      heads.pop();
+
+      const std::vector< TimeKey >& run = runs[ k ];
+      size_t& pos = positions[ k ];
+      for ( ; pos < run.size() and run[ pos ].first == time; ++pos )
+      {
+        group.push_back( GroupKey( data[ k ]->senders_[ run[ pos ].second ], k, run[ pos ].second ) );
+      }
+      if ( pos < run.size() )
+      {
+        heads.push( Head( run[ pos ].first, k ) );
+      }
+    }
+
+    std::sort( group.begin(), group.end() );
+    for ( const GroupKey& event : group )
+    {
+      order.push_back( std::make_pair( std::get< 1 >( event ), std::get< 2 >( event ) ) );
+    }
+  }
+
+  initialize_property_intvector( events, names::senders );
+  append_ordered_< IntVectorDatum >(
+    events, names::senders, order, [&data]( size_t k ) -> const std::vector< long >& { return data[ k ]->senders_; } );
+
+  if ( data[ 0 ]->time_in_steps_ )
+  {
+    initialize_property_intvector( events, names::times );
+    append_ordered_< IntVectorDatum >( events,
+      names::times,
+      order,
+      [&data]( size_t k ) -> const std::vector< long >& { return data[ k ]->times_steps_; } );
+
+    initialize_property_doublevector( events, names::offsets );
+    append_ordered_< DoubleVectorDatum >( events,
+      names::offsets,
+      order,
+      [&data]( size_t k ) -> const std::vector< double >& { return data[ k ]->times_offset_; } );
+  }
+  else
+  {
+    initialize_property_doublevector( events, names::times );
+    append_ordered_< DoubleVectorDatum >( events,
+      names::times,
+      order,
+      [&data]( size_t k ) -> const std::vector< double >& { return data[ k ]->times_ms_; } );
+  }
+
+  const std::vector< Name >& double_value_names = data[ 0 ]->double_value_names_;
+  for ( size_t i = 0; i < double_value_names.size(); ++i )
+  {
+    initialize_property_doublevector( events, double_value_names[ i ] );
+    append_ordered_< DoubleVectorDatum >( events,
+      double_value_names[ i ],
+      order,
+      [&data, i]( size_t k ) -> const std::vector< double >& { return data[ k ]->double_values_[ i ]; } );
+  }
+  const std::vector< Name >& long_value_names = data[ 0 ]->long_value_names_;
+  for ( size_t i = 0; i < long_value_names.size(); ++i )
+  {
+    initialize_property_intvector( events, long_value_names[ i ] );
+    append_ordered_< IntVectorDatum >( events,
+      long_value_names[ i ],
+      order,
+      [&data, i]( size_t k ) -> const std::vector< long >& { return data[ k ]->long_values_[ i ]; } );
+  }
 }
 
 void
@@ -274,6 +751,24 @@ nest::RecordingBackendMemory::DeviceData::set_status( const DictionaryDatum& d )
     time_in_steps_ = time_in_steps;
   }
 
+  updateValue< bool >( d, names::time_sorted, time_sorted_ );
+
+  long max_events = max_events_;
+  if ( updateValue< long >( d, names::max_events, max_events ) and max_events < 0 )
+  {
+    throw BadProperty( "Property max_events must be >= 0." );
+  }
+
+  double window_ms = window_ms_;
+  if ( updateValue< double >( d, names::window_ms, window_ms ) and window_ms < 0 )
+  {
+    throw BadProperty( "Property window_ms must be >= 0." );
+  }
+
+  max_events_ = max_events;
+  window_ms_ = window_ms;
+  discard_old_events( kernel().simulation_manager.get_time().get_ms() );
+
   size_t n_events = 1;
   if ( updateValue< long >( d, names::n_events, n_events ) and n_events == 0 )
   {
@@ -284,6 +779,10 @@ nest::RecordingBackendMemory::DeviceData::set_status( const DictionaryDatum& d )
 void
 nest::RecordingBackendMemory::DeviceData::clear()
 {
+  head_ = 0;
+  size_ = 0;
+  read_position_ = 0;
+
   senders_.clear();
   times_ms_.clear();
   times_steps_.clear();
@@ -61,6 +61,36 @@ be read out of the `n_events` entry in the status dictionary of the
 recording device. To delete data from memory, `n_events` can be set to
 0. Other values cannot be set.
 
+Reading ``events`` from the status dictionary always returns all data
+collected so far, which becomes slow if a recorder is read repeatedly
+during a long simulation, e.g. between calls to ``Run``. In this case,
+the function ``get_new_events()`` of the recorder's NodeCollection can
+be used instead. It keeps a read position for each recorder and only
+returns the events that were collected since its last call. If it is
+called with ``drain=True``, all data read so far is deleted from
+memory afterwards, so that memory consumption stays bounded. Draining
+does not change `n_events`, and ``events`` only contains the data that
+was not yet drained.
+
+As the data is collected separately on each thread, the events of a
+recorder are ordered by thread first and are therefore not sorted by
+time if more than one thread is used. If ``time_sorted`` is set to
+`true`, the events of all threads are instead merged by time, and
+events with equal times are ordered by sender. This is done in a single
+pass over the data of all threads, which is already sorted in most
+cases, and applies to both ``events`` and ``get_new_events()``.
+
+By default, all data is kept until it is deleted. For long simulations
+in which only the most recent data is of interest, e.g. for online
+monitoring, the amount of data kept in memory can be bounded by setting
+``max_events`` to the maximal number of events or ``window_ms`` to the
+length of a time window in ms. Both limits apply separately to the data
+collected on each thread and can be combined. Older events are then
+discarded while new ones are collected, and the data of each thread in
+``events`` is sorted by time. Events are only kept within the window
+if their time *t* fulfills *T - window_ms < t*, where *T* is the current
+simulation time.
+
 Parameter summary
 +++++++++++++++++
 
@@ -73,6 +103,11 @@ Parameter summary
    recording, the format of which depends on the setting of
    ``time_in_steps``.
 
+ max_events
+   An integer (default: *0*) that sets the maximal number of events kept
+   in memory per thread. Older events are discarded. If 0, the number
+   of events is not limited.
+
  n_events
    The number of events collected or sampled since the last reset of
    `n_events`. By setting `n_events` to 0, all events recorded so far
@@ -87,6 +122,16 @@ Parameter summary
    ms under key ``times``. This property cannot be set after Simulate
    has been called.
 
+ time_sorted
+   A Boolean (default: *false*) specifying whether the events of all
+   threads are merged and sorted by time and sender when they are read.
+
+ window_ms
+   A floating point number (default: *0.0*) that sets the length of the
+   time window in ms for which events are kept in memory. Older events
+   are discarded. If 0, the time for which events are kept is not
+   limited.
+
 EndDocumentation */
 
 namespace nest
@@ -143,6 +188,7 @@ public:
   void check_device_status( const DictionaryDatum& ) const override;
   void get_device_defaults( DictionaryDatum& ) const override;
   void get_device_status( const RecordingDevice& device, DictionaryDatum& ) const override;
+  void get_device_new_events( const RecordingDevice& device, DictionaryDatum&, bool ) override;
 
 private:
   struct DeviceData
@@ -152,9 +198,43 @@ private:
     void push_back( const Event&, const std::vector< double >&, const std::vector< long >& );
     void get_status( DictionaryDatum& ) const;
     void set_status( const DictionaryDatum& );
+    void get_new_events( DictionaryDatum&, bool );
+    void discard_old_events( double );
+    bool is_time_sorted() const;
+
+    /**
+     * Append the events of the given instances of a device on all
+     * threads to events, merged by time and sender. If new_only is
+     * true, only events not yet read by get_new_events() are appended.
+     */
+    static void append_time_sorted_events( DictionaryDatum&, const std::vector< const DeviceData* >&, bool new_only );
 
   private:
     void clear();
+    void append_events_( DictionaryDatum&, size_t ) const;
+    bool is_bounded_() const;
+    double time_ms_( size_t ) const;
+
+    //! Return the index in the vectors of the i-th oldest event kept
+    size_t index_( size_t ) const;
+
+    //! Return the index in the vectors at which to store a new event, growing the vectors if they are full
+    size_t new_slot_();
+    void set_( size_t, const Event&, const std::vector< double >&, const std::vector< long >& );
+    void swap_( size_t, size_t );
+    void drop_oldest_( size_t );
+
+    //! Move the events kept to the start of the vectors and resize them to the given capacity
+    void unroll_( size_t );
+
+    /*
+     * The events are stored in a ring buffer: the vectors below have
+     * the same length, which is the capacity of the buffer, and the
+     * events kept are stored in order at the indices head_ to
+     * head_ + size_ - 1, modulo the capacity. Discarding the oldest
+     * events only moves head_, and a full buffer of max_events_ events
+     * is reused by replacing the oldest event with the new one.
+     */
     std::vector< long > senders_;                        //!< sender node IDs of the events
     std::vector< double > times_ms_;                     //!< times of registered events in ms
     std::vector< long > times_steps_;                    //!< times of registered events in steps
@@ -164,8 +244,17 @@ private:
     std::vector< std::vector< double > > double_values_; //!< recorded values of type double, one vector per value
     std::vector< std::vector< long > > long_values_;     //!< recorded values of type long, one vector per value
     bool time_in_steps_;                                 //!< Should time be recorded in steps (ms if false)
+    bool time_sorted_;                                   //!< Should events of all threads be merged by time
+    size_t head_;                                        //!< Index of the oldest event kept
+    size_t size_;                                        //!< Number of events kept
+    size_t read_position_;                               //!< Number of oldest events read by get_new_events
+    size_t max_events_;                                  //!< Maximal number of events kept, 0 for no limit
+    double window_ms_;                                   //!< Length of the time window kept in ms, 0 for no limit
   };
 
+  //! Return the data of the instances of the device with the given node ID on all threads
+  std::vector< const DeviceData* > get_thread_siblings_data_( index node_id ) const;
+
   typedef std::vector< std::map< size_t, DeviceData > > device_data_map;
   device_data_map device_data_;
 };
@@ -206,6 +206,12 @@ nest::RecordingDevice::get_status( DictionaryDatum& d ) const
   }
 }
 
+void
+nest::RecordingDevice::get_new_events( DictionaryDatum& events, bool drain ) const
+{
+  kernel().io_manager.get_recording_backend_device_new_events( P_.record_to_, *this, events, drain );
+}
+
 bool
 nest::RecordingDevice::is_active( Time const& T ) const
 {
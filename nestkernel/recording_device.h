@@ -99,6 +99,13 @@ public:
   void set_status( const DictionaryDatum& ) override;
   void get_status( DictionaryDatum& ) const override;
 
+  /**
+   * Append the events recorded by this instance since the last call to
+   * the given dictionary. If drain is true, the events are removed from
+   * the recording backend afterwards.
+   */
+  void get_new_events( DictionaryDatum& events, bool drain ) const;
+
 protected:
   void write( const Event&, const std::vector< double >&, const std::vector< long >& );
   void set_initialized_() override;
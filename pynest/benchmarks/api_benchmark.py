@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+#
+# api_benchmark.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Micro-benchmarks for the PyNEST API
+-----------------------------------
+
+This script measures the time spent in individual PyNEST functions, as
+opposed to ``examples/hpc_benchmark.py``, which measures the simulation
+of a whole network. Each benchmark is run for all combinations of the
+given network sizes and numbers of threads, and the results are written
+as JSON.
+
+Each benchmark consists of a setup function, which builds the network it
+needs and returns the operation to be timed. Before every repetition, the
+kernel is reset and the setup function is called again, so that only the
+operation itself is timed.
+
+Usage::
+
+    python api_benchmark.py --sizes 1000 10000 --threads 1 2 4 --output results.json
+
+Run ``python api_benchmark.py --help`` for all options and
+``python api_benchmark.py --list`` for the available benchmarks.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+
+import numpy as np
+
+import nest
+
+
+INDEGREE = 10        # number of incoming connections per neuron
+NUM_SLICES = 100     # number of slices taken in the slicing benchmark
+NUM_RUNS = 10        # number of calls to Run in the run loop benchmark
+RUN_TIME = 1.        # duration of each call to Run in ms
+RECORD_TIME = 100.   # simulation time before reading out recorders in ms
+
+
+def _random_connections(n):
+    """Return source and target node IDs for `INDEGREE` connections per neuron."""
+    sources = np.random.randint(1, n + 1, size=n * INDEGREE)
+    targets = np.repeat(np.arange(1, n + 1), INDEGREE)
+    return sources, targets
+
+
+def _connected_network(n):
+    """Create `n` neurons connected with `INDEGREE` connections per neuron."""
+    nest.Create('iaf_psc_alpha', n)
+    sources, targets = _random_connections(n)
+    nest.Connect(sources, targets,
+                 syn_spec={'synapse_model': 'static_synapse',
+                           'weight': np.random.uniform(0.5, 1.5, len(sources)),
+                           'delay': np.random.uniform(1., 2., len(sources))})
+    return nest.GetConnections()
+
+
+def _recorded_network(n, recorder):
+    """Create `n` driven neurons recorded by `recorder` and simulate them."""
+    neurons = nest.Create('iaf_psc_alpha', n, {'I_e': 500.})
+    if recorder == 'multimeter':
+        rec = nest.Create(recorder, params={'record_from': ['V_m'], 'interval': 1.})
+        nest.Connect(rec, neurons)
+    else:
+        rec = nest.Create(recorder)
+        nest.Connect(neurons, rec)
+    nest.Simulate(RECORD_TIME)
+    return rec
+
+
+def setup_create_array_params(n):
+    """Create neurons with an array of membrane potentials."""
+    V_m = np.random.uniform(-70., -60., n)
+    return lambda: nest.Create('iaf_psc_alpha', n, {'V_m': V_m})
+
+
+def setup_connect_arrays(n):
+    """Connect neurons from arrays of node IDs, weights and delays."""
+    nest.Create('iaf_psc_alpha', n)
+    sources, targets = _random_connections(n)
+    syn_spec = {'synapse_model': 'static_synapse',
+                'weight': np.random.uniform(0.5, 1.5, len(sources)),
+                'delay': np.random.uniform(1., 2., len(sources))}
+    return lambda: nest.Connect(sources, targets, syn_spec=syn_spec)
+
+
+def setup_get_connections(n):
+    """Get all connections of the network."""
+    _connected_network(n)
+    return lambda: nest.GetConnections()
+
+
+def setup_synapse_get(n):
+    """Get the weights of all connections as a list."""
+    conns = _connected_network(n)
+    return lambda: conns.get('weight')
+
+
+def setup_synapse_get_numpy(n):
+    """Get the weights and delays of all connections as NumPy arrays."""
+    conns = _connected_network(n)
+    return lambda: conns.get(['weight', 'delay'], output='numpy')
+
+
+def setup_synapse_set(n):
+    """Set the weights of all connections from an array."""
+    conns = _connected_network(n)
+    weights = np.random.uniform(0.5, 1.5, len(conns))
+    return lambda: conns.set(weight=weights)
+
+
+def setup_node_get(n):
+    """Get the membrane potentials of all neurons."""
+    nodes = nest.Create('iaf_psc_alpha', n)
+    return lambda: nodes.get('V_m')
+
+
+def setup_node_set(n):
+    """Set the membrane potentials of all neurons from an array."""
+    nodes = nest.Create('iaf_psc_alpha', n)
+    V_m = np.random.uniform(-70., -60., n)
+    return lambda: nodes.set(V_m=V_m)
+
+
+def setup_node_iteration(n):
+    """Iterate over all nodes of a NodeCollection."""
+    nodes = nest.Create('iaf_psc_alpha', n)
+
+    def iterate():
+        for _ in nodes:
+            pass
+
+    return iterate
+
+
+def setup_node_slicing(n):
+    """Take `NUM_SLICES` slices with step two from a NodeCollection."""
+    nodes = nest.Create('iaf_psc_alpha', n)
+    starts = np.random.randint(0, n, size=NUM_SLICES)
+
+    def slice_nodes():
+        for start in starts:
+            nodes[int(start)::2]
+
+    return slice_nodes
+
+
+def setup_spike_detector_status(n):
+    """Read the events of a spike detector recording from all neurons."""
+    rec = _recorded_network(n, 'spike_detector')
+    return lambda: nest.GetStatus(rec, 'events')
+
+
+def setup_multimeter_status(n):
+    """Read the events of a multimeter recording from all neurons."""
+    rec = _recorded_network(n, 'multimeter')
+    return lambda: nest.GetStatus(rec, 'events')
+
+
+def setup_run_loop(n):
+    """Call Run `NUM_RUNS` times within a RunManager."""
+    _connected_network(n)
+
+    def run_loop():
+        with nest.RunManager():
+            for _ in range(NUM_RUNS):
+                nest.Run(RUN_TIME)
+
+    return run_loop
+
+
+BENCHMARKS = {name[len('setup_'):]: func for name, func in sorted(globals().items()) if name.startswith('setup_')}
+
+
+def run_benchmark(setup, n, threads, repeat):
+    """Time the operation returned by `setup` `repeat` times.
+
+    Returns a list of wall clock times in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        nest.ResetKernel()
+        nest.SetKernelStatus({'local_num_threads': threads})
+        operation = setup(n)
+        start = time.perf_counter()
+        operation()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Micro-benchmarks for the PyNEST API.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000],
+                        help='numbers of neurons (default: %(default)s)')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1],
+                        help='numbers of threads (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='repetitions of each measurement (default: %(default)s)')
+    parser.add_argument('--benchmarks', nargs='+', choices=sorted(BENCHMARKS), metavar='NAME',
+                        default=sorted(BENCHMARKS), help='benchmarks to run (default: all)')
+    parser.add_argument('--seed', type=int, default=12345,
+                        help='seed for the random numbers of the setup (default: %(default)s)')
+    parser.add_argument('--output', help='file to write the results to (default: standard output)')
+    parser.add_argument('--list', action='store_true', help='list the available benchmarks and exit')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name in sorted(BENCHMARKS):
+            print('{:<24} {}'.format(name, BENCHMARKS[name].__doc__))
+        return
+
+    nest.set_verbosity('M_ERROR')
+    np.random.seed(args.seed)
+
+    results = []
+    for name in args.benchmarks:
+        for n in args.sizes:
+            for threads in args.threads:
+                times = run_benchmark(BENCHMARKS[name], n, threads, args.repeat)
+                results.append({'benchmark': name,
+                                'n': n,
+                                'threads': threads,
+                                'times': times,
+                                'min': min(times),
+                                'median': statistics.median(times)})
+                print('{:<24} n={:<8} threads={:<3} min={:.6f}s median={:.6f}s'.format(
+                    name, n, threads, min(times), statistics.median(times)), file=sys.stderr)
+
+    report = {'nest_version': nest.version(),
+              'python_version': platform.python_version(),
+              'numpy_version': np.__version__,
+              'platform': platform.platform(),
+              'repeat': args.repeat,
+              'seed': args.seed,
+              'results': results}
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
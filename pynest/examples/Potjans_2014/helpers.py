@@ -32,6 +32,7 @@ import matplotlib.pyplot as plt
 import os
 import sys
 import numpy as np
+import nest
 if 'DISPLAY' not in os.environ:
     import matplotlib
     matplotlib.use('Agg')
@@ -420,19 +421,9 @@ def __load_spike_times(path, name, begin, end):
     """
     sd_files, sd_names, node_ids = __gather_metadata(path, name)
     data = {}
-    dtype = {'names': ('sender', 'time_ms'),  # as in header
-             'formats': ('i4', 'f8')}
     for i, name in enumerate(sd_names):
-        data_i_raw = np.array([[]], dtype=dtype)
-        for j, f in enumerate(sd_files):
-            if name in f:
-                # skip header while loading
-                ld = np.loadtxt(os.path.join(path, f), skiprows=3, dtype=dtype)
-                data_i_raw = np.append(data_i_raw, ld)
-
-        data_i_raw = np.sort(data_i_raw, order='time_ms')
+        files = [os.path.join(path, f) for f in sd_files if name in f]
         # begin and end are included if they exist
-        low = np.searchsorted(data_i_raw['time_ms'], v=begin, side='left')
-        high = np.searchsorted(data_i_raw['time_ms'], v=end, side='right')
-        data[i] = data_i_raw[low:high]
+        events = nest.io.read_events(files, start=begin, stop=end)
+        data[i] = {'sender': events['senders'], 'time_ms': events['times']}
     return sd_names, node_ids, data
@@ -33,6 +33,8 @@ from . import random                  # noqa
 from . import math                    # noqa
 from . import spatial_distributions   # noqa
 from . import logic                   # noqa
+from . import io                      # noqa
+from .io import export                # noqa
 from . import spatial                 # noqa needs to be imported last because of documentation generation
 
 
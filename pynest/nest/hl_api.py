@@ -70,6 +70,7 @@ __all__ = [
     'GetLocalNodeCollection',
     'GetNodes',
     'GetPosition',
+    'GetPositionCacheStatus',
     'GetStatus',
     'GetStructuralPlasticityStatus',
     'GetTargetNodes',
@@ -94,6 +95,7 @@ __all__ = [
     'SetDefaults',
     'SetKernelStatus',
     'SetMaxBuffered',
+    'SetPositionCacheStatus',
     'SetStatus',
     'SetStructuralPlasticityStatus',
     'Simulate',
@@ -0,0 +1,533 @@
+# -*- coding: utf-8 -*-
+#
+# io.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Functions to read the files written by recording devices and to export
+simulation data.
+
+The files of the `ascii` and `binary` recording backends are named
+``data_path/data_prefix(label|model_name)-node_id-vp.file_extension``,
+with one file per virtual process. The functions in this module find
+all files of a recorder and read them into NumPy arrays, merged in
+time order.
+
+The function `export` writes the events of recorders, the positions of
+nodes and connections into a single HDF5 file, which requires h5py.
+"""
+
+import glob
+import itertools
+import os
+import re
+import zlib
+
+import numpy
+
+import nest
+
+try:
+    import h5py
+    HAVE_H5PY = True
+except ImportError:
+    HAVE_H5PY = False
+
+__all__ = [
+    'export',
+    'find_files',
+    'read_events',
+    'read_file',
+]
+
+# Number of bytes of text parsed at once when reading ASCII files
+_ASCII_BLOCK_SIZE = 1 << 24
+
+_BINARY_MAGIC = b'NESTBIN\0'
+
+# Versions of the binary file format that can be read
+_BINARY_VERSIONS = (1, 2)
+
+
+def find_files(label, node_id=None, data_path=None, data_prefix=None, file_extension='dat'):
+    """Find the files written by a recorder for all virtual processes.
+
+    Parameters
+    ----------
+    label : str
+        Label of the recorder, or its model name if no label is set.
+    node_id : int, optional
+        Node ID of the recorder. If not given, the files of all recorders
+        with the given label are returned.
+    data_path : str, optional
+        Directory of the files. Defaults to the kernel property ``data_path``.
+    data_prefix : str, optional
+        Prefix of the files. Defaults to the kernel property ``data_prefix``.
+    file_extension : str, optional
+        File name extension without leading dot.
+
+    Returns
+    -------
+    list:
+        File names, sorted by node ID and virtual process.
+    """
+
+    if data_path is None:
+        data_path = nest.GetKernelStatus('data_path')
+    if data_prefix is None:
+        data_prefix = nest.GetKernelStatus('data_prefix')
+
+    pattern = re.compile(re.escape(data_prefix + label) + r'-(\d+)-(\d+)\.' + re.escape(file_extension) + '$')
+    candidates = glob.glob(os.path.join(glob.escape(data_path), glob.escape(data_prefix + label) + '-*'))
+
+    files = []
+    for fname in candidates:
+        match = pattern.match(os.path.basename(fname))
+        if match and (node_id is None or int(match.group(1)) == node_id):
+            files.append((int(match.group(1)), int(match.group(2)), fname))
+
+    return [fname for _, _, fname in sorted(files)]
+
+
+def read_file(fname, resolution=None):
+    """Read a file written by the `ascii` or the `binary` recording backend.
+
+    Parameters
+    ----------
+    fname : str
+        Name of the file
+    resolution : float, optional
+        Simulation resolution in ms, used to compute the times of ASCII files
+        written with ``time_in_steps``. Defaults to the current resolution.
+
+    Returns
+    -------
+    dict:
+        Events with the entries ``senders``, ``times`` and one entry per
+        recorded value, in the order in which they were written.
+    """
+
+    with open(fname, 'rb') as f:
+        is_binary = f.read(len(_BINARY_MAGIC)) == _BINARY_MAGIC
+
+    if is_binary:
+        return _read_binary(fname)
+    return _read_ascii(fname, resolution)
+
+
+def read_events(source, start=None, stop=None, senders=None, output='', resolution=None):
+    """Read the events of a recorder from all of its files, merged in time order.
+
+    Parameters
+    ----------
+    source : NodeCollection or str or list
+        A recorder with ``record_to`` set to ``'ascii'`` or ``'binary'``, whose
+        files are found for all virtual processes, or a file name or a list
+        of file names.
+    start : float, optional
+        Only events at or after this time in ms are returned.
+    stop : float, optional
+        Only events at or before this time in ms are returned.
+    senders : list, optional
+        Only events of these senders are returned.
+    output : str, ['pandas'], optional
+        If ``'pandas'``, the events are returned as a pandas DataFrame.
+    resolution : float, optional
+        Simulation resolution in ms, used to compute the times of ASCII files
+        written with ``time_in_steps``. Defaults to the current resolution.
+
+    Returns
+    -------
+    dict:
+        Events with the entries ``senders``, ``times`` and one entry per
+        recorded value, sorted by time. Events with equal times keep the
+        order of the files and of the events within the files.
+    pandas.DataFrame:
+        The events, if `output` is ``'pandas'``.
+
+    Raises
+    ------
+    ValueError
+        If no files are found or the files contain different columns.
+    """
+
+    if isinstance(source, nest.NodeCollection):
+        fnames = _find_recorder_files(source)
+    elif isinstance(source, str):
+        fnames = [source]
+    else:
+        fnames = list(source)
+
+    if not fnames:
+        raise ValueError('No files to read events from.')
+
+    runs = []
+    for fname in fnames:
+        events = read_file(fname, resolution)
+        if runs and list(events) != list(runs[0]):
+            raise ValueError("File '{}' contains the columns {}, but {} were expected.".format(
+                fname, list(events), list(runs[0])))
+        runs.append(_select(events, start, stop, senders))
+
+    order = _merge_order([run['times'] for run in runs])
+    events = {key: numpy.concatenate([run[key] for run in runs])[order] for key in runs[0]}
+
+    if output == 'pandas':
+        import pandas
+        return pandas.DataFrame(events)
+    return events
+
+
+def export(fname, recorders=None, nodes=None, connections=None, compression='gzip', compression_level=4):
+    """Write events, node positions and connections to one HDF5 file.
+
+    All data is written in bulk to chunked and compressed datasets, which
+    can be read with h5py or with ``pandas.DataFrame(dict(group))``. The
+    file contains
+
+    * the attributes ``nest_version``, ``resolution``, ``time``
+      and ``num_processes``,
+    * a group ``recorders/<node_id>`` for each recorder with the
+      attributes ``model`` and ``label`` and one dataset per entry of its
+      ``events``,
+    * a group ``nodes/<i>`` for the i-th entry of `nodes` with the datasets
+      ``node_ids`` and ``models``, and ``positions`` with one row per node
+      for nodes with spatial extent, and
+    * a group ``connections`` with the datasets ``source``, ``target``,
+      ``weight``, ``delay`` and ``synapse_model``.
+
+    In MPI-parallel simulations, each process writes the data that is local
+    to it into a separate file, whose name contains the rank before the file
+    name suffix. Rank 0 then merges these files into `fname` by concatenating
+    the datasets in the order of the ranks, and removes them. This requires
+    that all processes can access the same file system.
+
+    Parameters
+    ----------
+    fname : str
+        Name of the file
+    recorders : NodeCollection, optional
+        Recorders with ``record_to`` set to ``'memory'``
+    nodes : NodeCollection or list of NodeCollection, optional
+        Nodes whose IDs, models and positions are written
+    connections : SynapseCollection, optional
+        Connections as returned by `GetConnections`
+    compression : str, optional
+        Compression filter of the datasets, see `h5py.Group.create_dataset`.
+        No compression is used if `None`.
+    compression_level : int, optional
+        Compression level between 0 and 9 if `compression` is ``'gzip'``
+
+    Raises
+    ------
+    ImportError
+        If h5py is not available.
+    ValueError
+        If a recorder does not record to memory.
+    """
+
+    if not HAVE_H5PY:
+        raise ImportError('h5py could not be imported')
+
+    if recorders is not None:
+        for recorder in recorders:
+            if recorder.get('record_to') != 'memory':
+                raise ValueError('Only the events of recorders that record to memory can be exported.')
+
+    if isinstance(nodes, nest.NodeCollection):
+        nodes = [nodes]
+
+    options = {}
+    if compression is not None:
+        options = {'compression': compression, 'shuffle': True}
+        if compression == 'gzip':
+            options['compression_opts'] = compression_level
+
+    num_processes = nest.NumProcesses()
+    if num_processes == 1:
+        _write_shard(fname, recorders, nodes, connections, options)
+        return
+
+    root, ext = os.path.splitext(fname)
+    shards = ['{}-{}{}'.format(root, rank, ext) for rank in range(num_processes)]
+    _write_shard(shards[nest.Rank()], recorders, nodes, connections, options)
+    nest.SyncProcesses()
+    if nest.Rank() == 0:
+        _merge_shards(fname, shards)
+        for shard in shards:
+            os.remove(shard)
+    nest.SyncProcesses()
+
+
+def _write_shard(fname, recorders, nodes, connections, options):
+    """Write the data local to this process to an HDF5 file."""
+
+    def create_dataset(group, name, data):
+        data = numpy.asarray(data)
+        if data.dtype.kind in 'OSU':
+            data = numpy.array(data.tolist(), dtype=h5py.string_dtype())
+        # Resizable datasets can be extended when merging files
+        group.create_dataset(name, data=data, maxshape=(None,) + data.shape[1:], **options)
+
+    with h5py.File(fname, 'w') as f:
+        status = nest.GetKernelStatus(['resolution', 'time'])
+        f.attrs['nest_version'] = nest.version()
+        f.attrs['resolution'] = status[0]
+        f.attrs['time'] = status[1]
+        f.attrs['num_processes'] = nest.NumProcesses()
+
+        for recorder in recorders or []:
+            group = f.create_group('recorders/{}'.format(recorder.get('global_id')))
+            group.attrs['model'] = recorder.get('model')
+            group.attrs['label'] = recorder.get('label')
+            for key, values in recorder.get('events').items():
+                create_dataset(group, key, values)
+
+        for i, collection in enumerate(nodes or []):
+            group = f.create_group('nodes/{}'.format(i))
+            local_nodes = nest.GetLocalNodeCollection(collection)
+            models = local_nodes.get('model') if len(local_nodes) > 0 else ()
+            create_dataset(group, 'node_ids', numpy.array(local_nodes.tolist(), dtype=numpy.int_))
+            # Without local nodes the dataset must still hold strings to be merged with those of other processes
+            create_dataset(group, 'models', numpy.array([models] if isinstance(models, str) else list(models),
+                                                        dtype=h5py.string_dtype()))
+            if collection.spatial is not None:
+                positions = nest.GetPosition(local_nodes) if len(local_nodes) > 0 else ()
+                if len(local_nodes) == 1:
+                    positions = [positions]
+                num_dimensions = len(collection.spatial['center'])
+                create_dataset(group, 'positions', numpy.reshape(positions, (-1, num_dimensions)))
+
+        if connections is not None:
+            group = f.create_group('connections')
+            keys = ['source', 'target', 'weight', 'delay', 'synapse_model']
+            values = connections.get(keys, output='numpy') if len(connections) > 0 else {}
+            for key, dtype in zip(keys, [numpy.int_, numpy.int_, float, float, str]):
+                create_dataset(group, key, values.get(key, numpy.empty(0, dtype=dtype)))
+
+
+def _merge_shards(fname, shards):
+    """Merge the files written by all processes by concatenating their datasets."""
+
+    with h5py.File(fname, 'w') as merged:
+        for shard in shards:
+            with h5py.File(shard, 'r') as f:
+                def merge(name, obj):
+                    if isinstance(obj, h5py.Group):
+                        group = merged.require_group(name)
+                        for key, value in obj.attrs.items():
+                            group.attrs.setdefault(key, value)
+                    elif name not in merged:
+                        f.copy(obj, merged.require_group(obj.parent.name), name=name.split('/')[-1])
+                    else:
+                        dataset = merged[name]
+                        size = dataset.shape[0]
+                        dataset.resize(size + obj.shape[0], axis=0)
+                        dataset[size:] = obj[()]
+
+                for key, value in f.attrs.items():
+                    merged.attrs.setdefault(key, value)
+                f.visititems(merge)
+
+
+def _find_recorder_files(recorders):
+    """Find the files of all virtual processes of the given recorders."""
+
+    filenames = recorders.get('filenames')
+    if len(recorders) == 1:
+        filenames = [filenames]
+
+    fnames = []
+    for fname in itertools.chain.from_iterable(filenames):
+        match = re.match(r'^(.*-\d+)-\d+(\.[^./]*)$', fname)
+        if match is None:
+            fnames.append(fname)
+            continue
+        vp_pattern = re.compile(re.escape(match.group(1)) + r'-\d+' + re.escape(match.group(2)) + '$')
+        candidates = glob.glob(glob.escape(match.group(1)) + '-*' + glob.escape(match.group(2)))
+        fnames.extend(f for f in sorted(candidates) if vp_pattern.match(f) and f not in fnames)
+    return fnames
+
+
+def _select(events, start, stop, senders):
+    """Sort events by time and return those within the time window and of the given senders."""
+
+    times = events['times']
+    if numpy.any(times[1:] < times[:-1]):
+        order = numpy.argsort(times, kind='stable')
+        events = {key: values[order] for key, values in events.items()}
+        times = events['times']
+
+    low = 0 if start is None else numpy.searchsorted(times, start, side='left')
+    high = len(times) if stop is None else numpy.searchsorted(times, stop, side='right')
+    events = {key: values[low:high] for key, values in events.items()}
+
+    if senders is not None:
+        mask = numpy.isin(events['senders'], numpy.asarray(senders))
+        events = {key: values[mask] for key, values in events.items()}
+
+    return events
+
+
+def _merge_order(runs):
+    """Return the order that merges the concatenated sorted runs into one sorted array.
+
+    The runs are merged pairwise, which takes O(n log k) time for n values
+    in k runs. Equal values keep the order of the runs.
+    """
+
+    offsets = numpy.cumsum([0] + [len(run) for run in runs])
+    pairs = [(run, numpy.arange(offsets[i], offsets[i + 1])) for i, run in enumerate(runs)]
+
+    while len(pairs) > 1:
+        merged = [_merge_two(pairs[i], pairs[i + 1]) for i in range(0, len(pairs) - 1, 2)]
+        if len(pairs) % 2:
+            merged.append(pairs[-1])
+        pairs = merged
+
+    return pairs[0][1]
+
+
+def _merge_two(a, b):
+    """Merge two sorted runs, given as pairs of values and indices."""
+
+    values_a, indices_a = a
+    values_b, indices_b = b
+
+    positions_b = numpy.searchsorted(values_a, values_b, side='right') + numpy.arange(len(values_b))
+    in_a = numpy.ones(len(values_a) + len(values_b), dtype=bool)
+    in_a[positions_b] = False
+
+    values = numpy.empty(len(in_a), dtype=numpy.result_type(values_a, values_b))
+    values[in_a] = values_a
+    values[positions_b] = values_b
+    indices = numpy.empty(len(in_a), dtype=indices_a.dtype)
+    indices[in_a] = indices_a
+    indices[positions_b] = indices_b
+
+    return values, indices
+
+
+def _read_ascii(fname, resolution):
+    """Read a file written by the ascii recording backend."""
+
+    with open(fname, 'rb') as f:
+        line = f.readline()
+        while line.startswith(b'#'):
+            line = f.readline()
+        names = line.decode().split()
+
+        # Parse blocks of complete lines, so that memory for the text is bounded
+        blocks = []
+        rest = b''
+        while True:
+            text = f.read(_ASCII_BLOCK_SIZE)
+            if not text:
+                break
+            text = rest + text
+            end = text.rfind(b'\n') + 1
+            rest = text[end:]
+            blocks.append(numpy.fromstring(text[:end], sep=' '))
+        if rest.strip():
+            blocks.append(numpy.fromstring(rest, sep=' '))
+
+    values = numpy.concatenate(blocks) if blocks else numpy.empty(0)
+    if len(values) % len(names) != 0:
+        raise ValueError("File '{}' does not contain {} values per line.".format(fname, len(names)))
+    columns = values.reshape(-1, len(names))
+
+    events = {'senders': columns[:, 0].astype(numpy.int64)}
+    if names[1] == 'time_step':
+        if resolution is None:
+            resolution = nest.GetKernelStatus('resolution')
+        events['times'] = columns[:, 1] * resolution - columns[:, 2]
+        first_value = 3
+    else:
+        events['times'] = columns[:, 1].copy()
+        first_value = 2
+    for i, name in enumerate(names[first_value:], first_value):
+        events[name] = columns[:, i].copy()
+
+    return events
+
+
+def _read_binary(fname):
+    """Read a file written by the binary recording backend by memory-mapping it."""
+
+    data = numpy.memmap(fname, dtype=numpy.uint8, mode='r')
+
+    byte_order_mark = data[12:16].view('<u4')[0]
+    if byte_order_mark == 0x01020304:
+        endian = '<'
+    elif byte_order_mark == 0x04030201:
+        endian = '>'
+    else:
+        raise ValueError("File '{}' is not a valid binary recording file.".format(fname))
+
+    version = data[8:12].view(endian + 'u4')[0]
+    if version not in _BINARY_VERSIONS:
+        raise ValueError("File '{}' has the unsupported format version {}.".format(fname, version))
+
+    def read_uint32(pos):
+        return int(data[pos:pos + 4].view(endian + 'u4')[0]), pos + 4
+
+    def read_string(pos):
+        length, pos = read_uint32(pos)
+        return data[pos:pos + length].tobytes().decode(), pos + length
+
+    resolution = data[16:24].view(endian + 'f8')[0]
+    _, pos = read_string(24)
+    num_double, pos = read_uint32(pos)
+    num_long, pos = read_uint32(pos)
+    names = []
+    for _ in range(num_double + num_long):
+        name, pos = read_string(pos)
+        names.append(name)
+    compression = 0
+    if version >= 2:
+        compression, pos = read_uint32(pos)
+    pos += (8 - pos % 8) % 8
+
+    columns = ['senders', 'steps', 'offsets'] + names
+    dtypes = ['i8', 'i8', 'f8'] + ['f8'] * num_double + ['i8'] * num_long
+    chunks = {name: [] for name in columns}
+    while pos < len(data):
+        n = int(data[pos:pos + 8].view(endian + 'u8')[0])
+        pos += 8
+        if compression:
+            # Compressed chunks store the senders and steps as differences
+            size = int(data[pos:pos + 8].view(endian + 'u8')[0])
+            chunk = numpy.frombuffer(zlib.decompress(data[pos + 8:pos + 8 + size]), dtype=numpy.uint8)
+            pos += 8 + size + (8 - size % 8) % 8
+            for i, (name, dtype) in enumerate(zip(columns, dtypes)):
+                column = chunk[8 * n * i:8 * n * (i + 1)].view(endian + dtype)
+                chunks[name].append(numpy.cumsum(column) if i < 2 else column)
+        else:
+            for name, dtype in zip(columns, dtypes):
+                chunks[name].append(data[pos:pos + 8 * n].view(endian + dtype))
+                pos += 8 * n
+
+    values = {name: numpy.concatenate(chunks[name]).astype(dtype, copy=False) if chunks[name]
+              else numpy.empty(0, dtype=dtype) for name, dtype in zip(columns, dtypes)}
+
+    events = {'senders': values['senders'], 'times': values['steps'] * resolution - values['offsets']}
+    for name in names:
+        events[name] = values[name]
+
+    return events
@@ -26,6 +26,7 @@ Functions for connection handling
 import numpy
 
 from ..ll_api import *
+from ..ll_api import _get_connections_arrays, _gather_arrays
 from .. import pynestkernel as kernel
 from .hl_api_helper import *
 from .hl_api_connection_helpers import (_connect_layers_needed, _connect_spatial,
@@ -47,7 +48,7 @@ __all__ = [
 
 @check_stack
 def GetConnections(source=None, target=None, synapse_model=None,
-                   synapse_label=None):
+                   synapse_label=None, gather=False):
     """Return a `SynapseCollection` representing the connection identifiers.
 
     Any combination of `source`, `target`, `synapse_model` and
@@ -65,12 +66,22 @@ def GetConnections(source=None, target=None, synapse_model=None,
         Only connections with this synapse type are returned
     synapse_label : int, optional
         (non-negative) only connections with this synapse label are returned
+    gather : bool, optional
+        If `True`, the connections on all MPI processes are returned as
+        arrays instead of a `SynapseCollection`. Each array is exchanged
+        in a single collective call, so `GetConnections` must be called
+        on all processes.
 
     Returns
     -------
     SynapseCollection:
         Object representing the source-node_id, target-node_id, target-thread, synapse-id, port of connections, see
         :py:class:`.SynapseCollection` for more.
+    dict:
+        If `gather` is `True`, a dictionary with the NumPy arrays
+        ``source``, ``target``, ``synapse_id``, ``weight`` and ``delay``,
+        holding the connections of all processes in the order of their
+        rank.
 
     Raises
     ------
@@ -78,8 +89,8 @@ def GetConnections(source=None, target=None, synapse_model=None,
 
     Notes
     -----
-    Only connections with targets on the MPI process executing
-    the command are returned.
+    Unless `gather` is `True`, only connections with targets on the MPI
+    process executing the command are returned.
     """
 
     params = {}
@@ -102,15 +113,18 @@ def GetConnections(source=None, target=None, synapse_model=None,
     if synapse_label is not None:
         params['synapse_label'] = synapse_label
 
-    sps(params)
-    sr("GetConnections")
-
-    conns = spp()
-
-    if isinstance(conns, tuple):
-        conns = SynapseCollection(None)
-
-    return conns
+    conns = _get_connections_arrays(params)
+    if not gather:
+        return conns
+
+    # Target thread and port only identify connections on their own process. Indexing copies the rows, as the
+    # read-only buffer of the SynapseCollection cannot be passed to the kernel.
+    source, target, synapse_id = conns._datum[[0, 1, 3]]
+    columns = {'source': source, 'target': target, 'synapse_id': synapse_id,
+               'weight': numpy.zeros(0), 'delay': numpy.zeros(0)}
+    if len(conns) > 0:
+        columns.update(conns.get(['weight', 'delay'], output='numpy'))
+    return _gather_arrays(columns)
 
 
 @check_stack
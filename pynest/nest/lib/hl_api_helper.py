@@ -38,6 +38,7 @@ import json
 from string import Template
 
 from ..ll_api import *
+from ..ll_api import _get_node_status_arrays
 from .. import pynestkernel as kernel
 
 __all__ = [
@@ -557,7 +558,7 @@ def restructure_data(result, keys):
     return final_result
 
 
-def get_parameters(nc, param):
+def get_parameters(nc, param, output=''):
     """
     Get parameters from nodes.
 
@@ -569,6 +570,9 @@ def get_parameters(nc, param):
         nodes to get values from
     param: string or list of strings
         string or list of string naming model properties.
+    output: str, ['numpy', 'structured'], optional
+        If the values should be returned as NumPy arrays with one value per
+        node, or as a NumPy structured array with one field per parameter.
 
     Returns
     -------
@@ -576,23 +580,60 @@ def get_parameters(nc, param):
         param is a string so the value(s) is returned
     dict:
         param is a list of string so a dictionary is returned
+    numpy.ndarray:
+        output is 'numpy' and param is a string, or output is 'structured'
     """
-    # param is single literal
     if is_literal(param):
-        cmd = '/{} get'.format(param)
-        sps(nc._datum)
-        try:
-            sr(cmd)
-            result = spp()
-        except kernel.NESTError:
-            result = nc.get()[param]  # If the NodeCollection is a composite.
-    # param is array of strings
+        keys = [param]
     elif is_iterable(param):
-        result = {param_name: nc.get(param_name) for param_name in param}
+        keys = list(param)
     else:
         raise TypeError("Params should be either a string or an iterable")
 
-    return result
+    # All values are read from the kernel in one call, with one array per parameter
+    try:
+        columns = _get_node_status_arrays(nc._datum, keys)
+    except kernel.NESTError:
+        if output:
+            raise
+        # If the NodeCollection is a composite, not all nodes may have the parameter.
+        if is_literal(param):
+            return nc.get()[param]
+        return {key: get_parameters(nc, key) for key in keys}
+
+    if output:
+        result = {key: _column_to_array(columns[key]) for key in keys}
+        if output == 'structured':
+            structured = numpy.empty(len(nc), dtype=[(key, values.dtype, values.shape[1:])
+                                                     for key, values in result.items()])
+            for key, values in result.items():
+                structured[key] = values
+            return structured
+    else:
+        result = {key: tuple(columns[key].tolist()) if isinstance(columns[key], numpy.ndarray) else columns[key]
+                  for key in keys}
+        if len(nc) == 1:
+            result = {key: values[0] for key, values in result.items()}
+
+    return result[param] if is_literal(param) else result
+
+
+def _column_to_array(values):
+    """
+    Convert the values of a parameter for all nodes to a NumPy array.
+
+    Values that cannot be stacked into a regular array, like arrays of
+    different length or dictionaries, are stored in an array of objects.
+    """
+    if isinstance(values, numpy.ndarray):
+        return values
+    try:
+        return numpy.array(values)
+    except ValueError:
+        array = numpy.empty(len(values), dtype=object)
+        for i, value in enumerate(values):
+            array[i] = value
+        return array
 
 
 def get_parameters_hierarchical_addressing(nc, params):
@@ -27,7 +27,11 @@ import sys
 import os
 import webbrowser
 
+import numpy
+
 from ..ll_api import *
+from ..ll_api import _get_connection_status_arrays, _get_node_status_arrays
+from .. import pynestkernel as kernel
 from .hl_api_helper import *
 from .hl_api_types import to_json
 import nest
@@ -286,26 +290,15 @@ def SetStatus(nodes, params, val=None):
     if len(nodes) == 0:
         return
 
-    n0 = nodes[0]
-    params_is_dict = isinstance(params, dict)
-    set_status_nodes = isinstance(nodes, nest.NodeCollection)
-    set_status_local_nodes = set_status_nodes and n0.get('local')
-
-    if (params_is_dict and set_status_local_nodes):
-        contains_list = [is_iterable(vals) and not is_iterable(n0.get(key))
-                         for key, vals in params.items()]
-
-        if any(contains_list):
-            temp_param = [{} for _ in range(len(nodes))]
+    if isinstance(nodes, nest.SynapseCollection):
+        if val is not None and is_literal(params):
+            params = {params: val}
+        nodes.set(params)
+        return
 
-            for key, vals in params.items():
-                if not is_iterable(vals):
-                    for temp_dict in temp_param:
-                        temp_dict[key] = vals
-                else:
-                    for i, temp_dict in enumerate(temp_param):
-                        temp_dict[key] = vals[i]
-            params = temp_param
+    if isinstance(params, dict):
+        nodes.set(params)
+        return
 
     if val is not None and is_literal(params):
         if is_iterable(val) and not isinstance(val, (uni_str, dict)):
@@ -318,16 +311,7 @@ def SetStatus(nodes, params, val=None):
             "status dict must be a dict, or a list of dicts of length "
             "len(nodes)")
 
-    if isinstance(nodes, nest.SynapseCollection):
-        params = broadcast(params, len(nodes), (dict,), "params")
-
-        sps(nodes)
-        sps(params)
-
-        sr('2 arraystore')
-        sr('Transpose { arrayload pop SetStatus } forall')
-    else:
-        sli_func('SetStatus', nodes, params)
+    sli_func('SetStatus', nodes, params)
 
 
 @check_stack
@@ -378,6 +362,11 @@ def GetStatus(nodes, keys=None, output=''):
     if len(nodes) == 0:
         return nodes
 
+    if keys is not None and (is_literal(keys) or is_iterable(keys)):
+        result = _get_status_arrays(nodes, keys)
+        if result is not None:
+            return to_json(result) if output == 'json' else result
+
     if keys is None:
         cmd = 'GetStatus'
     elif is_literal(keys):
@@ -403,3 +392,32 @@ def GetStatus(nodes, keys=None, output=''):
         result = to_json(result)
 
     return result
+
+
+def _get_status_arrays(nodes, keys):
+    """Read the values of `keys` directly from the kernel.
+
+    Returns the result in the same form as the SLI based `GetStatus`, or
+    None if the values cannot be read in one call.
+    """
+
+    keys_list = [keys] if is_literal(keys) else list(keys)
+    if not keys_list:
+        return None
+
+    try:
+        if isinstance(nodes, nest.NodeCollection):
+            values = _get_node_status_arrays(nodes._datum, keys_list)
+        else:
+            values = _get_connection_status_arrays(nodes._datum, keys_list)
+    except kernel.NESTError:
+        return None
+
+    if not values:
+        return None
+
+    columns = [tuple(values[key].tolist()) if isinstance(values[key], numpy.ndarray) else tuple(values[key])
+               for key in keys_list]
+    if is_literal(keys):
+        return columns[0]
+    return tuple(zip(*columns))
@@ -27,6 +27,7 @@ import warnings
 
 import nest
 from ..ll_api import *
+from ..ll_api import _create
 from .. import pynestkernel as kernel
 from .hl_api_helper import *
 from .hl_api_info import SetStatus
@@ -104,16 +105,19 @@ def Create(model, n=1, params=None, positions=None):
                                 for k, v in params.items()]
         params_contains_list = max(params_contains_list)
 
-    if not params_contains_list:
-        cmd = "/%s 3 1 roll exch Create" % model
-        sps(params)
+    if params_contains_list and isinstance(model, str) and isinstance(n, int):
+        node_ids = _create(model, n)
     else:
-        cmd = "/%s exch Create" % model
+        if not params_contains_list:
+            cmd = "/%s 3 1 roll exch Create" % model
+            sps(params)
+        else:
+            cmd = "/%s exch Create" % model
 
-    sps(n)
-    sr(cmd)
+        sps(n)
+        sr(cmd)
 
-    node_ids = spp()
+        node_ids = spp()
 
     if params is not None and params_contains_list:
         try:
@@ -26,6 +26,7 @@ Functions for simulation control
 from contextlib import contextmanager
 
 from ..ll_api import *
+from ..ll_api import _cleanup, _prepare, _run_simulation, _simulate
 from .hl_api_helper import *
 
 __all__ = [
@@ -60,8 +61,7 @@ def Simulate(t):
 
     """
 
-    sps(float(t))
-    sr('ms Simulate')
+    _simulate(float(t))
 
 
 @check_stack
@@ -93,8 +93,7 @@ def Run(t):
 
     """
 
-    sps(float(t))
-    sr('ms Run')
+    _run_simulation(float(t))
 
 
 @check_stack
@@ -110,7 +109,7 @@ def Prepare():
 
     """
 
-    sr('Prepare')
+    _prepare()
 
 
 @check_stack
@@ -125,7 +124,7 @@ def Cleanup():
     Run, Prepare
 
     """
-    sr('Cleanup')
+    _cleanup()
 
 
 @contextmanager
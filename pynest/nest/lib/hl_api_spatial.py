@@ -51,12 +51,14 @@ __all__ = [
     'FindCenterElement',
     'FindNearestElement',
     'GetPosition',
+    'GetPositionCacheStatus',
     'GetTargetNodes',
     'GetTargetPositions',
     'PlotLayer',
     'PlotProbabilityParameter',
     'PlotTargets',
     'SelectNodesByMask',
+    'SetPositionCacheStatus',
 ]
 
 
@@ -303,7 +305,7 @@ def Displacement(from_arg, to_arg):
     if not isinstance(to_arg, NodeCollection):
         raise TypeError("to_arg must be a NodeCollection")
 
-    if isinstance(from_arg, np.ndarray):
+    if isinstance(from_arg, np.ndarray) and from_arg.ndim == 1:
         from_arg = (from_arg, )
 
     if (len(from_arg) > 1 and len(to_arg) > 1 and not
@@ -371,7 +373,7 @@ def Distance(from_arg, to_arg):
     if not isinstance(to_arg, NodeCollection):
         raise TypeError("to_arg must be a NodeCollection")
 
-    if isinstance(from_arg, np.ndarray):
+    if isinstance(from_arg, np.ndarray) and from_arg.ndim == 1:
         from_arg = (from_arg, )
 
     if (len(from_arg) > 1 and len(to_arg) > 1 and not
@@ -443,24 +445,21 @@ def FindNearestElement(layer, locations, find_all=False):
     if not is_iterable(locations[0]):
         locations = (locations, )
 
-    result = []
+    # Find the nearest node to each location in the position tree of the layer
+    points = np.require(locations, dtype=float, requirements=['C', 'W'])
+    dim = points.shape[-1]
+    indptr, indices, distances = sli_func('FindNearest', layer, points.ravel(), dim, 1, np.inf)
 
-    for loc in locations:
-        d = Distance(np.array(loc), layer)
+    result = []
 
+    for point, idx, d in zip(points, indices, distances):
         if not find_all:
-            dx = np.argmin(d)  # finds location of one minimum
-            result.append(layer[dx])
+            result.append(layer[idx])
         else:
-            minnode = list(layer[:1])
-            minval = d[0]
-            for idx in range(1, len(layer)):
-                if d[idx] < minval:
-                    minnode = [layer[idx]]
-                    minval = d[idx]
-                elif np.abs(d[idx] - minval) <= 1e-14 * minval:
-                    minnode.append(layer[idx])
-            result.append(minnode)
+            # All nodes with minimal distance, in the order of the layer
+            indptr, all_indices, all_distances = sli_func('FindNearest', layer, point, dim, len(layer),
+                                                          d * (1. + 1e-14))
+            result.append([layer[i] for i in np.sort(all_indices)])
 
     if len(result) == 1:
         result = result[0]
@@ -654,7 +653,35 @@ def FindCenterElement(layer):
     return layer[index:index+1]
 
 
-def GetTargetNodes(sources, tgt_layer, syn_model=None):
+def _get_targets(sources, tgt_layer, syn_model):
+    """
+    Return the targets of the connections from `sources` to `tgt_layer`
+    grouped by source, in compressed sparse row format.
+
+    The targets of the source with index j in `sources` are given by
+    ``indices[indptr[j]:indptr[j+1]]`` as indices into `tgt_layer`, in the
+    order of the connections.
+    """
+    # Selecting connections by target is slow in the kernel, so targets are selected here
+    conns = GetConnections(sources, synapse_model=syn_model)
+
+    source_ids = np.asarray(sources.tolist()).reshape(-1)
+    target_ids = np.asarray(tgt_layer.tolist()).reshape(-1)
+    source_order = np.argsort(source_ids, kind='stable')
+    target_order = np.argsort(target_ids, kind='stable')
+    target_indices = np.searchsorted(target_ids, conns.targets(), sorter=target_order)
+    in_tgt_layer = target_ids[target_order[np.minimum(target_indices, len(target_ids) - 1)]] == conns.targets()
+    source_indices = source_order[np.searchsorted(source_ids, conns.sources()[in_tgt_layer], sorter=source_order)]
+    target_indices = target_order[target_indices[in_tgt_layer]]
+
+    # Group by source, keeping the order of the connections of each source
+    by_source = np.argsort(source_indices, kind='stable')
+    indptr = np.zeros(len(source_ids) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(source_indices, minlength=len(source_ids)), out=indptr[1:])
+    return indptr, target_indices[by_source]
+
+
+def GetTargetNodes(sources, tgt_layer, syn_model=None, csr=False):
     """
     Obtain targets of `sources` in given `target` population.
 
@@ -670,12 +697,20 @@ def GetTargetNodes(sources, tgt_layer, syn_model=None):
         NodeCollection with node IDs of `tgt_layer`
     syn_model : [None | str], optional, default: None
         Return only target positions for a given synapse model.
+    csr : bool, optional, default: False
+        Return the targets as arrays in compressed sparse row format instead
+        of a `NodeCollection` per source node ID, which is faster for large
+        numbers of connections.
 
     Returns
     -------
     tuple of NodeCollection:
         Tuple of `NodeCollections` of target neurons fulfilling the given criteria, one `NodeCollection` per
         source node ID in `sources`.
+    tuple of numpy.ndarray:
+        If `csr` is True, arrays `(indptr, indices)`, where the indices into
+        `tgt_layer` of the targets of the source with index j in `sources`
+        are ``indices[indptr[j]:indptr[j+1]]``, sorted in ascending order.
 
     See also
     --------
@@ -715,21 +750,25 @@ def GetTargetNodes(sources, tgt_layer, syn_model=None):
     if not isinstance(tgt_layer, NodeCollection):
         raise TypeError("tgt_layer must be a NodeCollection")
 
-    conns = GetConnections(sources, tgt_layer, synapse_model=syn_model)
+    indptr, indices = _get_targets(sources, tgt_layer, syn_model)
 
-    # Re-organize conns into one list per source, containing only target node IDs.
-    src_tgt_map = dict((snode_id, []) for snode_id in sources.tolist())
-    for src, tgt in zip(conns.sources(), conns.targets()):
-        src_tgt_map[src].append(tgt)
+    # Sort the targets of each source and remove duplicates from multapses
+    source_indices = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    order = np.lexsort((indices, source_indices))
+    source_indices, indices = source_indices[order], indices[order]
+    unique = np.ones(len(indices), dtype=bool)
+    unique[1:] = (source_indices[1:] != source_indices[:-1]) | (indices[1:] != indices[:-1])
+    source_indices, indices = source_indices[unique], indices[unique]
+    indptr = np.searchsorted(source_indices, np.arange(len(indptr)))
 
-    for src in src_tgt_map.keys():
-        src_tgt_map[src] = NodeCollection(list(np.unique(src_tgt_map[src])))
+    if csr:
+        return indptr, indices
 
-    # convert dict to nested list in same order as sources
-    return tuple(src_tgt_map[snode_id] for snode_id in sources.tolist())
+    target_ids = np.asarray(tgt_layer.tolist()).reshape(-1)[indices]
+    return tuple(NodeCollection(target_ids[start:stop]) for start, stop in zip(indptr[:-1], indptr[1:]))
 
 
-def GetTargetPositions(sources, tgt_layer, syn_model=None):
+def GetTargetPositions(sources, tgt_layer, syn_model=None, csr=False):
     """
     Obtain positions of targets to a given `NodeCollection` of `sources`.
 
@@ -745,12 +784,22 @@ def GetTargetPositions(sources, tgt_layer, syn_model=None):
         `NodeCollection` of tgt_layer
     syn_type : [None | str], optional, default: None
         Return only target positions for a given synapse model.
+    csr : bool, optional, default: False
+        Return the positions as arrays in compressed sparse row format
+        instead of nested lists, which is faster for large numbers of
+        connections.
 
     Returns
     -------
     list of list(s) of tuple(s) of floats:
         Positions of target neurons fulfilling the given criteria as a nested
         list, containing one list of positions per node in sources.
+    tuple of numpy.ndarray:
+        If `csr` is True, arrays `(indptr, indices, positions)`, where the
+        targets of the connections from the source with index j in `sources`
+        are given by ``indices[indptr[j]:indptr[j+1]]`` as indices into
+        `tgt_layer`, and their positions by the corresponding rows of
+        `positions`, which has one row per connection.
 
     See also
     --------
@@ -786,28 +835,20 @@ def GetTargetPositions(sources, tgt_layer, syn_model=None):
     if not isinstance(sources, NodeCollection):
         raise TypeError("sources must be a NodeCollection.")
 
-    # Find positions to all nodes in target layer
-    pos_all_tgts = GetPosition(tgt_layer)
-    first_tgt_node_id = tgt_layer[0].get('global_id')
+    if not isinstance(tgt_layer, NodeCollection):
+        raise TypeError("tgt_layer must be a NodeCollection")
 
-    connections = GetConnections(sources, tgt_layer,
-                                 synapse_model=syn_model)
-    srcs = connections.get('source')
-    tgts = connections.get('target')
-    if isinstance(srcs, int):
-        srcs = [srcs]
-    if isinstance(tgts, int):
-        tgts = [tgts]
+    indptr, indices = _get_targets(sources, tgt_layer, syn_model)
 
-    # Make dictionary where the keys are the source node_ids, which is mapped to a
-    # list with the positions of the targets connected to the source.
-    src_tgt_pos_map = dict((snode_id, []) for snode_id in sources.tolist())
-    for i in range(len(connections)):
-        tgt_indx = tgts[i] - first_tgt_node_id
-        src_tgt_pos_map[srcs[i]].append(pos_all_tgts[tgt_indx])
+    # Find positions to all nodes in target layer, and pick those of the targets
+    pos_all_tgts = np.reshape(GetPosition(tgt_layer), (len(tgt_layer), -1))
+    positions = pos_all_tgts[indices]
 
-    # Turn dict into list in same order as sources
-    return [src_tgt_pos_map[snode_id] for snode_id in sources.tolist()]
+    if csr:
+        return indptr, indices, positions
+
+    positions = list(map(tuple, positions.tolist()))
+    return [positions[start:stop] for start, stop in zip(indptr[:-1], indptr[1:])]
 
 
 def SelectNodesByMask(layer, anchor, mask_obj):
@@ -845,6 +886,60 @@ def SelectNodesByMask(layer, anchor, mask_obj):
     return NodeCollection(node_id_list)
 
 
+def GetPositionCacheStatus():
+    """
+    Return the status of the cache of global positions of spatial layers.
+
+    Connecting to or from a spatial layer requires the positions of all its
+    nodes, which are gathered from all MPI processes and stored in a tree.
+    These positions are cached for several layers, so that they are only
+    gathered once if the same layers are connected repeatedly.
+
+    Returns
+    -------
+    dict:
+        Dictionary with the maximal memory of the cache in bytes,
+        ``max_memory``, the estimated memory currently used, ``memory``,
+        the number of cached layers, ``cached_layers``, and the number of
+        requests served from the cache, ``hits``, or not, ``misses``, and of
+        layers evicted from the cache, ``evictions``, since the last call
+        to :py:func:`.SetPositionCacheStatus` or ``ResetKernel``.
+
+    See also
+    --------
+    SetPositionCacheStatus
+    """
+
+    return sli_func('GetPositionCacheStatus')
+
+
+def SetPositionCacheStatus(params):
+    """
+    Set the maximal memory of the cache of global positions of spatial layers.
+
+    If the cache exceeds its maximal memory, the least recently used layers
+    are evicted, although the layer used last when connecting is always
+    kept. Setting the status resets the counters of hits, misses and
+    evictions. ``ResetKernel`` clears the cache and restores the default
+    maximal memory of 1 GiB.
+
+    Parameters
+    ----------
+    params : dict
+        Dictionary with the maximal memory of the cache in bytes under the
+        key ``max_memory``.
+
+    See also
+    --------
+    GetPositionCacheStatus
+    """
+
+    if not isinstance(params, dict):
+        raise TypeError("params must be a dict.")
+
+    sli_func('SetPositionCacheStatus', params)
+
+
 def _draw_extent(ax, xctr, yctr, xext, yext):
     """Draw extent and set aspect ration, limits"""
 
@@ -1257,11 +1352,8 @@ def PlotProbabilityParameter(source, parameter=None, mask=None, edges=[-0.5, 0.5
     ax.set_ylim(*edges[2:])
 
     if parameter is not None:
-        z = np.zeros(shape[::-1])
-        for i, x in enumerate(np.linspace(edges[0], edges[1], shape[0])):
-            positions = [[x, y] for y in np.linspace(edges[2], edges[3], shape[1])]
-            values = parameter.apply(source, positions)
-            z[:, i] = np.array(values)
+        x, y = np.meshgrid(np.linspace(edges[0], edges[1], shape[0]), np.linspace(edges[2], edges[3], shape[1]))
+        z = parameter.evaluate(np.column_stack((x.ravel(), y.ravel())), source).reshape(x.shape)
         img = ax.imshow(np.minimum(np.maximum(z, 0.0), 1.0), extent=edges,
                         origin='lower', cmap=prob_cmap, vmin=0., vmax=1.)
         plt.colorbar(img, ax=ax, fraction=0.046, pad=0.04)
@@ -25,6 +25,8 @@ Classes defining the different PyNEST types
 
 
 from ..ll_api import *
+from ..ll_api import (_gather_arrays, _get_connection_status_arrays, _get_new_events, _node_collection_to_array,
+                      _set_connection_status_arrays, _set_node_status_arrays, _slice_node_collection)
 from .. import pynestkernel as kernel
 from .hl_api_helper import *
 from .hl_api_simulation import GetKernelStatus
@@ -124,15 +126,16 @@ class NodeCollectionIterator(object):
     def __init__(self, nc):
         self._nc = nc
         self._increment = 0
+        self._size = len(nc)
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        if self._increment > len(self._nc) - 1:
+        if self._increment >= self._size:
             raise StopIteration
 
-        val = sli_func('Take', self._nc._datum, [self._increment + (self._increment >= 0)])
+        val = _slice_node_collection(self._nc._datum, self._increment, self._increment + 1, 1)
         self._increment += 1
         return val
 
@@ -172,6 +175,9 @@ class NodeCollection(object):
             # Convert to list
             nc_list =  nc.tolist()
 
+            # Node IDs as NumPy array
+            nc_ids = nc.ids
+
             # Concatenation
             Enrns = nest.Create('aeif_cond_alpha', 600)
             Inrns = nest.Create('iaf_psc_alpha', 400)
@@ -262,9 +268,19 @@ class NodeCollection(object):
             - A list of strings.
             - One or more strings, followed by a string or list of strings.
               This is for hierarchical addressing.
-        output : str, ['pandas','json'], optional
-             If the returned data should be in a Pandas DataFrame or in a
-             JSON serializable format.
+        output : str, ['pandas','json','numpy','structured'], optional
+             If the returned data should be in a Pandas DataFrame, in a
+             JSON serializable format, or as NumPy arrays. With ``'numpy'``,
+             an array with one value per node is returned for each
+             parameter, also for a single node. With ``'structured'``, a
+             NumPy structured array with one field per parameter is
+             returned. Both read all values in one pass over the nodes.
+        gather : bool, optional
+             Only with the single parameter ``'events'`` of recording
+             devices. If `True`, the events recorded on all MPI processes
+             are returned, with the arrays of the processes concatenated in
+             the order of their rank. Each array is exchanged in a single
+             collective call, so `get` must be called on all processes.
 
         Returns
         -------
@@ -280,6 +296,9 @@ class NodeCollection(object):
             for all nodes is returned.
         DataFrame:
             Pandas Data frame if output should be in pandas format.
+        numpy.ndarray:
+            If output is ``'numpy'`` and params is a single string, or if
+            output is ``'structured'``.
 
         Raises
         ------
@@ -295,16 +314,29 @@ class NodeCollection(object):
         # ------------------------- #
         #      Checks of input      #
         # ------------------------- #
-        if not kwargs:
-            output = ''
-        elif 'output' in kwargs:
-            output = kwargs['output']
-            if output == 'pandas' and not HAVE_PANDAS:
-                raise ImportError('Pandas could not be imported')
-        else:
+        output = kwargs.pop('output', '')
+        gather = kwargs.pop('gather', False)
+        if kwargs:
             raise TypeError('Got unexpected keyword argument')
+        if output == 'pandas' and not HAVE_PANDAS:
+            raise ImportError('Pandas could not be imported')
         pandas_output = output == 'pandas'
 
+        if gather:
+            if params != ('events',) or output:
+                raise TypeError("gather requires 'events' as the only parameter and no output format")
+            events = get_parameters(self, 'events')
+            if len(self) == 1:
+                return _gather_arrays(events)
+            return tuple(_gather_arrays(device_events) for device_events in events)
+
+        if output in ('numpy', 'structured'):
+            if len(params) != 1:
+                raise TypeError("output '{}' requires a string or a list of strings naming the parameters"
+                                .format(output))
+            # All values are read from the kernel in one pass over the nodes
+            return get_parameters(self, params[0], output)
+
         if len(params) == 0:
             # get() is called without arguments
             result = sli_func('get', self._datum)
@@ -341,6 +373,9 @@ class NodeCollection(object):
         If `kwargs` is given, it has to be names and values of an attribute as keyword argument pairs. The values
         can be single values or list of the same size as the `NodeCollection`.
 
+        Numeric values given as lists or NumPy arrays of the same size as the `NodeCollection` are passed to the
+        kernel in a single call, without creating a dictionary for each node.
+
         Parameters
         ----------
         params : str or dict or list
@@ -363,14 +398,38 @@ class NodeCollection(object):
             raise TypeError("must either provide params or kwargs, but not both.")
 
         if isinstance(params, dict) and self[0].get('local'):
-
-            contains_list = [is_iterable(vals) and not is_iterable(self[0].get(key)) for key, vals in params.items()]
-
-            if any(contains_list):
+            # Find the parameters that are given as one value per node, looking
+            # at the current values of the first node only.
+            iterable_keys = [key for key, vals in params.items() if is_iterable(vals)]
+            first_values = self[0].get(iterable_keys) if iterable_keys else {}
+            array_keys = [key for key in iterable_keys if not is_iterable(first_values[key])]
+
+            columns = {key: numpy.asarray(params[key]) for key in array_keys}
+            for key, values in columns.items():
+                if values.shape != (self.__len__(),):
+                    raise IndexError("the value of '{}' must be a single value or have length len(nodes)".format(key))
+
+            # Numeric values are sent to the kernel in one call, with one array per parameter,
+            # converted to the type of the current value of the parameter.
+            double_keys = [key for key in array_keys
+                           if isinstance(first_values[key], float) and columns[key].dtype.kind in 'fiu']
+            int_keys = [key for key in array_keys
+                        if isinstance(first_values[key], int) and not isinstance(first_values[key], bool) and
+                        columns[key].dtype.kind in 'iu']
+            if len(double_keys) + len(int_keys) == len(array_keys):
+                scalar_params = {key: vals for key, vals in params.items() if key not in columns}
+                double_values = numpy.array([columns[key] for key in double_keys], dtype=numpy.double)
+                int_values = numpy.array([columns[key] for key in int_keys], dtype=numpy.int_)
+                _set_node_status_arrays(self._datum, scalar_params,
+                                        double_keys, double_values.reshape(len(double_keys), self.__len__()),
+                                        int_keys, int_values.reshape(len(int_keys), self.__len__()))
+                return
+
+            if columns:
                 temp_param = [{} for _ in range(self.__len__())]
 
                 for key, vals in params.items():
-                    if not is_iterable(vals):
+                    if key not in columns:
                         for temp_dict in temp_param:
                             temp_dict[key] = vals
                     else:
@@ -384,13 +443,51 @@ class NodeCollection(object):
 
         sli_func('SetStatus', self._datum, params)
 
+    def get_new_events(self, drain=False):
+        """
+        Get the events recorded since the last call, without reading all events.
+
+        Each recorder keeps a read position, which is advanced to the end of
+        the recorded events by each call. Unlike ``get('events')``, the time
+        this takes only depends on the number of new events. This is only
+        supported by recorders with ``record_to`` set to ``'memory'``.
+
+        Parameters
+        ----------
+        drain : bool, optional
+            If True, all events read so far are deleted from memory, so that
+            memory consumption stays bounded. `n_events` is not changed.
+
+        Returns
+        -------
+        dict:
+            The new events in the format of ``get('events')``, if there is a
+            single recorder in the `NodeCollection`.
+        tuple:
+            One dictionary of new events per recorder, if there are multiple
+            recorders in the `NodeCollection`.
+
+        Raises
+        ------
+        kernel.NESTError
+            If a node is not a recorder or its backend does not keep events
+            in memory.
+        """
+        result = tuple(_get_new_events(node_id, drain) for node_id in self.tolist())
+        return result[0] if len(result) == 1 else result
+
+    @property
+    def ids(self):
+        """
+        Node IDs of the `NodeCollection` as a NumPy array.
+        """
+        return _node_collection_to_array(self._datum)
+
     def tolist(self):
         """
         Convert `NodeCollection` to list.
         """
-        if self.__len__() == 0:
-            return []
-        return list(self.get('global_id')) if self.__len__() > 1 else [self.get('global_id')]
+        return self.ids.tolist()
 
     def index(self, node_id):
         """
@@ -434,13 +531,19 @@ class SynapseCollectionIterator(object):
     """
 
     def __init__(self, synapse_collection):
-        self._iter = iter(synapse_collection._datum)
+        self._datum = synapse_collection._datum
+        self._increment = 0
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        return SynapseCollection(next(self._iter))
+        if self._increment >= self._datum.shape[1]:
+            raise StopIteration
+
+        val = SynapseCollection(self._datum[:, self._increment:self._increment + 1])
+        self._increment += 1
+        return val
 
     next = __next__  # Python2.x
 
@@ -451,53 +554,42 @@ class SynapseCollection(object):
 
     `SynapseCollection` represents the connections of a network. The class supports indexing, iteration, length and
     equality. You can get and set connection parameters by using the membership functions :py:func:`get()` and
-    :py:func:`set()`. By using the membership function :py:func:`sources()` you get an iterator over
-    source nodes, while :py:func:`targets()` returns an interator over the target nodes of the connections.
+    :py:func:`set()`. By using the membership function :py:func:`sources()` you get an array of the
+    source nodes, while :py:func:`targets()` returns an array of the target nodes of the connections.
 
     A SynapseCollection is created by the :py:func:`.GetConnections` function.
+
+    The connections are stored as five integer arrays holding source node IDs, target node IDs, target threads,
+    synapse model IDs and ports. Connection datums for the kernel are only created when they are passed to it.
     """
 
     _datum = None
 
     def __init__(self, data):
 
-        if isinstance(data, list):
-            for datum in data:
-                if (not isinstance(datum, kernel.SLIDatum) or
-                        datum.dtype != "connectiontype"):
-                    raise TypeError("Expected Connection Datum.")
-            self._datum = data
-        elif data is None:
+        if data is None:
             # We can have an empty SynapseCollection if there are no connections.
-            self._datum = data
+            data = numpy.empty((5, 0), dtype=int)
         else:
-            if (not isinstance(data, kernel.SLIDatum) or
-                    data.dtype != "connectiontype"):
-                raise TypeError("Expected Connection Datum.")
-            # self._datum needs to be a list of Connection datums.
-            self._datum = [data]
+            data = numpy.asarray(data)
+            if not numpy.issubdtype(data.dtype, numpy.integer):
+                raise TypeError("Expected array of connection IDs.")
+            data = data.reshape(5, -1)
+        # Connection IDs must not be changed in place, as they identify the connections in the kernel
+        data.flags.writeable = False
+        self._datum = data
 
     def __iter__(self):
         return SynapseCollectionIterator(self)
 
     def __len__(self):
-        if self._datum is None:
-            return 0
-        return len(self._datum)
+        return self._datum.shape[1]
 
     def __eq__(self, other):
         if not isinstance(other, SynapseCollection):
             raise NotImplementedError()
 
-        if self.__len__() != other.__len__():
-            return False
-        self_get = self.get(['source', 'target', 'target_thread',
-                             'synapse_id', 'port'])
-        other_get = other.get(['source', 'target', 'target_thread',
-                               'synapse_id', 'port'])
-        if self_get != other_get:
-            return False
-        return True
+        return numpy.array_equal(self._datum, other._datum)
 
     def __neq__(self, other):
         if not isinstance(other, SynapseCollection):
@@ -506,9 +598,11 @@ class SynapseCollection(object):
 
     def __getitem__(self, key):
         if isinstance(key, slice):
-            return SynapseCollection(self._datum[key])
+            return SynapseCollection(self._datum[:, key])
+        elif isinstance(key, (int, numpy.integer)):
+            return SynapseCollection(self._datum[:, key, numpy.newaxis])
         else:
-            return SynapseCollection([self._datum[key]])
+            raise IndexError('only integers and slices are valid indices')
 
     def __str__(self):
         """
@@ -519,13 +613,8 @@ class SynapseCollection(object):
             | target | 1, 2, 1, 2, |
             *--------*-------------*
         """
-        srcs = self.get('source')
-        trgt = self.get('target')
-
-        if isinstance(srcs, int):
-            srcs = [srcs]
-        if isinstance(trgt, int):
-            trgt = [trgt]
+        srcs = self.sources()
+        trgt = self.targets()
 
         # 35 is arbitrarily chosen.
         if len(srcs) < 35:
@@ -557,18 +646,12 @@ class SynapseCollection(object):
             self.set({attr: value})
 
     def sources(self):
-        """Returns iterator containing the source node IDs of the `SynapseCollection`."""
-        sources = self.get('source')
-        if not isinstance(sources, (list, tuple)):
-            sources = (sources,)
-        return iter(sources)
+        """Returns a read-only NumPy array containing the source node IDs of the `SynapseCollection`."""
+        return self._datum[0]
 
     def targets(self):
-        """Returns iterator containing the target node IDs of the `SynapseCollection`."""
-        targets = self.get('target')
-        if not isinstance(targets, (list, tuple)):
-            targets = (targets,)
-        return iter(targets)
+        """Returns a read-only NumPy array containing the target node IDs of the `SynapseCollection`."""
+        return self._datum[1]
 
     def get(self, keys=None, output=''):
         """
@@ -585,9 +668,11 @@ class SynapseCollection(object):
             String or a list of strings naming model properties. get
             then returns a single value or a dictionary with lists of values
             belonging to the given `keys`.
-        output : str, ['pandas','json'], optional
-            If the returned data should be in a Pandas DataFrame or in a
-            JSON serializable format.
+        output : str, ['pandas','json','numpy'], optional
+            If the returned data should be in a Pandas DataFrame, in a
+            JSON serializable format, or as NumPy arrays. With ``'numpy'``,
+            an array with one value per connection is returned for each key,
+            also for a single connection.
 
         Returns
         -------
@@ -609,32 +694,42 @@ class SynapseCollection(object):
         if pandas_output and not HAVE_PANDAS:
             raise ImportError('Pandas could not be imported')
 
-        # Return empty tuple if we have no connections or if we have done a
-        # nest.ResetKernel()
-        num_conn = GetKernelStatus('num_connections')
-        if self.__len__() == 0 or num_conn == 0:
+        if self.__len__() == 0:
             return ()
 
         if keys is None:
-            cmd = 'GetStatus'
+            keys_list = []
         elif is_literal(keys):
-            cmd = 'GetStatus {{ /{0} get }} Map'.format(keys)
+            keys_list = [keys]
         elif is_iterable(keys):
-            keys_str = " ".join("/{0}".format(x) for x in keys)
-            cmd = 'GetStatus {{ [ [ {0} ] ] get }} Map'.format(keys_str)
+            keys_list = list(keys)
         else:
             raise TypeError("keys should be either a string or an iterable")
 
-        sps(self._datum)
-        sr(cmd)
-        result = spp()
+        # All values are read from the kernel in one call, with one array per key
+        result = _get_connection_status_arrays(self._datum, keys_list)
+
+        # The result is empty if we have done a nest.ResetKernel()
+        if not result:
+            return ()
+
+        if keys_list:
+            # Keep the order of the requested keys
+            result = {key: result[key] for key in keys_list}
 
-        # Need to restructure the data.
-        final_result = restructure_data(result, keys)
+        if output == 'numpy':
+            result = {key: numpy.asarray(values) for key, values in result.items()}
+            return result[keys] if is_literal(keys) else result
+
+        final_result = {key: values.tolist() if isinstance(values, numpy.ndarray) else list(values)
+                        for key, values in result.items()}
+        if self.__len__() == 1:
+            final_result = {key: values[0] for key, values in final_result.items()}
+        if is_literal(keys):
+            final_result = final_result[keys]
 
         if pandas_output:
-            index = (self.get('source') if self.__len__() > 1 else
-                     (self.get('source'),))
+            index = self.sources()
             if is_literal(keys):
                 final_result = {keys: final_result}
             final_result = pandas.DataFrame(final_result, index=index)
@@ -652,6 +747,10 @@ class SynapseCollection(object):
         If `kwargs` is given, it has to be names and values of an attribute as keyword argument pairs. The values
         can be single values or list of the same size as the `SynapseCollection`.
 
+        Numeric values given as lists or NumPy arrays of the same size as the `SynapseCollection` are passed to
+        the kernel in a single call, so setting e.g. all weights from an array does not create a dictionary per
+        connection.
+
         Parameters
         ----------
         params : str or dict or list
@@ -670,8 +769,8 @@ class SynapseCollection(object):
 
         # This was added to ensure that the function is a nop (instead of,
         # for instance, raising an exception) when applied to an empty
-        # SynapseCollection, or after having done a nest.ResetKernel().
-        if self.__len__() == 0 or GetKernelStatus()['network_size'] == 0:
+        # SynapseCollection.
+        if self.__len__() == 0:
             return
 
         if (isinstance(params, (list, tuple)) and
@@ -686,23 +785,55 @@ class SynapseCollection(object):
             raise TypeError("must either provide params or kwargs, but not both.")
 
         if isinstance(params, dict):
-            contains_list = [is_iterable(vals) and not is_iterable(self[0].get(key)) for key, vals in params.items()]
-
-            if any(contains_list):
-                temp_param = [{} for _ in range(self.__len__())]
-
-                for key, vals in params.items():
-                    if not is_iterable(vals):
-                        for temp_dict in temp_param:
-                            temp_dict[key] = vals
-                    else:
-                        for i, temp_dict in enumerate(temp_param):
-                            temp_dict[key] = vals[i]
-                params = temp_param
+            # Find the parameters that are given as one value per connection,
+            # looking at the current values of the first connection only.
+            iterable_keys = [key for key, vals in params.items() if is_iterable(vals)]
+            first_values = {}
+            if iterable_keys:
+                first_values = _get_connection_status_arrays(self._datum[:, :1], iterable_keys)
+                # The result is empty if we have done a nest.ResetKernel()
+                if not first_values:
+                    return
+            array_keys = [key for key in iterable_keys if not is_iterable(first_values[key][0])]
+
+            columns = {key: numpy.asarray(params[key]) for key in array_keys}
+            for key, values in columns.items():
+                if values.shape != (self.__len__(),):
+                    raise IndexError("the value of '{}' must be a single value or have length len(connections)"
+                                     .format(key))
+
+            # Numeric values are sent to the kernel in one call, with one array per parameter,
+            # converted to the type of the current value of the parameter.
+            double_keys = [key for key in array_keys if isinstance(first_values[key], numpy.ndarray) and
+                           first_values[key].dtype.kind == 'f' and columns[key].dtype.kind in 'fiu']
+            int_keys = [key for key in array_keys if isinstance(first_values[key], numpy.ndarray) and
+                        first_values[key].dtype.kind == 'i' and columns[key].dtype.kind in 'iu']
+            if len(double_keys) + len(int_keys) == len(array_keys):
+                scalar_params = {key: vals for key, vals in params.items() if key not in columns}
+                double_values = numpy.array([columns[key] for key in double_keys], dtype=numpy.double)
+                int_values = numpy.array([columns[key] for key in int_keys], dtype=numpy.int_)
+                _set_connection_status_arrays(self._datum, scalar_params,
+                                              double_keys, double_values.reshape(len(double_keys), self.__len__()),
+                                              int_keys, int_values.reshape(len(int_keys), self.__len__()))
+                return
+
+            temp_param = [{} for _ in range(self.__len__())]
+            for key, vals in params.items():
+                if key not in columns:
+                    for temp_dict in temp_param:
+                        temp_dict[key] = vals
+                else:
+                    for i, temp_dict in enumerate(temp_param):
+                        temp_dict[key] = vals[i]
+            params = temp_param
+
+        # This ensures that the function is a nop after having done a nest.ResetKernel().
+        if GetKernelStatus()['network_size'] == 0:
+            return
 
         params = broadcast(params, self.__len__(), (dict,), "params")
 
-        sps(self._datum)
+        sps(self)
         sps(params)
 
         sr('2 arraystore')
@@ -884,6 +1015,96 @@ class Parameter(object):
                     raise ValueError('All positions must have the same number of dimensions')
             return sli_func('Apply', self._datum, {'source': spatial_nc, 'targets': positions})
 
+    def evaluate(self, positions, source):
+        """
+        Evaluate the parameter at many positions in one call.
+
+        Unlike :py:meth:`apply`, the positions are passed to the kernel as a
+        single array, so that evaluating the parameter on a large grid, e.g.
+        for plotting, does not require a call for each position.
+
+        Parameters
+        ----------
+        positions : numpy.ndarray
+            Array of shape (N, D) with N target positions, where D is the
+            number of dimensions of the layer of `source`
+        source : NodeCollection
+            NodeCollection with a single node of a spatial layer, used as
+            source for distance dependent parameters
+
+        Returns
+        -------
+        numpy.ndarray:
+            Array of length N with the values of the parameter
+
+        Raises
+        ------
+        ValueError
+            If `source` is not a single node, or `positions` is not a
+            two-dimensional array
+        NESTError
+            If `source` is not a node of a spatial layer, or D does not match
+            the number of dimensions of its layer
+
+        Example
+        -------
+            ::
+
+                import numpy as np
+                import nest
+
+                layer = nest.Create('iaf_psc_alpha', positions=nest.spatial.grid(shape=[5, 5]))
+                x, y = np.meshgrid(np.linspace(-0.5, 0.5, 100), np.linspace(-0.5, 0.5, 100))
+                positions = np.column_stack((x.ravel(), y.ravel()))
+
+                values = nest.spatial.distance.evaluate(positions, layer[0]).reshape(x.shape)
+        """
+        if not isinstance(source, NodeCollection):
+            raise TypeError('source must be a NodeCollection')
+        if len(source) != 1:
+            raise ValueError('The NodeCollection must contain a single node ID only')
+        # The kernel needs a writable, contiguous buffer of doubles
+        positions = numpy.require(positions, dtype=float, requirements=['C', 'W'])
+        if positions.ndim != 2 or positions.shape[1] == 0:
+            raise ValueError('positions must be an array of shape (N, D)')
+        # The kernel checks that D matches the layer of source
+        return sli_func('Evaluate', self._datum, source, positions.ravel(), positions.shape[1])
+
+    def sample(self, n):
+        """
+        Draw many values of the parameter in one call.
+
+        Parameters
+        ----------
+        n : int
+            Number of values to draw
+
+        Returns
+        -------
+        numpy.ndarray:
+            Array of length n with the values of the parameter
+
+        Raises
+        ------
+        TypeError
+            If `n` is not an integer
+        ValueError
+            If `n` is negative
+
+        Example
+        -------
+            ::
+
+                import nest
+
+                values = nest.random.normal(mean=0.0, std=1.0).sample(1000)
+        """
+        if not isinstance(n, (int, numpy.integer)) or isinstance(n, bool):
+            raise TypeError('n must be an integer')
+        if n < 0:
+            raise ValueError('n must not be negative')
+        return sli_func('Sample', self._datum, int(n))
+
 
 def serializable(data):
     """Make data serializable for JSON.
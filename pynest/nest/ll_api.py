@@ -93,6 +93,20 @@ engine = kernel.NESTEngine()
 sli_push = sps = engine.push
 sli_pop = spp = engine.pop
 connect_arrays = engine.connect_arrays
+_create = engine.create
+_simulate = engine.simulate
+_run_simulation = engine.run_simulation
+_prepare = engine.prepare
+_cleanup = engine.cleanup
+_get_connection_status_arrays = engine.get_connection_status_arrays
+_set_connection_status_arrays = engine.set_connection_status_arrays
+_set_node_status_arrays = engine.set_node_status_arrays
+_get_connections_arrays = engine.get_connections_arrays
+_gather_arrays = engine.gather_arrays
+_get_node_status_arrays = engine.get_node_status_arrays
+_get_new_events = engine.get_new_events
+_node_collection_to_array = engine.node_collection_to_array
+_slice_node_collection = engine.slice_node_collection
 
 
 def catching_sli_run(cmd):
@@ -140,29 +140,15 @@ def from_file(fname, **kwargs):
 
 def from_file_pandas(fname, **kwargs):
     """Use pandas."""
-    data = None
-    for f in fname:
-        dataFrame = pandas.read_table(f, header=2, skipinitialspace=True)
-        newdata = dataFrame.values
-
-        if data is None:
-            data = newdata
-        else:
-            data = numpy.concatenate((data, newdata))
+    data = nest.io.read_events(fname, output='pandas')[['senders', 'times']].values
 
     return from_data(data, **kwargs)
 
 
 def from_file_numpy(fname, **kwargs):
     """Use numpy."""
-    data = None
-    for f in fname:
-        newdata = numpy.loadtxt(f, skiprows=3)
-
-        if data is None:
-            data = newdata
-        else:
-            data = numpy.concatenate((data, newdata))
+    events = nest.io.read_events(fname)
+    data = numpy.column_stack((events['senders'], events['times']))
 
     return from_data(data, **kwargs)
 
@@ -20,7 +20,7 @@
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
 import numpy as np
-from ..lib.hl_api_types import CreateParameter, Parameter
+from ..lib.hl_api_types import CreateParameter, NodeCollection, Parameter
 from ..ll_api import sli_func
 
 __all__ = [
@@ -28,6 +28,7 @@ __all__ = [
     'grid',
     'free',
     'pos',
+    'query',
     'source_pos',
     'target_pos',
 ]
@@ -264,3 +265,105 @@ class free(object):
         # each dimension. When creating positions for nodes, values from
         # each parameter are fetched for the position vector.
         return sli_func(dimfunc, *dim_parameters)
+
+
+def query(layer, points, k=None, radius=None, return_distance=False):
+    """
+    Find the nodes of a spatial layer nearest to many points.
+
+    All points are queried in one call to the kernel, which searches the
+    tree of node positions of the layer, also used when connecting with
+    masks. Distances take periodic boundary conditions into account.
+
+    Parameters
+    ----------
+    layer : NodeCollection
+        `NodeCollection` of spatially distributed nodes
+    points : numpy.ndarray
+        Array of shape (M, D) with M query points, or a single point of
+        length D, where D is the number of dimensions of `layer`
+    k : int, optional
+        Number of nearest nodes to find for each point
+    radius : float, optional
+        Only nodes within this distance of a point are found
+    return_distance : bool, optional
+        If True, also return the distances of the nodes found
+
+    Returns
+    -------
+    numpy.ndarray:
+        If `k` is given, array of shape (M, k) with the indices into
+        `layer` of the nodes nearest to each point, sorted by distance.
+        Entries are -1 if fewer than `k` nodes are found within `radius`.
+    tuple:
+        If only `radius` is given, arrays `(indptr, indices)` in
+        compressed sparse row format, where the indices into `layer` of
+        the nodes found for point j are ``indices[indptr[j]:indptr[j+1]]``,
+        sorted by distance.
+
+        If `return_distance` is True, an array of distances in the same
+        layout as the indices is appended, with infinite distance for
+        missing nodes.
+
+    Raises
+    ------
+    ValueError
+        If neither `k` nor `radius` is given, if they are negative, if
+        `layer` is not spatial, or if `points` do not have the number of
+        dimensions of `layer`.
+
+    Example
+    -------
+        ::
+
+            import numpy as np
+            import nest
+
+            layer = nest.Create('iaf_psc_alpha', positions=nest.spatial.grid(shape=[100, 100]))
+            electrodes = np.random.uniform(-0.5, 0.5, (1000, 2))
+
+            # indices of the 5 nodes closest to each electrode
+            nearest = nest.spatial.query(layer, electrodes, k=5)
+            nearest_ids = np.array(layer.tolist())[nearest]
+
+            # all nodes within 0.05 of each electrode
+            indptr, indices = nest.spatial.query(layer, electrodes, radius=0.05)
+    """
+    if not isinstance(layer, NodeCollection):
+        raise TypeError('layer must be a NodeCollection')
+    if k is None and radius is None:
+        raise ValueError('At least one of k or radius must be specified')
+    if k is not None and (not isinstance(k, (int, np.integer)) or isinstance(k, bool)):
+        raise TypeError('k must be an integer')
+    if k is not None and k < 1:
+        raise ValueError('k must be positive')
+    if radius is not None and not radius >= 0:
+        raise ValueError('radius must not be negative')
+
+    if layer.spatial is None:
+        raise ValueError('layer must be a spatial layer')
+
+    # The kernel needs a writable, contiguous buffer of doubles
+    points = np.require(np.atleast_2d(points), dtype=float, requirements=['C', 'W'])
+    dim = len(layer.spatial['extent'])
+    if points.ndim != 2 or points.shape[1] != dim:
+        raise ValueError('points must be an array of shape (M, {})'.format(dim))
+
+    indptr, indices, distances = sli_func('FindNearest', layer, points.ravel(), dim,
+                                          len(layer) if k is None else int(k),
+                                          np.inf if radius is None else float(radius))
+
+    if k is None:
+        return (indptr, indices, distances) if return_distance else (indptr, indices)
+
+    # Arrange nodes found for each point in a row, padding rows with fewer than k nodes
+    counts = np.diff(indptr)
+    rows = np.repeat(np.arange(len(points)), counts)
+    columns = np.arange(len(indices)) - np.repeat(indptr[:-1], counts)
+    nearest = np.full((len(points), k), -1, dtype=np.int64)
+    nearest[rows, columns] = indices
+    if not return_distance:
+        return nearest
+    nearest_distances = np.full((len(points), k), np.inf)
+    nearest_distances[rows, columns] = distances
+    return nearest, nearest_distances
@@ -173,6 +173,26 @@ class TestNodeCollection(unittest.TestCase):
             self.assertEqual(nc, n[compare])
             compare += 1
 
+    def test_iterating_composite(self):
+        """Iteration of composite and sliced NodeCollections"""
+
+        n = nest.Create('iaf_psc_alpha', 5) + nest.Create('iaf_psc_exp', 5)
+        n = n[1::3]
+        self.assertEqual([nc.get('global_id') for nc in n], [2, 5, 8])
+        self.assertEqual([nc.get('model') for nc in n], ['iaf_psc_alpha', 'iaf_psc_alpha', 'iaf_psc_exp'])
+
+    @unittest.skipIf(not HAVE_NUMPY, 'NumPy package is not available')
+    def test_ids(self):
+        """Node IDs of NodeCollections as NumPy array"""
+
+        n = nest.Create('iaf_psc_alpha', 5) + nest.Create('iaf_psc_exp', 5)
+        ids = n[::2].ids
+        self.assertTrue(isinstance(ids, np.ndarray))
+        self.assertTrue(np.issubdtype(ids.dtype, np.integer))
+        np.testing.assert_array_equal(ids, [1, 3, 5, 7, 9])
+        self.assertEqual(n.ids.size, 10)
+        self.assertEqual(nest.NodeCollection([]).ids.size, 0)
+
     def test_NodeCollection_addition(self):
         """Addition of NodeCollections"""
 
@@ -99,10 +99,10 @@ def get_connectivity_matrix(pop1, pop2):
     M = np.zeros((len(pop2), len(pop1)))
     connections = nest.GetConnections(pop1, pop2)
     index_dic = {}
-    for count, node in enumerate(pop1):
-        index_dic[node.get('global_id')] = count
-    for count, node in enumerate(pop2):
-        index_dic[node.get('global_id')] = count
+    for count, node_id in enumerate(pop1.tolist()):
+        index_dic[node_id] = count
+    for count, node_id in enumerate(pop2.tolist()):
+        index_dic[node_id] = count
     for source, target in zip(connections.sources(), connections.targets()):
         M[index_dic[target]][index_dic[source]] += 1
     return M
@@ -121,10 +121,10 @@ def get_weighted_connectivity_matrix(pop1, pop2, label):
     targets = connections.get('target')
     weights = connections.get(label)
     index_dic = {}
-    for count, node in enumerate(pop1):
-        index_dic[node.get('global_id')] = count
-    for count, node in enumerate(pop2):
-        index_dic[node.get('global_id')] = count
+    for count, node_id in enumerate(pop1.tolist()):
+        index_dic[node_id] = count
+    for count, node_id in enumerate(pop2.tolist()):
+        index_dic[node_id] = count
     for counter, weight in enumerate(weights):
         source_id = sources[counter]
         target_id = targets[counter]
@@ -26,6 +26,7 @@ Creation tests
 import unittest
 import warnings
 import nest
+import numpy as np
 
 
 @nest.ll_api.check_stack
@@ -79,6 +80,23 @@ class CreateTestCase(unittest.TestCase):
 
         self.assertEqual(nest.GetStatus(n, 'V_m'), V_m)
 
+    def test_ModelCreateNumPyArrays(self):
+        """Model Creation with NumPy arrays of different types and layouts"""
+
+        nest.ResetKernel()
+
+        spike_times = np.arange(1., 21.)
+        arrays = [spike_times.astype(np.float32),  # needs a cast
+                  spike_times[::2],                # not contiguous
+                  memoryview(spike_times)]         # not an ndarray
+
+        for arr in arrays:
+            sg = nest.Create('spike_generator', params={'spike_times': arr})
+            np.testing.assert_array_equal(sg.get('spike_times'), np.asarray(arr, dtype=float))
+
+        with self.assertRaises(nest.kernel.NESTErrors.PyNESTError):
+            nest.Create('spike_generator', params={'spike_times': np.array([True, False])})
+
     def test_CopyModel(self):
         """CopyModel"""
 
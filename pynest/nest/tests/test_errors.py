@@ -121,6 +121,27 @@ class ErrorTestCase(unittest.TestCase):
 
         self.assertRaisesRegex(
             nest.kernel.NESTError, "UnknownModelName", nest.Create, -1)
+        self.assertRaisesRegex(
+            nest.kernel.NESTError, "UnknownModelName", nest.Create, 'unknown_model')
+        self.assertRaisesRegex(
+            nest.kernel.NESTError, "unknown_model is not a known model name", nest.Create, 'unknown_model')
+
+    def test_NegativeSimulationTime(self):
+        """Negative simulation time"""
+
+        nest.ResetKernel()
+
+        self.assertRaisesRegex(
+            nest.kernel.NESTError, "BadParameter in simulate: The simulation time cannot be negative",
+            nest.Simulate, -1.)
+
+    def test_RunWithoutPrepare(self):
+        """Run without Prepare"""
+
+        nest.ResetKernel()
+
+        self.assertRaisesRegex(
+            nest.kernel.NESTError, "KernelException", nest.Run, 10.)
 
 
 def suite():
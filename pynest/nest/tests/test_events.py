@@ -24,6 +24,7 @@ Test of events
 """
 
 import unittest
+import numpy
 import nest
 
 
@@ -64,6 +65,37 @@ class EventsTestCase(unittest.TestCase):
 
         self.assert_(len(d['times']) > 0)
 
+    def test_EventsGather(self):
+        """Gathered events equal local events on a single process"""
+
+        nest.ResetKernel()
+
+        nest.ll_api.sr('20 setverbosity')
+
+        n = nest.Create('iaf_psc_alpha', params={'I_e': 1000.})
+        sd = nest.Create('spike_detector')
+        vm = nest.Create('voltmeter', params={'interval': 1.})
+
+        nest.Connect(n, sd)
+        nest.Connect(vm, n)
+        nest.Simulate(100)
+
+        events = sd.get('events')
+        gathered = sd.get('events', gather=True)
+        self.assertEqual(sorted(gathered.keys()), sorted(events.keys()))
+        for key in events:
+            numpy.testing.assert_array_equal(gathered[key], events[key])
+
+        recorders = sd + vm
+        gathered = recorders.get('events', gather=True)
+        self.assertEqual(len(gathered), 2)
+        numpy.testing.assert_array_equal(gathered[1]['V_m'], vm.get('events', 'V_m'))
+
+        with self.assertRaises(TypeError):
+            sd.get('n_events', gather=True)
+        with self.assertRaises(TypeError):
+            sd.get('events', gather=True, output='json')
+
 
 def suite():
 
@@ -310,6 +310,41 @@ class TestNodeCollectionGetSet(unittest.TestCase):
                                            output='pandas'),
                               ref_df)
 
+    @unittest.skipIf(not HAVE_NUMPY, 'NumPy package is not available')
+    def test_get_numpy(self):
+        """
+        Test that get function with NumPy output works as expected.
+        """
+        nodes = nest.Create('iaf_psc_alpha', 10)
+        nodes.set(V_m=np.linspace(-80., -60., 10))
+
+        V_m = nodes.get('V_m', output='numpy')
+        self.assertTrue(isinstance(V_m, np.ndarray))
+        np.testing.assert_array_equal(V_m, np.linspace(-80., -60., 10))
+
+        values = nodes.get(['global_id', 'V_m', 'frozen'], output='numpy')
+        self.assertEqual(list(values.keys()), ['global_id', 'V_m', 'frozen'])
+        self.assertTrue(np.issubdtype(values['global_id'].dtype, np.integer))
+        np.testing.assert_array_equal(values['global_id'], nodes.tolist())
+        np.testing.assert_array_equal(values['frozen'], [False] * 10)
+
+        np.testing.assert_array_equal(nodes[3].get('V_m', output='numpy'), [V_m[3]])
+
+        structured = nodes[::2].get(['global_id', 'V_m', 'model'], output='structured')
+        self.assertEqual(structured.dtype.names, ('global_id', 'V_m', 'model'))
+        self.assertEqual(len(structured), 5)
+        np.testing.assert_array_equal(structured['global_id'], [1, 3, 5, 7, 9])
+        np.testing.assert_array_equal(structured['V_m'], V_m[::2])
+        self.assertEqual(list(structured['model']), ['iaf_psc_alpha'] * 5)
+
+        multisynapse = nest.Create('iaf_psc_exp_multisynapse', 3, {'tau_syn': [0.2, 0.5]})
+        np.testing.assert_array_equal(multisynapse.get('tau_syn', output='numpy'), [[0.2, 0.5]] * 3)
+
+        with self.assertRaises(nest.kernel.NESTError):
+            (nodes + multisynapse).get('tau_syn_ex', output='numpy')
+        with self.assertRaises(TypeError):
+            nodes.get(output='numpy')
+
     def test_get_JSON(self):
         """
         Test that get function with json output works as expected.
@@ -469,6 +504,57 @@ class TestNodeCollectionGetSet(unittest.TestCase):
         self.assertEqual(C_m, (250.0, 250.0, 111.0, 250.0, 111.0,
                                250.0, 111.0, 250.0, 111.0, 250.0))
 
+    @unittest.skipIf(not HAVE_NUMPY, 'NumPy package is not available')
+    def test_set_numpy_arrays(self):
+        """
+        Test that set with NumPy arrays works on threaded and composite NodeCollections
+        """
+        nest.SetKernelStatus({'local_num_threads': 2})
+        nodes = nest.Create('iaf_psc_alpha', 5) + nest.Create('iaf_psc_exp', 5)
+
+        V_m = np.linspace(-80., -60., 10)
+        nodes.set(V_m=V_m, C_m=np.arange(100, 110), tau_m=12.)
+        self.assertEqual(nodes.get('V_m'), tuple(V_m))
+        self.assertEqual(nodes.get('C_m'), tuple(np.arange(100., 110.)))
+        self.assertEqual(nodes.get('tau_m'), (12.,) * 10)
+
+        nest.SetStatus(nodes[::3], {'E_L': np.array([-75., -74., -73., -72.])})
+        self.assertEqual(nodes.get('E_L'), (-75., -70., -70., -74., -70., -70., -73., -70., -70., -72.))
+
+        with self.assertRaises(IndexError):
+            nodes.set(V_m=V_m[:5])
+        with self.assertRaises(nest.kernel.NESTError):
+            nodes.set(V_m=V_m, nonexistent_attribute=1.)
+
+        # No node is changed if the nodes of one model do not have a key
+        nodes = nodes + nest.Create('parrot_neuron', 2) + nest.Create('spike_detector')
+        with self.assertRaises(nest.kernel.NESTError):
+            nodes.set(V_m=np.full(13, -50.))
+        self.assertEqual(nodes[:10].get('V_m'), tuple(V_m))
+
+        nodes[10:].set(frozen=[True, False, True])
+        self.assertEqual(nodes[10:].get('frozen'), (True, False, True))
+
+    @unittest.skipIf(not HAVE_NUMPY, 'NumPy package is not available')
+    def test_get_recordables(self):
+        """
+        Test that recordables read with get match the status dictionary of all models
+        """
+        for model in nest.Models('nodes'):
+            nest.ResetKernel()
+            try:
+                nodes = nest.Create(model, 2)
+                nest.Simulate(2.)
+                status = nodes.get()
+            except nest.kernel.NESTError:
+                # Model that needs further setup
+                continue
+            if 'recordables' not in status:
+                continue
+            for key in status['recordables'][0]:
+                if key in status:
+                    np.testing.assert_array_equal(nodes.get(key), status[key], err_msg=model + ': ' + key)
+
     def test_get_attribute(self):
         """Test get using getattr"""
         nodes = nest.Create('iaf_psc_alpha', 10)
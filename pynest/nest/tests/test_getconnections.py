@@ -24,6 +24,7 @@ GetConnections
 """
 
 import unittest
+import numpy
 import nest
 
 
@@ -96,6 +97,29 @@ class GetConnectionsTestCase(unittest.TestCase):
                 len(conns), 1,
                 'Failed to get connection with source model {}'.format(model))
 
+    def test_GetConnectionsGather(self):
+        """GetConnections gathered from all processes"""
+
+        nest.ResetKernel()
+
+        a = nest.Create("iaf_psc_alpha", 3)
+        b = nest.Create("iaf_psc_alpha", 2)
+        nest.Connect(a, b, syn_spec={'weight': 2.5, 'delay': 1.5})
+
+        conns = nest.GetConnections(a, b)
+        gathered = nest.GetConnections(a, b, gather=True)
+        self.assertEqual(sorted(gathered.keys()), ['delay', 'source', 'synapse_id', 'target', 'weight'])
+        numpy.testing.assert_array_equal(gathered['source'], conns.sources())
+        numpy.testing.assert_array_equal(gathered['target'], conns.targets())
+        numpy.testing.assert_array_equal(gathered['synapse_id'], conns.get('synapse_id', output='numpy'))
+        numpy.testing.assert_array_equal(gathered['weight'], numpy.full(6, 2.5))
+        numpy.testing.assert_array_equal(gathered['delay'], numpy.full(6, 1.5))
+
+        empty = nest.GetConnections(b, a, gather=True)
+        self.assertEqual(sorted(empty.keys()), sorted(gathered.keys()))
+        for values in empty.values():
+            self.assertEqual(len(values), 0)
+
 
 def suite():
 
@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+#
+# test_io.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests for reading recorder files and exporting data with nest.io
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import nest
+
+try:
+    import pandas
+    HAVE_PANDAS = True
+except ImportError:
+    HAVE_PANDAS = False
+
+try:
+    import h5py
+    HAVE_H5PY = True
+except ImportError:
+    HAVE_H5PY = False
+
+
+@nest.ll_api.check_stack
+class ReadEventsTestCase(unittest.TestCase):
+    """Tests for nest.io"""
+
+    def setUp(self):
+        nest.ResetKernel()
+        nest.set_verbosity('M_ERROR')
+        self.data_path = tempfile.mkdtemp()
+        nest.SetKernelStatus({'data_path': self.data_path, 'overwrite_files': True, 'local_num_threads': 2})
+
+    def simulate_spikes(self, record_to, params=None):
+        """Record spikes to memory and to the given backend, and return both recorders."""
+
+        params = dict(params or {}, record_to=record_to)
+        nrns = nest.Create('iaf_psc_alpha', 6, {'I_e': 450.})
+        nrns.set(V_m=np.linspace(-70., -60., 6))
+        sd_mem = nest.Create('spike_detector')
+        sd_file = nest.Create('spike_detector', params)
+        nest.Connect(nrns, sd_mem)
+        nest.Connect(nrns, sd_file)
+        nest.Simulate(200.)
+
+        return sd_mem, sd_file
+
+    def assertEventsEqual(self, events, expected):
+        """Compare events to the unsorted events of the memory backend."""
+
+        order = np.lexsort((expected['senders'], expected['times']))
+        sorted_order = np.lexsort((events['senders'], events['times']))
+        self.assertTrue(np.all(np.diff(events['times']) >= 0))
+        np.testing.assert_array_equal(events['senders'][sorted_order], expected['senders'][order])
+        np.testing.assert_allclose(events['times'][sorted_order], expected['times'][order], atol=1e-3)
+
+    def test_read_ascii(self):
+        """Read spikes from ASCII files of all threads"""
+
+        sd_mem, sd_file = self.simulate_spikes('ascii')
+        events = nest.io.read_events(sd_file)
+
+        self.assertEqual(sorted(events), ['senders', 'times'])
+        self.assertEventsEqual(events, sd_mem.get('events'))
+
+    def test_read_ascii_time_in_steps(self):
+        """Read spikes from ASCII files with times in steps"""
+
+        sd_mem, sd_file = self.simulate_spikes('ascii', {'time_in_steps': True, 'precision': 6})
+        events = nest.io.read_events(sd_file)
+
+        self.assertEventsEqual(events, sd_mem.get('events'))
+
+    def test_read_binary(self):
+        """Read spikes from binary files of all threads"""
+
+        sd_mem, sd_file = self.simulate_spikes('binary', {'chunk_size': 5})
+        events = nest.io.read_events(sd_file)
+
+        self.assertEventsEqual(events, sd_mem.get('events'))
+
+    def test_read_binary_compressed(self):
+        """Read spikes from compressed binary files"""
+
+        sd_mem, sd_file = self.simulate_spikes('binary', {'chunk_size': 5, 'compression': 'zlib'})
+        events = nest.io.read_events(sd_file)
+
+        self.assertEventsEqual(events, sd_mem.get('events'))
+
+    def test_read_multimeter(self):
+        """Read recorded values"""
+
+        nrns = nest.Create('iaf_psc_alpha', 4, {'I_e': 450.})
+        mm_mem = nest.Create('multimeter', {'record_from': ['V_m']})
+        mm_file = nest.Create('multimeter', {'record_from': ['V_m'], 'record_to': 'binary'})
+        nest.Connect(mm_mem, nrns)
+        nest.Connect(mm_file, nrns)
+        nest.Simulate(20.)
+
+        events = nest.io.read_events(mm_file)
+        expected = mm_mem.get('events')
+        order = np.lexsort((expected['senders'], expected['times']))
+        sorted_order = np.lexsort((events['senders'], events['times']))
+
+        np.testing.assert_array_equal(events['V_m'][sorted_order], expected['V_m'][order])
+
+    def test_select(self):
+        """Select events by time window and senders"""
+
+        sd_mem, sd_file = self.simulate_spikes('binary')
+        events = nest.io.read_events(sd_file, start=50., stop=150., senders=[1, 3])
+
+        expected = sd_mem.get('events')
+        mask = ((expected['times'] >= 50.) & (expected['times'] <= 150.) &
+                np.isin(expected['senders'], [1, 3]))
+        self.assertGreater(np.sum(mask), 0)
+        self.assertEventsEqual(events, {key: values[mask] for key, values in expected.items()})
+
+    def test_find_files(self):
+        """Find the files of all threads by label"""
+
+        sd_mem, sd_file = self.simulate_spikes('ascii', {'label': 'spikes'})
+
+        fnames = nest.io.find_files('spikes')
+        self.assertEqual(fnames, sorted(sd_file.get('filenames')))
+        self.assertEqual(nest.io.find_files('spikes', node_id=sd_file.global_id), fnames)
+        self.assertEqual(nest.io.find_files('spikes', node_id=sd_mem.global_id), [])
+
+        self.assertEventsEqual(nest.io.read_events(fnames), sd_mem.get('events'))
+
+    @unittest.skipIf(not HAVE_PANDAS, 'Pandas package is not available')
+    def test_read_pandas(self):
+        """Read events into a DataFrame"""
+
+        sd_mem, sd_file = self.simulate_spikes('binary')
+        events = nest.io.read_events(sd_file, output='pandas')
+
+        self.assertIsInstance(events, pandas.DataFrame)
+        self.assertEqual(len(events), sd_mem.get('n_events'))
+
+    def test_merge_order(self):
+        """Merging sorted runs gives the order of a stable sort"""
+
+        runs = [np.sort(np.random.randint(0, 20, size=n)) for n in [0, 5, 17, 1, 30]]
+        order = nest.io._merge_order(runs)
+
+        np.testing.assert_array_equal(order, np.argsort(np.concatenate(runs), kind='stable'))
+
+
+@nest.ll_api.check_stack
+@unittest.skipIf(not HAVE_H5PY, 'h5py is not available')
+class ExportTestCase(unittest.TestCase):
+    """Tests for nest.export"""
+
+    def setUp(self):
+        nest.ResetKernel()
+        nest.set_verbosity('M_ERROR')
+        self.fname = os.path.join(tempfile.mkdtemp(), 'export.h5')
+
+    def simulate(self):
+        """Simulate a spatial network with recorders and return the nodes."""
+
+        layer = nest.Create('iaf_psc_alpha', positions=nest.spatial.free(nest.random.uniform(), num_dimensions=3),
+                            n=10, params={'I_e': 450.})
+        layer.V_m = np.linspace(-70., -60., 10)
+        sd = nest.Create('spike_detector')
+        mm = nest.Create('multimeter', {'record_from': ['V_m'], 'time_in_steps': True})
+        nest.Connect(layer, sd)
+        nest.Connect(mm, layer[:3])
+        nest.Connect(layer, layer, {'rule': 'fixed_indegree', 'indegree': 3}, {'weight': nest.random.uniform()})
+        nest.Simulate(100.)
+
+        return layer, sd, mm
+
+    def test_export(self):
+        """Export events, positions and connections"""
+
+        layer, sd, mm = self.simulate()
+        conns = nest.GetConnections(layer, layer)
+        nest.export(self.fname, sd + mm, [layer, mm], conns)
+
+        with h5py.File(self.fname, 'r') as f:
+            self.assertEqual(f.attrs['resolution'], nest.GetKernelStatus('resolution'))
+            self.assertEqual(f.attrs['time'], 100.)
+            self.assertEqual(f.attrs['num_processes'], 1)
+
+            for recorder in [sd, mm]:
+                group = f['recorders/{}'.format(recorder.get('global_id'))]
+                self.assertEqual(group.attrs['model'], recorder.get('model'))
+                events = recorder.get('events')
+                self.assertEqual(sorted(group), sorted(events))
+                for key, values in events.items():
+                    np.testing.assert_array_equal(group[key][()], values)
+                    self.assertEqual(group[key].compression, 'gzip')
+
+            np.testing.assert_array_equal(f['nodes/0/node_ids'][()], layer.tolist())
+            np.testing.assert_array_equal(f['nodes/0/positions'][()], nest.GetPosition(layer))
+            self.assertEqual(f['nodes/0/models'].asstr()[()].tolist(), ['iaf_psc_alpha'] * 10)
+            self.assertEqual(f['nodes/1/node_ids'][()].tolist(), mm.tolist())
+            self.assertNotIn('positions', f['nodes/1'])
+
+            for key in ['source', 'target', 'weight', 'delay']:
+                np.testing.assert_array_equal(f['connections'][key][()], conns.get(key))
+            self.assertEqual(f['connections/synapse_model'].asstr()[()].tolist(), ['static_synapse'] * 30)
+
+    def test_export_empty(self):
+        """Export without events and connections"""
+
+        sd = nest.Create('spike_detector')
+        nest.export(self.fname, sd, connections=nest.GetConnections(), compression=None)
+
+        with h5py.File(self.fname, 'r') as f:
+            self.assertEqual(f['recorders/1/times'].shape, (0,))
+            self.assertEqual(f['connections/source'].shape, (0,))
+            self.assertIsNone(f['connections/source'].compression)
+            self.assertNotIn('nodes', f)
+
+    def test_merge_shards(self):
+        """Merging the files of several processes concatenates the datasets"""
+
+        layer, sd, mm = self.simulate()
+        shards = [self.fname + str(rank) for rank in range(3)]
+        for shard in shards:
+            nest.io._write_shard(shard, sd, [layer], nest.GetConnections(), {'compression': 'gzip'})
+        nest.io._merge_shards(self.fname, shards)
+
+        with h5py.File(self.fname, 'r') as f:
+            self.assertEqual(f.attrs['time'], 100.)
+            self.assertEqual(f['recorders/11'].attrs['model'], 'spike_detector')
+            np.testing.assert_array_equal(f['recorders/11/times'][()], np.tile(sd.get('events')['times'], 3))
+            self.assertEqual(f['nodes/0/positions'].shape, (30, 3))
+            self.assertEqual(f['connections/synapse_model'].shape, (3 * nest.GetKernelStatus('num_connections'),))
+
+    def test_merge_empty_shard(self):
+        """Merging works if the first process has no local nodes"""
+
+        layer, sd, mm = self.simulate()
+        shards = [self.fname + str(rank) for rank in range(3)]
+        with mock.patch.object(nest, 'GetLocalNodeCollection', return_value=nest.NodeCollection([])):
+            nest.io._write_shard(shards[0], sd, [layer], nest.GetConnections(), {})
+        for shard in shards[1:]:
+            nest.io._write_shard(shard, sd, [layer], nest.GetConnections(), {})
+        nest.io._merge_shards(self.fname, shards)
+
+        with h5py.File(self.fname, 'r') as f:
+            np.testing.assert_array_equal(f['nodes/0/node_ids'][()], 2 * layer.tolist())
+            self.assertEqual(f['nodes/0/models'].asstr()[()].tolist(), ['iaf_psc_alpha'] * 20)
+            self.assertEqual(f['nodes/0/positions'].shape, (20, 3))
+
+    def test_export_recorder_not_in_memory(self):
+        """Only recorders that record to memory can be exported"""
+
+        sd = nest.Create('spike_detector', {'record_to': 'ascii'})
+        with self.assertRaises(ValueError):
+            nest.export(self.fname, sd)
+
+
+def suite():
+    suite1 = unittest.makeSuite(ReadEventsTestCase, 'test')
+    suite2 = unittest.makeSuite(ExportTestCase, 'test')
+    suite = unittest.TestSuite([suite1, suite2])
+    return suite
+
+
+def run():
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
+
+
+if __name__ == "__main__":
+    run()
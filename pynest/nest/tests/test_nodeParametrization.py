@@ -700,6 +700,90 @@ class TestNodeParametrization(unittest.TestCase):
         distance_reference = tuple(np.sqrt(position_array[:, 0]**2 + position_array[:, 1]**2))
         self.assertEqual(distance_reference, nest.spatial.distance.apply(layer[0], positions))
 
+    def test_parameter_apply_compound(self):
+        """Parameter apply function with compound parameter in periodic layer"""
+        positions = [[x, 0.9 - x] for x in np.linspace(0, 0.9, 10)]
+        position_array = np.array(positions)
+        layer = nest.Create('iaf_psc_alpha', positions=nest.spatial.free(positions, extent=[1., 1.], edge_wrap=True))
+        param = nest.logic.conditional(nest.spatial.distance < 0.4,
+                                       0.8 * nest.math.exp(-nest.spatial.distance / 0.3),
+                                       nest.spatial.distance.x + nest.spatial.target_pos.y)
+
+        displacement = position_array - position_array[0]
+        displacement -= np.round(displacement)
+        distance = np.sqrt(np.sum(displacement**2, axis=1))
+        reference = np.where(distance < 0.4, 0.8 * np.exp(-distance / 0.3),
+                             np.abs(displacement[:, 0]) + position_array[:, 1])
+        np.testing.assert_allclose(param.apply(layer[0], positions), reference)
+
+    def test_parameter_evaluate(self):
+        """Parameter evaluate function with array of positions"""
+        layer = nest.Create('iaf_psc_alpha', positions=nest.spatial.free([[0.1, -0.2]], extent=[1., 1.]))
+        param = 0.5 * nest.math.exp(-nest.spatial.distance / 0.3) + nest.spatial.target_pos.x
+        x, y = np.meshgrid(np.linspace(-0.5, 0.5, 30), np.linspace(-0.5, 0.5, 20))
+        positions = np.column_stack((x.ravel(), y.ravel()))
+
+        values = param.evaluate(positions, layer)
+        self.assertIsInstance(values, np.ndarray)
+        self.assertEqual(values.shape, (len(positions),))
+        np.testing.assert_array_equal(values, param.apply(layer, positions.tolist()))
+
+        # Positions need not be contiguous doubles
+        np.testing.assert_array_equal(param.evaluate(positions[::2].astype(np.float32), layer),
+                                      param.apply(layer, positions[::2].astype(np.float32).tolist()))
+        self.assertEqual(len(param.evaluate(np.empty((0, 2)), layer)), 0)
+
+    def test_parameter_evaluate_wrong_args(self):
+        """Parameter evaluate function with wrong arguments"""
+        layer = nest.Create('iaf_psc_alpha', positions=nest.spatial.free([[0., 0.], [0.1, 0.1]]))
+        with self.assertRaises(ValueError):
+            nest.spatial.distance.evaluate(np.zeros((5, 2)), layer)
+        with self.assertRaises(ValueError):
+            nest.spatial.distance.evaluate(np.zeros(10), layer[0])
+        with self.assertRaises(TypeError):
+            nest.spatial.distance.evaluate(np.zeros((5, 2)), [1])
+        with self.assertRaises(ValueError):
+            nest.spatial.distance.evaluate(np.zeros((5, 0)), layer[0])
+        with self.assertRaises(nest.kernel.NESTError):
+            nest.spatial.distance.evaluate(np.zeros((5, 3)), layer[0])
+        with self.assertRaises(nest.kernel.NESTError):
+            nest.spatial.distance.evaluate(np.zeros((4, 3)), layer[0])
+        with self.assertRaises(nest.kernel.NESTError):
+            nest.spatial.distance.evaluate(np.zeros((5, 2)), nest.Create('iaf_psc_alpha'))
+        with self.assertRaises(nest.kernel.NESTError):
+            nest.ll_api.sli_func('Evaluate', nest.spatial.distance._datum, layer[0], np.zeros(12), 3)
+
+    def test_parameter_sample(self):
+        """Parameter sample function"""
+        values = nest.random.uniform(min=-1., max=2.).sample(1000)
+        self.assertIsInstance(values, np.ndarray)
+        self.assertEqual(values.shape, (1000,))
+        self.assertTrue(np.all(values >= -1.) and np.all(values < 2.))
+        self.assertGreater(len(np.unique(values)), 1)
+
+        np.testing.assert_array_equal(nest.CreateParameter('constant', {'value': 3.}).sample(5), [3.] * 5)
+        self.assertEqual(len(nest.random.normal().sample(np.int64(0))), 0)
+        with self.assertRaises(ValueError):
+            nest.random.normal().sample(-1)
+        with self.assertRaises(TypeError):
+            nest.random.normal().sample(2.5)
+
+    def test_deterministic_kernel_connections(self):
+        """Connections with deterministic kernel evaluated in blocks"""
+        positions = [[x, y] for x in np.linspace(-0.4, 0.4, 9) for y in np.linspace(-0.4, 0.4, 9)]
+        position_array = np.array(positions)
+        layer = nest.Create('iaf_psc_alpha', positions=nest.spatial.free(positions, extent=[1., 1.], edge_wrap=True))
+        kernel = nest.logic.conditional(nest.spatial.distance < 0.25, 1.0, 0.0)
+        nest.Connect(layer, layer, {'rule': 'pairwise_bernoulli', 'p': kernel, 'allow_autapses': False})
+
+        displacement = position_array[np.newaxis, :, :] - position_array[:, np.newaxis, :]
+        displacement -= np.round(displacement)
+        distance = np.sqrt(np.sum(displacement**2, axis=2))
+        expected = sorted((s + 1, t + 1) for s, t in zip(*np.nonzero(distance < 0.25)) if s != t)
+
+        conns = nest.GetConnections().get(['source', 'target'])
+        self.assertEqual(sorted(zip(conns['source'], conns['target'])), expected)
+
 
 def suite():
     suite = unittest.makeSuite(TestNodeParametrization, 'test')
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+#
+# test_recording_backend_aggregate.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+import numpy as np
+
+import nest
+
+
+class TestRecordingBackendAggregate(unittest.TestCase):
+
+    def setUp(self):
+        nest.ResetKernel()
+
+    def simulate_spikes(self, params):
+        """Record spikes to memory and to the aggregate backend, and return both events."""
+
+        nrns = nest.Create("iaf_psc_alpha", 10, {"I_e": 500.})
+        nrns.V_m = np.linspace(-70., -60., 10)
+        sd_mem = nest.Create("spike_detector")
+        sd_agg = nest.Create("spike_detector", dict(params, record_to="aggregate"))
+        nest.Connect(nrns[:8], sd_mem)
+        nest.Connect(nrns[:8], sd_agg)
+        nest.Simulate(200.)
+
+        return sd_mem.get("events"), sd_agg.get("events")
+
+    def testCounts(self):
+        """Test that the spikes of each sender are counted."""
+
+        nest.SetKernelStatus({"local_num_threads": 2})
+        expected, events = self.simulate_spikes({})
+
+        senders, counts = np.unique(expected["senders"], return_counts=True)
+        np.testing.assert_array_equal(events["senders"], senders)
+        np.testing.assert_array_equal(events["counts"], counts)
+        self.assertEqual(events["histogram"].size, 0)
+
+    def testHistogram(self):
+        """Test that the spikes of all senders are counted in time bins."""
+
+        nest.SetKernelStatus({"local_num_threads": 2})
+        expected, events = self.simulate_spikes({"bin_width": 10.})
+
+        bins = np.ceil(expected["times"] / 10.).astype(int) - 1
+        np.testing.assert_array_equal(events["histogram"], np.bincount(bins))
+
+    def testMeansAndVariances(self):
+        """Test the statistics of multimeter values per sender and per time bin."""
+
+        nest.SetKernelStatus({"local_num_threads": 2})
+        nrns = nest.Create("iaf_psc_alpha", 4, {"I_e": 400.})
+        nrns.V_m = np.linspace(-70., -60., 4)
+        mm_params = {"record_from": ["V_m", "I_syn_ex"], "interval": 0.5}
+        mm_mem = nest.Create("multimeter", mm_params)
+        mm_agg = nest.Create("multimeter", dict(mm_params, record_to="aggregate", bin_width=5.))
+        nest.Connect(mm_mem, nrns)
+        nest.Connect(mm_agg, nrns)
+        nest.Simulate(50.)
+
+        expected, events = mm_mem.get("events"), mm_agg.get("events")
+
+        for i, sender in enumerate(events["senders"]):
+            values = expected["V_m"][expected["senders"] == sender]
+            self.assertEqual(events["counts"][i], values.size)
+            self.assertAlmostEqual(events["means"]["V_m"][i], np.mean(values))
+            self.assertAlmostEqual(events["variances"]["V_m"][i], np.var(values))
+        self.assertEqual(sorted(events["means"]), ["I_syn_ex", "V_m"])
+
+        bins = np.ceil(expected["times"] / 5.).astype(int) - 1
+        bin_means = np.bincount(bins, weights=expected["V_m"]) / np.bincount(bins)
+        np.testing.assert_allclose(events["bin_means"]["V_m"], bin_means)
+
+    def testResetEvents(self):
+        """Test that setting n_events to 0 resets the statistics."""
+
+        nrns = nest.Create("iaf_psc_alpha", 2, {"I_e": 500.})
+        sd = nest.Create("spike_detector", {"record_to": "aggregate", "bin_width": 1.})
+        nest.Connect(nrns, sd)
+        nest.Simulate(100.)
+
+        self.assertEqual(sd.get("events")["counts"].sum(), sd.get("n_events"))
+        sd.n_events = 0
+        self.assertEqual(sd.get("events")["senders"].size, 0)
+        self.assertEqual(sd.get("events")["histogram"].size, 0)
+
+    def testInvalidBinWidth(self):
+        """Test that the bin width must be a non-negative multiple of the resolution."""
+
+        sd = nest.Create("spike_detector", {"record_to": "aggregate", "bin_width": 0.2})
+        self.assertAlmostEqual(sd.get("bin_width"), 0.2)
+        nest.Simulate(1.)
+        with self.assertRaises(nest.kernel.NESTErrors.BadProperty):
+            sd.bin_width = 1.
+
+        with self.assertRaises(nest.kernel.NESTErrors.BadProperty):
+            nest.Create("spike_detector", {"record_to": "aggregate", "bin_width": -1.})
+        with self.assertRaises(nest.kernel.NESTErrors.BadProperty):
+            nest.Create("spike_detector", {"record_to": "aggregate", "bin_width": 0.15})
+
+
+def suite():
+    suite = unittest.TestLoader()
+    suite = suite.loadTestsFromTestCase(TestRecordingBackendAggregate)
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
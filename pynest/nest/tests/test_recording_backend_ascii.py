@@ -20,6 +20,7 @@
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
 import os
+import tempfile
 import unittest
 import nest
 
@@ -215,6 +216,85 @@ class TestRecordingBackendASCII(unittest.TestCase):
             h3_expected = "sender\ttime_step\ttime_offset\tV_m\n"
             self.assertEqual(lines[2], h3_expected)
 
+    def simulate_multimeter(self, backend_params):
+        """Record with the given backend properties and return the file contents after each Run."""
+
+        nest.ResetKernel()
+        nest.SetKernelStatus({"overwrite_files": True, "local_num_threads": 2})
+        nest.SetKernelStatus({"recording_backends": {"ascii": backend_params}})
+
+        mm = nest.Create("multimeter", params={"record_to": "ascii", "interval": 0.1, "record_from": ["V_m"]})
+        nest.Connect(mm, nest.Create("iaf_psc_alpha", 4, {"I_e": 500.}))
+
+        contents = []
+        with nest.RunManager():
+            for _ in range(3):
+                nest.Run(20)
+                run_contents = []
+                for fname in mm.get("filenames"):
+                    with open(fname) as f:
+                        run_contents.append(f.read())
+                contents.append(run_contents)
+
+        return contents
+
+    def testAsyncWrite(self):
+        """Test that the writer thread writes the same files and reports statistics."""
+
+        self.addCleanup(nest.SetKernelStatus, {"recording_backends": {"ascii": {
+            "async_write": False, "block_size": 1 << 20, "max_pending_blocks": 64}}})
+
+        expected = self.simulate_multimeter({"async_write": False})
+        status = nest.GetKernelStatus("recording_backends")["ascii"]
+        self.assertFalse(status["async_write"])
+        self.assertEqual(status["blocks_written"], 0)
+
+        # Submit every line as a block to a queue of a single block, so that submitting has to wait for the writer
+        contents = self.simulate_multimeter({"async_write": True, "block_size": 1, "max_pending_blocks": 1})
+        self.assertEqual(contents, expected)
+
+        status = nest.GetKernelStatus("recording_backends")["ascii"]
+        header_size = sum(len("".join(f.splitlines(True)[:3])) for f in contents[-1])
+        self.assertTrue(status["async_write"])
+        self.assertEqual(status["bytes_written"], sum(len(f) for f in contents[-1]) - header_size)
+        self.assertEqual(status["blocks_written"], sum(len(f.splitlines()) - 3 for f in contents[-1]))
+        self.assertEqual(status["peak_pending_blocks"], 1)
+        self.assertGreater(status["stalls"], 0)
+        self.assertGreater(status["stall_time"], 0.)
+
+    @unittest.skipIf(not os.path.exists("/dev/full"), "requires /dev/full")
+    def testAsyncWriteError(self):
+        """Test that errors of the writer thread are raised."""
+
+        self.addCleanup(nest.SetKernelStatus, {"recording_backends": {"ascii": {"async_write": False}}})
+
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+
+        nest.ResetKernel()
+        nest.SetKernelStatus({"overwrite_files": True, "data_path": tmpdir.name,
+                              "recording_backends": {"ascii": {"async_write": True}}})
+
+        mm = nest.Create("multimeter", params={"record_to": "ascii", "interval": 0.1, "record_from": ["V_m"]})
+        nest.Connect(mm, nest.Create("iaf_psc_alpha", 10))
+
+        # Writing to /dev/full fails once the file buffer is flushed
+        os.symlink("/dev/full", mm.get("filenames")[0])
+
+        with self.assertRaisesRegex(nest.kernel.NESTErrors.FileWriteError, "I/O error while writing"):
+            nest.Simulate(100)
+
+    def testAsyncWriteInvalidProperties(self):
+        """Test that block_size and max_pending_blocks must be positive."""
+
+        nest.ResetKernel()
+
+        with self.assertRaises(nest.kernel.NESTErrors.BadProperty):
+            nest.SetKernelStatus({"recording_backends": {"ascii": {"block_size": 0}}})
+        with self.assertRaises(nest.kernel.NESTErrors.BadProperty):
+            nest.SetKernelStatus({"recording_backends": {"ascii": {"max_pending_blocks": 0}}})
+        self.assertEqual(nest.GetKernelStatus("recording_backends")["ascii"]["block_size"], 1 << 20)
+
 
 def suite():
     suite = unittest.TestLoader()
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+#
+# test_recording_backend_binary.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import struct
+import tempfile
+import unittest
+import zlib
+
+import numpy as np
+
+import nest
+
+
+def read_binary_file(fname):
+    """Read a file written by the binary recording backend.
+
+    Returns the header fields and a dictionary with the concatenated
+    columns of all chunks.
+    """
+
+    with open(fname, 'rb') as f:
+        data = f.read()
+
+    def read_string(pos):
+        length, = struct.unpack_from('=I', data, pos)
+        return data[pos + 4:pos + 4 + length].decode(), pos + 4 + length
+
+    magic, version, bom, resolution = struct.unpack_from('=8sIId', data, 0)
+    nest_version, pos = read_string(24)
+    num_double, num_long = struct.unpack_from('=II', data, pos)
+    pos += 8
+    names = []
+    for _ in range(num_double + num_long):
+        name, pos = read_string(pos)
+        names.append(name)
+    compression, = struct.unpack_from('=I', data, pos)
+    pos += 4
+    pos += (8 - pos % 8) % 8
+
+    header = {'magic': magic, 'version': version, 'byte_order_mark': bom, 'resolution': resolution,
+              'nest_version': nest_version, 'double_names': names[:num_double], 'long_names': names[num_double:],
+              'compression': compression}
+
+    columns = ['senders', 'steps', 'offsets'] + names
+    types = [np.int64, np.int64, np.float64] + [np.float64] * num_double + [np.int64] * num_long
+    events = {name: [] for name in columns}
+    while pos < len(data):
+        n, = struct.unpack_from('=Q', data, pos)
+        pos += 8
+        chunk, offset = data, pos
+        if compression:
+            size, = struct.unpack_from('=Q', data, pos)
+            chunk, offset = zlib.decompress(data[pos + 8:pos + 8 + size]), 0
+            pos += 8 + size + (8 - size % 8) % 8
+        for i, (name, dtype) in enumerate(zip(columns, types)):
+            column = np.frombuffer(chunk, dtype=dtype, count=n, offset=offset + 8 * n * i)
+            events[name].append(np.cumsum(column) if compression and i < 2 else column)
+        if not compression:
+            pos += 8 * n * len(columns)
+
+    events = {name: np.concatenate(values) if values else np.array([]) for name, values in events.items()}
+    return header, events
+
+
+class TestRecordingBackendBinary(unittest.TestCase):
+
+    def setUp(self):
+        nest.ResetKernel()
+        self.data_path = tempfile.mkdtemp()
+        nest.SetKernelStatus({"data_path": self.data_path, "overwrite_files": True})
+
+    def testOverwriteFiles(self):
+        """Test that existing files are only overwritten if enabled."""
+
+        nest.SetKernelStatus({"overwrite_files": False})
+        mm_params = {"record_to": "binary", "record_from": ["V_m"]}
+        mm = nest.Create("multimeter", params=mm_params)
+        nest.Connect(mm, nest.Create("iaf_psc_alpha"))
+        nest.Simulate(10)
+
+        nest.ResetKernel()
+        nest.SetKernelStatus({"data_path": self.data_path, "overwrite_files": False})
+        mm = nest.Create("multimeter", params=mm_params)
+        nest.Connect(mm, nest.Create("iaf_psc_alpha"))
+
+        with self.assertRaises(nest.kernel.NESTErrors.IOError):
+            nest.Simulate(10)
+
+        nest.Cleanup()
+
+        nest.SetKernelStatus({"overwrite_files": True})
+        nest.Simulate(10)
+
+    def testFilename(self):
+        """Test that label and file extension end up in the file name."""
+
+        mm = nest.Create("multimeter", {"record_to": "binary", "label": "label", "file_extension": "bin"})
+        fname = mm.get("filenames")[0]
+
+        self.assertTrue(fname.startswith(self.data_path))
+        self.assertTrue("label" in fname)
+        self.assertTrue(fname.endswith(".bin"))
+        self.assertEqual(mm.get("chunk_size"), 65536)
+
+    def testHeader(self):
+        """Test that the header describes the data."""
+
+        mm = nest.Create("multimeter", {"record_to": "binary", "record_from": ["V_m", "I_syn_ex"]})
+        nest.Connect(mm, nest.Create("iaf_psc_exp"))
+        nest.Simulate(10)
+
+        header, events = read_binary_file(mm.get("filenames")[0])
+
+        self.assertEqual(header["magic"], b"NESTBIN\0")
+        self.assertEqual(header["byte_order_mark"], 0x01020304)
+        self.assertEqual(header["resolution"], nest.GetKernelStatus("resolution"))
+        self.assertEqual(header["nest_version"], nest.version().split()[-1])
+        self.assertEqual(header["double_names"], ["V_m", "I_syn_ex"])
+        self.assertEqual(header["long_names"], [])
+        self.assertEqual(header["version"], 2)
+        self.assertEqual(header["compression"], 0)
+
+    def testContentMultimeter(self):
+        """Test that the file contains the same data as the memory backend."""
+
+        nrns = nest.Create("iaf_psc_alpha", 3, {"I_e": 500.})
+        mm_mem = nest.Create("multimeter", {"record_from": ["V_m"]})
+        mm_bin = nest.Create("multimeter", {"record_to": "binary", "record_from": ["V_m"], "chunk_size": 7})
+        nest.Connect(mm_mem, nrns)
+        nest.Connect(mm_bin, nrns)
+        with nest.RunManager():
+            nest.Run(20)
+            nest.Run(5)
+
+        header, events = read_binary_file(mm_bin.get("filenames")[0])
+        expected = mm_mem.get("events")
+
+        times = events["steps"] * header["resolution"] - events["offsets"]
+        np.testing.assert_array_equal(events["senders"], expected["senders"])
+        np.testing.assert_allclose(times, expected["times"])
+        np.testing.assert_array_equal(events["V_m"], expected["V_m"])
+        self.assertEqual(mm_bin.get("n_events"), len(events["senders"]))
+
+    def testContentSpikeDetectorThreads(self):
+        """Test that all spikes are written with multiple threads."""
+
+        nest.SetKernelStatus({"local_num_threads": 2})
+        nrns = nest.Create("iaf_psc_alpha", 4, {"I_e": 500.})
+        sd_mem = nest.Create("spike_detector")
+        sd_bin = nest.Create("spike_detector", {"record_to": "binary"})
+        nest.Connect(nrns, sd_mem)
+        nest.Connect(nrns, sd_bin)
+        nest.Simulate(100)
+
+        fnames = sd_bin.get("filenames")
+        self.assertEqual(len(fnames), 2)
+
+        senders, times = [], []
+        for fname in fnames:
+            header, events = read_binary_file(fname)
+            senders.append(events["senders"])
+            times.append(events["steps"] * header["resolution"] - events["offsets"])
+        senders, times = np.concatenate(senders), np.concatenate(times)
+
+        expected = sd_mem.get("events")
+        order = np.lexsort((senders, times))
+        expected_order = np.lexsort((expected["senders"], expected["times"]))
+        self.assertGreater(len(senders), 0)
+        np.testing.assert_array_equal(senders[order], expected["senders"][expected_order])
+        np.testing.assert_allclose(times[order], expected["times"][expected_order])
+
+    def testCompression(self):
+        """Test that compressed files contain the same data and are smaller."""
+
+        nrns = nest.Create("iaf_psc_alpha", 20, {"I_e": 500.})
+        nrns.V_m = np.linspace(-70., -60., 20)
+        sd_mem = nest.Create("spike_detector")
+        sd_bin = nest.Create("spike_detector", {"record_to": "binary", "label": "plain"})
+        sd_zlib = nest.Create("spike_detector", {"record_to": "binary", "label": "zlib", "compression": "zlib",
+                                                 "chunk_size": 100})
+        nest.Connect(nrns, sd_mem)
+        nest.Connect(nrns, sd_bin)
+        nest.Connect(nrns, sd_zlib)
+        with nest.RunManager():
+            nest.Run(500)
+            nest.Run(100)
+
+        self.assertEqual(sd_zlib.get("compression"), "zlib")
+        self.assertEqual(sd_zlib.get("compression_level"), 1)
+
+        header, events = read_binary_file(sd_zlib.get("filenames")[0])
+        expected = sd_mem.get("events")
+
+        self.assertEqual(header["compression"], 1)
+        self.assertGreater(len(events["senders"]), 100)
+        times = events["steps"] * header["resolution"] - events["offsets"]
+        np.testing.assert_array_equal(events["senders"], expected["senders"])
+        np.testing.assert_allclose(times, expected["times"])
+
+        with open(sd_bin.get("filenames")[0], 'rb') as plain, open(sd_zlib.get("filenames")[0], 'rb') as compressed:
+            self.assertLess(len(compressed.read()), len(plain.read()) / 2)
+
+    def testAsyncWrite(self):
+        """Test that the writer thread writes the same files."""
+
+        self.addCleanup(nest.SetKernelStatus, {"recording_backends": {"binary": {
+            "async_write": False, "block_size": 1 << 20}}})
+
+        contents = {}
+        for async_write in [False, True]:
+            nest.ResetKernel()
+            nest.SetKernelStatus({"data_path": self.data_path, "overwrite_files": True, "local_num_threads": 2})
+            nest.SetKernelStatus({"recording_backends": {"binary": {"async_write": async_write, "block_size": 500}}})
+            mm = nest.Create("multimeter", {"record_to": "binary", "record_from": ["V_m"], "chunk_size": 10})
+            nest.Connect(mm, nest.Create("iaf_psc_alpha", 4, {"I_e": 500.}))
+            nest.Simulate(50)
+            contents[async_write] = []
+            for fname in mm.get("filenames"):
+                with open(fname, 'rb') as f:
+                    contents[async_write].append(f.read())
+
+        self.assertEqual(contents[True], contents[False])
+        self.assertGreater(nest.GetKernelStatus("recording_backends")["binary"]["blocks_written"], 0)
+
+    def testInvalidChunkSize(self):
+        """Test that the chunk size must be positive."""
+
+        with self.assertRaises(nest.kernel.NESTErrors.BadProperty):
+            nest.Create("spike_detector", {"record_to": "binary", "chunk_size": 0})
+
+    def testInvalidCompression(self):
+        """Test that only known compression methods and levels are accepted."""
+
+        with self.assertRaises(nest.kernel.NESTErrors.BadProperty):
+            nest.Create("spike_detector", {"record_to": "binary", "compression": "lz4"})
+        with self.assertRaises(nest.kernel.NESTErrors.BadProperty):
+            nest.Create("spike_detector", {"record_to": "binary", "compression_level": 10})
+
+
+def suite():
+    suite = unittest.TestLoader()
+    suite = suite.loadTestsFromTestCase(TestRecordingBackendBinary)
+    return suite
+
+
+if __name__ == '__main__':
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
@@ -20,6 +20,9 @@
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
 import unittest
+
+import numpy
+
 import nest
 
 
@@ -67,6 +70,29 @@ class TestRecordingBackendMemory(unittest.TestCase):
         self.assertEqual(mm.get("n_events"), 300)
         self.assertEqual(mm.get("events")["times"].size, 300)
 
+    def testEventsAreSharedNotCopied(self):
+        """Test that event arrays share the kernel data and outlive it."""
+
+        nest.ResetKernel()
+
+        mm = nest.Create("multimeter", params={"record_to": "memory"})
+        mm.set({"interval": 0.1, "record_from": ["V_m"]})
+        nest.Connect(mm, nest.Create("iaf_psc_alpha"))
+
+        nest.Simulate(15)
+        events = mm.get("events")
+
+        self.assertFalse(events["times"].flags.owndata)
+        self.assertFalse(events["senders"].flags.owndata)
+        self.assertEqual(events["senders"].dtype, "int64")
+        self.assertEqual(events["V_m"].dtype, "float64")
+
+        # The arrays must stay valid after the kernel data is gone
+        nest.ResetKernel()
+        self.assertEqual(events["times"].size, 140)
+        self.assertLess(events["times"].max(), 15.)
+        self.assertTrue(all(events["senders"] == events["senders"][0]))
+
     def testResetEventCounter(self):
         """"""
 
@@ -119,6 +145,227 @@ class TestRecordingBackendMemory(unittest.TestCase):
         with self.assertRaises(nest.kernel.NESTErrors.BadProperty):
             mm.time_in_steps = False
 
+    def testGetNewEvents(self):
+        """Test that get_new_events only returns events since the last call."""
+
+        nest.ResetKernel()
+        nest.SetKernelStatus({"local_num_threads": 2})
+
+        mm = nest.Create("multimeter", params={"interval": 0.1, "record_from": ["V_m"]})
+        nest.Connect(mm, nest.Create("iaf_psc_alpha", 2))
+
+        self.assertEqual(mm.get_new_events()["times"].size, 0)
+
+        times = []
+        with nest.RunManager():
+            for _ in range(3):
+                nest.Run(5)
+                events = mm.get_new_events()
+                self.assertEqual(sorted(events), ["V_m", "senders", "times"])
+                times.append(events["times"])
+
+        self.assertEqual([t.size for t in times], [80, 100, 100])
+        self.assertTrue(times[0].max() < times[1].min() and times[1].max() < times[2].min())
+        self.assertEqual(sorted(mm.get("events")["times"]), sorted(numpy.concatenate(times)))
+        self.assertEqual(mm.get_new_events()["times"].size, 0)
+
+    def testGetNewEventsDrain(self):
+        """Test that draining deletes the events read so far."""
+
+        nest.ResetKernel()
+
+        mm = nest.Create("multimeter", params={"interval": 0.1, "record_from": ["V_m"], "time_in_steps": True})
+        nest.Connect(mm, nest.Create("iaf_psc_alpha"))
+
+        nest.Simulate(5)
+        self.assertEqual(mm.get_new_events()["times"].size, 40)
+        nest.Simulate(5)
+        events = mm.get_new_events(drain=True)
+
+        self.assertEqual(events["times"].size, 50)
+        self.assertEqual(events["offsets"].size, 50)
+        self.assertEqual(mm.get("events")["times"].size, 0)
+        self.assertEqual(mm.get("n_events"), 90)
+
+        nest.Simulate(5)
+        self.assertEqual(mm.get_new_events()["times"].size, 50)
+        self.assertEqual(mm.get("events")["times"].size, 50)
+
+    def testGetNewEventsMultipleRecorders(self):
+        """Test that get_new_events returns one dictionary per recorder."""
+
+        nest.ResetKernel()
+
+        sd = nest.Create("spike_detector", 2)
+        nest.Connect(nest.Create("iaf_psc_alpha", 1, {"I_e": 500.}), sd[0])
+        nest.Simulate(100)
+
+        events = sd.get_new_events()
+        self.assertEqual(len(events), 2)
+        self.assertGreater(events[0]["times"].size, 0)
+        self.assertEqual(events[1]["times"].size, 0)
+
+    def testMaxEvents(self):
+        """Test that only the newest max_events events are kept."""
+
+        nest.ResetKernel()
+
+        mm_params = {"interval": 0.1, "record_from": ["V_m"]}
+        mm_all = nest.Create("multimeter", params=mm_params)
+        mm = nest.Create("multimeter", params=dict(mm_params, max_events=30))
+        nrn = nest.Create("iaf_psc_alpha", params={"I_e": 500.})
+        nest.Connect(mm_all, nrn)
+        nest.Connect(mm, nrn)
+
+        self.assertEqual(mm.get("max_events"), 30)
+        self.assertEqual(mm_all.get("max_events"), 0)
+
+        for _ in range(3):
+            nest.Simulate(15)
+            events, expected = mm.get("events"), mm_all.get("events")
+            self.assertEqual(events["times"].size, 30)
+            numpy.testing.assert_array_equal(events["times"], expected["times"][-30:])
+            numpy.testing.assert_array_equal(events["V_m"], expected["V_m"][-30:])
+
+        self.assertEqual(mm.get("n_events"), mm_all.get("n_events"))
+
+    def testMaxEventsChanged(self):
+        """Test that events stay in order when the kept events wrap around or max_events changes."""
+
+        nest.ResetKernel()
+
+        mm_params = {"interval": 0.1, "record_from": ["V_m"], "time_in_steps": True}
+        mm_all = nest.Create("multimeter", params=mm_params)
+        mm = nest.Create("multimeter", params=dict(mm_params, max_events=7))
+        nrn = nest.Create("iaf_psc_alpha", params={"I_e": 500.})
+        nest.Connect(mm_all, nrn)
+        nest.Connect(mm, nrn)
+
+        for max_events in [7, 7, 3, 10]:
+            mm.max_events = max_events
+            nest.Simulate(1.3)
+            events, expected = mm.get("events"), mm_all.get("events")
+            for key in ["times", "offsets", "V_m"]:
+                numpy.testing.assert_array_equal(events[key], expected[key][-max_events:])
+
+        mm.max_events = 0
+        nest.Simulate(1.)
+        self.assertEqual(mm.get("events")["times"].size, 20)
+        numpy.testing.assert_array_equal(mm.get("events")["V_m"], mm_all.get("events")["V_m"][-20:])
+
+    def testWindow(self):
+        """Test that only the events within window_ms are kept, sorted by time."""
+
+        nest.ResetKernel()
+
+        nrns = nest.Create("iaf_psc_alpha", 20, {"I_e": 1000.})
+        nrns.V_m = numpy.linspace(-70., -56., 20)
+        sd_all = nest.Create("spike_detector")
+        sd = nest.Create("spike_detector", params={"window_ms": 10., "time_in_steps": True})
+        nest.Connect(nrns, sd_all)
+        nest.Connect(nrns, sd)
+
+        nest.Simulate(100)
+
+        events, expected = sd.get("events"), sd_all.get("events")
+        times = events["times"] * nest.GetKernelStatus("resolution") - events["offsets"]
+        expected_times = numpy.sort(expected["times"][expected["times"] > 90.])
+
+        self.assertGreater(times.size, 0)
+        numpy.testing.assert_allclose(times, expected_times)
+        self.assertEqual(sd.get("window_ms"), 10.)
+
+    def testBoundedGetNewEvents(self):
+        """Test that get_new_events only returns events that were kept."""
+
+        nest.ResetKernel()
+
+        mm = nest.Create("multimeter", params={"interval": 0.1, "record_from": ["V_m"], "max_events": 20})
+        nest.Connect(mm, nest.Create("iaf_psc_alpha"))
+
+        with nest.RunManager():
+            nest.Run(2)
+            self.assertEqual(mm.get_new_events()["times"].size, 10)
+            nest.Run(1)
+            self.assertEqual(mm.get_new_events()["times"].size, 10)
+            nest.Run(5)
+            times = mm.get_new_events()["times"]
+            self.assertEqual(times.size, 20)
+            numpy.testing.assert_array_equal(times, mm.get("events")["times"])
+
+    def testInvalidBounds(self):
+        """Test that max_events and window_ms cannot be negative."""
+
+        nest.ResetKernel()
+
+        with self.assertRaises(nest.kernel.NESTErrors.BadProperty):
+            nest.Create("spike_detector", params={"max_events": -1})
+        with self.assertRaises(nest.kernel.NESTErrors.BadProperty):
+            nest.Create("spike_detector", params={"window_ms": -1.})
+
+    def testTimeSorted(self):
+        """Test that events of all threads are merged by time and sender."""
+
+        nest.ResetKernel()
+        nest.SetKernelStatus({"local_num_threads": 4})
+
+        nrns = nest.Create("iaf_psc_alpha", 40, {"I_e": 1000.})
+        nrns.V_m = numpy.linspace(-70., -56., 40)
+        sd_all = nest.Create("spike_detector")
+        sd = nest.Create("spike_detector", params={"time_sorted": True})
+        nest.Connect(nrns, sd_all)
+        nest.Connect(nrns, sd)
+
+        self.assertFalse(sd_all.get("time_sorted"))
+        self.assertTrue(sd.get("time_sorted"))
+
+        nest.Simulate(50)
+        new_events = sd.get_new_events()
+        nest.Simulate(50)
+        new_events_2 = sd.get_new_events()
+
+        events, expected = sd.get("events"), sd_all.get("events")
+        order = numpy.lexsort((expected["senders"], expected["times"]))
+        self.assertGreater(events["times"].size, 0)
+        numpy.testing.assert_array_equal(events["times"], expected["times"][order])
+        numpy.testing.assert_array_equal(events["senders"], expected["senders"][order])
+
+        # Events returned by get_new_events are sorted per call
+        numpy.testing.assert_array_equal(numpy.concatenate((new_events["times"], new_events_2["times"])),
+                                         events["times"])
+        numpy.testing.assert_array_equal(numpy.concatenate((new_events["senders"], new_events_2["senders"])),
+                                         events["senders"])
+
+    def testTimeSortedMultimeter(self):
+        """Test that sampled values are merged together with their times."""
+
+        nest.ResetKernel()
+        nest.SetKernelStatus({"local_num_threads": 2})
+
+        nrns = nest.Create("iaf_psc_alpha", 4, {"I_e": 200.})
+        mm = nest.Create("multimeter", params={"interval": 1., "record_from": ["V_m"], "time_sorted": True,
+                                               "time_in_steps": True})
+        nest.Connect(mm, nrns)
+        nest.Simulate(20)
+
+        events = mm.get("events")
+        self.assertEqual(events["times"].size, 4 * 19)
+        numpy.testing.assert_array_equal(events["times"], numpy.repeat(numpy.arange(10, 200, 10), 4))
+        numpy.testing.assert_array_equal(events["senders"], numpy.tile(nrns.tolist(), 19))
+        for sender in nrns.tolist():
+            v_m = events["V_m"][events["senders"] == sender]
+            self.assertTrue(numpy.all(numpy.diff(v_m) > 0))
+
+    def testGetNewEventsUnsupported(self):
+        """Test that get_new_events fails for nodes without events in memory."""
+
+        nest.ResetKernel()
+
+        with self.assertRaises(nest.kernel.NESTErrors.BadProperty):
+            nest.Create("spike_detector", params={"record_to": "ascii"}).get_new_events()
+        with self.assertRaises(nest.kernel.NESTErrors.BadProperty):
+            nest.Create("iaf_psc_alpha").get_new_events()
+
 
 def suite():
     suite = unittest.TestLoader()
@@ -37,6 +37,8 @@ from . import test_basics
 from . import test_connection_with_elliptical_mask
 from . import test_dumping
 from . import test_plotting
+from . import test_position_cache
+from . import test_query
 from . import test_rotated_rect_mask
 from . import test_selection_function_and_elliptical_mask
 from . import test_spatial_kernels
@@ -49,6 +51,8 @@ def suite():
     suite.addTest(test_connection_with_elliptical_mask.suite())
     suite.addTest(test_dumping.suite())
     suite.addTest(test_plotting.suite())
+    suite.addTest(test_position_cache.suite())
+    suite.addTest(test_query.suite())
     suite.addTest(test_rotated_rect_mask.suite())
     suite.addTest(test_selection_function_and_elliptical_mask.suite())
     suite.addTest(test_spatial_kernels.suite())
@@ -417,6 +417,40 @@ class BasicsTestCase(unittest.TestCase):
             self.assertAlmostEqual(positions[indx][0], p[0][indx][0])
             self.assertAlmostEqual(positions[indx][1], p[0][indx][1])
 
+    @unittest.skipIf(not HAVE_NUMPY, 'NumPy package is not available')
+    def test_GetTargets_csr(self):
+        """Targets and target positions in compressed sparse row format"""
+        nest.ResetKernel()
+        src = nest.Create('iaf_psc_alpha', positions=nest.spatial.grid(shape=[4, 4]))
+        tgt = nest.Create('iaf_psc_alpha', 30,
+                          positions=nest.spatial.free(nest.random.uniform(-0.5, 0.5), num_dimensions=2))
+        nest.Connect(src[::2], tgt, {'rule': 'fixed_outdegree', 'outdegree': 20, 'allow_multapses': True})
+        nest.Connect(src[3], tgt[5])
+
+        conns = nest.GetConnections(src, tgt)
+        tgt_ids = np.array(tgt.tolist())
+        tgt_pos = np.array(nest.GetPosition(tgt))
+
+        indptr, indices = nest.GetTargetNodes(src, tgt, csr=True)
+        nc_targets = nest.GetTargetNodes(src, tgt)
+        self.assertEqual(len(indptr), len(src) + 1)
+        for j, node_id in enumerate(src.tolist()):
+            expected = np.unique(conns.targets()[conns.sources() == node_id])
+            np.testing.assert_array_equal(tgt_ids[indices[indptr[j]:indptr[j + 1]]], expected)
+            self.assertEqual(len(nc_targets[j]), len(expected))
+            if len(expected) > 0:
+                self.assertEqual(nc_targets[j], nest.NodeCollection(expected.tolist()))
+
+        indptr, indices, positions = nest.GetTargetPositions(src, tgt, csr=True)
+        pos_targets = nest.GetTargetPositions(src, tgt)
+        self.assertEqual(len(indices), len(conns))
+        self.assertEqual(positions.shape, (len(conns), 2))
+        for j, node_id in enumerate(src.tolist()):
+            expected = conns.targets()[conns.sources() == node_id]
+            np.testing.assert_array_equal(tgt_ids[indices[indptr[j]:indptr[j + 1]]], expected)
+            np.testing.assert_array_equal(positions[indptr[j]:indptr[j + 1]], tgt_pos[expected - tgt_ids[0]])
+            self.assertEqual(pos_targets[j], [tuple(p) for p in tgt_pos[expected - tgt_ids[0]]])
+
 
 def suite():
     suite = unittest.makeSuite(BasicsTestCase, 'test')
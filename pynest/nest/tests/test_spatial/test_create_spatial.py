@@ -25,6 +25,7 @@ Tests Create with spacial specifications (create a layer)
 
 import unittest
 import nest
+import numpy as np
 
 
 class CreateLayer(unittest.TestCase):
@@ -89,6 +90,15 @@ class CreateLayer(unittest.TestCase):
         self.assertEqual(layer.spatial['positions'], pos)
         self.assertEqual(layer.spatial['extent'], extent)
 
+    def test_Create_free_layer_from_numpy_array(self):
+        """Test Create free layer from a two-dimensional NumPy array."""
+        pos = np.array(((1., 1.), (2., 2.), (3., 3.)), dtype=np.float32)
+        layer = nest.Create('iaf_psc_alpha',
+                            positions=nest.spatial.free(pos))
+
+        self.assertEqual(len(layer), 3)
+        self.assertEqual(layer.spatial['positions'], tuple(map(tuple, pos.tolist())))
+
     def test_Create_free_layer_with_wrong_extent(self):
         """Test Create free layer with too small extent."""
         pos = ((1., 1.), (2., 2.), (3., 3.))
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+#
+# test_position_cache.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests for the cache of global positions of spatial layers.
+"""
+
+import unittest
+import nest
+
+
+class PositionCacheTestCase(unittest.TestCase):
+
+    conn_spec = {'rule': 'pairwise_bernoulli',
+                 'mask': {'circular': {'radius': 0.3}}}
+
+    def setUp(self):
+        nest.ResetKernel()
+        nest.set_verbosity('M_ERROR')
+
+    def _create_layers(self, n_layers):
+        return [nest.Create('iaf_psc_alpha', 50,
+                            positions=nest.spatial.free(nest.random.uniform(), num_dimensions=2))
+                for _ in range(n_layers)]
+
+    def _connect_all(self, layers, p=0.5):
+        for pre in layers:
+            for post in layers:
+                nest.Connect(pre, post, dict(self.conn_spec, p=p))
+
+    def test_defaults(self):
+        """Cache is empty after ResetKernel"""
+        status = nest.GetPositionCacheStatus()
+        self.assertEqual(status['cached_layers'], 0)
+        self.assertEqual(status['memory'], 0)
+        self.assertEqual(status['hits'], 0)
+        self.assertEqual(status['misses'], 0)
+        self.assertEqual(status['evictions'], 0)
+        self.assertEqual(status['max_memory'], 1 << 30)
+
+    def test_several_layers_cached(self):
+        """Positions of all layers are cached when connecting several layers"""
+        layers = self._create_layers(3)
+        self._connect_all(layers)
+
+        status = nest.GetPositionCacheStatus()
+        self.assertEqual(status['cached_layers'], len(layers))
+        self.assertEqual(status['misses'], len(layers))
+        self.assertEqual(status['hits'], len(layers)**2 - len(layers))
+        self.assertEqual(status['evictions'], 0)
+        self.assertGreater(status['memory'], 0)
+
+    def test_eviction(self):
+        """Least recently used layers are evicted if the cache is full"""
+        layers = self._create_layers(3)
+        nest.SetPositionCacheStatus({'max_memory': 0})
+        self._connect_all(layers)
+
+        status = nest.GetPositionCacheStatus()
+        self.assertEqual(status['cached_layers'], 1)
+        self.assertGreater(status['evictions'], 0)
+
+    def test_same_connections(self):
+        """Caching does not change the connections created"""
+        conns = []
+        for max_memory in [0, 1 << 30]:
+            nest.ResetKernel()
+            nest.SetPositionCacheStatus({'max_memory': max_memory})
+            layers = self._create_layers(3)
+            self._connect_all(layers, p=1.0)
+            conns.append(sorted(zip(*nest.GetConnections().get(['source', 'target']).values())))
+        self.assertEqual(conns[0], conns[1])
+
+    def test_reset(self):
+        """SetPositionCacheStatus resets the counters and ResetKernel clears the cache"""
+        layers = self._create_layers(2)
+        self._connect_all(layers)
+        nest.SetPositionCacheStatus({})
+        status = nest.GetPositionCacheStatus()
+        self.assertEqual(status['cached_layers'], 2)
+        self.assertEqual(status['hits'], 0)
+        self.assertEqual(status['misses'], 0)
+
+        nest.ResetKernel()
+        status = nest.GetPositionCacheStatus()
+        self.assertEqual(status['cached_layers'], 0)
+        self.assertEqual(status['memory'], 0)
+
+    def test_bad_max_memory(self):
+        """Negative max_memory raises an error"""
+        with self.assertRaises(nest.kernel.NESTErrors.BadProperty):
+            nest.SetPositionCacheStatus({'max_memory': -1})
+        with self.assertRaises(TypeError):
+            nest.SetPositionCacheStatus(1)
+
+
+def suite():
+    suite = unittest.makeSuite(PositionCacheTestCase, 'test')
+    return suite
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+#
+# test_query.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests for nearest neighbour and radius queries on spatial layers.
+"""
+
+import unittest
+import numpy as np
+import nest
+
+
+class QueryTestCase(unittest.TestCase):
+
+    def setUp(self):
+        nest.ResetKernel()
+        nest.set_verbosity('M_ERROR')
+        nest.SetKernelStatus({'rng_seeds': [12]})
+        np.random.seed(12)
+
+    def _reference_distances(self, layer, points, extent=None):
+        """Distances from all points to all nodes, computed with NumPy"""
+        positions = np.array(nest.GetPosition(layer))
+        displacement = positions[np.newaxis, :, :] - points[:, np.newaxis, :]
+        if extent is not None:
+            displacement -= extent * np.round(displacement / extent)
+        return np.sqrt(np.sum(displacement**2, axis=2))
+
+    def test_k_nearest(self):
+        """Query k nearest nodes in free layers"""
+        for dim in [2, 3]:
+            nest.ResetKernel()
+            layer = nest.Create('iaf_psc_alpha', 500,
+                                positions=nest.spatial.free(nest.random.uniform(-0.5, 0.5), num_dimensions=dim))
+            points = np.random.uniform(-0.6, 0.6, (50, dim))
+            reference = self._reference_distances(layer, points)
+
+            nearest, distances = nest.spatial.query(layer, points, k=7, return_distance=True)
+            self.assertEqual(nearest.shape, (50, 7))
+            np.testing.assert_array_equal(nearest, np.argsort(reference, axis=1, kind='stable')[:, :7])
+            np.testing.assert_allclose(distances, np.sort(reference, axis=1)[:, :7])
+
+    def test_radius(self):
+        """Query nodes within radius in free layer"""
+        layer = nest.Create('iaf_psc_alpha', 500, positions=nest.spatial.free(nest.random.uniform(-0.5, 0.5),
+                                                                              num_dimensions=2))
+        points = np.random.uniform(-0.5, 0.5, (50, 2))
+        reference = self._reference_distances(layer, points)
+
+        indptr, indices = nest.spatial.query(layer, points, radius=0.1)
+        self.assertEqual(len(indptr), len(points) + 1)
+        for j in range(len(points)):
+            found = indices[indptr[j]:indptr[j + 1]]
+            self.assertEqual(sorted(found), list(np.nonzero(reference[j] <= 0.1)[0]))
+            self.assertTrue(np.all(np.diff(reference[j, found]) >= 0.))
+
+    def test_k_nearest_within_radius(self):
+        """Missing nodes are marked by -1 if fewer than k nodes are within radius"""
+        layer = nest.Create('iaf_psc_alpha', positions=nest.spatial.grid(shape=[5, 5], extent=[5., 5.]))
+        nearest, distances = nest.spatial.query(layer, [[0., 0.], [10., 10.]], k=6, radius=1.,
+                                                return_distance=True)
+        self.assertEqual(nearest[0, 0], 12)
+        self.assertEqual(sorted(nearest[0, 1:5]), [7, 11, 13, 17])
+        self.assertEqual(nearest[0, 5], -1)
+        np.testing.assert_array_equal(distances[0], [0., 1., 1., 1., 1., np.inf])
+        np.testing.assert_array_equal(nearest[1], [-1] * 6)
+
+        # More nodes requested than in layer
+        self.assertEqual(np.sum(nest.spatial.query(layer, [0., 0.], k=30) >= 0), 25)
+
+    def test_periodic(self):
+        """Queries take periodic boundary conditions into account"""
+        extent = np.array([1., 1.])
+        layer = nest.Create('iaf_psc_alpha', 200,
+                            positions=nest.spatial.free(nest.random.uniform(-0.5, 0.5), extent=list(extent),
+                                                        edge_wrap=True))
+        points = np.random.uniform(-0.5, 0.5, (30, 2))
+        points[:10, 0] = 0.49
+        reference = self._reference_distances(layer, points, extent)
+
+        nearest, distances = nest.spatial.query(layer, points, k=5, return_distance=True)
+        np.testing.assert_array_equal(nearest, np.argsort(reference, axis=1, kind='stable')[:, :5])
+        np.testing.assert_allclose(distances, np.sort(reference, axis=1)[:, :5])
+
+        indptr, indices = nest.spatial.query(layer, points, radius=0.2)
+        self.assertEqual(len(indices), np.sum(reference <= 0.2))
+
+    def test_find_nearest_element(self):
+        """FindNearestElement gives the same nodes as query"""
+        layer = nest.Create('iaf_psc_alpha', 100, positions=nest.spatial.free(nest.random.uniform(-0.5, 0.5),
+                                                                              num_dimensions=2))
+        points = np.random.uniform(-0.5, 0.5, (10, 2))
+        nearest = nest.spatial.query(layer, points, k=1)
+        self.assertEqual(nest.FindNearestElement(layer, points.tolist()), [layer[i] for i in nearest[:, 0]])
+
+    def test_wrong_args(self):
+        """Query with wrong arguments"""
+        layer = nest.Create('iaf_psc_alpha', positions=nest.spatial.grid(shape=[5, 5]))
+        with self.assertRaises(ValueError):
+            nest.spatial.query(layer, [[0., 0.]])
+        with self.assertRaises(ValueError):
+            nest.spatial.query(layer, [[0., 0.]], k=0)
+        with self.assertRaises(ValueError):
+            nest.spatial.query(layer, [[0., 0.]], radius=-1.)
+        with self.assertRaises(TypeError):
+            nest.spatial.query(layer, [[0., 0.]], k=1.5)
+        with self.assertRaises(TypeError):
+            nest.spatial.query([1, 2], [[0., 0.]], k=1)
+        with self.assertRaises(ValueError):
+            nest.spatial.query(layer, [[0., 0., 0.]], k=1)
+        with self.assertRaises(ValueError):
+            nest.spatial.query(nest.Create('iaf_psc_alpha'), [[0., 0.]], k=1)
+
+    def test_wrong_dimensions(self):
+        """Query with points of wrong dimension"""
+        layer = nest.Create('iaf_psc_alpha', positions=nest.spatial.grid(shape=[5, 5]))
+        points = np.zeros((4, 3))
+        with self.assertRaises(ValueError):
+            nest.spatial.query(layer, points, radius=0.5)
+        with self.assertRaises(ValueError):
+            nest.spatial.query(layer, points, k=1)
+        with self.assertRaises(ValueError):
+            nest.spatial.query(layer, np.zeros(3), k=1)
+        with self.assertRaises(nest.kernel.NESTError):
+            nest.ll_api.sli_func('FindNearest', layer, np.zeros(12), 3, 1, np.inf)
+
+
+def suite():
+    suite = unittest.makeSuite(QueryTestCase, 'test')
+    return suite
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite())
@@ -25,6 +25,7 @@ Tests for the SynapseCollection class
 
 import unittest
 import nest
+import numpy as np
 
 try:
     import pandas
@@ -218,6 +219,132 @@ class TestSynapseCollection(unittest.TestCase):
         self.assertEqual(sources, [4, 5, 6])
         self.assertEqual(targets, [3, 5, 7])
 
+    def test_slicing_and_arrays(self):
+        """
+        Test slicing, iteration and source and target arrays of SynapseCollection
+        """
+        nrns = nest.Create('iaf_psc_alpha', 3)
+        nest.Connect(nrns, nrns)
+
+        conns = nest.GetConnections()
+
+        self.assertEqual(list(conns.sources()), [1, 1, 1, 2, 2, 2, 3, 3, 3])
+        self.assertEqual(list(conns.targets()), [1, 2, 3, 1, 2, 3, 1, 2, 3])
+        with self.assertRaises(ValueError):
+            conns.sources()[0] = 5
+
+        sliced = conns[1::3]
+        self.assertEqual(len(sliced), 3)
+        self.assertEqual(list(sliced.targets()), [2, 2, 2])
+        self.assertEqual(sliced.get('target'), [2, 2, 2])
+        self.assertEqual(conns[-1].get('source'), 3)
+        self.assertEqual(conns[4], nest.GetConnections(nrns[1], nrns[1]))
+        self.assertEqual([c.get('target') for c in conns[:3]], [1, 2, 3])
+
+        sliced.set(weight=5.)
+        self.assertEqual(conns.get('weight'), [1., 5., 1., 1., 5., 1., 1., 5., 1.])
+
+    def test_get_numpy(self):
+        """
+        Test get() on SynapseCollection with NumPy output
+        """
+        nrns = nest.Create('iaf_psc_alpha', 2)
+        nest.Connect(nrns, nrns, syn_spec={'weight': [[1., 2.], [3., 4.]]})
+        conns = nest.GetConnections()
+
+        weight = conns.get('weight', output='numpy')
+        self.assertTrue(isinstance(weight, np.ndarray))
+        np.testing.assert_array_equal(weight, [1., 3., 2., 4.])
+
+        params = conns.get(['source', 'delay', 'synapse_model'], output='numpy')
+        self.assertEqual(list(params.keys()), ['source', 'delay', 'synapse_model'])
+        self.assertTrue(np.issubdtype(params['source'].dtype, np.integer))
+        np.testing.assert_array_equal(params['source'], conns.sources())
+        np.testing.assert_array_equal(params['delay'], [1.] * 4)
+        self.assertEqual(list(params['synapse_model']), ['static_synapse'] * 4)
+
+        np.testing.assert_array_equal(conns[1].get('weight', output='numpy'), [3.])
+        self.assertEqual(conns[1].get('weight'), 3.)
+        self.assertEqual(set(conns.get(output='numpy').keys()), set(conns.get().keys()))
+
+        with self.assertRaises(nest.kernel.NESTError):
+            conns.get('foo')
+
+        nest.ResetKernel()
+        self.assertEqual(conns.get('weight', output='numpy'), ())
+
+    def test_get_numpy_mixed_models(self):
+        """
+        Test get() with NumPy output on connections of several synapse models
+        """
+        nrns = nest.Create('iaf_psc_alpha', 2)
+        pg = nest.Create('poisson_generator')
+        nest.Connect(nrns[0], nrns[1], syn_spec={'weight': 2., 'delay': 1.5})
+        nest.Connect(nrns[1], nrns[0], syn_spec={'synapse_model': 'cont_delay_synapse', 'weight': 3.})
+        nest.GetConnections(synapse_model='cont_delay_synapse').set(delay=1.25)
+        nest.Connect(nrns[1], nrns[1], syn_spec={'synapse_model': 'static_synapse_lbl', 'synapse_label': 4})
+        nest.Connect(pg, nrns[0], syn_spec={'weight': 5.})
+        conns = nest.GetConnections()
+
+        params = conns.get(['source', 'target', 'weight', 'delay', 'synapse_model'], output='numpy')
+        self.assertTrue(np.issubdtype(params['target'].dtype, np.integer))
+        expected = {(1, 2): (2., 1.5, 'static_synapse'),
+                    (2, 1): (3., 1.25, 'cont_delay_synapse'),
+                    (2, 2): (1., 1., 'static_synapse_lbl'),
+                    (3, 1): (5., 1., 'static_synapse')}
+        for i, (source, target) in enumerate(zip(params['source'], params['target'])):
+            self.assertEqual((params['weight'][i], params['delay'][i], params['synapse_model'][i]),
+                             expected[(source, target)])
+
+        label = nest.GetConnections(synapse_model='static_synapse_lbl').get('synapse_label', output='numpy')
+        self.assertTrue(np.issubdtype(label.dtype, np.integer))
+        np.testing.assert_array_equal(label, [4])
+
+        # Without keys, only the parameters shared by all synapse models are returned
+        nest.Connect(nrns[0], nrns[0], syn_spec={'synapse_model': 'static_synapse_hom_w'})
+        params = nest.GetConnections().get(output='numpy')
+        self.assertIn('delay', params)
+        self.assertNotIn('weight', params)
+        self.assertNotIn('synapse_label', params)
+
+    def test_set_arrays(self):
+        """
+        Test set() on SynapseCollection with arrays
+        """
+        nest.SetKernelStatus({'local_num_threads': 2})
+        nrns = nest.Create('iaf_psc_alpha', 3)
+        nest.Connect(nrns, nrns, syn_spec={'synapse_model': 'stdp_synapse'})
+        conns = nest.GetConnections()
+
+        weights = np.arange(len(conns), dtype=float)
+        conns.set(weight=weights, delay=2.)
+        np.testing.assert_array_equal(conns.get('weight', output='numpy'), weights)
+        self.assertEqual(conns.get('delay'), [2.] * len(conns))
+
+        # Integer values for a double parameter are converted
+        conns.set({'weight': np.ones(len(conns), dtype=int), 'alpha': [0.5] * len(conns)})
+        self.assertEqual(conns.get('weight'), [1.] * len(conns))
+        self.assertEqual(conns.get('alpha'), [0.5] * len(conns))
+
+        nest.SetStatus(conns[::2], 'weight', [3.] * len(conns[::2]))
+        self.assertEqual(conns.get('weight')[::2], [3.] * len(conns[::2]))
+        self.assertEqual(conns.get('weight')[1::2], [1.] * len(conns[1::2]))
+
+        with self.assertRaises(IndexError):
+            conns.set(weight=[1., 2.])
+        with self.assertRaises(nest.kernel.NESTError):
+            conns.set(weight=weights, foo=1.)
+
+        # Connection IDs with a thread that does not exist are rejected
+        keys = ['source', 'target', 'target_thread', 'synapse_id', 'port']
+        conn_ids = np.array([conns.get(key) for key in keys])
+        conn_ids[2, 0] = 2
+        with self.assertRaises(nest.kernel.NESTError):
+            nest.ll_api._set_connection_status_arrays(conn_ids, {}, ['weight'], weights.reshape(1, -1), [], [])
+
+        nest.ResetKernel()
+        conns.set(weight=weights)
+
     def test_GetConnectionsSynapse(self):
         """
         Test GetConnections with synapse_model
@@ -28,6 +28,7 @@ from cpython.ref cimport PyObject
 
 cdef extern from "name.h":
     cppclass Name:
+        Name(const string&) except +
         string toString() except +
 
 cdef extern from "datum.h":
@@ -72,6 +73,7 @@ cdef extern from "parameter.h":
 
 cdef extern from "node_collection.h":
     cppclass NodeCollectionDatum:
+        NodeCollectionDatum()
         NodeCollectionDatum(const NodeCollectionDatum&)
 
     cppclass NodeCollectionIteratorDatum:
@@ -79,6 +81,7 @@ cdef extern from "node_collection.h":
 
 cdef extern from "connection_id.h" namespace "nest":
     cppclass ConnectionID:
+        ConnectionID() except +
         ConnectionID(long, long, long, long) except +
         ConnectionID(long, long, long, long, long) except +
 
@@ -102,10 +105,13 @@ cdef extern from "arraydatum.h":
         Token* end()
 
     cppclass IntVectorDatum:
+        IntVectorDatum() except +
         IntVectorDatum(vector[long]*) except +
+        IntVectorDatum(const IntVectorDatum&) except +
 
     cppclass DoubleVectorDatum:
         DoubleVectorDatum(vector[double]*) except +
+        DoubleVectorDatum(const DoubleVectorDatum&) except +
 
 cdef extern from "dict.h":
     cppclass Dictionary:
@@ -120,7 +126,9 @@ cdef extern from "dictdatum.h":
             Token second
 
     cppclass DictionaryDatum:
+        DictionaryDatum() except +
         DictionaryDatum(Dictionary *) except +
+        DictionaryDatum(const DictionaryDatum&) except +
         void insert(const string&, Datum*) except +
         TokenMap.const_iterator begin()
         TokenMap.const_iterator end()
@@ -145,9 +153,24 @@ cdef extern from "neststartup.h":
     void nestshutdown(int) except +
     cbool nest_has_mpi4py()
     void c_set_communicator "set_communicator" (object) with gil
+    void set_python_error_from_exception() except *
 
 cdef extern from "nest.h" namespace "nest":
-    void connect_arrays( long* sources, long* targets, double* weights, double* delays, vector[string]& p_keys, double* p_values, size_t n, string syn_model ) except +
+    NodeCollectionDatum create( const Name& model_name, const size_t n ) except +set_python_error_from_exception
+    void simulate( const double& t ) except +set_python_error_from_exception
+    void run( const double& t ) except +set_python_error_from_exception
+    void prepare() except +set_python_error_from_exception
+    void cleanup() except +set_python_error_from_exception
+    void connect_arrays( long* sources, long* targets, double* weights, double* delays, vector[string]& p_keys, double* p_values, size_t n, string syn_model ) except +set_python_error_from_exception
+    IntVectorDatum node_collection_to_vector( const NodeCollectionDatum& nc ) except +set_python_error_from_exception
+    NodeCollectionDatum slice_node_collection( const NodeCollectionDatum& nc, size_t start, size_t stop, size_t step ) except +set_python_error_from_exception
+    IntVectorDatum get_connections_arrays( const DictionaryDatum& dict ) except +set_python_error_from_exception
+    DictionaryDatum get_connection_status_arrays( const long* conns, size_t n, const vector[string]& keys ) except +set_python_error_from_exception
+    void set_connection_status_arrays( const long* conns, size_t n, const DictionaryDatum& params, const vector[string]& double_keys, const double* double_values, const vector[string]& int_keys, const long* int_values ) except +set_python_error_from_exception
+    DictionaryDatum gather_arrays( const DictionaryDatum& arrays ) except +set_python_error_from_exception
+    DictionaryDatum get_node_status_arrays( const NodeCollectionDatum& nc, const vector[string]& keys ) except +set_python_error_from_exception
+    void set_node_status_arrays( const NodeCollectionDatum& nc, const DictionaryDatum& params, const vector[string]& double_keys, const double* double_values, const vector[string]& int_keys, const long* int_values ) except +set_python_error_from_exception
+    DictionaryDatum get_new_events( const size_t node_id, const cbool drain ) except +set_python_error_from_exception
 
 cdef extern from *:
 
@@ -193,3 +216,17 @@ ctypedef fused numeric_buffer_t:
 
     buffer_float_1d_t
     buffer_double_1d_t
+
+ctypedef long [::1] buffer_long_contiguous_1d_t
+ctypedef double [::1] buffer_double_contiguous_1d_t
+
+ctypedef fused contiguous_buffer_1d_t:
+    buffer_long_contiguous_1d_t
+    buffer_double_contiguous_1d_t
+
+ctypedef long [:, ::1] buffer_long_contiguous_2d_t
+ctypedef double [:, ::1] buffer_double_contiguous_2d_t
+
+ctypedef fused contiguous_buffer_2d_t:
+    buffer_long_contiguous_2d_t
+    buffer_double_contiguous_2d_t
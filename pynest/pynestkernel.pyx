@@ -81,6 +81,17 @@ except ImportError:
     pass
 
 
+cdef object kernel_error(unicode commandname, error):
+    """Convert a RuntimeError raised by a direct kernel call to a NESTError.
+
+    The RuntimeError carries the name and the message of the kernel exception.
+    """
+
+    errorname = error.args[0]
+    message = error.args[1] if len(error.args) > 1 else ''
+    return getattr(NESTErrors, errorname)(commandname, ': ' + message if message else '')
+
+
 cdef class SLIDatum(object):
 
     cdef Datum* thisptr
@@ -109,6 +120,68 @@ cdef class SLIDatum(object):
         self.thisptr = dat
 
 
+cdef class SLIVectorView(object):
+    """Buffer view on the data of an SLI int or double vector.
+
+    The view holds a reference to the underlying vector datum, so the
+    data stays alive as long as the view (or any NumPy array created
+    from it) exists. No data is copied.
+    """
+
+    cdef Datum* thisptr
+    cdef void* data
+    cdef char* format
+    cdef Py_ssize_t itemsize
+    cdef Py_ssize_t shape[1]
+    cdef Py_ssize_t strides[1]
+
+    def __cinit__(self):
+
+        self.thisptr = NULL
+        self.data = NULL
+        self.format = NULL
+        self.itemsize = 0
+        self.shape[0] = 0
+        self.strides[0] = 0
+
+    def __dealloc__(self):
+
+        if self.thisptr is not NULL:
+            del self.thisptr
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __repr__(self):
+        return "<SLIVectorView: {0}[{1}]>".format(self.format.decode() if self.format is not NULL else "", self.shape[0])
+
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+
+        buffer.buf = self.data
+        buffer.obj = self
+        buffer.len = self.shape[0] * self.itemsize
+        buffer.readonly = 0
+        buffer.itemsize = self.itemsize
+        buffer.format = self.format
+        buffer.ndim = 1
+        buffer.shape = self.shape
+        buffer.strides = self.strides
+        buffer.suboffsets = NULL
+        buffer.internal = NULL
+
+    def __releasebuffer__(self, Py_buffer* buffer):
+        pass
+
+    cdef _set_vector(self, Datum* dat, void* data, size_t size, Py_ssize_t itemsize, char* format):
+
+        self.thisptr = dat
+        self.data = data
+        self.format = format
+        self.itemsize = itemsize
+        self.shape[0] = size
+        self.strides[0] = itemsize
+
+
 cdef class SLILiteral(object):
 
     cdef readonly object name
@@ -247,6 +320,59 @@ cdef class NESTEngine(object):
 
         return ret
 
+    def create(self, model, n):
+        """Calls create function, bypassing SLI to create n nodes of the given model"""
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        if n <= 0:
+            raise NESTErrors.RangeCheck('create', 'n must be a positive integer')
+
+        cdef NodeCollectionDatum* nodes = NULL
+        try:
+            nodes = new NodeCollectionDatum(create(Name(model.encode('UTF-8')), n))
+        except RuntimeError as e:
+            raise kernel_error('create', e) from None
+
+        datum = SLIDatum()
+        (<SLIDatum> datum)._set_datum(<Datum*> nodes, SLI_TYPE_NODECOLLECTION.decode())
+        return nest.NodeCollection(datum)
+
+    def simulate(self, t):
+        """Calls simulate function, bypassing SLI to simulate for t ms"""
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        try:
+            simulate(t)
+        except RuntimeError as e:
+            raise kernel_error('simulate', e) from None
+
+    def run_simulation(self, t):
+        """Calls run function, bypassing SLI to run a prepared simulation for t ms"""
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        try:
+            run(t)
+        except RuntimeError as e:
+            raise kernel_error('run', e) from None
+
+    def prepare(self):
+        """Calls prepare function, bypassing SLI to prepare the network for run_simulation"""
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        try:
+            prepare()
+        except RuntimeError as e:
+            raise kernel_error('prepare', e) from None
+
+    def cleanup(self):
+        """Calls cleanup function, bypassing SLI to finalize the network after run_simulation"""
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        try:
+            cleanup()
+        except RuntimeError as e:
+            raise kernel_error('cleanup', e) from None
+
     def connect_arrays(self, sources, targets, weights, delays, synapse_model, syn_param_keys, syn_param_values):
         """Calls connect_arrays function, bypassing SLI to expose pointers to the NumPy arrays"""
         if self.pEngine is NULL:
@@ -283,10 +409,10 @@ cdef class NESTEngine(object):
                 raise ValueError('syn_param_values must be a matrix with arrays of the same length as sources and targets.')
 
         # Get pointers to the first element in each NumPy array
-        cdef long[::1] sources_mv = numpy.ascontiguousarray(sources, dtype=numpy.long)
+        cdef long[::1] sources_mv = numpy.ascontiguousarray(sources, dtype=numpy.int_)
         cdef long* sources_ptr = &sources_mv[0]
 
-        cdef long[::1] targets_mv = numpy.ascontiguousarray(targets, dtype=numpy.long)
+        cdef long[::1] targets_mv = numpy.ascontiguousarray(targets, dtype=numpy.int_)
         cdef long* targets_ptr = &targets_mv[0]
 
         cdef double[::1] weights_mv
@@ -318,8 +444,226 @@ cdef class NESTEngine(object):
         try:
             connect_arrays( sources_ptr, targets_ptr, weights_ptr, delays_ptr, param_keys_ptr, param_values_ptr, len(sources), syn_model_string )
         except RuntimeError as e:
-            exceptionCls = getattr(NESTErrors, str(e))
-            raise exceptionCls('connect_arrays', '') from None
+            raise kernel_error('connect_arrays', e) from None
+
+    def node_collection_to_array(self, nc):
+        """Calls node_collection_to_vector function, bypassing SLI to get all node IDs of a NodeCollection at once"""
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        if not (isinstance(nc, SLIDatum) and (<SLIDatum> nc).dtype == SLI_TYPE_NODECOLLECTION.decode()):
+            raise TypeError('nc must be a NodeCollection datum')
+
+        cdef IntVectorDatum* node_ids = NULL
+        try:
+            node_ids = new IntVectorDatum(node_collection_to_vector(deref(<NodeCollectionDatum*> (<SLIDatum> nc).thisptr)))
+        except RuntimeError as e:
+            raise kernel_error('node_collection_to_array', e) from None
+
+        try:
+            return sli_vector_to_object[sli_vector_int_ptr_t, long](node_ids)
+        finally:
+            del node_ids
+
+    def slice_node_collection(self, nc, start, stop, step):
+        """Calls slice_node_collection function, bypassing SLI to slice a NodeCollection"""
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        if not (isinstance(nc, SLIDatum) and (<SLIDatum> nc).dtype == SLI_TYPE_NODECOLLECTION.decode()):
+            raise TypeError('nc must be a NodeCollection datum')
+
+        cdef NodeCollectionDatum* sliced = NULL
+        try:
+            sliced = new NodeCollectionDatum(slice_node_collection(deref(<NodeCollectionDatum*> (<SLIDatum> nc).thisptr),
+                                                                   start, stop, step))
+        except RuntimeError as e:
+            raise kernel_error('slice_node_collection', e) from None
+
+        datum = SLIDatum()
+        (<SLIDatum> datum)._set_datum(<Datum*> sliced, SLI_TYPE_NODECOLLECTION.decode())
+        return nest.NodeCollection(datum)
+
+    def get_node_status_arrays(self, nc, keys):
+        """Calls get_node_status_arrays function, bypassing SLI to get parameters of all nodes in a NodeCollection"""
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        if not (isinstance(nc, SLIDatum) and (<SLIDatum> nc).dtype == SLI_TYPE_NODECOLLECTION.decode()):
+            raise TypeError('nc must be a NodeCollection datum')
+
+        cdef vector[string] keys_vec
+        for key in keys:
+            keys_vec.push_back(key.encode('UTF-8'))
+
+        cdef DictionaryDatum* result = NULL
+        try:
+            result = new DictionaryDatum(get_node_status_arrays(deref(<NodeCollectionDatum*> (<SLIDatum> nc).thisptr),
+                                                                keys_vec))
+        except RuntimeError as e:
+            raise kernel_error('get_node_status_arrays', e) from None
+
+        try:
+            return sli_dict_to_object(result)
+        finally:
+            del result
+
+    def get_new_events(self, node_id, drain):
+        """Calls get_new_events function, bypassing SLI to get the events recorded since the last call"""
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+
+        cdef DictionaryDatum* result = NULL
+        try:
+            result = new DictionaryDatum(get_new_events(node_id, drain))
+        except RuntimeError as e:
+            raise kernel_error('get_new_events', e) from None
+
+        try:
+            return sli_dict_to_object(result)
+        finally:
+            del result
+
+    def set_node_status_arrays(self, nc, params, double_keys, double_values, int_keys, int_values):
+        """Calls set_node_status_arrays function, bypassing SLI to set parameters of all nodes in a NodeCollection"""
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        if not HAVE_NUMPY:
+            raise NESTErrors.PyNESTError("NumPy is not available")
+        if not (isinstance(nc, SLIDatum) and (<SLIDatum> nc).dtype == SLI_TYPE_NODECOLLECTION.decode()):
+            raise TypeError('nc must be a NodeCollection datum')
+        if not isinstance(params, dict):
+            raise TypeError('params must be a dictionary')
+
+        cdef const double[:, ::1] double_values_mv = numpy.ascontiguousarray(double_values, dtype=numpy.double)
+        cdef const long[:, ::1] int_values_mv = numpy.ascontiguousarray(int_values, dtype=numpy.int_)
+        if double_values_mv.shape[0] != len(double_keys) or int_values_mv.shape[0] != len(int_keys):
+            raise ValueError('values must be matrices with one row per key')
+
+        cdef vector[string] double_keys_vec
+        for key in double_keys:
+            double_keys_vec.push_back(key.encode('UTF-8'))
+        cdef vector[string] int_keys_vec
+        for key in int_keys:
+            int_keys_vec.push_back(key.encode('UTF-8'))
+
+        cdef const double* double_values_ptr = &double_values_mv[0, 0] if double_values_mv.size > 0 else NULL
+        cdef const long* int_values_ptr = &int_values_mv[0, 0] if int_values_mv.size > 0 else NULL
+
+        cdef Datum* params_datum = python_object_to_datum(params)
+        try:
+            set_node_status_arrays(deref(<NodeCollectionDatum*> (<SLIDatum> nc).thisptr),
+                                   deref(<DictionaryDatum*> params_datum),
+                                   double_keys_vec, double_values_ptr, int_keys_vec, int_values_ptr)
+        except RuntimeError as e:
+            raise kernel_error('set_node_status_arrays', e) from None
+        finally:
+            del params_datum
+
+    def get_connections_arrays(self, params):
+        """Calls get_connections_arrays function, bypassing SLI to get connections as columns of connection IDs"""
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        if not isinstance(params, dict):
+            raise TypeError('params must be a dictionary')
+
+        cdef Datum* params_datum = python_object_to_datum(params)
+        cdef IntVectorDatum* conns = NULL
+        try:
+            conns = new IntVectorDatum(get_connections_arrays(deref(<DictionaryDatum*> params_datum)))
+        except RuntimeError as e:
+            raise kernel_error('get_connections_arrays', e) from None
+        finally:
+            del params_datum
+
+        return connection_vector_to_object(conns)
+
+    def get_connection_status_arrays(self, conns, keys):
+        """Calls get_connection_status_arrays function, bypassing SLI to get parameters of many connections at once"""
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        if not HAVE_NUMPY:
+            raise NESTErrors.PyNESTError("NumPy is not available")
+
+        cdef const long[:, ::1] conns_mv = numpy.ascontiguousarray(conns, dtype=numpy.int_)
+        if conns_mv.shape[0] != 5:
+            raise ValueError('conns must have one row for each of the five parts of a connection ID')
+
+        cdef vector[string] keys_vec
+        for key in keys:
+            keys_vec.push_back(key.encode('UTF-8'))
+
+        cdef size_t n = conns_mv.shape[1]
+        cdef const long* conns_ptr = &conns_mv[0, 0] if n > 0 else NULL
+        cdef DictionaryDatum* result = NULL
+        try:
+            result = new DictionaryDatum(get_connection_status_arrays(conns_ptr, n, keys_vec))
+        except RuntimeError as e:
+            raise kernel_error('get_connection_status_arrays', e) from None
+
+        try:
+            return sli_dict_to_object(result)
+        finally:
+            del result
+
+    def set_connection_status_arrays(self, conns, params, double_keys, double_values, int_keys, int_values):
+        """Calls set_connection_status_arrays function, bypassing SLI to set parameters of many connections at once"""
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        if not HAVE_NUMPY:
+            raise NESTErrors.PyNESTError("NumPy is not available")
+        if not isinstance(params, dict):
+            raise TypeError('params must be a dictionary')
+
+        cdef const long[:, ::1] conns_mv = numpy.ascontiguousarray(conns, dtype=numpy.int_)
+        if conns_mv.shape[0] != 5:
+            raise ValueError('conns must have one row for each of the five parts of a connection ID')
+        cdef size_t n = conns_mv.shape[1]
+
+        cdef const double[:, ::1] double_values_mv = numpy.ascontiguousarray(double_values, dtype=numpy.double).reshape(
+            len(double_keys), n)
+        cdef const long[:, ::1] int_values_mv = numpy.ascontiguousarray(int_values, dtype=numpy.int_).reshape(
+            len(int_keys), n)
+
+        cdef vector[string] double_keys_vec
+        for key in double_keys:
+            double_keys_vec.push_back(key.encode('UTF-8'))
+        cdef vector[string] int_keys_vec
+        for key in int_keys:
+            int_keys_vec.push_back(key.encode('UTF-8'))
+
+        if n == 0:
+            return
+        cdef const long* conns_ptr = &conns_mv[0, 0]
+        cdef const double* double_values_ptr = &double_values_mv[0, 0] if len(double_keys) > 0 else NULL
+        cdef const long* int_values_ptr = &int_values_mv[0, 0] if len(int_keys) > 0 else NULL
+
+        cdef Datum* params_datum = python_object_to_datum(params)
+        try:
+            set_connection_status_arrays(conns_ptr, n, deref(<DictionaryDatum*> params_datum),
+                                         double_keys_vec, double_values_ptr, int_keys_vec, int_values_ptr)
+        except RuntimeError as e:
+            raise kernel_error('set_connection_status_arrays', e) from None
+        finally:
+            del params_datum
+
+    def gather_arrays(self, arrays):
+        """Calls gather_arrays function, bypassing SLI to gather arrays from all MPI processes"""
+        if self.pEngine is NULL:
+            raise NESTErrors.PyNESTError("engine uninitialized")
+        if not isinstance(arrays, dict):
+            raise TypeError('arrays must be a dictionary')
+
+        cdef Datum* arrays_datum = python_object_to_datum(arrays)
+        cdef DictionaryDatum* result = NULL
+        try:
+            result = new DictionaryDatum(gather_arrays(deref(<DictionaryDatum*> arrays_datum)))
+        except RuntimeError as e:
+            raise kernel_error('gather_arrays', e) from None
+        finally:
+            del arrays_datum
+
+        try:
+            return sli_dict_to_object(result)
+        finally:
+            del result
 
 cdef inline Datum* python_object_to_datum(obj) except NULL:
 
@@ -380,6 +724,10 @@ cdef inline Datum* python_object_to_datum(obj) except NULL:
         ret = unpackConnectionGeneratorDatum(<PyObject*> obj)
         if ret is NULL:
             raise NESTErrors.PyNESTError("failed to unpack passed connection generator object")
+    elif HAVE_NUMPY and isinstance(obj, (numpy.ndarray, memoryview)):
+        ret = numpy_array_to_datum(numpy.asarray(obj))
+    elif isinstance(obj, nest.SynapseCollection):
+        ret = synapse_collection_to_datum(numpy.ascontiguousarray(obj._datum, dtype=numpy.int_))
     else:
 
         try:
@@ -402,16 +750,6 @@ cdef inline Datum* python_object_to_datum(obj) except NULL:
         except (ValueError, TypeError):
             pass
 
-        # NumPy < 1.5.0 doesn't support PEP-3118 buffer interface
-        #
-        if ret is NULL and HAVE_NUMPY and isinstance(obj, numpy.ndarray) and obj.ndim == 1:
-            if numpy.issubdtype(obj.dtype, numpy.integer):
-                ret = python_buffer_to_datum[object, long](obj)
-            elif numpy.issubdtype(obj.dtype, numpy.floating):
-                ret = python_buffer_to_datum[object, double](obj)
-            else:
-                raise NESTError.PyNESTError("only vectors of integers or floats are supported")
-
         if ret is NULL:
             try:
                 if isinstance( obj._datum, SLIDatum ) or isinstance( obj._datum[0], SLIDatum):
@@ -429,7 +767,86 @@ cdef inline Datum* python_object_to_datum(obj) except NULL:
 
     return ret
 
+cdef inline Datum* numpy_array_to_datum(obj) except NULL:
+
+    # Dispatch once on the dtype and convert the whole array with a
+    # single cast (a no-op for arrays that already have the right type
+    # and layout) instead of probing and copying element by element.
+    if numpy.issubdtype(obj.dtype, numpy.integer):
+        arr = numpy.ascontiguousarray(obj, dtype=numpy.int_)
+        if arr.ndim == 1:
+            return python_contiguous_buffer_to_datum[buffer_long_contiguous_1d_t](arr)
+        elif arr.ndim == 2:
+            return python_contiguous_matrix_to_datum[buffer_long_contiguous_2d_t](arr)
+    elif numpy.issubdtype(obj.dtype, numpy.floating):
+        arr = numpy.ascontiguousarray(obj, dtype=numpy.double)
+        if arr.ndim == 1:
+            return python_contiguous_buffer_to_datum[buffer_double_contiguous_1d_t](arr)
+        elif arr.ndim == 2:
+            return python_contiguous_matrix_to_datum[buffer_double_contiguous_2d_t](arr)
+    else:
+        raise NESTErrors.PyNESTError("only arrays of integers or floats are supported")
+
+    raise NESTErrors.PyNESTError("only one- or two-dimensional arrays are supported")
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline Datum* python_contiguous_buffer_to_datum(contiguous_buffer_1d_t buff) except NULL:
+
+    cdef size_t n = buff.shape[0]
+
+    cdef Datum* dat = NULL
+    cdef vector[long]* long_vector_ptr = NULL
+    cdef vector[double]* double_vector_ptr = NULL
+
+    if contiguous_buffer_1d_t is buffer_long_contiguous_1d_t:
+        long_vector_ptr = new vector[long](n)
+        dat = <Datum*> new IntVectorDatum(long_vector_ptr)
+        if n > 0:
+            memcpy(&long_vector_ptr.front(), &buff[0], n * sizeof(long))
+    else:
+        double_vector_ptr = new vector[double](n)
+        dat = <Datum*> new DoubleVectorDatum(double_vector_ptr)
+        if n > 0:
+            memcpy(&double_vector_ptr.front(), &buff[0], n * sizeof(double))
+
+    return dat
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline Datum* python_contiguous_matrix_to_datum(contiguous_buffer_2d_t buff) except NULL:
+
+    # Each row becomes one vector datum, so that consumers that expect
+    # an array of vectors (e.g. positions of free layers) can use the
+    # result directly.
+    cdef size_t i
+    cdef size_t n = buff.shape[0]
+
+    cdef ArrayDatum* ad = new ArrayDatum()
+    ad.reserve(n)
+
+    for i in range(n):
+        if contiguous_buffer_2d_t is buffer_long_contiguous_2d_t:
+            ad.push_back(python_contiguous_buffer_to_datum[buffer_long_contiguous_1d_t](buff[i]))
+        else:
+            ad.push_back(python_contiguous_buffer_to_datum[buffer_double_contiguous_1d_t](buff[i]))
+
+    return <Datum*> ad
+
 @cython.boundscheck(False)
+cdef inline Datum* synapse_collection_to_datum(const long[:, ::1] conns) except NULL:
+    """Create an array of connection datums from the connection ID columns of a SynapseCollection"""
+
+    cdef size_t i
+    cdef ArrayDatum* ad = new ArrayDatum()
+    ad.reserve(conns.shape[1])
+
+    for i in range(conns.shape[1]):
+        ad.push_back(<Datum*> new ConnectionDatum(ConnectionID(conns[0, i], conns[1, i], conns[2, i],
+                                                               conns[3, i], conns[4, i])))
+
+    return <Datum*> ad
+
 cdef inline Datum* python_buffer_to_datum(numeric_buffer_t buff, vector_value_t _ = 0) except NULL:
 
     cdef size_t i, n
@@ -462,6 +879,7 @@ cdef inline object sli_datum_to_object(Datum* dat):
     cdef string obj_str
     cdef object ret = None
     cdef ignore_none = False
+    cdef vector[long]* conns = NULL
 
     cdef string datum_type = dat.gettypename().toString()
 
@@ -484,9 +902,9 @@ cdef inline object sli_datum_to_object(Datum* dat):
     elif datum_type == SLI_TYPE_DICTIONARY:
         ret = sli_dict_to_object(<DictionaryDatum*> dat)
     elif datum_type == SLI_TYPE_CONNECTION:
-        datum = SLIDatum()
-        (<SLIDatum> datum)._set_datum(<Datum*> new ConnectionDatum(deref(<ConnectionDatum*> dat)), SLI_TYPE_CONNECTION.decode())
-        ret = nest.SynapseCollection(datum)
+        conns = new vector[long](5)
+        store_connection_id(conns, <ConnectionDatum*> dat, 0, 1)
+        ret = connection_vector_to_object(new IntVectorDatum(conns))
     elif datum_type == SLI_TYPE_VECTOR_INT:
         ret = sli_vector_to_object[sli_vector_int_ptr_t, long](<IntVectorDatum*> dat)
     elif datum_type == SLI_TYPE_VECTOR_DOUBLE:
@@ -516,33 +934,51 @@ cdef inline object sli_datum_to_object(Datum* dat):
 
 cdef inline object sli_array_to_object(ArrayDatum* dat):
 
-    # the size of dat has to be explicitly cast to int to avoid
-    # compiler warnings (#1318) during cythonization
-    cdef tmp = [None] * int(dat.size())
+    cdef tmp = None
 
     # i and n have to be cast to size_t (unsigned long int) to avoid
     # compiler warnings (#1318) in the for loop below
     cdef size_t i, n
     cdef Token* tok = dat.begin()
+    cdef vector[long]* conns = NULL
 
-    n = len(tmp)
+    n = dat.size()
     if not n:
         return ()
 
     if tok.datum().gettypename().toString() == SLI_TYPE_CONNECTION:
+        # Connections are collected column-wise, without a Python object per connection
+        conns = new vector[long](5 * n)
         for i in range(n):
-            datum = SLIDatum()
-            (<SLIDatum> datum)._set_datum(<Datum*> new ConnectionDatum(deref(<ConnectionDatum*> tok.datum())), SLI_TYPE_CONNECTION.decode())
-            tmp[i] = datum
-            # Increment
+            store_connection_id(conns, <ConnectionDatum*> tok.datum(), i, n)
             inc(tok)
-        return nest.SynapseCollection(tmp)
+        return connection_vector_to_object(new IntVectorDatum(conns))
     else:
+        # the size of dat has to be explicitly cast to int to avoid
+        # compiler warnings (#1318) during cythonization
+        tmp = [None] * int(n)
         for i in range(n):
             tmp[i] = sli_datum_to_object(tok.datum())
             inc(tok)
         return tuple(tmp)
 
+cdef inline void store_connection_id(vector[long]* conns, ConnectionDatum* conn, size_t i, size_t n):
+    """Store the connection ID of conn at position i of the n connections in the column vector conns"""
+
+    deref(conns)[i] = conn.get_source_node_id()
+    deref(conns)[n + i] = conn.get_target_node_id()
+    deref(conns)[2 * n + i] = conn.get_target_thread()
+    deref(conns)[3 * n + i] = conn.get_synapse_model_id()
+    deref(conns)[4 * n + i] = conn.get_port()
+
+cdef inline object connection_vector_to_object(IntVectorDatum* conns):
+    """Create a SynapseCollection from a vector of connection ID columns and release the vector"""
+
+    try:
+        return nest.SynapseCollection(sli_vector_to_object[sli_vector_int_ptr_t, long](conns))
+    finally:
+        del conns
+
 cdef inline object sli_dict_to_object(DictionaryDatum* dat):
 
     cdef tmp = {}
@@ -564,29 +1000,48 @@ cdef inline object sli_vector_to_object(sli_vector_ptr_t dat, vector_value_t _ =
 
     cdef vector_value_t* array_data = NULL
     cdef vector[vector_value_t]* vector_ptr = NULL
+    cdef Datum* view_datum = NULL
+    cdef char* view_format = NULL
 
     if sli_vector_ptr_t is sli_vector_int_ptr_t and vector_value_t is long:
         vector_ptr = deref_ivector(dat)
-        arr = array.clone(ARRAY_LONG, vector_ptr.size(), False)
-        array_data = arr.data.as_longs
         if HAVE_NUMPY:
             ret_dtype = numpy.int_
+            view_format = b"l"
     elif sli_vector_ptr_t is sli_vector_double_ptr_t and vector_value_t is double:
         vector_ptr = deref_dvector(dat)
-        arr = array.clone(ARRAY_DOUBLE, vector_ptr.size(), False)
-        array_data = arr.data.as_doubles
         if HAVE_NUMPY:
             ret_dtype = numpy.float_
+            view_format = b"d"
     else:
         raise NESTErrors.PyNESTError("unsupported specialization")
 
-    memcpy(array_data, &vector_ptr.front(), vector_ptr.size() * sizeof(vector_value_t))
-
     if HAVE_NUMPY:
-        if vector_ptr.size() > 0:
-            return numpy.frombuffer(arr, dtype=ret_dtype)
-        else:
+        if vector_ptr.size() == 0:
             # Compatibility with NumPy < 1.7.0
             return numpy.array([], dtype=ret_dtype)
+
+        # Share the vector with a copy of the datum instead of copying
+        # the data. The view keeps the vector alive for the lifetime
+        # of the returned array.
+        if sli_vector_ptr_t is sli_vector_int_ptr_t:
+            view_datum = <Datum*> new IntVectorDatum(deref(dat))
+        else:
+            view_datum = <Datum*> new DoubleVectorDatum(deref(dat))
+
+        view = SLIVectorView()
+        (<SLIVectorView> view)._set_vector(view_datum, <void*> &vector_ptr.front(), vector_ptr.size(),
+                                           sizeof(vector_value_t), view_format)
+        return numpy.frombuffer(view, dtype=ret_dtype)
+
+    if vector_value_t is long:
+        arr = array.clone(ARRAY_LONG, vector_ptr.size(), False)
+        array_data = <vector_value_t*> arr.data.as_longs
     else:
-        return arr
+        arr = array.clone(ARRAY_DOUBLE, vector_ptr.size(), False)
+        array_data = <vector_value_t*> arr.data.as_doubles
+
+    if vector_ptr.size() > 0:
+        memcpy(array_data, &vector_ptr.front(), vector_ptr.size() * sizeof(vector_value_t))
+
+    return arr
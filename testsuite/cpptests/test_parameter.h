@@ -56,6 +56,49 @@ BOOST_AUTO_TEST_CASE( test_redraw_value_impossible, *boost::unit_test::timeout(
   BOOST_CHECK_THROW( redraw_pd->value( rng, nullptr ), nest::KernelException );
 }
 
+/**
+ * This test checks that evaluating parameters in blocks gives the same values and draws the same random numbers
+ * as evaluating them one value after another.
+ */
+BOOST_AUTO_TEST_CASE( test_block_values )
+{
+  DictionaryDatum d = new Dictionary();
+  ParameterDatum uniform_pd = new nest::UniformParameter( d );
+  ParameterDatum normal_pd = new nest::NormalParameter( d );
+  ParameterDatum exponential_pd = new nest::ExponentialParameter( d );
+  ParameterDatum half_pd = new nest::ConstantParameter( 0.5 );
+  ParameterDatum two_pd = new nest::ConstantParameter( 2.0 );
+  // Zero, that is false, in half of the cases
+  ParameterDatum condition_pd = uniform_pd->subtract_parameter( *half_pd )->max( 0.0 );
+
+  std::vector< ParameterDatum > parameters = {
+    half_pd->add_parameter( *uniform_pd->exp() ),
+    uniform_pd->multiply_parameter( *normal_pd )->subtract_parameter( *exponential_pd ),
+    condition_pd->conditional_parameter( *half_pd, *two_pd ),
+    condition_pd->conditional_parameter( *normal_pd, *two_pd ),
+    normal_pd->redraw( -1.0, 1.0 )->pow( 2.0 )->min( 0.5 ),
+  };
+
+  const std::vector< nest::Node* > nodes( 100, nullptr );
+  for ( auto& parameter : parameters )
+  {
+    auto rng = librandom::RngPtr( librandom::RandomGen::create_knuthlfg_rng( librandom::RandomGen::DefaultSeed ) );
+    std::vector< double > expected;
+    for ( size_t i = 0; i < nodes.size(); ++i )
+    {
+      expected.push_back( parameter->value( rng, nodes[ i ] ) );
+    }
+    const double expected_next = rng->drand();
+
+    rng = librandom::RngPtr( librandom::RandomGen::create_knuthlfg_rng( librandom::RandomGen::DefaultSeed ) );
+    std::vector< double > result;
+    parameter->values( rng, nest::ParameterBlock( nodes ), result );
+
+    BOOST_CHECK_EQUAL_COLLECTIONS( result.begin(), result.end(), expected.begin(), expected.end() );
+    BOOST_CHECK_EQUAL( rng->drand(), expected_next );
+  }
+}
+
 BOOST_AUTO_TEST_SUITE_END()
 
 #endif /* BOOST_VERSION */
@@ -24,6 +24,7 @@
 #define CONNECTION_CREATOR_H
 
 // C++ includes:
+#include <memory>
 #include <vector>
 
 // Includes from nestkernel:
@@ -118,7 +119,7 @@ private:
     PoolWrapper_();
     ~PoolWrapper_();
     void define( MaskedLayer< D >* );
-    void define( std::vector< std::pair< Position< D >, index > >* );
+    void define( std::shared_ptr< std::vector< std::pair< Position< D >, index > > > );
 
     typename Ntree< D, index >::masked_iterator masked_begin( const Position< D >& pos ) const;
     typename Ntree< D, index >::masked_iterator masked_end() const;
@@ -128,7 +129,7 @@ private:
 
   private:
     MaskedLayer< D >* masked_layer_;
-    std::vector< std::pair< Position< D >, index > >* positions_;
+    std::shared_ptr< std::vector< std::pair< Position< D >, index > > > positions_;
   };
 
   template < typename Iterator, int D >
@@ -139,6 +140,14 @@ private:
     thread tgt_thread,
     const Layer< D >& source );
 
+  /**
+   * Copies the positions of (position, node ID) pairs consecutively into
+   * a vector, for evaluating the kernel in blocks.
+   */
+  template < int D >
+  static void get_position_block_( const std::vector< std::pair< Position< D >, index > >& pairs,
+    std::vector< double >& positions );
+
   template < int D >
   void pairwise_bernoulli_on_source_( Layer< D >& source,
     NodeCollectionPTR source_nc,
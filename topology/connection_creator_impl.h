@@ -88,6 +88,45 @@ ConnectionCreator::connect_to_target_( Iterator from,
   std::vector< double > source_pos( D );
   const std::vector< double > target_pos = tgt_pos.get_vector();
 
+  if ( kernel_.get() and not kernel_->is_random() )
+  {
+    // The kernel draws no random numbers, so its values for all sources
+    // can be computed in one block before drawing the connections.
+    std::vector< index > source_ids;
+    std::vector< double > source_positions;
+    for ( Iterator iter = from; iter != to; ++iter )
+    {
+      if ( ( not allow_autapses_ ) and ( iter->second == tgt_ptr->get_node_id() ) )
+      {
+        continue;
+      }
+      source_ids.push_back( iter->second );
+      for ( int i = 0; i < D; ++i )
+      {
+        source_positions.push_back( iter->first[ i ] );
+      }
+    }
+
+    std::vector< double > probabilities;
+    kernel_->values( rng, ParameterBlock( source_ids.size(), source_positions, target_pos, source ), probabilities );
+
+    for ( size_t i = 0; i < source_ids.size(); ++i )
+    {
+      if ( rng->drand() < probabilities[ i ] )
+      {
+        std::copy( source_positions.begin() + i * D, source_positions.begin() + ( i + 1 ) * D, source_pos.begin() );
+        kernel().connection_manager.connect( source_ids[ i ],
+          tgt_ptr,
+          tgt_thread,
+          synapse_model_,
+          dummy_param_dicts_[ tgt_thread ],
+          delay_->value( rng, source_pos, target_pos, source ),
+          weight_->value( rng, source_pos, target_pos, source ) );
+      }
+    }
+    return;
+  }
+
   const bool without_kernel = not kernel_.get();
   for ( Iterator iter = from; iter != to; ++iter )
   {
@@ -110,10 +149,25 @@ ConnectionCreator::connect_to_target_( Iterator from,
   }
 }
 
+template < int D >
+void
+ConnectionCreator::get_position_block_( const std::vector< std::pair< Position< D >, index > >& pairs,
+  std::vector< double >& positions )
+{
+  positions.resize( pairs.size() * D );
+  auto pos = positions.begin();
+  for ( const auto& pair : pairs )
+  {
+    for ( int i = 0; i < D; ++i )
+    {
+      *pos++ = pair.first[ i ];
+    }
+  }
+}
+
 template < int D >
 ConnectionCreator::PoolWrapper_< D >::PoolWrapper_()
   : masked_layer_( 0 )
-  , positions_( 0 )
 {
 }
 
@@ -131,18 +185,18 @@ void
 ConnectionCreator::PoolWrapper_< D >::define( MaskedLayer< D >* ml )
 {
   assert( masked_layer_ == 0 );
-  assert( positions_ == 0 );
+  assert( not positions_ );
   assert( ml != 0 );
   masked_layer_ = ml;
 }
 
 template < int D >
 void
-ConnectionCreator::PoolWrapper_< D >::define( std::vector< std::pair< Position< D >, index > >* pos )
+ConnectionCreator::PoolWrapper_< D >::define( std::shared_ptr< std::vector< std::pair< Position< D >, index > > > pos )
 {
   assert( masked_layer_ == 0 );
-  assert( positions_ == 0 );
-  assert( pos != 0 );
+  assert( not positions_ );
+  assert( pos );
   positions_ = pos;
 }
 
@@ -382,6 +436,7 @@ ConnectionCreator::fixed_indegree_( Layer< D >& source,
     const auto masked_source_end = masked_source.end();
 
     std::vector< std::pair< Position< D >, index > > positions;
+    std::vector< double > source_positions;
 
     for ( NodeCollection::const_iterator tgt_it = target_begin; tgt_it < target_end; ++tgt_it )
     {
@@ -409,17 +464,11 @@ ConnectionCreator::fixed_indegree_( Layer< D >& source,
       if ( kernel_.get() )
       {
 
-        std::vector< double > probabilities;
-        probabilities.reserve( positions.size() );
-
         // Collect probabilities for the sources
-        for ( typename std::vector< std::pair< Position< D >, index > >::iterator iter = positions.begin();
-              iter != positions.end();
-              ++iter )
-        {
-          iter->first.get_vector( source_pos_vector );
-          probabilities.push_back( kernel_->value( rng, source_pos_vector, target_pos_vector, source ) );
-        }
+        std::vector< double > probabilities;
+        get_position_block_( positions, source_positions );
+        kernel_->values(
+          rng, ParameterBlock( positions.size(), source_positions, target_pos_vector, source ), probabilities );
 
         if ( positions.empty()
           or ( ( not allow_autapses_ ) and ( positions.size() == 1 ) and ( positions[ 0 ].second == target_id ) )
@@ -505,7 +554,12 @@ ConnectionCreator::fixed_indegree_( Layer< D >& source,
     // no mask
 
     // Get (position,node ID) pairs for all nodes in source layer
-    std::vector< std::pair< Position< D >, index > >* positions = source.get_global_positions_vector( source_nc );
+    const auto positions = source.get_global_positions_vector( source_nc );
+    std::vector< double > source_positions;
+    if ( kernel_.get() )
+    {
+      get_position_block_( *positions, source_positions );
+    }
 
     for ( NodeCollection::const_iterator tgt_it = target_begin; tgt_it < target_end; ++tgt_it )
     {
@@ -533,17 +587,10 @@ ConnectionCreator::fixed_indegree_( Layer< D >& source,
       if ( kernel_.get() )
       {
 
-        std::vector< double > probabilities;
-        probabilities.reserve( positions->size() );
-
         // Collect probabilities for the sources
-        for ( typename std::vector< std::pair< Position< D >, index > >::iterator iter = positions->begin();
-              iter != positions->end();
-              ++iter )
-        {
-          iter->first.get_vector( source_pos_vector );
-          probabilities.push_back( kernel_->value( rng, source_pos_vector, target_pos_vector, source ) );
-        }
+        std::vector< double > probabilities;
+        kernel_->values(
+          rng, ParameterBlock( positions->size(), source_positions, target_pos_vector, source ), probabilities );
 
         // A Vose object draws random integers with a non-uniform
         // distribution.
@@ -666,10 +713,10 @@ ConnectionCreator::fixed_outdegree_( Layer< D >& source,
   // position and node ID pairs. This is done to avoid creating and destroying
   // unnecessarily many vectors.
   std::vector< std::pair< Position< D >, index > > target_pos_node_id_pairs;
-  std::vector< std::pair< Position< D >, index > > source_pos_node_id_pairs =
-    *source.get_global_positions_vector( source_nc );
+  std::vector< double > target_positions;
+  const auto source_pos_node_id_pairs = source.get_global_positions_vector( source_nc );
 
-  for ( const auto& source_pos_node_id_pair : source_pos_node_id_pairs )
+  for ( const auto& source_pos_node_id_pair : *source_pos_node_id_pairs )
   {
     const Position< D > source_pos = source_pos_node_id_pair.first;
     const index source_id = source_pos_node_id_pair.second;
@@ -686,15 +733,13 @@ ConnectionCreator::fixed_outdegree_( Layer< D >& source,
     target_pos_node_id_pairs.resize( std::distance( masked_target.begin( source_pos ), masked_target_end ) );
     std::copy( masked_target.begin( source_pos ), masked_target_end, target_pos_node_id_pairs.begin() );
 
-    probabilities.reserve( target_pos_node_id_pairs.size() );
     if ( kernel_.get() )
     {
-      for ( const auto& target_pos_node_id_pair : target_pos_node_id_pairs )
-      {
-        // TODO: Why is probability calculated in source layer, but weight and delay in target layer?
-        target_pos_node_id_pair.first.get_vector( target_pos_vector );
-        probabilities.push_back( kernel_->value( rng, source_pos_vector, target_pos_vector, source ) );
-      }
+      // TODO: Why is probability calculated in source layer, but weight and delay in target layer?
+      get_position_block_( target_pos_node_id_pairs, target_positions );
+      kernel_->values( rng,
+        ParameterBlock( target_pos_node_id_pairs.size(), source_pos_vector, target_positions, source ),
+        probabilities );
     }
     else
     {
@@ -44,8 +44,14 @@
 namespace nest
 {
 
-NodeCollectionMetadataPTR AbstractLayer::cached_ntree_md_ = NodeCollectionMetadataPTR( 0 );
-NodeCollectionMetadataPTR AbstractLayer::cached_vector_md_ = NodeCollectionMetadataPTR( 0 );
+std::list< AbstractLayer::CacheEntry > AbstractLayer::cache_;
+const size_t AbstractLayer::default_max_cache_memory_ = 1 << 30;
+size_t AbstractLayer::max_cache_memory_ = default_max_cache_memory_;
+size_t AbstractLayer::cache_memory_ = 0;
+size_t AbstractLayer::cache_hits_ = 0;
+size_t AbstractLayer::cache_misses_ = 0;
+size_t AbstractLayer::cache_evictions_ = 0;
+unsigned long AbstractLayer::cache_fingerprint_ = 0;
 
 AbstractLayer::~AbstractLayer()
 {
@@ -176,4 +182,125 @@ AbstractLayer::get_metadata() const
   return node_collection_->get_metadata();
 }
 
+void
+AbstractLayer::validate_cache_()
+{
+  // Layers of a previous kernel are never used again
+  if ( cache_fingerprint_ != kernel().get_fingerprint() )
+  {
+    cache_.clear();
+    max_cache_memory_ = default_max_cache_memory_;
+    cache_memory_ = 0;
+    cache_hits_ = 0;
+    cache_misses_ = 0;
+    cache_evictions_ = 0;
+    cache_fingerprint_ = kernel().get_fingerprint();
+  }
+}
+
+void
+AbstractLayer::get_cache_status( DictionaryDatum& d )
+{
+  validate_cache_();
+  ( *d )[ names::max_memory ] = max_cache_memory_;
+  ( *d )[ names::memory ] = cache_memory_;
+  ( *d )[ names::cached_layers ] = cache_.size();
+  ( *d )[ names::hits ] = cache_hits_;
+  ( *d )[ names::misses ] = cache_misses_;
+  ( *d )[ names::evictions ] = cache_evictions_;
+}
+
+void
+AbstractLayer::set_cache_status( const DictionaryDatum& d )
+{
+  long max_memory = max_cache_memory_;
+  updateValue< long >( d, names::max_memory, max_memory );
+  if ( max_memory < 0 )
+  {
+    throw BadProperty( "max_memory must be >= 0." );
+  }
+
+  validate_cache_();
+  max_cache_memory_ = max_memory;
+
+  // Drop all layers that no longer fit into the cache
+  while ( not cache_.empty() and cache_memory_ > max_cache_memory_ )
+  {
+    cache_memory_ -= cache_.back().memory;
+    cache_.pop_back();
+  }
+
+  cache_hits_ = 0;
+  cache_misses_ = 0;
+  cache_evictions_ = 0;
+}
+
+AbstractLayer::CacheEntry*
+AbstractLayer::find_cache_entry_( NodeCollectionMetadataPTR metadata, bool ntree )
+{
+  validate_cache_();
+
+  for ( auto entry = cache_.begin(); entry != cache_.end(); ++entry )
+  {
+    if ( entry->metadata == metadata )
+    {
+      cache_.splice( cache_.begin(), cache_, entry );
+      if ( ntree ? cache_.front().ntree : cache_.front().vector )
+      {
+        ++cache_hits_;
+      }
+      else
+      {
+        ++cache_misses_;
+      }
+      return &cache_.front();
+    }
+  }
+
+  ++cache_misses_;
+  return 0;
+}
+
+void
+AbstractLayer::insert_cache_entry_( NodeCollectionMetadataPTR metadata,
+  bool ntree,
+  std::shared_ptr< void > data,
+  size_t memory )
+{
+  if ( cache_.empty() or cache_.front().metadata != metadata )
+  {
+    erase_cache_entry_( metadata );
+    cache_.push_front( CacheEntry() );
+    cache_.front().metadata = metadata;
+    cache_.front().memory = 0;
+  }
+
+  CacheEntry& entry = cache_.front();
+  ( ntree ? entry.ntree : entry.vector ) = data;
+  entry.memory += memory;
+  cache_memory_ += memory;
+
+  // Evict the least recently used layers, but keep the new entry
+  while ( cache_.size() > 1 and cache_memory_ > max_cache_memory_ )
+  {
+    cache_memory_ -= cache_.back().memory;
+    cache_.pop_back();
+    ++cache_evictions_;
+  }
+}
+
+void
+AbstractLayer::erase_cache_entry_( NodeCollectionMetadataPTR metadata )
+{
+  for ( auto entry = cache_.begin(); entry != cache_.end(); ++entry )
+  {
+    if ( entry->metadata == metadata )
+    {
+      cache_memory_ -= entry->memory;
+      cache_.erase( entry );
+      return;
+    }
+  }
+}
+
 } // namespace nest
@@ -26,6 +26,8 @@
 // C++ includes:
 #include <bitset>
 #include <iostream>
+#include <list>
+#include <memory>
 #include <utility>
 
 // Includes from nestkernel:
@@ -112,6 +114,20 @@ public:
   virtual double compute_distance( const std::vector< double >& from_pos,
     const std::vector< double >& to_pos ) const = 0;
 
+  /**
+   * Computes distances, or absolute displacements in one dimension, for a
+   * block of position pairs. The positions are stored consecutively, or
+   * from_pos or to_pos holds a single position used for all pairs.
+   * @param from_pos  position vectors in layer
+   * @param to_pos    position vectors in layer
+   * @param dimension 0 for the distance, 1-3 for the displacement in x-z
+   * @param result    vector of size number of pairs to store the results in
+   */
+  virtual void compute_distances( const std::vector< double >& from_pos,
+    const std::vector< double >& to_pos,
+    const unsigned int dimension,
+    std::vector< double >& result ) const = 0;
+
   /**
    * Connect this layer to the given target layer. The actual connections
    * are made in class ConnectionCreator.
@@ -147,6 +163,28 @@ public:
     bool allow_oversized,
     NodeCollectionPTR node_collection ) = 0;
 
+  /**
+   * Find the nodes nearest to each of the given points. The results are
+   * stored in compressed sparse row format: the nodes found for point j
+   * are at positions indptr[j] to indptr[j+1] of indices and distances,
+   * sorted by distance.
+   * @param points          query positions, stored consecutively
+   * @param k               maximal number of nodes to find per point
+   * @param max_distance    only nodes within this distance are found
+   * @param node_collection NodeCollection of the layer
+   * @param indptr          vector to store the offsets for each point in
+   * @param indices         vector to store the indices of the nodes in
+   *                        node_collection in
+   * @param distances       vector to store the distances of the nodes in
+   */
+  virtual void find_nearest( const std::vector< double >& points,
+    size_t k,
+    double max_distance,
+    NodeCollectionPTR node_collection,
+    std::vector< long >& indptr,
+    std::vector< long >& indices,
+    std::vector< double >& distances ) = 0;
+
   /**
    * Write layer data to stream.
    * For each node in layer, write one line to stream containing:
@@ -170,31 +208,81 @@ public:
     AbstractLayerPTR target_layer,
     const Token& syn_model ) = 0;
 
+  /**
+   * Export the size and the hit and miss counters of the cache for
+   * global position information.
+   * @param d Dictionary.
+   */
+  static void get_cache_status( DictionaryDatum& d );
+
+  /**
+   * Set the maximal memory used by the cache for global position
+   * information. Setting it also resets the counters.
+   * @param d Dictionary with named parameter settings.
+   */
+  static void set_cache_status( const DictionaryDatum& d );
+
 protected:
   /**
-   * The NodeCollection to which the layer belongs
+   * Global position information of a layer, as Ntree, as vector or both.
+   * The pointers are to Ntree< D, index > and to
+   * std::vector< std::pair< Position< D >, index > > for the dimension D
+   * of the layer.
    */
-  NodeCollectionPTR node_collection_;
+  struct CacheEntry
+  {
+    NodeCollectionMetadataPTR metadata;
+    std::shared_ptr< void > ntree;
+    std::shared_ptr< void > vector;
+    size_t memory; //!< Estimated memory in bytes used by ntree and vector
+  };
+
+  /**
+   * Clear the cache if the kernel has been reset since it was last used.
+   */
+  static void validate_cache_();
 
   /**
-   * Metadata for the layer for which we cache global position information
+   * Find the cache entry for the layer with the given metadata and mark
+   * it as the most recently used one. Counts a hit if the entry holds
+   * the ntree or vector as requested, and a miss otherwise.
+   * @returns pointer to the entry, or 0 if the layer is not cached.
    */
-  static NodeCollectionMetadataPTR cached_ntree_md_;
+  static CacheEntry* find_cache_entry_( NodeCollectionMetadataPTR metadata, bool ntree );
 
   /**
-   * Metadata for the layer for which we cache global position information
+   * Store the ntree or vector of global positions of the layer with the
+   * given metadata in the cache, as the most recently used entry. The
+   * least recently used entries are then evicted until the cache fits
+   * into the maximal memory, keeping at least the new entry.
+   * @param metadata Metadata of the layer.
+   * @param ntree    If true, store data as ntree, otherwise as vector.
+   * @param data     The ntree or vector.
+   * @param memory   Estimated memory in bytes used by the data.
    */
-  static NodeCollectionMetadataPTR cached_vector_md_;
+  static void insert_cache_entry_( NodeCollectionMetadataPTR metadata,
+    bool ntree,
+    std::shared_ptr< void > data,
+    size_t memory );
 
   /**
-   * Clear the cache for global position information
+   * Remove the layer with the given metadata from the cache.
    */
-  virtual void clear_ntree_cache_() const = 0;
+  static void erase_cache_entry_( NodeCollectionMetadataPTR metadata );
 
   /**
-   * Clear the cache for global position information
+   * The NodeCollection to which the layer belongs
    */
-  virtual void clear_vector_cache_() const = 0;
+  NodeCollectionPTR node_collection_;
+
+  static std::list< CacheEntry > cache_;         //!< Cached layers, most recently used first
+  static const size_t default_max_cache_memory_; //!< Maximal memory in bytes after ResetKernel
+  static size_t max_cache_memory_;               //!< Maximal memory in bytes used by the cache
+  static size_t cache_memory_;                   //!< Estimated memory in bytes used by the cache
+  static size_t cache_hits_;                     //!< Number of requests served from the cache
+  static size_t cache_misses_;                   //!< Number of requests that gathered positions
+  static size_t cache_evictions_;                //!< Number of layers evicted from the cache
+  static unsigned long cache_fingerprint_;       //!< Fingerprint of the kernel the cached layers belong to
 
   /**
    * Gets metadata of the NodeCollection to which this layer belongs.
@@ -332,13 +420,18 @@ public:
 
   double compute_distance( const std::vector< double >& from_pos, const std::vector< double >& to_pos ) const;
 
+  void compute_distances( const std::vector< double >& from_pos,
+    const std::vector< double >& to_pos,
+    const unsigned int dimension,
+    std::vector< double >& result ) const;
+
 
   /**
    * Get positions for all nodes in layer, including nodes on other MPI
    * processes. The positions will be cached so that subsequent calls for
-   * the same layer are fast. One one layer is cached at the time, so the
-   * user should group together all ConnectLayers calls using the same
-   * pool layer.
+   * the same layer are fast. Several layers are cached, and the least
+   * recently used ones are evicted if the cache exceeds its maximal
+   * memory.
    */
   std::shared_ptr< Ntree< D, index > > get_global_positions_ntree( NodeCollectionPTR node_collection );
 
@@ -353,7 +446,12 @@ public:
     Position< D > extent,
     NodeCollectionPTR node_collection );
 
-  std::vector< std::pair< Position< D >, index > >* get_global_positions_vector( NodeCollectionPTR node_collection );
+  /**
+   * Get positions for all nodes in layer as vector, cached like the ntree
+   * returned by get_global_positions_ntree().
+   */
+  std::shared_ptr< std::vector< std::pair< Position< D >, index > > > get_global_positions_vector(
+    NodeCollectionPTR node_collection );
 
   virtual std::vector< std::pair< Position< D >, index > > get_global_positions_vector( const MaskDatum& mask,
     const Position< D >& anchor,
@@ -368,6 +466,18 @@ public:
     bool allow_oversized,
     NodeCollectionPTR node_collection );
 
+  /**
+   * Find the nodes nearest to each of the given points, using the ntree
+   * of global positions.
+   */
+  void find_nearest( const std::vector< double >& points,
+    size_t k,
+    double max_distance,
+    NodeCollectionPTR node_collection,
+    std::vector< long >& indptr,
+    std::vector< long >& indices,
+    std::vector< double >& distances );
+
   /**
    * Connect this layer to the given target layer. The actual connections
    * are made in class ConnectionCreator.
@@ -407,16 +517,10 @@ public:
 
 protected:
   /**
-   * Clear the cache for global position information
-   */
-  void clear_ntree_cache_() const;
-
-  /**
-   * Clear the cache for global position information
+   * Returns the displacement in one dimension between two coordinates,
+   * taking periodic boundary conditions into account.
    */
-  void clear_vector_cache_() const;
-
-  std::shared_ptr< Ntree< D, index > > do_get_global_positions_ntree_( NodeCollectionPTR node_collection );
+  double compute_displacement_( const double from, const double to, const unsigned int dimension ) const;
 
   /**
    * Insert global position info into ntree.
@@ -434,12 +538,6 @@ protected:
   Position< D > extent_;      //!< size of layer
   std::bitset< D > periodic_; //!< periodic b.c.
 
-  /**
-   * Global position information for a single layer
-   */
-  static std::shared_ptr< Ntree< D, index > > cached_ntree_;
-  static std::vector< std::pair< Position< D >, index > >* cached_vector_;
-
   friend class MaskedLayer< D >;
 };
 
@@ -586,15 +684,7 @@ inline Layer< D >::Layer( const Layer& other_layer )
 template < int D >
 inline Layer< D >::~Layer()
 {
-  if ( cached_ntree_md_ == get_metadata() )
-  {
-    clear_ntree_cache_();
-  }
-
-  if ( cached_vector_md_ == get_metadata() )
-  {
-    clear_vector_cache_();
-  }
+  erase_cache_entry_( get_metadata() );
 }
 
 template < int D >
@@ -633,6 +723,18 @@ Layer< D >::compute_distance( const std::vector< double >& from_pos, const index
   return compute_displacement( Position< D >( from_pos ), lid ).length();
 }
 
+template < int D >
+inline double
+Layer< D >::compute_displacement_( const double from, const double to, const unsigned int dimension ) const
+{
+  double displacement = to - from;
+  if ( periodic_[ dimension ] )
+  {
+    displacement -= extent_[ dimension ] * std::round( displacement * ( 1 / extent_[ dimension ] ) );
+  }
+  return displacement;
+}
+
 template < int D >
 inline double
 Layer< D >::compute_distance( const std::vector< double >& from_pos, const std::vector< double >& to_pos ) const
@@ -653,26 +755,6 @@ Layer< D >::get_position_vector( const index sind ) const
   return get_position( sind ).get_vector();
 }
 
-template < int D >
-inline void
-Layer< D >::clear_ntree_cache_() const
-{
-  cached_ntree_ = std::shared_ptr< Ntree< D, index > >();
-  cached_ntree_md_ = NodeCollectionMetadataPTR( 0 );
-}
-
-template < int D >
-inline void
-Layer< D >::clear_vector_cache_() const
-{
-  if ( cached_vector_ != 0 )
-  {
-    delete cached_vector_;
-  }
-  cached_vector_ = 0;
-  cached_vector_md_ = NodeCollectionMetadataPTR( 0 );
-}
-
 } // namespace nest
 
 #endif
@@ -37,12 +37,6 @@
 namespace nest
 {
 
-template < int D >
-std::shared_ptr< Ntree< D, index > > Layer< D >::cached_ntree_;
-
-template < int D >
-std::vector< std::pair< Position< D >, index > >* Layer< D >::cached_vector_ = 0;
-
 template < int D >
 Position< D >
 Layer< D >::compute_displacement( const Position< D >& from_pos, const Position< D >& to_pos ) const
@@ -69,12 +63,45 @@ Layer< D >::compute_displacement( const std::vector< double >& from_pos,
   const std::vector< double >& to_pos,
   const unsigned int dimension ) const
 {
-  double displacement = to_pos[ dimension ] - from_pos[ dimension ];
-  if ( periodic_[ dimension ] )
+  return compute_displacement_( from_pos[ dimension ], to_pos[ dimension ], dimension );
+}
+
+template < int D >
+void
+Layer< D >::compute_distances( const std::vector< double >& from_pos,
+  const std::vector< double >& to_pos,
+  const unsigned int dimension,
+  std::vector< double >& result ) const
+{
+  const size_t from_stride = from_pos.size() == D ? 0 : D;
+  const size_t to_stride = to_pos.size() == D ? 0 : D;
+  const double* from = from_pos.data();
+  const double* to = to_pos.data();
+
+  if ( dimension == 0 )
   {
-    displacement -= extent_[ dimension ] * std::round( displacement * ( 1 / extent_[ dimension ] ) );
+    for ( auto& distance : result )
+    {
+      double squared_displacement = 0;
+      for ( unsigned int i = 0; i < D; ++i )
+      {
+        const double displacement = compute_displacement_( from[ i ], to[ i ], i );
+        squared_displacement += displacement * displacement;
+      }
+      distance = std::sqrt( squared_displacement );
+      from += from_stride;
+      to += to_stride;
+    }
+  }
+  else
+  {
+    for ( auto& distance : result )
+    {
+      distance = std::abs( compute_displacement_( from[ dimension - 1 ], to[ dimension - 1 ], dimension - 1 ) );
+      from += from_stride;
+      to += to_stride;
+    }
   }
-  return displacement;
 }
 
 template < int D >
@@ -134,18 +161,34 @@ template < int D >
 std::shared_ptr< Ntree< D, index > >
 Layer< D >::get_global_positions_ntree( NodeCollectionPTR node_collection )
 {
-  if ( cached_ntree_md_ == node_collection->get_metadata() )
+  const NodeCollectionMetadataPTR metadata = node_collection->get_metadata();
+  CacheEntry* entry = find_cache_entry_( metadata, true );
+  if ( entry and entry->ntree )
   {
-    assert( cached_ntree_.get() );
-    return cached_ntree_;
+    return std::static_pointer_cast< Ntree< D, index > >( entry->ntree );
   }
 
-  clear_ntree_cache_();
+  std::shared_ptr< Ntree< D, index > > ntree(
+    new Ntree< D, index >( this->lower_left_, this->extent_, this->periodic_ ) );
+  if ( entry and entry->vector )
+  {
+    // Convert from vector to Ntree
+    const auto positions =
+      std::static_pointer_cast< std::vector< std::pair< Position< D >, index > > >( entry->vector );
+    typename std::insert_iterator< Ntree< D, index > > to = std::inserter( *ntree, ntree->end() );
+    for ( const auto& position : *positions )
+    {
+      *to = position;
+    }
+  }
+  else
+  {
+    insert_global_positions_ntree_( *ntree, node_collection );
+  }
 
-  cached_ntree_ =
-    std::shared_ptr< Ntree< D, index > >( new Ntree< D, index >( this->lower_left_, this->extent_, this->periodic_ ) );
+  insert_cache_entry_( metadata, true, ntree, node_collection->size() * sizeof( std::pair< Position< D >, index > ) );
 
-  return do_get_global_positions_ntree_( node_collection );
+  return ntree;
 }
 
 template < int D >
@@ -155,9 +198,6 @@ Layer< D >::get_global_positions_ntree( std::bitset< D > periodic,
   Position< D > extent,
   NodeCollectionPTR node_collection )
 {
-  clear_ntree_cache_();
-  clear_vector_cache_();
-
   // Keep layer geometry for non-periodic dimensions
   for ( int i = 0; i < D; ++i )
   {
@@ -168,82 +208,50 @@ Layer< D >::get_global_positions_ntree( std::bitset< D > periodic,
     }
   }
 
-  cached_ntree_ = std::shared_ptr< Ntree< D, index > >( new Ntree< D, index >( this->lower_left_, extent, periodic ) );
-
-  do_get_global_positions_ntree_( node_collection );
-
-  // Do not use cache since the periodic bits and extents were altered.
-  cached_ntree_md_ = NodeCollectionMetadataPTR( 0 );
-
-  return cached_ntree_;
-}
-
-template < int D >
-std::shared_ptr< Ntree< D, index > >
-Layer< D >::do_get_global_positions_ntree_( NodeCollectionPTR node_collection )
-{
-  if ( cached_vector_md_ == node_collection->get_metadata() )
-  {
-    // Convert from vector to Ntree
-
-    typename std::insert_iterator< Ntree< D, index > > to = std::inserter( *cached_ntree_, cached_ntree_->end() );
-
-    for ( typename std::vector< std::pair< Position< D >, index > >::iterator from = cached_vector_->begin();
-          from != cached_vector_->end();
-          ++from )
-    {
-      *to = *from;
-    }
-  }
-  else
+  // The ntree is not cached since the periodic bits and extents were
+  // altered, but the positions are taken from the cache.
+  std::shared_ptr< Ntree< D, index > > ntree( new Ntree< D, index >( this->lower_left_, extent, periodic ) );
+  const auto positions = get_global_positions_vector( node_collection );
+  typename std::insert_iterator< Ntree< D, index > > to = std::inserter( *ntree, ntree->end() );
+  for ( const auto& position : *positions )
   {
-
-    insert_global_positions_ntree_( *cached_ntree_, node_collection );
+    *to = position;
   }
 
-  clear_vector_cache_();
-
-  cached_ntree_md_ = node_collection->get_metadata();
-
-  return cached_ntree_;
+  return ntree;
 }
 
 template < int D >
-std::vector< std::pair< Position< D >, index > >*
+std::shared_ptr< std::vector< std::pair< Position< D >, index > > >
 Layer< D >::get_global_positions_vector( NodeCollectionPTR node_collection )
 {
-  if ( cached_vector_md_ == node_collection->get_metadata() )
+  const NodeCollectionMetadataPTR metadata = node_collection->get_metadata();
+  CacheEntry* entry = find_cache_entry_( metadata, false );
+  if ( entry and entry->vector )
   {
-    assert( cached_vector_ );
-    return cached_vector_;
+    return std::static_pointer_cast< std::vector< std::pair< Position< D >, index > > >( entry->vector );
   }
 
-  clear_vector_cache_();
-
-  cached_vector_ = new std::vector< std::pair< Position< D >, index > >;
-
-  if ( cached_ntree_md_ == node_collection->get_metadata() )
+  std::shared_ptr< std::vector< std::pair< Position< D >, index > > > positions(
+    new std::vector< std::pair< Position< D >, index > > );
+  if ( entry and entry->ntree )
   {
-    // Convert from NTree to vector
-
-    typename std::back_insert_iterator< std::vector< std::pair< Position< D >, index > > > to =
-      std::back_inserter( *cached_vector_ );
-
-    for ( typename Ntree< D, index >::iterator from = cached_ntree_->begin(); from != cached_ntree_->end(); ++from )
+    // Convert from Ntree to vector
+    const auto ntree = std::static_pointer_cast< Ntree< D, index > >( entry->ntree );
+    for ( typename Ntree< D, index >::iterator from = ntree->begin(); from != ntree->end(); ++from )
     {
-      *to = *from;
+      positions->push_back( *from );
     }
   }
   else
   {
-    insert_global_positions_vector_( *cached_vector_, node_collection );
+    insert_global_positions_vector_( *positions, node_collection );
   }
 
-  clear_ntree_cache_();
-
-  cached_vector_md_ = node_collection->get_metadata();
+  insert_cache_entry_(
+    metadata, false, positions, positions->capacity() * sizeof( std::pair< Position< D >, index > ) );
 
-  return cached_vector_;
+  return positions;
 }
 
 template < int D >
@@ -281,6 +289,34 @@ Layer< D >::get_global_nodes( const MaskDatum& mask,
   return nodes;
 }
 
+template < int D >
+void
+Layer< D >::find_nearest( const std::vector< double >& points,
+  size_t k,
+  double max_distance,
+  NodeCollectionPTR node_collection,
+  std::vector< long >& indptr,
+  std::vector< long >& indices,
+  std::vector< double >& distances )
+{
+  assert( points.size() % D == 0 );
+  const size_t num_points = points.size() / D;
+  std::shared_ptr< Ntree< D, index > > ntree = get_global_positions_ntree( node_collection );
+
+  indptr.assign( 1, 0 );
+  indptr.reserve( num_points + 1 );
+  for ( size_t j = 0; j < num_points; ++j )
+  {
+    const Position< D > point( std::vector< double >( points.begin() + j * D, points.begin() + ( j + 1 ) * D ) );
+    for ( const auto& nearest : ntree->get_nearest( point, k, max_distance ) )
+    {
+      indices.push_back( node_collection->find( nearest.second ) );
+      distances.push_back( nearest.first );
+    }
+    indptr.push_back( indices.size() );
+  }
+}
+
 template < int D >
 void
 Layer< D >::dump_nodes( std::ostream& out ) const
@@ -302,7 +338,7 @@ Layer< D >::dump_connections( std::ostream& out,
   AbstractLayerPTR target_layer,
   const Token& syn_model )
 {
-  std::vector< std::pair< Position< D >, index > >* src_vec = get_global_positions_vector( node_collection );
+  const auto src_vec = get_global_positions_vector( node_collection );
 
   // Dictionary with parameters for get_connections()
   DictionaryDatum ncdict( new Dictionary );
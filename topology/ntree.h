@@ -303,6 +303,17 @@ public:
    */
   std::vector< value_type > get_nodes( const Mask< D >& mask, const Position< D >& anchor );
 
+  /**
+   * Find the nodes closest to a position. Distances take the periodic
+   * boundary conditions of the tree into account.
+   * @param pos           position to search around.
+   * @param k             maximal number of nodes to return.
+   * @param max_distance  only nodes within this distance are returned.
+   * @returns pairs of distance and node, sorted by distance, nodes at
+   *          the same distance sorted by node.
+   */
+  std::vector< std::pair< double, T > > get_nearest( const Position< D >& pos, size_t k, double max_distance );
+
   /**
    * This function returns a node iterator which will traverse the
    * subtree below this Ntree.
@@ -359,6 +370,24 @@ protected:
    */
   void append_nodes_( std::vector< value_type >&, const Mask< D >&, const Position< D >& );
 
+  /**
+   * Add the nodes in this ntree closer to pos than the k-th nearest node
+   * found so far, or than max_distance if fewer than k nodes were found,
+   * to the heap. The heap holds pairs of squared distance and node, with
+   * the farthest node on top.
+   * @param period  top ntree extent in periodic dimensions, 0 otherwise.
+   */
+  void append_nearest_( const Position< D >& pos,
+    size_t k,
+    double max_sq_distance,
+    const Position< D >& period,
+    std::vector< std::pair< double, T > >& heap );
+
+  /**
+   * @returns the squared distance from pos to the region of this ntree.
+   */
+  double squared_distance_to_region_( const Position< D >& pos, const Position< D >& period ) const;
+
   /**
    * @returns the subquad number for this position
    */
@@ -25,6 +25,10 @@
 
 #include "ntree.h"
 
+// C++ includes:
+#include <algorithm>
+#include <cmath>
+
 // Includes from topology:
 #include "mask.h"
 
@@ -448,6 +452,127 @@ Ntree< D, T, max_capacity, max_depth >::append_nodes_( std::vector< std::pair< P
   }
 }
 
+template < int D, class T, int max_capacity, int max_depth >
+std::vector< std::pair< double, T > >
+Ntree< D, T, max_capacity, max_depth >::get_nearest( const Position< D >& pos, size_t k, double max_distance )
+{
+  // Only the top ntree knows the periodic boundary conditions
+  Ntree* top = this;
+  while ( top->parent_ )
+  {
+    top = top->parent_;
+  }
+  Position< D > period;
+  for ( int i = 0; i < D; ++i )
+  {
+    period[ i ] = top->periodic_[ i ] ? top->extent_[ i ] : 0.0;
+  }
+
+  std::vector< std::pair< double, T > > heap;
+  if ( k > 0 )
+  {
+    append_nearest_( pos, k, max_distance * max_distance, period, heap );
+  }
+
+  std::sort_heap( heap.begin(), heap.end() );
+  for ( auto& entry : heap )
+  {
+    entry.first = std::sqrt( entry.first );
+  }
+  return heap;
+}
+
+template < int D, class T, int max_capacity, int max_depth >
+void
+Ntree< D, T, max_capacity, max_depth >::append_nearest_( const Position< D >& pos,
+  size_t k,
+  double max_sq_distance,
+  const Position< D >& period,
+  std::vector< std::pair< double, T > >& heap )
+{
+  if ( leaf_ )
+  {
+    for ( const auto& node : nodes_ )
+    {
+      double sq_distance = 0.0;
+      for ( int i = 0; i < D; ++i )
+      {
+        double d = std::abs( node.first[ i ] - pos[ i ] );
+        if ( period[ i ] > 0.0 )
+        {
+          d = std::fmod( d, period[ i ] );
+          d = std::min( d, period[ i ] - d );
+        }
+        sq_distance += d * d;
+      }
+      if ( sq_distance > max_sq_distance )
+      {
+        continue;
+      }
+
+      const std::pair< double, T > entry( sq_distance, node.second );
+      if ( heap.size() < k )
+      {
+        heap.push_back( entry );
+        std::push_heap( heap.begin(), heap.end() );
+      }
+      else if ( entry < heap.front() )
+      {
+        std::pop_heap( heap.begin(), heap.end() );
+        heap.back() = entry;
+        std::push_heap( heap.begin(), heap.end() );
+      }
+    }
+    return;
+  }
+
+  // Visit the closest children first, so that the bound shrinks quickly
+  std::pair< double, int > children[ N ];
+  for ( int j = 0; j < N; ++j )
+  {
+    children[ j ] = std::make_pair( children_[ j ]->squared_distance_to_region_( pos, period ), j );
+  }
+  std::sort( children, children + N );
+
+  for ( int j = 0; j < N; ++j )
+  {
+    const double bound = heap.size() < k ? max_sq_distance : heap.front().first;
+    if ( children[ j ].first > bound )
+    {
+      break;
+    }
+    children_[ children[ j ].second ]->append_nearest_( pos, k, max_sq_distance, period, heap );
+  }
+}
+
+template < int D, class T, int max_capacity, int max_depth >
+double
+Ntree< D, T, max_capacity, max_depth >::squared_distance_to_region_( const Position< D >& pos,
+  const Position< D >& period ) const
+{
+  double sq_distance = 0.0;
+  for ( int i = 0; i < D; ++i )
+  {
+    double d;
+    if ( period[ i ] > 0.0 )
+    {
+      // Offset of pos from the lower edge, mapped into [0, period)
+      double offset = std::fmod( pos[ i ] - lower_left_[ i ], period[ i ] );
+      if ( offset < 0.0 )
+      {
+        offset += period[ i ];
+      }
+      d = offset <= extent_[ i ] ? 0.0 : std::min( offset - extent_[ i ], period[ i ] - offset );
+    }
+    else
+    {
+      d = std::max( std::max( lower_left_[ i ] - pos[ i ], pos[ i ] - lower_left_[ i ] - extent_[ i ] ), 0.0 );
+    }
+    sq_distance += d * d;
+  }
+  return sq_distance;
+}
+
 template < int D, class T, int max_capacity, int max_depth >
 typename Ntree< D, T, max_capacity, max_depth >::iterator
 Ntree< D, T, max_capacity, max_depth >::insert( Position< D > pos, const T& node )
@@ -384,4 +384,57 @@ get_layer_status( NodeCollectionPTR layer_nc )
   return DictionaryDatum();
 }
 
+ArrayDatum
+find_nearest( NodeCollectionPTR layer_nc, const std::vector< double >& points, long dim, long k, double max_distance )
+{
+  AbstractLayerPTR layer = get_layer( layer_nc );
+  const long num_dimensions = layer->get_num_dimensions();
+
+  if ( dim != num_dimensions )
+  {
+    throw BadProperty( String::compose(
+      "Points have %1 dimensions, but the positions in the layer have %2 dimensions.", dim, num_dimensions ) );
+  }
+  if ( points.size() % num_dimensions != 0 )
+  {
+    throw BadProperty(
+      String::compose( "Number of coordinates must be a multiple of the number of dimensions %1.", num_dimensions ) );
+  }
+  if ( k < 0 )
+  {
+    throw BadProperty( "Number of nearest nodes must not be negative." );
+  }
+  if ( not( max_distance >= 0.0 ) )
+  {
+    throw BadProperty( "Maximal distance must not be negative." );
+  }
+
+  std::vector< long >* indptr = new std::vector< long >;
+  std::vector< long >* indices = new std::vector< long >;
+  std::vector< double >* distances = new std::vector< double >;
+  layer->find_nearest( points, k, max_distance, layer_nc, *indptr, *indices, *distances );
+
+  ArrayDatum result;
+  result.push_back( new IntVectorDatum( indptr ) );
+  result.push_back( new IntVectorDatum( indices ) );
+  result.push_back( new DoubleVectorDatum( distances ) );
+  return result;
+}
+
+DictionaryDatum
+get_position_cache_status()
+{
+  DictionaryDatum d( new Dictionary );
+  AbstractLayer::get_cache_status( d );
+  return d;
+}
+
+void
+set_position_cache_status( const DictionaryDatum& dict )
+{
+  dict->clear_access_flags();
+  AbstractLayer::set_cache_status( dict );
+  ALL_ENTRIES_ACCESSED( *dict, "topology::SetPositionCacheStatus", "Unread dictionary entries: " );
+}
+
 } // namespace nest
@@ -113,6 +113,10 @@ void dump_layer_connections( const Token& syn_model,
   NodeCollectionPTR target_layer_nc,
   OstreamDatum& out_file );
 DictionaryDatum get_layer_status( NodeCollectionPTR layer_nc );
+ArrayDatum
+find_nearest( NodeCollectionPTR layer_nc, const std::vector< double >& points, long dim, long k, double max_distance );
+DictionaryDatum get_position_cache_status();
+void set_position_cache_status( const DictionaryDatum& dict );
 }
 
 #endif /* TOPOLOGY_H */
@@ -36,6 +36,7 @@ const Name allow_oversized_mask( "allow_oversized_mask" );
 const Name anchor( "anchor" );
 const Name azimuth_angle( "azimuth_angle" );
 const Name box( "box" );
+const Name cached_layers( "cached_layers" );
 const Name center( "center" );
 const Name circular( "circular" );
 const Name connection_type( "connection_type" );
@@ -43,15 +44,19 @@ const Name edge_wrap( "edge_wrap" );
 const Name elements( "elements" );
 const Name ellipsoidal( "ellipsoidal" );
 const Name elliptical( "elliptical" );
+const Name evictions( "evictions" );
 const Name extent( "extent" );
 const Name grid( "grid" );
 const Name grid3d( "grid3d" );
+const Name hits( "hits" );
 const Name inner_radius( "inner_radius" );
 const Name kernel( "kernel" );
 const Name lower_left( "lower_left" );
 const Name major_axis( "major_axis" );
 const Name mask( "mask" );
+const Name max_memory( "max_memory" );
 const Name minor_axis( "minor_axis" );
+const Name misses( "misses" );
 const Name number_of_connections( "number_of_connections" );
 const Name outer_radius( "outer_radius" );
 const Name pairwise_bernoulli_on_source( "pairwise_bernoulli_on_source" );
@@ -44,6 +44,7 @@ extern const Name allow_oversized_mask;
 extern const Name anchor;
 extern const Name azimuth_angle;
 extern const Name box;
+extern const Name cached_layers;
 extern const Name center;
 extern const Name circular;
 extern const Name connection_type;
@@ -51,15 +52,19 @@ extern const Name edge_wrap;
 extern const Name elements;
 extern const Name ellipsoidal;
 extern const Name elliptical;
+extern const Name evictions;
 extern const Name extent;
 extern const Name grid;
 extern const Name grid3d;
+extern const Name hits;
 extern const Name inner_radius;
 extern const Name kernel;
 extern const Name lower_left;
 extern const Name major_axis;
 extern const Name mask;
+extern const Name max_memory;
 extern const Name minor_axis;
+extern const Name misses;
 extern const Name number_of_connections;
 extern const Name outer_radius;
 extern const Name pairwise_bernoulli_on_source;
@@ -252,6 +252,12 @@ TopologyModule::init( SLIInterpreter* i )
 
   i->createcommand( "SelectNodesByMask_g_a_M", &selectnodesbymask_g_a_Mfunction );
 
+  i->createcommand( "FindNearest_g_dv_i_i_d", &findnearest_g_dv_i_i_dfunction );
+
+  i->createcommand( "GetPositionCacheStatus", &getpositioncachestatusfunction );
+
+  i->createcommand( "SetPositionCacheStatus_D", &setpositioncachestatus_Dfunction );
+
   // Register mask types
   register_mask< BallMask< 2 > >();
   register_mask< BallMask< 3 > >();
@@ -1027,4 +1033,103 @@ LayerNodeExpected::message() const
 }
 
 
+/** @BeginDocumentation
+  Name: topology::FindNearest - find the nodes of a layer nearest to points
+
+  Synopsis:
+  layer points dim k max_distance FindNearest -> [indptr indices distances]
+
+  Parameters:
+  layer        - NodeCollection of a spatial layer
+  points       - doublevector with the flattened coordinates of the points
+  dim          - number of dimensions of each point, must be the number
+                 of dimensions of the layer
+  k            - maximal number of nodes to find for each point
+  max_distance - only nodes within this distance of a point are found
+
+  Description:
+  For each point, finds up to k nodes of the layer nearest to it, using
+  the ntree of global positions of the layer, so that many points can
+  be queried efficiently. Distances take periodic boundary conditions
+  into account.
+
+  The result is returned in compressed sparse row format: the nodes
+  found for point j are given by elements indptr[j] to indptr[j+1]-1 of
+  indices, which are indices into layer, and distances, sorted by
+  distance. Nodes at the same distance are sorted by node ID.
+
+  SeeAlso: SelectNodesByMask
+*/
+void
+TopologyModule::FindNearest_g_dv_i_i_dFunction::execute( SLIInterpreter* i ) const
+{
+  i->assert_stack_load( 5 );
+
+  const NodeCollectionDatum layer_nc = getValue< NodeCollectionDatum >( i->OStack.pick( 4 ) );
+  const std::vector< double > points = getValue< std::vector< double > >( i->OStack.pick( 3 ) );
+  const long dim = getValue< long >( i->OStack.pick( 2 ) );
+  const long k = getValue< long >( i->OStack.pick( 1 ) );
+  const double max_distance = getValue< double >( i->OStack.pick( 0 ) );
+
+  ArrayDatum result = find_nearest( layer_nc, points, dim, k, max_distance );
+
+  i->OStack.pop( 5 );
+  i->OStack.push( result );
+  i->EStack.pop();
+}
+
+/** @BeginDocumentation
+  Name: topology::GetPositionCacheStatus - return information about the cache of layer positions
+
+  Synopsis:
+  GetPositionCacheStatus -> dict
+
+  Returns:
+  Status dictionary with the maximal and current memory in bytes used
+  by the cache of global positions of layers, the number of cached
+  layers and the numbers of hits, misses and evictions.
+
+  SeeAlso: topology::SetPositionCacheStatus
+*/
+void
+TopologyModule::GetPositionCacheStatusFunction::execute( SLIInterpreter* i ) const
+{
+  DictionaryDatum result = get_position_cache_status();
+
+  i->OStack.push( result );
+  i->EStack.pop();
+}
+
+/** @BeginDocumentation
+  Name: topology::SetPositionCacheStatus - set the size of the cache of layer positions
+
+  Synopsis:
+  dict SetPositionCacheStatus -> -
+
+  Parameters:
+  dict - dictionary with the maximal memory in bytes used by the cache
+         under the key max_memory
+
+  Description:
+  The global positions of the nodes of spatial layers are cached, so
+  that they need not be gathered from all MPI processes again for
+  each connection to or from the same layer. If the cache exceeds the
+  given memory, the least recently used layers are evicted. Setting
+  the status resets the counters of hits, misses and evictions.
+
+  SeeAlso: topology::GetPositionCacheStatus
+*/
+void
+TopologyModule::SetPositionCacheStatus_DFunction::execute( SLIInterpreter* i ) const
+{
+  i->assert_stack_load( 1 );
+
+  const DictionaryDatum dict = getValue< DictionaryDatum >( i->OStack.pick( 0 ) );
+
+  set_position_cache_status( dict );
+
+  i->OStack.pop( 1 );
+  i->EStack.pop();
+}
+
 } // namespace nest
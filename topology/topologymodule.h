@@ -164,6 +164,24 @@ public:
     void execute( SLIInterpreter* ) const;
   } selectnodesbymask_g_a_Mfunction;
 
+  class FindNearest_g_dv_i_i_dFunction : public SLIFunction
+  {
+  public:
+    void execute( SLIInterpreter* ) const;
+  } findnearest_g_dv_i_i_dfunction;
+
+  class GetPositionCacheStatusFunction : public SLIFunction
+  {
+  public:
+    void execute( SLIInterpreter* ) const;
+  } getpositioncachestatusfunction;
+
+  class SetPositionCacheStatus_DFunction : public SLIFunction
+  {
+  public:
+    void execute( SLIInterpreter* ) const;
+  } setpositioncachestatus_Dfunction;
+
   typedef GenericFactory< AbstractMask > MaskFactory;
   typedef GenericFactory< AbstractMask >::CreatorFunction MaskCreatorFunction;
 